@@ -0,0 +1,119 @@
+"""
+Benchmark: ADIF parsing throughput and peak memory, whole-file vs streaming
+
+Writes a synthetic ADIF file, then parses it in a fresh child process per
+case so each peak RSS is measured on its own:
+
+  legacy     f.read() + re.split on <EOR> + per-record regex (the old parser)
+  streaming  ADIFParser.iter_records() over the chunked tokenizer
+  mapped     MappedADIFReader record index (count + one random record)
+
+Usage:
+    python benchmarks/bench_adif_parse.py [--records 200000] [--case legacy|streaming|mapped]
+"""
+
+import argparse
+import os
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adif import ADIF_FIELD_MAP, ADIFGenerator, ADIFParser, MappedADIFReader  # noqa: E402
+
+CASES = ('legacy', 'streaming', 'mapped')
+
+
+def write_log(path, count):
+    """Write an ADIF file with synthetic SKCC contacts"""
+    def contacts():
+        for i in range(count):
+            yield {
+                'callsign': f"K{i % 10}{chr(65 + i % 26)}{chr(65 + (i // 26) % 26)}",
+                'date': f"20{10 + i % 15:02d}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+                'time_on': f"{i % 24:02d}:{i % 60:02d}",
+                'band': '20M',
+                'mode': 'CW',
+                'rst_sent': '599',
+                'rst_rcvd': '579',
+                'name': 'Operator',
+                'state': 'VA',
+                'skcc_number': f"{i % 30000 + 1}T",
+                'key_type': 'STRAIGHT',
+                'comment': 'Synthetic <benchmark> contact',
+            }
+
+    ADIFGenerator().generate_file(path, contacts())
+
+
+def legacy_parse(path):
+    """The pre-streaming parser: whole-file read, split, per-record regex"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        content = f.read()
+    eoh_match = re.search(r'<eoh>|<EOH>', content, re.IGNORECASE)
+    if eoh_match:
+        content = content[eoh_match.end():]
+
+    for record in re.split(r'<eor>|<EOR>', content, flags=re.IGNORECASE):
+        if not record.strip():
+            continue
+        pattern = re.compile(r'<([A-Za-z0-9_]+):(\d+)(?::[^>]*)?>', re.IGNORECASE)
+        contact = {}
+        pos = 0
+        while True:
+            match = pattern.search(record, pos)
+            if not match:
+                break
+            data_start = match.end()
+            pos = data_start + int(match.group(2))
+            field_map = dict(ADIF_FIELD_MAP)
+            db_field = field_map.get(match.group(1).upper())
+            if db_field:
+                contact[db_field] = record[data_start:pos].strip()
+        if contact:
+            yield contact
+
+
+def run_case(case, path):
+    """Parse the file in this process and print records, rate and peak RSS"""
+    start = time.perf_counter()
+    if case == 'legacy':
+        records = sum(1 for _ in legacy_parse(path))
+    elif case == 'streaming':
+        records = sum(1 for _ in ADIFParser(path).iter_records())
+    else:
+        with MappedADIFReader(path) as reader:
+            records = len(reader)
+            reader[records // 2]['callsign']
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{case:<10} records={records}  {records / elapsed:,.0f} rec/s  "
+          f"elapsed={elapsed:.2f} s  peak RSS={peak_kb / 1024:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--records', type=int, default=200000)
+    parser.add_argument('--case', choices=CASES, help='Run one case in this process')
+    parser.add_argument('--file', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        run_case(args.case, args.file)
+        return
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, 'bench.adi')
+        write_log(path, args.records)
+        print(f"{args.records} records, {os.path.getsize(path) / 1024 / 1024:.1f} MB ADIF")
+        for case in CASES:
+            subprocess.run([sys.executable, os.path.abspath(__file__),
+                            '--case', case, '--file', path], check=True)
+
+
+if __name__ == '__main__':
+    main()
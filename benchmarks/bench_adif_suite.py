@@ -0,0 +1,206 @@
+"""
+Benchmark suite: ADIF parse, import and export rates at several log sizes
+
+For each size a synthetic SKCC log (benchmarks/synthetic_log.py) is written
+as ADIF, ADX and Cabrillo, and loaded into a reference database once.
+Every case then runs in a fresh child process so its peak RSS is measured
+on its own:
+
+  parse           ADIFParser.iter_records() over the whole file
+  parse_adx       iter_log_contacts() over the ADX file
+  parse_cabrillo  iter_log_contacts() over the Cabrillo file
+  import          Database.add_contacts_batch(skip_duplicates=False) into a
+                  copy of the reference database (populated, same size)
+  import_dedup    as import, with duplicate detection against the log
+  export          export_contacts_to_adif(Database.iter_contacts(), ...)
+
+Results are written as JSON (environment, then one entry per case and
+size). Passing an earlier results file with --compare prints the change in
+rate for every case, so regressions show up between releases.
+
+Usage:
+    python benchmarks/bench_adif_suite.py [--sizes 1000,10000,100000] [--output results.json]
+                                          [--compare previous.json] [--seed 42]
+    python benchmarks/bench_adif_suite.py --sizes 1000000   # the 1M-record run
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_log import (  # noqa: E402
+    synthetic_contacts,
+    write_synthetic_adif,
+    write_synthetic_adx,
+    write_synthetic_cabrillo,
+)
+from src.adif import ADIFParser, export_contacts_to_adif  # noqa: E402
+from src.database import Database  # noqa: E402
+from src.log_formats import iter_log_contacts  # noqa: E402
+
+CASES = ('parse', 'parse_adx', 'parse_cabrillo', 'import', 'import_dedup', 'export')
+# The other formats are written next to the ADIF file
+FORMAT_SUFFIXES = {'parse_adx': '.adx', 'parse_cabrillo': '.log'}
+DEFAULT_SIZES = '1000,10000,100000'
+# The reference database holds a different log than the file being imported
+REFERENCE_SEED_OFFSET = 1
+
+
+def build_reference(db_path, count, seed):
+    """Create the populated database the import and export cases start from"""
+    database = Database(db_path=db_path)
+    try:
+        database.add_contacts_batch(list(synthetic_contacts(count, seed + REFERENCE_SEED_OFFSET)),
+                                    skip_duplicates=False)
+    finally:
+        database.close()
+
+
+def run_case(case, adif_path, reference_db, work_dir):
+    """Run one case in this process and return its measurements"""
+    records = 0
+    if case == 'parse':
+        start = time.perf_counter()
+        records = sum(1 for _ in ADIFParser(adif_path).iter_records())
+        elapsed = time.perf_counter() - start
+    elif case in FORMAT_SUFFIXES:
+        log_path = os.path.splitext(adif_path)[0] + FORMAT_SUFFIXES[case]
+        start = time.perf_counter()
+        records = sum(1 for _ in iter_log_contacts(log_path))
+        elapsed = time.perf_counter() - start
+    elif case in ('import', 'import_dedup'):
+        db_path = os.path.join(work_dir, f"{case}.db")
+        shutil.copyfile(reference_db, db_path)
+        database = Database(db_path=db_path)
+        try:
+            # Parsing is measured by its own case
+            contacts = ADIFParser(adif_path).parse_file(adif_path)
+            start = time.perf_counter()
+            result = database.add_contacts_batch(contacts, skip_duplicates=(case == 'import_dedup'))
+            elapsed = time.perf_counter() - start
+            records = len(contacts)
+            if result['errors']:
+                raise RuntimeError(f"{case}: {result['errors']} contacts failed to import")
+        finally:
+            database.close()
+    else:
+        database = Database(db_path=reference_db)
+        try:
+            start = time.perf_counter()
+            records = export_contacts_to_adif(database.iter_contacts(),
+                                              os.path.join(work_dir, 'export.adi'))
+            elapsed = time.perf_counter() - start
+        finally:
+            database.close()
+
+    return {
+        'records': records,
+        'elapsed_s': round(elapsed, 4),
+        'records_per_s': round(records / elapsed) if elapsed else None,
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def environment():
+    """Describe the machine and code version the results belong to"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+
+
+def compare(results, baseline_path):
+    """Print the rate change of every case against an earlier results file"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(entry['case'], entry['size']): entry for entry in json.load(f)['results']}
+
+    print(f"\nChange against {baseline_path}:")
+    for entry in results:
+        before = baseline.get((entry['case'], entry['size']))
+        if not before or not before['records_per_s'] or not entry['records_per_s']:
+            continue
+        change = (entry['records_per_s'] - before['records_per_s']) / before['records_per_s'] * 100
+        print(f"  {entry['case']:<15} {entry['size']:>9,}  {change:+6.1f}%  "
+              f"({before['records_per_s']:,} -> {entry['records_per_s']:,} rec/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help='Comma-separated record counts (default: %(default)s)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='adif_benchmark.json', help='Results file (JSON)')
+    parser.add_argument('--compare', help='Earlier results file to compare against')
+    parser.add_argument('--case', choices=CASES + ('build',), help=argparse.SUPPRESS)
+    parser.add_argument('--size', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--adif', help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    parser.add_argument('--work', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case == 'build':
+        build_reference(args.db, args.size, args.seed)
+        return
+    if args.case:
+        print(json.dumps(run_case(args.case, args.adif, args.db, args.work)))
+        return
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tempdir:
+            adif_path = os.path.join(tempdir, 'log.adi')
+            reference_db = os.path.join(tempdir, 'reference.db')
+            write_synthetic_adif(adif_path, size, args.seed)
+            write_synthetic_adx(os.path.join(tempdir, 'log.adx'), size, args.seed)
+            write_synthetic_cabrillo(os.path.join(tempdir, 'log.log'), size, args.seed)
+            # Built in a child too: Linux keeps a parent's peak RSS across fork/exec
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--case', 'build',
+                            '--size', str(size), '--seed', str(args.seed), '--db', reference_db],
+                           check=True, stdout=subprocess.DEVNULL)
+            print(f"{size:,} records, {os.path.getsize(adif_path) / 1024 / 1024:.1f} MB ADIF")
+
+            for case in CASES:
+                output = subprocess.run(
+                    [sys.executable, os.path.abspath(__file__), '--case', case, '--adif', adif_path,
+                     '--db', reference_db, '--work', tempdir],
+                    check=True, capture_output=True, text=True,
+                ).stdout
+                # Only the last line is ours; Database may print while opening
+                measurement = json.loads(output.strip().splitlines()[-1])
+                results.append({'case': case, 'size': size, **measurement})
+                print(f"  {case:<15} {measurement['records_per_s']:>10,} rec/s  "
+                      f"elapsed={measurement['elapsed_s']:.2f} s  "
+                      f"peak RSS={measurement['peak_rss_mb']:.1f} MB")
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'environment': environment(), 'results': results}, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
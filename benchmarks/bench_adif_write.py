@@ -0,0 +1,86 @@
+"""
+Benchmark: ADIF export throughput and peak memory
+
+Builds a throwaway log with synthetic contacts, then exports it in a fresh
+child process per case so each peak RSS is measured on its own:
+
+  iter_contacts  export_contacts_to_adif(Database.iter_contacts(), ...)
+  cursor         export_contacts_to_adif(<read-only cursor>, ...)
+  gzip           as iter_contacts, written to a .adi.gz file
+
+Usage:
+    python benchmarks/bench_adif_write.py [--contacts 100000] [--case iter_contacts|cursor|gzip]
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_date_queries import build_log  # noqa: E402
+from src.adif import export_contacts_to_adif  # noqa: E402
+from src.database import Database  # noqa: E402
+
+CASES = ('iter_contacts', 'cursor', 'gzip')
+
+
+def run_case(case, db_path, out_dir):
+    """Export the log in this process and print rate, file size and peak RSS"""
+    database = Database(db_path=db_path)
+    try:
+        filename = os.path.join(out_dir, f"{case}.adi" + (".gz" if case == 'gzip' else ""))
+        start = time.perf_counter()
+        if case == 'cursor':
+            with database.read_connection() as conn:
+                written = export_contacts_to_adif(conn.execute("SELECT * FROM contacts"), filename)
+        else:
+            written = export_contacts_to_adif(database.iter_contacts(), filename)
+        elapsed = time.perf_counter() - start
+    finally:
+        database.close()
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{case:<14} contacts={written}  {written / elapsed:,.0f} rec/s  "
+          f"elapsed={elapsed:.2f} s  size={os.path.getsize(filename) / 1024 / 1024:.1f} MB  "
+          f"peak RSS={peak_kb / 1024:.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contacts', type=int, default=100000)
+    parser.add_argument('--case', choices=CASES + ('build',), help='Run one case in this process')
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    parser.add_argument('--out', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case == 'build':
+        database = Database(db_path=args.db)
+        try:
+            build_log(database, args.contacts)
+        finally:
+            database.close()
+        return
+    if args.case:
+        run_case(args.case, args.db, args.out)
+        return
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        db_path = os.path.join(tempdir, 'bench.db')
+        # Built in a child too: Linux keeps a parent's peak RSS across fork/exec
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--case', 'build',
+                        '--contacts', str(args.contacts), '--db', db_path],
+                       check=True, stdout=subprocess.DEVNULL)
+
+        print(f"{args.contacts} contacts")
+        for case in CASES:
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--case', case,
+                            '--db', db_path, '--out', tempdir], check=True)
+
+
+if __name__ == '__main__':
+    main()
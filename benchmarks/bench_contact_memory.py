@@ -0,0 +1,69 @@
+"""
+Benchmark: memory of the shared ContactStore versus lists of contact dicts
+
+For each log size, builds a throwaway log with synthetic contacts and reports
+the load time, traced allocation peak and retained size of Database.get_all_contacts()
+(one dict per row, as each tab used to hold) next to a loaded ContactStore.
+
+Usage:
+    python benchmarks/bench_contact_memory.py [--sizes 10000 100000 500000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_date_queries import build_log  # noqa: E402
+from src.contact_store import ContactStore  # noqa: E402
+from src.database import Database  # noqa: E402
+
+
+def measure(label, load):
+    """Print the load time of load(), then its traced allocation peak and retained size"""
+    start = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start
+
+    # tracemalloc slows allocation-heavy code, so it is traced in a second run
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} retained={retained / 1e6:8.1f} MB  peak={peak / 1e6:8.1f} MB  "
+          f"load={elapsed:6.2f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 500000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, 'bench.db'))
+            try:
+                build_log(database, size)
+                print(f"\n{size} contacts")
+                measure("get_all_contacts (dicts)", lambda: database.get_all_contacts(limit=size))
+
+                def load_store():
+                    store = ContactStore(database)
+                    len(store)
+                    return store
+
+                measure("ContactStore (__slots__)", load_store)
+            finally:
+                database.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: contact write paths
+
+Measures inserts/sec through Database.add_contact (one commit per QSO) and
+Database.add_contacts_batch (one transaction), plus the latency of
+update_contact, on a throwaway log.
+
+Usage:
+    python benchmarks/bench_contact_writes.py [--contacts 2000] [--batch 50000]
+                                              [--durability safe]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import DURABILITY_PROFILES, Database  # noqa: E402
+
+
+def make_contact(index):
+    """Synthetic contact with the fields a typical logged QSO carries"""
+    return {
+        'callsign': f"K{index % 10}{chr(65 + index % 26)}{chr(65 + (index // 26) % 26)}",
+        'date': f"2025-{1 + index % 12:02d}-{1 + index % 28:02d}",
+        'time_on': f"{index % 24:02d}{index % 60:02d}",
+        'frequency': '14.025',
+        'band': '20M',
+        'mode': 'CW',
+        'rst_sent': '599',
+        'rst_rcvd': '579',
+        'name': 'Op',
+        'state': 'VA',
+        'country': 'United States',
+        'skcc_number': str(1000 + index),
+        'key_type': 'STRAIGHT',
+        'power_watts': 5,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contacts', type=int, default=2000, help="single inserts and updates")
+    parser.add_argument('--batch', type=int, default=50000, help="contacts in the batch import")
+    parser.add_argument('--durability', choices=sorted(DURABILITY_PROFILES), default='safe')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        database = Database(db_path=os.path.join(tempdir, 'bench.db'), durability=args.durability)
+        try:
+            print(f"durability={args.durability}")
+
+            start = time.perf_counter()
+            ids = [database.add_contact(make_contact(i)) for i in range(args.contacts)]
+            elapsed = time.perf_counter() - start
+            print(f"add_contact:        {args.contacts / elapsed:10.0f} inserts/s")
+
+            batch = [make_contact(i) for i in range(args.batch)]
+            start = time.perf_counter()
+            database.add_contacts_batch(batch, skip_duplicates=False)
+            elapsed = time.perf_counter() - start
+            print(f"add_contacts_batch: {args.batch / elapsed:10.0f} inserts/s")
+
+            latencies = []
+            for index, contact_id in enumerate(ids):
+                start = time.perf_counter()
+                database.update_contact(contact_id, {'name': f'Op{index}', 'rst_rcvd': '599'})
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            print(f"update_contact:     median={statistics.median(latencies) * 1000:.3f} ms  "
+                  f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.3f} ms")
+        finally:
+            database.close()
+
+
+if __name__ == '__main__':
+    main()
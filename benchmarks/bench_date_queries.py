@@ -0,0 +1,113 @@
+"""
+Benchmark: date-filtered contact queries before and after the qso_ts index
+
+Builds a throwaway log with synthetic contacts, then prints the SQLite query
+plan and median run time of the old REPLACE()/OR date predicates next to the
+range seeks used now.
+
+Usage:
+    python benchmarks/bench_date_queries.py [--contacts 50000] [--repeat 20]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import Database  # noqa: E402
+
+MODES = ['CW', 'CW', 'CW', 'SSB', 'FT8']
+KEY_TYPES = ['STRAIGHT', 'BUG', 'SIDESWIPER', 'KEYER', '']
+
+
+def build_log(database, count):
+    """Fill the database with synthetic contacts spread over 15 years"""
+    rng = random.Random(42)
+    contacts = []
+    for i in range(count):
+        day = rng.randrange(15 * 365)
+        year, day_of_year = 2011 + day // 365, day % 365
+        month, day_of_month = 1 + day_of_year // 31 % 12, 1 + day_of_year % 28
+        contacts.append({
+            'callsign': f"K{i % 10}{chr(65 + i % 26)}{chr(65 + (i // 26) % 26)}",
+            'date': f"{year:04d}-{month:02d}-{day_of_month:02d}",
+            'time_on': f"{rng.randrange(24):02d}{rng.randrange(60):02d}",
+            'band': '20M',
+            'mode': rng.choice(MODES),
+            'key_type': rng.choice(KEY_TYPES),
+            'skcc_number': f"{rng.randrange(1, 30000)}{rng.choice(['', 'C', 'T', 'S'])}",
+        })
+    database.add_contacts_batch(contacts, skip_duplicates=False)
+
+
+def run_case(database, label, sql, params, repeat):
+    """Print the query plan and median time of one query"""
+    plan = [row['detail'] for row in database.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    timings = []
+    rows = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(database.conn.execute(sql, params).fetchall())
+        timings.append(time.perf_counter() - start)
+
+    print(f"\n{label}")
+    print(f"  rows={rows}  median={statistics.median(timings) * 1000:.2f} ms")
+    for line in plan:
+        print(f"  plan: {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contacts', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        database = Database(db_path=os.path.join(tempdir, 'bench.db'))
+        try:
+            build_log(database, args.contacts)
+            qso_ts = database.normalized_column('qso_ts')
+            mode_norm = database.normalized_column('mode_norm')
+            key_type_norm = database.normalized_column('key_type_norm')
+            skcc_base = database.normalized_column('skcc_base_number')
+            print(f"{args.contacts} contacts, SQLite {database.conn.execute('SELECT sqlite_version()').fetchone()[0]}")
+
+            run_case(
+                database, "BEFORE award count: REPLACE(date, '-', '') >= ?",
+                "SELECT COUNT(DISTINCT skcc_number) FROM contacts "
+                "WHERE mode = ? AND skcc_number IS NOT NULL AND skcc_number != '' "
+                "AND key_type IN (?, ?, ?) AND REPLACE(date, '-', '') >= ?",
+                ('CW', 'STRAIGHT', 'BUG', 'SIDESWIPER', '20230101'), args.repeat,
+            )
+            run_case(
+                database, "AFTER award count: qso_ts range on (mode_norm, key_type_norm, qso_ts)",
+                f"SELECT COUNT(DISTINCT {skcc_base}) FROM contacts "
+                f"WHERE {mode_norm} = ? AND {key_type_norm} IN (?, ?, ?) "
+                f"AND {skcc_base} IS NOT NULL AND {qso_ts} >= ?",
+                ('CW', 'STRAIGHT', 'BUG', 'SIDESWIPER', 202301010000), args.repeat,
+            )
+            run_case(
+                database, "BEFORE date range: OR predicate on date/time_on",
+                "SELECT * FROM contacts "
+                "WHERE (date > ? OR (date = ? AND time_on >= ?)) "
+                "AND (date < ? OR (date = ? AND time_on <= ?)) "
+                "ORDER BY date ASC, time_on ASC",
+                ('2024-03-01', '2024-03-01', '00:00', '2024-03-31', '2024-03-31', '23:59'),
+                args.repeat,
+            )
+            run_case(
+                database, "AFTER date range: qso_ts BETWEEN",
+                f"SELECT * FROM contacts WHERE {qso_ts} BETWEEN ? AND ? ORDER BY {qso_ts} ASC",
+                (202403010000, 202403312359), args.repeat,
+            )
+        finally:
+            database.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark: DXCC lookups per second through the prefix trie
+
+Resolves every SKCC roster callsign plus a set of portable DX calls, first
+through DXCCIndex.lookup() and then through a flat prefix dict probed with
+the callsign's first 4, 3, 2 and 1 characters (how lookups were done before
+the trie), both built from the same bundled entity table. Also reports how
+many roster members resolve to the DXCC entity the roster gives them.
+
+Usage:
+    python benchmarks/bench_dxcc_lookup.py [--repeat 5]
+"""
+
+import argparse
+import csv
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic_log import load_roster  # noqa: E402
+from src.dxcc import DXCC_DATA_FILE, _expand_prefix, _parse_token, load_dxcc_index  # noqa: E402
+
+PORTABLE_CALLS = ['VP2E/W1ABC', 'W1ABC/KH6', 'DL1ABC/P', 'EA8/DL1ABC', 'F/ON4ABC',
+                  'W1ABC/MM', 'VE3ABC/W4', 'K1ABC/QRP', '4U1UN', 'UA9ABC/P']
+
+
+def build_flat_prefixes(path=DXCC_DATA_FILE):
+    """Prefix -> entity dict from the entity table, for the probing baseline"""
+    prefixes = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            for token in row['prefixes'].split():
+                prefix, exact, _ = _parse_token(token)
+                if not exact:
+                    for expanded in _expand_prefix(prefix):
+                        prefixes[expanded] = int(row['entity'])
+    return prefixes
+
+
+def probe_lookup(prefixes, callsign):
+    """Longest of the callsign's first 4..1 characters found in prefixes"""
+    call = callsign.upper().split('/')[0]
+    for length in range(min(4, len(call)), 0, -1):
+        entity = prefixes.get(call[:length])
+        if entity is not None:
+            return entity
+    return None
+
+
+def time_lookups(lookup, calls, repeat):
+    """Median lookups per second over repeat passes"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for call in calls:
+            lookup(call)
+        timings.append(time.perf_counter() - start)
+    return len(calls) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = load_dxcc_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    prefixes = build_flat_prefixes()
+
+    members = load_roster()
+    calls = [member[0] for member in members] + PORTABLE_CALLS
+    print(f"{len(index)} entities (table version {index.version}), built in {build_ms:.1f} ms")
+    print(f"{len(calls)} callsigns per pass")
+
+    trie_rate = time_lookups(index.lookup, calls, args.repeat)
+    probe_rate = time_lookups(lambda call: probe_lookup(prefixes, call), calls, args.repeat)
+    print(f"  trie    {trie_rate:>12,.0f} lookups/s")
+    print(f"  probe   {probe_rate:>12,.0f} lookups/s")
+
+    # Members whose roster entity is known, compared with the lookup
+    known = [(call, int(dxcc)) for call, _, _, _, dxcc in members if dxcc.isdigit()]
+    matched = 0
+    for call, entity in known:
+        info = index.lookup(call)
+        matched += bool(info and info['entity'] == entity)
+    print(f"  roster agreement: {matched}/{len(known)} ({matched / max(len(known), 1):.1%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark: SKCC roster startup from the SQLite roster cache versus the CSV
+
+Each case runs in a fresh child process on a copy of data/skcc_roster.csv,
+so its load time and resident memory are measured on their own:
+
+  csv_dicts    csv.DictReader into per-row dicts indexed by every call and
+               base number (how the roster was loaded before the cache)
+  cache_build  SKCCRosterManager with no cache yet (first start, or after
+               the roster changed): indexes the CSV into the cache
+  cache_open   SKCCRosterManager with an up-to-date cache (every other start)
+
+Memory is the growth of peak RSS over the loaded-but-idle interpreter, after
+loading and again after resolving every roster call once.
+
+Usage:
+    python benchmarks/bench_roster_load.py [--roster data/skcc_roster.csv]
+"""
+
+import argparse
+import csv
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.skcc_roster import SKCCRosterManager  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CASES = ('csv_dicts', 'cache_build', 'cache_open')
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def load_csv_dicts(path):
+    """Index the roster CSV into dicts, as SKCCRosterManager used to"""
+    by_call, by_number = {}, {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            calls = [row.get('call', '')] + SKCCRosterManager._split_other_calls(row.get('other_calls', ''))
+            for call in calls:
+                call = call.strip().upper()
+                for key in (call, SKCCRosterManager.normalize_callsign(call)):
+                    if key:
+                        by_call.setdefault(key, row)
+            base_number = SKCCRosterManager.normalize_skcc_number(row.get('skcc_number', ''))
+            if base_number:
+                by_number.setdefault(base_number, row)
+    return by_call
+
+
+def open_manager(data_dir):
+    """SKCCRosterManager reading the roster and cache in data_dir"""
+    data_path = lambda *parts: os.path.join(data_dir, parts[-1])  # noqa: E731
+    with mock.patch('src.skcc_roster.app_path', side_effect=data_path), \
+            mock.patch('src.skcc_roster.bundled_path', side_effect=data_path):
+        return SKCCRosterManager()
+
+
+def run_case(case, data_dir):
+    """Run one case in this process and return its measurements"""
+    with open(os.path.join(data_dir, 'skcc_roster.csv'), newline='', encoding='utf-8') as f:
+        calls = [row['call'].strip().upper() for row in csv.DictReader(f)]
+
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+    if case == 'csv_dicts':
+        roster = load_csv_dicts(os.path.join(data_dir, 'skcc_roster.csv'))
+        lookup = roster.get
+    else:
+        roster = open_manager(data_dir)
+        lookup = roster.lookup_callsign
+    elapsed = time.perf_counter() - start
+    memory = peak_rss_mb() - baseline
+
+    start = time.perf_counter()
+    found = sum(1 for call in calls if lookup(call))
+    lookup_elapsed = time.perf_counter() - start
+
+    return {
+        'load_ms': round(elapsed * 1000, 1),
+        'rss_mb': round(memory, 1),
+        'rss_after_lookups_mb': round(peak_rss_mb() - baseline, 1),
+        'lookups_per_s': round(len(calls) / lookup_elapsed),
+        'found': found,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--roster', default=os.path.join(ROOT, 'data', 'skcc_roster.csv'))
+    parser.add_argument('--case', choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument('--data', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.data)))
+        return
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        shutil.copyfile(args.roster, os.path.join(data_dir, 'skcc_roster.csv'))
+        if os.path.exists(args.roster + '.meta'):
+            shutil.copyfile(args.roster + '.meta', os.path.join(data_dir, 'skcc_roster.csv.meta'))
+        print(f"{args.roster}: {os.path.getsize(args.roster) / 1024 / 1024:.1f} MB")
+
+        # cache_build leaves the cache that cache_open then opens
+        for case in CASES:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--case', case, '--data', data_dir],
+                check=True, capture_output=True, text=True,
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"  {case:<12} load={result['load_ms']:>8.1f} ms  RSS +{result['rss_mb']:5.1f} MB "
+                  f"(+{result['rss_after_lookups_mb']:5.1f} MB after lookups)  "
+                  f"{result['lookups_per_s']:>9,} lookups/s  ({result['found']} found)")
+
+
+if __name__ == '__main__':
+    main()
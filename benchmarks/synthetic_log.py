@@ -0,0 +1,221 @@
+"""
+Deterministic synthetic SKCC logs for benchmarks
+
+Contacts are drawn from the bundled SKCC roster (data/skcc_roster.csv), so
+callsigns, SKCC numbers, names and states look like a real member log. The
+same count and seed always produce the same contacts, which keeps results
+comparable between runs and releases.
+
+The log can be written as ADIF, ADX (XML ADIF) or Cabrillo; the format
+follows the output file's extension.
+
+Usage:
+    python benchmarks/synthetic_log.py out.adi [--records 10000] [--seed 42]
+    python benchmarks/synthetic_log.py out.adx
+    python benchmarks/synthetic_log.py out.log
+"""
+
+import argparse
+import csv
+import io
+import os
+import random
+import sys
+from xml.sax.saxutils import escape, quoteattr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.adif import ADIFGenerator, iter_adif_fields  # noqa: E402
+
+ROSTER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'data', 'skcc_roster.csv')
+
+# (band, lowest CW frequency in MHz, weight)
+BANDS = [('160M', 1.810, 2), ('80M', 3.530, 8), ('40M', 7.030, 25), ('30M', 10.110, 10),
+         ('20M', 14.040, 30), ('17M', 18.080, 5), ('15M', 21.040, 8), ('12M', 24.900, 2),
+         ('10M', 28.040, 7), ('6M', 50.090, 3)]
+MODES = [('CW', 90), ('SSB', 5), ('FT8', 4), ('RTTY', 1)]
+KEY_TYPES = [('STRAIGHT', 40), ('BUG', 30), ('SIDESWIPER', 15), ('', 15)]
+GRID_FIELDS = 'ABCDEFGHIJKLMNOPQR'
+# DXCC entities whose roster "spc" column is a state or province
+STATE_ENTITIES = {'291', '1', '110', '6'}
+# Contact mode -> Cabrillo mode
+CABRILLO_MODES = {'CW': 'CW', 'SSB': 'PH', 'FT8': 'DG', 'RTTY': 'RY'}
+MY_CALL = 'W4GNS'
+
+
+def load_roster(path=ROSTER_PATH):
+    """
+    Read the members used as synthetic contacts
+
+    Returns:
+        list: (callsign, skcc_number, name, state, dxcc_entity) tuples
+    """
+    members = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            call = row['call'].strip().upper()
+            # Skip deceased (/SK) and former (/EX) members
+            if not call or '/' in call:
+                continue
+            dxcc = row['dxcc'].strip().lstrip('0')
+            state = row['spc'].strip() if dxcc in STATE_ENTITIES else ''
+            members.append((call, row['skcc_number'].strip(), row['name'].strip(), state, dxcc))
+    return members
+
+
+def _weighted(rng_choices, items):
+    """Expand (value, weight) pairs into a choices() function"""
+    values = [item[:-1] if len(item) > 2 else item[0] for item in items]
+    weights = [item[-1] for item in items]
+    return lambda k: rng_choices(values, weights=weights, k=k)
+
+
+def _grid(rng):
+    return (rng.choice(GRID_FIELDS) + rng.choice(GRID_FIELDS)
+            + str(rng.randrange(10)) + str(rng.randrange(10)))
+
+
+def synthetic_contacts(count, seed=42, roster=None):
+    """
+    Generate synthetic contacts as import-ready dictionaries
+
+    QSOs run forward in time from 2010-01-01 at 1-30 minute intervals, so
+    large logs span decades like real ones do.
+
+    Args:
+        count: Number of contacts
+        seed: Random seed
+        roster: Members from load_roster() (loaded on demand)
+
+    Yields:
+        dict: Contact fields keyed by database column
+    """
+    rng = random.Random(seed)
+    members = roster or load_roster()
+    pick_band = _weighted(rng.choices, BANDS)
+    pick_mode = _weighted(rng.choices, MODES)
+    pick_key = _weighted(rng.choices, KEY_TYPES)
+    my_grid = 'FM07'
+
+    minute = 0
+    for _ in range(count):
+        minute += rng.randrange(1, 31)
+        day, minute_of_day = divmod(minute, 24 * 60)
+        year = 2010 + day // 336
+        month = 1 + day % 336 // 28
+        callsign, skcc_number, name, state, dxcc = rng.choice(members)
+        band, base_mhz = pick_band(1)[0]
+        mode = pick_mode(1)[0]
+
+        contact = {
+            'callsign': callsign,
+            'date': f"{year:04d}-{month:02d}-{1 + day % 28:02d}",
+            'time_on': f"{minute_of_day // 60:02d}:{minute_of_day % 60:02d}",
+            'frequency': f"{base_mhz + rng.randrange(40) / 1000:.3f}",
+            'band': band,
+            'mode': mode,
+            'rst_sent': '599' if mode == 'CW' else '59',
+            'rst_rcvd': rng.choice(['599', '579', '559', '449']) if mode == 'CW' else '59',
+            'name': name,
+            'state': state,
+            'dxcc_entity': dxcc,
+            'gridsquare': _grid(rng),
+            'my_gridsquare': my_grid,
+            'power_watts': str(rng.choice([5, 5, 50, 100, 100])),
+        }
+        if mode == 'CW':
+            contact['skcc_number'] = skcc_number
+            contact['my_skcc_number'] = '12345T'
+            contact['key_type'] = pick_key(1)[0]
+            contact['duration_minutes'] = str(rng.randrange(2, 45))
+        if rng.random() < 0.2:
+            contact['comment'] = rng.choice(['Nice fist', 'QSB', 'Sked', 'Rag chew', 'POTA'])
+        yield contact
+
+
+def write_synthetic_adif(path, count, seed=42):
+    """
+    Write a synthetic log as an ADIF file with SKCCLogger APP_ fields
+
+    Returns:
+        int: Records written
+    """
+    ADIFGenerator().generate_file(path, synthetic_contacts(count, seed))
+    return count
+
+
+def write_synthetic_adx(path, count, seed=42):
+    """
+    Write the same log as write_synthetic_adif() as an ADX (XML ADIF) file
+
+    APP_<PROGRAM>_<FIELD> fields become <APP PROGRAMID=... FIELDNAME=...>.
+
+    Returns:
+        int: Records written
+    """
+    generator = ADIFGenerator()
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n<ADX>\n<HEADER>\n'
+                f'<ADIF_VER>{generator.version}</ADIF_VER>\n'
+                '<PROGRAMID>W4GNS Synthetic Log</PROGRAMID>\n</HEADER>\n<RECORDS>\n')
+        for record in generator.iter_records(synthetic_contacts(count, seed)):
+            f.write('<RECORD>')
+            for fields in iter_adif_fields(io.StringIO(record)):
+                for name, data in fields:
+                    if name.startswith('APP_'):
+                        _, program, field = name.split('_', 2)
+                        f.write(f'<APP PROGRAMID={quoteattr(program)} FIELDNAME={quoteattr(field)} '
+                                f'TYPE="S">{escape(data)}</APP>')
+                    else:
+                        f.write(f'<{name}>{escape(data)}</{name}>')
+            f.write('</RECORD>\n')
+        f.write('</RECORDS>\n</ADX>\n')
+    return count
+
+
+def write_synthetic_cabrillo(path, count, seed=42):
+    """
+    Write the synthetic log as a Cabrillo SKCC contest log
+
+    The exchange is RST, SPC, name and SKCC number. Contacts without an SKCC
+    number (the non-CW ones) send NONE, which the importer keeps in the comment.
+
+    Returns:
+        int: Records written
+    """
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"START-OF-LOG: 3.0\nCONTEST: SKCC-WES\nCALLSIGN: {MY_CALL}\n"
+                "CREATED-BY: W4GNS Synthetic Log\n")
+        for contact in synthetic_contacts(count, seed):
+            khz = round(float(contact['frequency']) * 1000)
+            name = (contact['name'] or 'OM').split()[0]
+            f.write(
+                f"QSO: {khz:>5} {CABRILLO_MODES[contact['mode']]} {contact['date']} "
+                f"{contact['time_on'].replace(':', '')} {MY_CALL:<13} {contact['rst_sent']:<3} "
+                f"GA  GARY  12345T {contact['callsign']:<13} {contact['rst_rcvd']:<3} "
+                f"{contact['state'] or 'DX':<3} {name:<10} {contact.get('skcc_number') or 'NONE'}\n"
+            )
+        f.write("END-OF-LOG:\n")
+    return count
+
+
+WRITERS = {'.adx': write_synthetic_adx, '.log': write_synthetic_cabrillo,
+           '.cbr': write_synthetic_cabrillo}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output')
+    parser.add_argument('--records', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    writer = WRITERS.get(os.path.splitext(args.output)[1].lower(), write_synthetic_adif)
+    writer(args.output, args.records, args.seed)
+    print(f"Wrote {args.records} records to {args.output} "
+          f"({os.path.getsize(args.output) / 1024 / 1024:.1f} MB)")
+
+
+if __name__ == '__main__':
+    main()
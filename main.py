@@ -6,10 +6,10 @@ Amateur Radio Contact Logging and DX Cluster Integration
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import multiprocessing
 import threading
 import sys
 import os
-import sqlite3
 
 # Add src directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -28,7 +28,18 @@ from src.gui.contest_tab import ContestTab
 from src.gui.date_range_dialog import DateRangeDialog
 from src.gui.monthly_brag_dialog import MonthlyBragDialog
 from src.gui.help_dialog import HelpDialog
-from src.adif import export_contacts_to_adif, import_contacts_from_adif, validate_adif_file
+from src.adif import (
+    export_contacts_to_adif,
+    validate_adif_file,
+)
+from src.adif_backup import (
+    FULL_SNAPSHOT_DAYS,
+    JOURNAL_MAX_RECORDS,
+    backup_adif,
+    journal_path_for,
+)
+from src.import_pipeline import file_digest, find_import_checkpoint, import_log_file
+from src.log_formats import ADIF_FORMAT, detect_log_format
 from src.app_paths import app_path
 
 
@@ -46,7 +57,13 @@ class W4GNSLogger:
         self.root.geometry(f"{width}x{height}")
 
         # Initialize database
-        self.database = Database()
+        self.database = Database(durability=self.config.get('database.durability', 'safe'))
+        self.database.configure_spot_writer(
+            batch_size=self.config.get('dx_cluster.spot_batch_size', 50),
+            flush_interval_ms=self.config.get('dx_cluster.spot_flush_ms', 500),
+            max_age_hours=self.config.get('dx_cluster.spot_retention_hours', 24),
+            max_rows=self.config.get('dx_cluster.spot_max_rows', 20000),
+        )
 
         # Initialize theme manager
         self.theme_manager = ThemeManager(self.root, self.config)
@@ -105,7 +122,7 @@ class W4GNSLogger:
         file_menu.add_command(label="Export Log (ADIF)...", command=self.export_adif)
         file_menu.add_command(label="Export by Date/Time Range (ADIF)...", command=self.export_adif_by_date_range)
         file_menu.add_command(label="Export SKCC Contacts (ADIF)...", command=self.export_skcc_adif)
-        file_menu.add_command(label="Import Log (ADIF)...", command=self.import_adif)
+        file_menu.add_command(label="Import Log (ADIF/ADX/Cabrillo)...", command=self.import_adif)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.on_closing)
 
@@ -209,21 +226,18 @@ class W4GNSLogger:
             # Update progress (main loop is guaranteed to be running)
             self.root.after(0, lambda: progress_label.config(text="Loading contacts from database..."))
 
-            # Get all contacts from database
-            contacts = self.database.get_all_contacts(limit=999999)
+            # Count first so the export itself can stream from the database
+            contact_count = self.database.count_contacts()
 
-            if not contacts:
+            if not contact_count:
                 self.root.after(0, lambda: self._export_no_contacts(progress_dialog))
                 return
 
-            contacts_list = list(contacts)
-            contact_count = len(contacts_list)
-
             # Update progress
             self.root.after(0, lambda: progress_label.config(text=f"Exporting {contact_count} contacts..."))
 
             # Export to ADIF
-            export_contacts_to_adif(contacts_list, filename)
+            contact_count = export_contacts_to_adif(self.database.iter_contacts(), filename)
 
             # Schedule success message on main thread
             self.root.after(0, lambda: self._export_success(progress_dialog, contact_count, filename))
@@ -332,20 +346,21 @@ class W4GNSLogger:
     def export_skcc_adif(self):
         """Export SKCC contacts only to ADIF format"""
         # Get SKCC contacts from database (contacts with SKCC numbers)
-        cursor = self.database.conn.cursor()
-        cursor.execute('''
-            SELECT
-                callsign, date, time_on, time_off, frequency, band, mode,
-                rst_sent, rst_rcvd, power, name, qth, gridsquare, county,
-                state, country, continent, cq_zone, itu_zone, dxcc,
-                my_gridsquare, comment, skcc_number, my_skcc_number,
-                dxcc_entity
-            FROM contacts
-            WHERE skcc_number IS NOT NULL AND skcc_number != ''
-            ORDER BY date, time_on
-        ''')
-
-        contacts = cursor.fetchall()
+        with self.database.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT
+                    callsign, date, time_on, time_off, frequency, band, mode,
+                    rst_sent, rst_rcvd, power, name, qth, gridsquare, county,
+                    state, country, continent, cq_zone, itu_zone, dxcc,
+                    my_gridsquare, comment, skcc_number, my_skcc_number,
+                    dxcc_entity
+                FROM contacts
+                WHERE skcc_number IS NOT NULL AND skcc_number != ''
+                ORDER BY date, time_on
+            ''')
+
+            contacts = cursor.fetchall()
 
         if not contacts:
             messagebox.showwarning(
@@ -515,44 +530,69 @@ class W4GNSLogger:
             messagebox.showerror("Export Failed", f"Failed to export SKCC contacts:\n{str(e)}")
 
     def import_adif(self):
-        """Import contacts from ADIF format"""
+        """Import contacts from an ADIF, ADX or Cabrillo log"""
         # Ask user for file to import
         filename = filedialog.askopenfilename(
             filetypes=[
+                ("Log files", "*.adi *.adif *.adx *.log *.cbr"),
                 ("ADIF files", "*.adi"),
                 ("ADIF files", "*.adif"),
+                ("ADX (XML ADIF) files", "*.adx"),
+                ("Cabrillo files", "*.log *.cbr"),
                 ("All files", "*.*")
             ],
-            title="Import Log from ADIF"
+            title="Import Log"
         )
 
         if not filename:
             return  # User cancelled
 
         try:
-            # Validate ADIF file
-            is_valid, message = validate_adif_file(filename)
-            if not is_valid:
-                messagebox.showerror("Invalid ADIF File", message)
-                return
-
-            # Import contacts
-            contacts = import_contacts_from_adif(filename)
-
-            if not contacts:
-                messagebox.showwarning("No Contacts", "No contacts found in ADIF file.")
+            log_format = detect_log_format(filename)
+            if log_format is ADIF_FORMAT:
+                # Validate ADIF file
+                is_valid, message = validate_adif_file(filename)
+                if not is_valid:
+                    messagebox.showerror("Invalid ADIF File", message)
+                    return
+
+            # Count records without decoding them
+            record_count = log_format.count_records(filename)
+            if not record_count:
+                messagebox.showerror(f"Invalid {log_format.name} File",
+                                     f"No contact records found in {log_format.name} file")
                 return
 
-            # Ask for confirmation
-            response = messagebox.askyesno(
-                "Confirm Import",
-                f"Found {len(contacts)} contacts in file.\n\n"
-                f"Import these contacts into your log?\n\n"
-                f"Note: Duplicates within 10 minutes will be skipped."
-            )
+            # An earlier import of this file may have been interrupted
+            file_hash = None
+            checkpoint = None
+            if log_format is ADIF_FORMAT:
+                file_hash = file_digest(filename)
+                checkpoint = find_import_checkpoint(self.database, filename, file_hash)
+
+            if checkpoint:
+                response = messagebox.askyesnocancel(
+                    "Resume Import",
+                    f"A previous import of this file stopped after "
+                    f"{checkpoint['record_index']} of {record_count} contacts.\n\n"
+                    f"Yes: continue from there\n"
+                    f"No: start over (contacts already imported are skipped as duplicates)"
+                )
+                if response is None:
+                    return
+                resume = response
+            else:
+                # Ask for confirmation
+                response = messagebox.askyesno(
+                    "Confirm Import",
+                    f"Found {record_count} contacts in file.\n\n"
+                    f"Import these contacts into your log?\n\n"
+                    f"Note: Duplicates within 10 minutes will be skipped."
+                )
 
-            if not response:
-                return
+                if not response:
+                    return
+                resume = False
 
             # Create progress dialog
             progress_window = tk.Toplevel(self.root)
@@ -581,13 +621,16 @@ class W4GNSLogger:
                 progress_detail.config(text=f"{current} / {total}")
                 progress_window.update()
 
-            # Use fast batch import method
+            # Parse, enrich and insert in overlapping stages
             try:
-                result = self.database.add_contacts_batch(
-                    contacts,
+                result = import_log_file(
+                    self.database,
+                    filename,
                     skip_duplicates=True,
                     window_minutes=10,
-                    progress_callback=update_progress
+                    progress_callback=update_progress,
+                    resume=resume,
+                    file_hash=file_hash
                 )
 
                 imported_count = result['imported']
@@ -677,75 +720,55 @@ https://www.ng3k.com/Misc/cluster.html
                     os.remove(old_file)
                     print(f"Deleted old backup: {os.path.basename(old_file)}")
 
-            # Delete old ADIF backups (keep only most recent 5)
+            # Delete old ADIF backups and their journals (keep only most recent 5)
             if len(adif_files) > keep_count:
                 for old_file in adif_files[keep_count:]:
                     os.remove(old_file)
                     print(f"Deleted old backup: {os.path.basename(old_file)}")
+                    journal_file = journal_path_for(old_file)
+                    if os.path.exists(journal_file):
+                        os.remove(journal_file)
 
         except Exception as e:
             print(f"Error cleaning up old backups: {e}")
 
     def backup_on_shutdown(self):
-        """Backup log to local and external locations on shutdown"""
-        try:
-            from datetime import datetime
+        """
+        Bring the local and external ADIF backups up to date on shutdown
 
+        The .db copy is written with each full snapshot (every
+        backup.full_snapshot_days, default weekly, or after deletions), not on
+        every exit; exits in between only append changed contacts to the
+        ADIF journal.
+        """
+        try:
             # Check if database connection is still open
             if not self.database or not self.database.conn:
                 print("Database connection is closed, skipping shutdown backup")
                 return
 
-            # Get all contacts
-            contacts = self.database.get_all_contacts(limit=999999)
-
-            if not contacts:
+            if not self.database.count_contacts():
                 return  # Nothing to backup
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            adif_filename = f"w4gns_log_{timestamp}.adi"
-            db_filename = f"w4gns_log_{timestamp}.db"
+            # Only contacts changed since the last backup are journaled; a full
+            # ADIF snapshot and database copy are written periodically
+            full_snapshot_days = self.config.get('backup.full_snapshot_days', FULL_SNAPSHOT_DAYS)
+            journal_max_records = self.config.get('backup.journal_max_records', JOURNAL_MAX_RECORDS)
 
-            # Always backup to local logs directory
-            logs_dir = app_path("logs")
-            os.makedirs(logs_dir, exist_ok=True)
-
-            # Backup ADIF
-            local_adif_path = os.path.join(logs_dir, adif_filename)
-            export_contacts_to_adif(contacts, local_adif_path)
-            print(f"Backed up {len(contacts)} contacts to {local_adif_path}")
-
-            # Backup database using SQLite's backup API (prevents corruption)
-            local_db_path = os.path.join(logs_dir, db_filename)
-            if self.database and self.database.conn:
-                backup_conn = sqlite3.connect(local_db_path)
-                with backup_conn:
-                    self.database.conn.backup(backup_conn)
-                backup_conn.close()
-                print(f"Backed up database to {local_db_path}")
-
-            # Clean up old backups in local logs directory (keep last 5)
-            self.cleanup_old_backups(logs_dir, keep_count=5)
-
-            # Backup to external path if configured
+            directories = [app_path("logs")]
             external_path = str(self.config.get('backup.external_path', '')).strip()
             if external_path and os.path.exists(external_path):
-                # Backup ADIF to external
-                external_adif_file = os.path.join(external_path, adif_filename)
-                export_contacts_to_adif(contacts, external_adif_file)
-                print(f"Also backed up ADIF to {external_adif_file}")
-
-                # Backup database to external using SQLite's backup API
-                external_db_file = os.path.join(external_path, db_filename)
-                if self.database and self.database.conn:
-                    backup_conn = sqlite3.connect(external_db_file)
-                    with backup_conn:
-                        self.database.conn.backup(backup_conn)
-                    backup_conn.close()
-                    print(f"Also backed up database to {external_db_file}")
-
-                # Clean up old backups in external directory (keep last 5)
-                self.cleanup_old_backups(external_path, keep_count=5)
+                directories.append(external_path)
+
+            for directory in directories:
+                result = backup_adif(self.database, directory, full_snapshot_days,
+                                     journal_max_records)
+                if result['mode'] == 'full':
+                    print(f"Backed up {result['written']} contacts to {result['path']}")
+                    # Clean up old backups (keep last 5)
+                    self.cleanup_old_backups(directory, keep_count=5)
+                elif result['mode'] == 'journal':
+                    print(f"Journaled {result['written']} changed contacts to {result['path']}")
 
         except Exception as e:
             print(f"Error during shutdown backup: {e}")
@@ -792,42 +815,37 @@ https://www.ng3k.com/Misc/cluster.html
 
     def download_skcc_rosters_background(self):
         """
-        Download SKCC award rosters in background thread.
+        Refresh SKCC award rosters in a background thread, now and daily.
 
         These rosters are needed for Tribune and Senator award validation.
         They contain the dates when members achieved each award level.
+        Validation uses the rosters stored locally until a download completes.
         """
-        import threading
-
-        def download_rosters():
-            try:
-                from src.skcc_award_rosters import get_award_roster_manager
-
-                roster_mgr = get_award_roster_manager(database=self.database)
-
-                # Download all rosters fresh on every startup for precise validation
-                results = roster_mgr.download_all_rosters(force=True)
-
-                # Log results
-                success_count = sum(1 for success in results.values() if success)
-                if success_count > 0:
-                    print(f"SKCC Rosters: Downloaded/loaded {success_count}/3 rosters")
-
-                    # Show roster info
-                    roster_info = roster_mgr.get_roster_info()
-                    for award_type, info in roster_info.items():
-                        if info['loaded']:
-                            print(f"  {award_type.title()}: {info['count']} members (age: {info['age_days']} days)")
-                else:
-                    print("SKCC Rosters: Failed to download rosters (will use fallback validation)")
+        from src.skcc_award_rosters import get_award_roster_manager
+
+        def report(results):
+            # Log results
+            success_count = sum(1 for success in results.values() if success)
+            if success_count > 0:
+                print(f"SKCC Rosters: Downloaded/loaded {success_count}/3 rosters")
+
+                # Show roster info
+                roster_info = roster_mgr.get_roster_info()
+                for award_type, info in roster_info.items():
+                    if info['loaded']:
+                        print(f"  {award_type.title()}: {info['count']} members (age: {info['age_days']} days)")
+            else:
+                print("SKCC Rosters: Failed to download rosters (will use fallback validation)")
 
-            except Exception as e:
-                print(f"SKCC Rosters: Error downloading rosters: {e}")
-                print("  Tribune/Senator validation will use fallback mode (T/S suffix)")
+        try:
+            # Loads the stored rosters (local only) so lookups work right away
+            roster_mgr = get_award_roster_manager(database=self.database)
 
-        # Start download in background thread
-        thread = threading.Thread(target=download_rosters, daemon=True)
-        thread.start()
+            # Download all rosters fresh on every startup for precise validation
+            roster_mgr.start_background_refresh(force=True, callback=report)
+        except Exception as e:
+            print(f"SKCC Rosters: Error starting roster refresh: {e}")
+            print("  Tribune/Senator validation will use fallback mode (T/S suffix)")
 
     def on_closing(self):
         """Handle window closing"""
@@ -861,4 +879,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Import worker processes re-run this module in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
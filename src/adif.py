@@ -3,12 +3,193 @@ ADIF (Amateur Data Interchange Format) Parser and Generator
 Supports ADIF 3.x format for import/export of contact logs
 """
 
+import gzip
+import io
+import mmap
 import re
+import sqlite3
+from array import array
 from datetime import datetime, timezone
 
+# Characters read from the file per tokenizer refill
+ADIF_CHUNK_SIZE = 64 * 1024
+
+# ADIF tag: <FIELD_NAME:LENGTH:TYPE>, <FIELD_NAME:LENGTH> or <EOR>/<EOH>
+_TAG_PATTERN = re.compile(r'<([A-Za-z0-9_]+)(?::(\d+)(?::[^<>]*)?)?>')
+_BYTES_TAG_PATTERN = re.compile(rb'<([A-Za-z0-9_]+)(?::(\d+)(?::[^<>]*)?)?>')
+_BYTES_EOH_PATTERN = re.compile(rb'<eoh>', re.IGNORECASE)
+_BYTES_EOR_PATTERN = re.compile(rb'<eor>', re.IGNORECASE)
+# What must follow a real <EOR>: the next tag or end of file
+_BYTES_AFTER_EOR_PATTERN = re.compile(rb'\s*(?:<|\Z)')
+
+# Map ADIF fields to our database fields
+ADIF_FIELD_MAP = {
+    'CALL': 'callsign',
+    'QSO_DATE': 'date',
+    'TIME_ON': 'time_on',
+    'TIME_OFF': 'time_off',
+    'FREQ': 'frequency',
+    'BAND': 'band',
+    'MODE': 'mode',
+    'RST_SENT': 'rst_sent',
+    'RST_RCVD': 'rst_rcvd',
+    'TX_PWR': 'power',
+    'NAME': 'name',
+    'QTH': 'qth',
+    'GRIDSQUARE': 'gridsquare',
+    'CNTY': 'county',
+    'STATE': 'state',
+    'COUNTRY': 'country',
+    'CONT': 'continent',
+    'CQZ': 'cq_zone',
+    'ITUZ': 'itu_zone',
+    'DXCC': 'dxcc',
+    'IOTA': 'iota',
+    'SOTA_REF': 'sota',
+    'POTA_REF': 'pota',
+    'MY_GRIDSQUARE': 'my_gridsquare',
+    'COMMENT': 'comment',
+    'NOTES': 'notes',
+    # SKCC-specific fields (user-defined ADIF fields with APP_ prefix)
+    'APP_SKCC_NUMBER': 'skcc_number',
+    'APP_SKCC_MY_NUMBER': 'my_skcc_number',
+    'APP_SKCC_KEY_TYPE': 'key_type',
+    'APP_SKCC_DURATION': 'duration_minutes',
+    'APP_SKCC_DISTANCE': 'distance_miles',
+    'APP_SKCC_DISTANCE_NM': 'distance_nm',
+    'APP_SKCC_POWER': 'power_watts',
+    'APP_SKCC_THEIR_POWER': 'their_power_watts',
+    'APP_SKCC_MPW_DISTANCE': 'distance_miles',
+    'APP_SKCC_DISTANCE_MILES': 'distance_miles',
+    'APP_SKCC_DISTANCE_SOURCE': 'distance_source',
+    'APP_SKCC_SITE': 'site',
+    'APP_SKCC_ANTENNA': 'antenna',
+    'APP_SKCC_SATELLITE': 'is_satellite',
+    # SKCC Logger-specific fields (uses different naming)
+    'SKCC': 'skcc_number',  # SKCC Logger uses this field name
+    'APP_SKCCLOGGER_KEYTYPE': 'key_type',
+    'APP_SKCCLOGGER_NUMBER': 'skcc_number',
+    'DXCC_ENTITY': 'dxcc_entity',
+    # Contact ID written by ADIF backups (see ADIFGenerator include_contact_id)
+    'APP_W4GNS_CONTACT_ID': 'id'
+}
+
+# SKCC Logger abbreviated key codes
+KEY_TYPE_CODES = {
+    'BG': 'BUG',
+    'SK': 'STRAIGHT',
+    'ST': 'STRAIGHT',  # Support both SK and ST for straight key
+    'SS': 'SIDESWIPER',
+    # Also support full names if already present
+    'BUG': 'BUG',
+    'STRAIGHT': 'STRAIGHT',
+    'SIDESWIPER': 'SIDESWIPER'
+}
+
+
+def iter_adif_fields(stream, chunk_size=ADIF_CHUNK_SIZE):
+    """
+    Tokenize ADIF text into records without reading the whole file
+
+    The stream is read in fixed-size chunks. Each tag's length prefix says
+    exactly how much data follows, so field data may contain '<' and tags or
+    data may straddle a chunk boundary. Header fields (everything before
+    <EOH>) are dropped.
+
+    Args:
+        stream: Text file object (or io.StringIO)
+        chunk_size: Characters read per refill
+
+    Yields:
+        list: (FIELD_NAME, data) pairs of one record, field names upper-cased
+    """
+    buffer = ''
+    pos = 0
+    eof = False
+    fields = []
+
+    while True:
+        match = _TAG_PATTERN.search(buffer, pos)
+        if match is None:
+            if eof:
+                break
+            # Keep a possibly incomplete tag at the end of the buffer
+            tail = buffer.rfind('<', pos)
+            if tail == -1 or '>' in buffer[tail:]:
+                tail = len(buffer)
+            chunk = stream.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[tail:] + chunk
+            pos = 0
+            continue
+
+        name = match.group(1).upper()
+        length = match.group(2)
+
+        if length is None:
+            pos = match.end()
+            if name == 'EOR':
+                if fields:
+                    yield fields
+                fields = []
+            elif name == 'EOH':
+                fields = []
+            continue
+
+        data_start = match.end()
+        data_end = data_start + int(length)
+        if data_end > len(buffer) and not eof:
+            # Data runs past the buffer: drop what is consumed, then refill
+            buffer = buffer[data_start:]
+            data_start, data_end = 0, int(length)
+            while data_end > len(buffer) and not eof:
+                chunk = stream.read(max(chunk_size, data_end - len(buffer)))
+                eof = not chunk
+                buffer += chunk
+        fields.append((name, buffer[data_start:data_end]))
+        pos = data_end
+
+    # Trailing record without <EOR>
+    if fields:
+        yield fields
+
+
+def _translate_key_type(code):
+    """Translate an SKCC Logger key code (BG, SK/ST, SS) to its full name"""
+    return KEY_TYPE_CODES.get(code.upper().strip(), code)
+
+
+def _convert_field(field_name, field_data):
+    """Convert raw ADIF field data to the format stored in the database"""
+    # Format date from YYYYMMDD to YYYY-MM-DD
+    if field_name == 'QSO_DATE' and len(field_data) == 8:
+        field_data = f"{field_data[:4]}-{field_data[4:6]}-{field_data[6:8]}"
+
+    # Format time from HHMM or HHMMSS to HH:MM
+    elif field_name in ('TIME_ON', 'TIME_OFF') and field_data:
+        if len(field_data) >= 4:
+            field_data = f"{field_data[:2]}:{field_data[2:4]}"
+
+    # Translate SKCC Logger abbreviated key codes to full names
+    elif field_name in ('APP_SKCCLOGGER_KEYTYPE', 'APP_SKCC_KEY_TYPE'):
+        field_data = _translate_key_type(field_data)
+
+    return field_data.strip()
+
+
+def _contact_from_fields(fields):
+    """Map tokenized (FIELD_NAME, data) pairs to a contact dictionary, or None"""
+    contact = {}
+    for field_name, field_data in fields:
+        db_field = ADIF_FIELD_MAP.get(field_name)
+        if db_field is not None:
+            contact[db_field] = _convert_field(field_name, field_data)
+
+    return contact if contact else None
+
 
 class ADIFParser:
-    """Parse ADIF files and extract contact records with lazy parsing for performance"""
+    """Parse ADIF files and extract contact records, streaming them from disk"""
 
     def __init__(self, filename=None, lazy=True):
         """
@@ -16,73 +197,29 @@ class ADIFParser:
 
         Args:
             filename: Optional ADIF file to parse
-            lazy: If True, parse records on-demand; if False, parse all upfront
+            lazy: If True, stream records on demand; if False, parse all upfront
         """
         self.filename = filename
         self.lazy = lazy
         self._records = None  # Cached parsed records
-        self._raw_content = None  # Raw file content for lazy parsing
-        self._record_strings = None  # Split records for lazy parsing
-
-        if filename:
-            if lazy:
-                self._load_raw_content()
-            else:
-                self._records = self.parse_file(filename)
+        self._count = None  # Record count from a streaming pass
 
-    def _load_raw_content(self):
-        """Load raw file content for lazy parsing"""
-        if not self.filename:
-            return
-
-        with open(self.filename, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-
-        # Find the end of header marker
-        eoh_match = re.search(r'<eoh>|<EOH>', content, re.IGNORECASE)
-        if eoh_match:
-            content = content[eoh_match.end():]
-
-        # Split into record strings (but don't parse yet)
-        self._record_strings = [
-            rec.strip() for rec in re.split(r'<eor>|<EOR>', content, flags=re.IGNORECASE)
-            if rec.strip()
-        ]
+        if filename and not lazy:
+            self._records = self.parse_file(filename)
 
     @property
     def records(self):
         """Lazy property that parses records on first access"""
         if self._records is None:
-            if self._record_strings is not None:
-                # Lazy parse from cached record strings
-                self._records = []
-                for rec in self._record_strings:
-                    contact = self._parse_record(rec)
-                    if contact:
-                        self._records.append(contact)
+            if self.filename:
+                self._records = self.parse_file(self.filename)
             else:
                 self._records = []
         return self._records
 
     def parse_file(self, filename):
         """Parse an ADIF file and return list of contact records (non-lazy)"""
-        with open(filename, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
-
-        # Find the end of header marker
-        eoh_match = re.search(r'<eoh>|<EOH>', content, re.IGNORECASE)
-        if eoh_match:
-            content = content[eoh_match.end():]
-
-        # Split into records (each record ends with <eor>)
-        records = re.split(r'<eor>|<EOR>', content, flags=re.IGNORECASE)
-
-        contacts = []
-        for record in records:
-            if record.strip():
-                contact = self._parse_record(record)
-                if contact:
-                    contacts.append(contact)
+        contacts = list(self._iter_file(filename))
 
         # Store records for iteration (update internal cache)
         if filename == self.filename:
@@ -102,126 +239,31 @@ class ADIFParser:
             >>> for contact in parser.iter_records():
             ...     print(contact['callsign'])
         """
-        if self._record_strings:
-            # Lazy parsing from cached strings
-            for rec_str in self._record_strings:
-                contact = self._parse_record(rec_str)
-                if contact:
-                    yield contact
-        elif self._records:
+        if self._records is not None:
             # Already parsed, just iterate
             yield from self._records
         elif self.filename:
-            # Parse on-the-fly without caching
-            with open(self.filename, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-
-            eoh_match = re.search(r'<eoh>|<EOH>', content, re.IGNORECASE)
-            if eoh_match:
-                content = content[eoh_match.end():]
+            yield from self._iter_file(self.filename)
 
-            records = re.split(r'<eor>|<EOR>', content, flags=re.IGNORECASE)
-
-            for record in records:
-                if record.strip():
-                    contact = self._parse_record(record)
-                    if contact:
-                        yield contact
+    def _iter_file(self, filename):
+        """Stream contact records from an ADIF file"""
+        with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+            for fields in iter_adif_fields(f):
+                contact = self._contact_from_fields(fields)
+                if contact:
+                    yield contact
 
     def _parse_record(self, record):
         """Parse a single ADIF record"""
-        # ADIF field format: <FIELD_NAME:LENGTH:TYPE>DATA
-        # Type is optional, most common is just <FIELD_NAME:LENGTH>DATA
-        pattern = re.compile(r'<([A-Za-z0-9_]+):(\d+)(?::[^>]*)?>', re.IGNORECASE)
-
         contact = {}
-        pos = 0
-        while True:
-            match = pattern.search(record, pos)
-            if not match:
-                break
-
-            field_name = match.group(1).upper()
-            field_length = int(match.group(2))
-            data_start = match.end()
-            data_end = data_start + field_length
-            field_data = record[data_start:data_end]
-            pos = data_end
-
-            # Map ADIF fields to our database fields
-            field_map = {
-                'CALL': 'callsign',
-                'QSO_DATE': 'date',
-                'TIME_ON': 'time_on',
-                'TIME_OFF': 'time_off',
-                'FREQ': 'frequency',
-                'BAND': 'band',
-                'MODE': 'mode',
-                'RST_SENT': 'rst_sent',
-                'RST_RCVD': 'rst_rcvd',
-                'TX_PWR': 'power',
-                'NAME': 'name',
-                'QTH': 'qth',
-                'GRIDSQUARE': 'gridsquare',
-                'CNTY': 'county',
-                'STATE': 'state',
-                'COUNTRY': 'country',
-                'CONT': 'continent',
-                'CQZ': 'cq_zone',
-                'ITUZ': 'itu_zone',
-                'DXCC': 'dxcc',
-                'IOTA': 'iota',
-                'SOTA_REF': 'sota',
-                'POTA_REF': 'pota',
-                'MY_GRIDSQUARE': 'my_gridsquare',
-                'COMMENT': 'comment',
-                'NOTES': 'notes',
-                # SKCC-specific fields (user-defined ADIF fields with APP_ prefix)
-                'APP_SKCC_NUMBER': 'skcc_number',
-                'APP_SKCC_MY_NUMBER': 'my_skcc_number',
-                'APP_SKCC_KEY_TYPE': 'key_type',
-                'APP_SKCC_DURATION': 'duration_minutes',
-                'APP_SKCC_DISTANCE': 'distance_miles',
-                'APP_SKCC_DISTANCE_NM': 'distance_nm',
-                'APP_SKCC_POWER': 'power_watts',
-                'APP_SKCC_THEIR_POWER': 'their_power_watts',
-                'APP_SKCC_MPW_DISTANCE': 'distance_miles',
-                'APP_SKCC_DISTANCE_MILES': 'distance_miles',
-                'APP_SKCC_DISTANCE_SOURCE': 'distance_source',
-                'APP_SKCC_SITE': 'site',
-                'APP_SKCC_ANTENNA': 'antenna',
-                'APP_SKCC_SATELLITE': 'is_satellite',
-                # SKCC Logger-specific fields (uses different naming)
-                'SKCC': 'skcc_number',  # SKCC Logger uses this field name
-                'APP_SKCCLOGGER_KEYTYPE': 'key_type',
-                'APP_SKCCLOGGER_NUMBER': 'skcc_number',
-                'DXCC_ENTITY': 'dxcc_entity'
-            }
-
-            if field_name in field_map:
-                db_field = field_map[field_name]
-
-                # Format date from YYYYMMDD to YYYY-MM-DD
-                if field_name == 'QSO_DATE' and len(field_data) == 8:
-                    field_data = f"{field_data[:4]}-{field_data[4:6]}-{field_data[6:8]}"
-
-                # Format time from HHMM or HHMMSS to HH:MM
-                elif field_name in ('TIME_ON', 'TIME_OFF') and field_data:
-                    if len(field_data) >= 4:
-                        field_data = f"{field_data[:2]}:{field_data[2:4]}"
-
-                # Convert frequency from MHz to display format
-                elif field_name == 'FREQ':
-                    field_data = field_data  # Keep as-is
-
-                # Translate SKCC Logger abbreviated key codes to full names
-                elif field_name in ('APP_SKCCLOGGER_KEYTYPE', 'APP_SKCC_KEY_TYPE') and db_field == 'key_type':
-                    field_data = self._translate_key_type(field_data)
-
-                contact[db_field] = field_data.strip() if field_data is not None else ''
-
+        for fields in iter_adif_fields(io.StringIO(record)):
+            contact.update(self._contact_from_fields(fields) or {})
         return contact if contact else None
 
+    def _contact_from_fields(self, fields):
+        """Map tokenized (FIELD_NAME, data) pairs to a contact dictionary"""
+        return _contact_from_fields(fields)
+
     def _translate_key_type(self, code):
         """
         Translate SKCC Logger abbreviated key codes to full names
@@ -237,42 +279,30 @@ class ADIFParser:
         Returns:
             Full key type name (STRAIGHT, BUG, SIDESWIPER) or original if unrecognized
         """
-        code_map = {
-            'BG': 'BUG',
-            'SK': 'STRAIGHT',
-            'ST': 'STRAIGHT',  # Support both SK and ST for straight key
-            'SS': 'SIDESWIPER',
-            # Also support full names if already present
-            'BUG': 'BUG',
-            'STRAIGHT': 'STRAIGHT',
-            'SIDESWIPER': 'SIDESWIPER'
-        }
-
-        return code_map.get(code.upper().strip(), code)
+        return _translate_key_type(code)
 
     # Python data model methods for iterator protocol
     def __iter__(self):
-        """Enable iteration: for contact in parser: (uses lazy parsing if available)"""
-        if self.lazy and (self._record_strings is not None or self.filename):
+        """Enable iteration: for contact in parser: (streams from disk when lazy)"""
+        if self.lazy and self._records is None and self.filename:
             return self.iter_records()
         return iter(self.records)
 
     def __len__(self):
-        """Enable len(): len(parser) (forces parsing if lazy)"""
-        if self._record_strings and self._records is None:
-            # Return count without full parsing
-            return len(self._record_strings)
-        return len(self.records)
+        """Enable len(): len(parser) (counts in a streaming pass when lazy)"""
+        if self._records is not None:
+            return len(self._records)
+        if self._count is None:
+            self._count = sum(1 for _ in self.iter_records())
+        return self._count
 
     def __repr__(self):
         """Developer-friendly representation"""
         mode = "lazy" if self.lazy else "eager"
         if self._records is not None:
-            count = len(self._records)
-            status = f"parsed={count}"
-        elif self._record_strings is not None:
-            count = len(self._record_strings)
-            status = f"unparsed={count}"
+            status = f"parsed={len(self._records)}"
+        elif self.filename:
+            status = "unparsed"
         else:
             status = "empty"
 
@@ -281,50 +311,352 @@ class ADIFParser:
         return f"<ADIFParser({status}, mode={mode})>"
 
 
+class ADIFRecordView:
+    """
+    One record of a MappedADIFReader, decoded on access
+
+    Reads like the contact dict ADIFParser produces (``view['callsign']``,
+    ``view.get('band')``, ``keys()``, ``to_dict()``), but the record's tags are
+    only located on first access and each field is decoded when it is read.
+    """
+
+    __slots__ = ('_reader', '_start', '_end', '_spans')
+
+    def __init__(self, reader, start, end):
+        self._reader = reader
+        self._start = start
+        self._end = end
+        self._spans = None  # db field -> (ADIF name, data start, length, bound)
+
+    def _index_fields(self):
+        mm = self._reader._mm
+        spans = {}
+        pending = None
+        pos = self._start
+        while True:
+            match = _BYTES_TAG_PATTERN.search(mm, pos, self._end)
+            if pending is not None:
+                spans[pending[0]] = pending[1:] + (match.start() if match else self._end,)
+                pending = None
+            if match is None:
+                break
+            pos = match.end()
+            if match.group(2) is None:
+                continue
+            name = match.group(1).decode('ascii').upper()
+            length = int(match.group(2))
+            db_field = ADIF_FIELD_MAP.get(name)
+            if db_field is not None:
+                pending = (db_field, name, pos, length)
+            pos += length
+        self._spans = spans
+
+    def raw(self, db_field):
+        """Decoded field data before conversion, or None if the field is absent"""
+        if self._spans is None:
+            self._index_fields()
+        span = self._spans.get(db_field)
+        if span is None:
+            return None
+        _, data_start, length, bound = span
+        data = self._reader._mm[data_start:data_start + length]
+        if data.isascii():
+            return data.decode('ascii')
+        # Non-ASCII data: count the length in characters, as ADIFParser does
+        return self._reader._mm[data_start:bound].decode('utf-8', errors='replace')[:length]
+
+    def __getitem__(self, db_field):
+        raw = self.raw(db_field)
+        if raw is None:
+            raise KeyError(db_field)
+        return _convert_field(self._spans[db_field][0], raw)
+
+    def __contains__(self, db_field):
+        if self._spans is None:
+            self._index_fields()
+        return db_field in self._spans
+
+    def get(self, db_field, default=None):
+        return self[db_field] if db_field in self else default
+
+    def keys(self):
+        if self._spans is None:
+            self._index_fields()
+        return list(self._spans)
+
+    def to_dict(self):
+        """Fully decoded contact dictionary (same as ADIFParser's)"""
+        return {db_field: self[db_field] for db_field in self.keys()}
+
+    def __repr__(self):
+        return f"<ADIFRecordView(offset={self._start}, callsign={self.get('callsign')!r})>"
+
+
+class MappedADIFReader:
+    """
+    Memory-mapped ADIF reader for validation, counting and preview
+
+    Opening the file indexes the byte offsets of every record in one scan
+    over the mapping; no field data is decoded until a record is read. Use it
+    as a context manager so the mapping is released:
+
+        >>> with MappedADIFReader('contest.adi') as reader:
+        ...     print(len(reader), reader[-1]['callsign'])
+
+    Records are the <EOR>-terminated groups that contain at least one tag,
+    so the count can include records ADIFParser drops for having no
+    recognised fields.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._mm = b''
+        self._starts = array('q')
+        self._ends = array('q')
+        self._build_index()
+
+    def _build_index(self):
+        mm = self._mm
+        start = 0
+        eoh_match = _BYTES_EOH_PATTERN.search(mm)
+        if eoh_match:
+            start = eoh_match.end()
+
+        first = start
+        after_eor = _BYTES_AFTER_EOR_PATTERN.match
+        for match in _BYTES_EOR_PATTERN.finditer(mm, start):
+            if after_eor(mm, match.end()) is None:
+                # An <EOR> not followed by another tag sits inside field data:
+                # follow every length prefix instead
+                self._starts = array('q')
+                self._ends = array('q')
+                self._build_index_exact(first)
+                return
+            if mm.find(b'<', start, match.start()) != -1:
+                self._starts.append(start)
+                self._ends.append(match.start())
+            start = match.end()
+        if mm.find(b'<', start) != -1:
+            # Trailing record without <EOR>
+            self._starts.append(start)
+            self._ends.append(len(mm))
+
+    def _build_index_exact(self, start):
+        mm = self._mm
+        pos = start
+        has_fields = False
+        while True:
+            match = _BYTES_TAG_PATTERN.search(mm, pos)
+            if match is None:
+                break
+            pos = match.end()
+            if match.group(2) is not None:
+                pos += int(match.group(2))
+                has_fields = True
+            elif match.group(1).upper() == b'EOR':
+                if has_fields:
+                    self._starts.append(start)
+                    self._ends.append(match.start())
+                start = pos
+                has_fields = False
+        if has_fields:
+            self._starts.append(start)
+            self._ends.append(len(mm))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._starts)
+        if not 0 <= index < len(self._starts):
+            raise IndexError("ADIF record index out of range")
+        return ADIFRecordView(self, self._starts[index], self._ends[index])
+
+    def __iter__(self):
+        for start, end in zip(self._starts, self._ends):
+            yield ADIFRecordView(self, start, end)
+
+    def contact(self, index):
+        """
+        Parse one record into a contact dictionary, exactly as ADIFParser does
+
+        Faster than ADIFRecordView.to_dict() when every field is needed.
+
+        Returns:
+            dict: Contact fields, or None if the record has no recognised fields
+        """
+        if index < 0:
+            index += len(self._starts)
+        record = self._mm[self._starts[index]:self._ends[index]].decode('utf-8', errors='replace')
+        for fields in iter_adif_fields(io.StringIO(record)):
+            return _contact_from_fields(fields)
+        return None
+
+    def record_offset(self, index):
+        """Byte offset where record index starts (the file size for len(reader))"""
+        if index == len(self._starts):
+            return len(self._mm)
+        return self._starts[index]
+
+    def close(self):
+        """Release the mapping and the file handle"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"<MappedADIFReader(file={self.filename!r}, records={len(self)})>"
+
+
+# Country to 3-letter code mapping for SKCC logger
+COUNTRY_CODES = {
+    'UNITED STATES': 'USA',
+    'CANADA': 'CAN',
+    'MEXICO': 'MEX',
+    'ENGLAND': 'ENG',
+    'SCOTLAND': 'SCO',
+    'WALES': 'WAL',
+    'NORTHERN IRELAND': 'NIR',
+    'IRELAND': 'IRL',
+    'GERMANY': 'DEU',
+    'FRANCE': 'FRA',
+    'ITALY': 'ITA',
+    'SPAIN': 'ESP',
+    'PORTUGAL': 'PRT',
+    'NETHERLANDS': 'NLD',
+    'BELGIUM': 'BEL',
+    'AUSTRIA': 'AUT',
+    'SWITZERLAND': 'CHE',
+    'DENMARK': 'DNK',
+    'SWEDEN': 'SWE',
+    'NORWAY': 'NOR',
+    'FINLAND': 'FIN',
+    'POLAND': 'POL',
+    'CZECH REPUBLIC': 'CZE',
+    'HUNGARY': 'HUN',
+    'GREECE': 'GRC',
+    'TURKEY': 'TUR',
+    'RUSSIA': 'RUS',
+    'UKRAINE': 'UKR',
+    'AUSTRALIA': 'AUS',
+    'NEW ZEALAND': 'NZL',
+    'JAPAN': 'JPN',
+    'CHINA': 'CHN',
+    'SOUTH KOREA': 'KOR',
+    'BRAZIL': 'BRA',
+    'ARGENTINA': 'ARG',
+    'CHILE': 'CHL',
+}
+
+# Database fields exported as plain ADIF fields, in output order
+ADIF_EXPORT_FIELDS = {
+    'callsign': 'CALL',
+    'date': 'QSO_DATE',
+    'qso_date': 'QSO_DATE',  # Support both field names
+    'time_on': 'TIME_ON',
+    'time_off': 'TIME_OFF',
+    'frequency': 'FREQ',
+    'band': 'BAND',
+    'mode': 'MODE',
+    'rst_sent': 'RST_SENT',
+    'rst_rcvd': 'RST_RCVD',
+    'power': 'TX_PWR',
+    'power_watts': 'TX_PWR',  # Support alternate field name
+    'name': 'NAME',
+    'qth': 'QTH',
+    'gridsquare': 'GRIDSQUARE',
+    'county': 'CNTY',
+    'state': 'STATE',
+    'country': 'COUNTRY',
+    'continent': 'CONT',
+    'cq_zone': 'CQZ',
+    'itu_zone': 'ITUZ',
+    'iota': 'IOTA',
+    'sota': 'SOTA_REF',
+    'pota': 'POTA_REF',
+    'my_gridsquare': 'MY_GRIDSQUARE',
+    # SKCC-specific fields (user-defined ADIF fields)
+    'my_skcc_number': 'APP_SKCC_MY_NUMBER',
+    'duration_minutes': 'APP_SKCC_DURATION',
+    'distance_nm': 'APP_SKCC_DISTANCE_NM',
+    'distance_miles': 'APP_SKCC_DISTANCE',
+    'distance_source': 'APP_SKCC_DISTANCE_SOURCE',
+    'site': 'APP_SKCC_SITE',
+    'antenna': 'APP_SKCC_ANTENNA',
+    'is_satellite': 'APP_SKCC_SATELLITE',
+    'their_power_watts': 'APP_SKCC_THEIR_POWER',
+    'dxcc_entity': 'DXCC_ENTITY'
+}
+
+
+def _encode_satellite(value):
+    return '1' if value.lower() in ('1', 'true', 'yes', 'y') else ''
+
+
+# Per-field value encoders, applied after stripping
+_EXPORT_ENCODERS = {
+    'QSO_DATE': lambda value: value.replace('-', ''),             # YYYY-MM-DD -> YYYYMMDD
+    'TIME_ON': lambda value: value.replace(':', '') + '00',      # HH:MM -> HHMMSS
+    'TIME_OFF': lambda value: value.replace(':', '') + '00',
+    'GRIDSQUARE': str.upper,
+    'CALL': str.upper,
+    'APP_SKCC_SATELLITE': _encode_satellite,
+}
+
+# (database field, tag prefix, encoder) built once for every record
+_EXPORT_FIELD_ENCODERS = tuple(
+    (db_field, f"<{adif_field}:", _EXPORT_ENCODERS.get(adif_field))
+    for db_field, adif_field in ADIF_EXPORT_FIELDS.items()
+)
+
+# Full key type names to SKCCLogger abbreviated codes
+KEY_TYPE_EXPORT_CODES = {
+    'STRAIGHT': 'ST',
+    'BUG': 'BG',
+    'SIDESWIPER': 'SS'
+}
+
+# SKCC data in various comment formats, removed in this order:
+# - New format: "SKCC:12345-Name-State" or "SKCC:12345T-Name-CAN"
+# - Old format: "SKCC: 12345S - Name - State"
+# - Old format: "SKCC 12345 BG MD" (with key type codes)
+_SKCC_COMMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'SKCC:\d+[CTS]?-[^-\s]+-[A-Z]{2,3}',  # New format: SKCC:12345-Ron-MD or SKCC:12345T-Ron-CAN
+    r'SKCC:\d+[CTS]?-[^-\s]+',  # New format partial: SKCC:12345-Ron
+    r'SKCC:\d+[CTS]?',  # New format minimal: SKCC:12345
+    r'SKCC:\s*\d+[CTS]?\s*(?:-\s*[^-]*(?:-\s*[^-]*)?)?',  # Old format: SKCC: 12345S - Name - State
+    r'SKCC\s+\d+[CTS]?\s+(?:BG|ST|SS)(?:\s+[A-Z]{2,})?',  # Old format: SKCC 12345S BG MD or SKCC 12345 BG Canada
+    r'SKCC\s+\d+[CTS]?',  # Old format minimal: SKCC 12345S
+))
+
+# Output buffer for generated files
+ADIF_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 class ADIFGenerator:
     """Generate ADIF files from contact records"""
 
-    def __init__(self):
+    def __init__(self, include_contact_id=False):
+        """
+        Args:
+            include_contact_id: Write each contact's database ID as APP_W4GNS_CONTACT_ID
+                (backups use it to match journal records to snapshot records)
+        """
         self.version = "3.1.4"
-        # Country to 3-letter code mapping for SKCC logger
-        self.country_codes = {
-            'UNITED STATES': 'USA',
-            'CANADA': 'CAN',
-            'MEXICO': 'MEX',
-            'ENGLAND': 'ENG',
-            'SCOTLAND': 'SCO',
-            'WALES': 'WAL',
-            'NORTHERN IRELAND': 'NIR',
-            'IRELAND': 'IRL',
-            'GERMANY': 'DEU',
-            'FRANCE': 'FRA',
-            'ITALY': 'ITA',
-            'SPAIN': 'ESP',
-            'PORTUGAL': 'PRT',
-            'NETHERLANDS': 'NLD',
-            'BELGIUM': 'BEL',
-            'AUSTRIA': 'AUT',
-            'SWITZERLAND': 'CHE',
-            'DENMARK': 'DNK',
-            'SWEDEN': 'SWE',
-            'NORWAY': 'NOR',
-            'FINLAND': 'FIN',
-            'POLAND': 'POL',
-            'CZECH REPUBLIC': 'CZE',
-            'HUNGARY': 'HUN',
-            'GREECE': 'GRC',
-            'TURKEY': 'TUR',
-            'RUSSIA': 'RUS',
-            'UKRAINE': 'UKR',
-            'AUSTRALIA': 'AUS',
-            'NEW ZEALAND': 'NZL',
-            'JAPAN': 'JPN',
-            'CHINA': 'CHN',
-            'SOUTH KOREA': 'KOR',
-            'BRAZIL': 'BRA',
-            'ARGENTINA': 'ARG',
-            'CHILE': 'CHL',
-        }
+        self.country_codes = COUNTRY_CODES
+        self.include_contact_id = include_contact_id
 
     def _get_country_code(self, country):
         """Convert country name to 3-letter code for SKCC logger format"""
@@ -333,23 +665,74 @@ class ADIFGenerator:
         country_upper = country.upper()
         return self.country_codes.get(country_upper, country[:3].upper())
 
-    def generate_file(self, filename, contacts, program_name="W4GNS General Logger", program_version="1.0.0"):
-        """Generate an ADIF file from list of contact records"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            # Write header
-            f.write(f"ADIF Export from {program_name}\n")
-            f.write(f"<ADIF_VER:{len(self.version)}>{self.version}\n")
-            f.write(f"<PROGRAMID:{len(program_name)}>{program_name}\n")
-            f.write(f"<PROGRAMVERSION:{len(program_version)}>{program_version}\n")
-            timestamp = datetime.now(timezone.utc).strftime('%Y%m%d %H%M%S')
-            f.write(f"<CREATED_TIMESTAMP:15>{timestamp}\n")
-            f.write("<EOH>\n\n")
-
-            # Write records
-            for contact in contacts:
-                record = self._generate_record(contact)
-                f.write(record)
-                f.write("\n")
+    def generate_file(self, filename, contacts, program_name="W4GNS General Logger",
+                      program_version="1.0.0", compress=None):
+        """
+        Generate an ADIF file from contact records
+
+        Records are generated one at a time and written through a large
+        buffer, so memory stays flat however many contacts are exported.
+
+        Args:
+            filename: Output filename
+            contacts: Iterable of contact mappings (dicts, ContactRecords, ...)
+            program_name: Name of the program generating the file
+            program_version: Version of the program generating the file
+            compress: Write gzip output; by default, when filename ends in .gz
+        """
+        if compress is None:
+            compress = str(filename).lower().endswith('.gz')
+
+        if compress:
+            handle = gzip.open(filename, 'wt', encoding='utf-8', compresslevel=6)
+        else:
+            handle = open(filename, 'w', encoding='utf-8', buffering=ADIF_WRITE_BUFFER_SIZE)
+
+        with handle as f:
+            f.write(self._generate_header(program_name, program_version))
+            f.writelines(self.iter_records(contacts))
+
+    def append_file(self, filename, contacts, program_name="W4GNS General Logger",
+                    program_version="1.0.0"):
+        """
+        Append records to an ADIF file, writing the header first if it is new
+
+        Args:
+            filename: ADIF file to extend
+            contacts: Iterable of contact mappings
+            program_name: Name of the program generating the file
+            program_version: Version of the program generating the file
+        """
+        with open(filename, 'a', encoding='utf-8', buffering=ADIF_WRITE_BUFFER_SIZE) as f:
+            if f.tell() == 0:
+                f.write(self._generate_header(program_name, program_version))
+            f.writelines(self.iter_records(contacts))
+
+    def _generate_header(self, program_name, program_version):
+        """Generate the ADIF header block"""
+        timestamp = datetime.now(timezone.utc).strftime('%Y%m%d %H%M%S')
+        return (
+            f"ADIF Export from {program_name}\n"
+            f"<ADIF_VER:{len(self.version)}>{self.version}\n"
+            f"<PROGRAMID:{len(program_name)}>{program_name}\n"
+            f"<PROGRAMVERSION:{len(program_version)}>{program_version}\n"
+            f"<CREATED_TIMESTAMP:15>{timestamp}\n"
+            "<EOH>\n\n"
+        )
+
+    def iter_records(self, contacts):
+        """
+        Generate ADIF record lines lazily
+
+        Args:
+            contacts: Iterable of contact mappings
+
+        Yields:
+            str: One record, newline-terminated
+        """
+        generate_record = self._generate_record
+        for contact in contacts:
+            yield generate_record(contact) + "\n"
 
     def _generate_record(self, contact):
         """Generate a single ADIF record from contact data"""
@@ -396,83 +779,28 @@ class ADIFGenerator:
         # Combine comment parts
         full_comment = " ".join(comment_parts)
 
-        # Map database fields to ADIF fields
-        field_map = {
-            'callsign': 'CALL',
-            'date': 'QSO_DATE',
-            'qso_date': 'QSO_DATE',  # Support both field names
-            'time_on': 'TIME_ON',
-            'time_off': 'TIME_OFF',
-            'frequency': 'FREQ',
-            'band': 'BAND',
-            'mode': 'MODE',
-            'rst_sent': 'RST_SENT',
-            'rst_rcvd': 'RST_RCVD',
-            'power': 'TX_PWR',
-            'power_watts': 'TX_PWR',  # Support alternate field name
-            'name': 'NAME',
-            'qth': 'QTH',
-            'gridsquare': 'GRIDSQUARE',
-            'county': 'CNTY',
-            'state': 'STATE',
-            'country': 'COUNTRY',
-            'continent': 'CONT',
-            'cq_zone': 'CQZ',
-            'itu_zone': 'ITUZ',
-            'iota': 'IOTA',
-            'sota': 'SOTA_REF',
-            'pota': 'POTA_REF',
-            'my_gridsquare': 'MY_GRIDSQUARE',
-            # SKCC-specific fields (user-defined ADIF fields)
-            'my_skcc_number': 'APP_SKCC_MY_NUMBER',
-            'duration_minutes': 'APP_SKCC_DURATION',
-            'distance_nm': 'APP_SKCC_DISTANCE_NM',
-            'distance_miles': 'APP_SKCC_DISTANCE',
-            'distance_source': 'APP_SKCC_DISTANCE_SOURCE',
-            'site': 'APP_SKCC_SITE',
-            'antenna': 'APP_SKCC_ANTENNA',
-            'is_satellite': 'APP_SKCC_SATELLITE',
-            'their_power_watts': 'APP_SKCC_THEIR_POWER',
-            'dxcc_entity': 'DXCC_ENTITY'
-        }
-
         dxcc_value = contact.get('dxcc') or contact.get('dxcc_entity')
         if dxcc_value:
             dxcc_value = str(dxcc_value).strip()
             if dxcc_value:
                 fields.append(f"<DXCC:{len(dxcc_value)}>{dxcc_value}")
 
-        for db_field, adif_field in field_map.items():
-            value = contact.get(db_field, '')
-
-            if isinstance(value, str):
-                value = value.strip()
-            else:
-                value = str(value) if value else ''
-
-            if db_field == 'is_satellite':
-                value = '1' if str(value).strip().lower() in ('1', 'true', 'yes', 'y') else ''
-
+        get = contact.get
+        for db_field, tag, encode in _EXPORT_FIELD_ENCODERS:
+            value = get(db_field)
             if not value:
                 continue
 
-            # Format date from YYYY-MM-DD to YYYYMMDD
-            if adif_field == 'QSO_DATE':
-                value = value.replace('-', '')
-
-            # Format time from HH:MM to HHMMSS (append 00 for seconds)
-            elif adif_field in ('TIME_ON', 'TIME_OFF'):
-                value = value.replace(':', '') + '00'
-
-            # Ensure gridsquare is uppercase
-            elif adif_field == 'GRIDSQUARE':
-                value = value.upper()
+            value = value.strip() if isinstance(value, str) else str(value)
+            if not value:
+                continue
 
-            # Ensure callsign is uppercase
-            elif adif_field == 'CALL':
-                value = value.upper()
+            if encode is not None:
+                value = encode(value)
+                if not value:
+                    continue
 
-            fields.append(f"<{adif_field}:{len(value)}>{value}")
+            fields.append(f"{tag}{len(value)}>{value}")
 
         # Add SKCC-enhanced comment field (SKCCLogger reads this)
         if full_comment:
@@ -506,6 +834,12 @@ class ADIFGenerator:
             if power_str:
                 fields.append(f"<APP_SKCC_POWER:{len(power_str)}>{power_str}")
 
+        if self.include_contact_id:
+            contact_id = contact.get('id')
+            if contact_id is not None:
+                contact_id = str(contact_id)
+                fields.append(f"<APP_W4GNS_CONTACT_ID:{len(contact_id)}>{contact_id}")
+
         # Add end-of-record marker
         fields.append("<EOR>")
 
@@ -521,12 +855,7 @@ class ADIFGenerator:
         Returns:
             Abbreviated code (ST, BG, SS)
         """
-        code_map = {
-            'STRAIGHT': 'ST',
-            'BUG': 'BG',
-            'SIDESWIPER': 'SS'
-        }
-        return code_map.get(key_type.upper().strip(), key_type)
+        return KEY_TYPE_EXPORT_CODES.get(key_type.upper().strip(), key_type)
 
     def _strip_skcc_from_comment(self, comment):
         """
@@ -547,22 +876,13 @@ class ADIFGenerator:
         if not comment:
             return ''
 
-        # Pattern to match SKCC data in various formats:
-        # - New format: "SKCC:12345-Name-State" or "SKCC:12345T-Name-CAN"
-        # - Old format: "SKCC: 12345S - Name - State"
-        # - Old format: "SKCC 12345 BG MD" (with key type codes)
-        patterns = [
-            r'SKCC:\d+[CTS]?-[^-\s]+-[A-Z]{2,3}',  # New format: SKCC:12345-Ron-MD or SKCC:12345T-Ron-CAN
-            r'SKCC:\d+[CTS]?-[^-\s]+',  # New format partial: SKCC:12345-Ron
-            r'SKCC:\d+[CTS]?',  # New format minimal: SKCC:12345
-            r'SKCC:\s*\d+[CTS]?\s*(?:-\s*[^-]*(?:-\s*[^-]*)?)?',  # Old format: SKCC: 12345S - Name - State
-            r'SKCC\s+\d+[CTS]?\s+(?:BG|ST|SS)(?:\s+[A-Z]{2,})?',  # Old format: SKCC 12345S BG MD or SKCC 12345 BG Canada
-            r'SKCC\s+\d+[CTS]?',  # Old format minimal: SKCC 12345S
-        ]
+        # Most comments carry no SKCC data; skip the regex passes for them
+        if 'SKCC' not in comment.upper():
+            return ' '.join(comment.split())
 
         cleaned = comment
-        for pattern in patterns:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        for pattern in _SKCC_COMMENT_PATTERNS:
+            cleaned = pattern.sub('', cleaned)
 
         # Clean up extra whitespace
         cleaned = ' '.join(cleaned.split())
@@ -570,23 +890,33 @@ class ADIFGenerator:
         return cleaned.strip()
 
 
-def export_contacts_to_adif(contacts, filename, program_name="W4GNS General Logger"):
+def export_contacts_to_adif(contacts, filename, program_name="W4GNS General Logger",
+                            include_contact_id=False):
     """
     Export contacts to ADIF file
 
+    Contacts are written as they are read, so a generator such as
+    Database.iter_contacts() or a database cursor is exported without
+    loading the whole log. A filename ending in .gz is written gzip-compressed.
+
     Args:
-        contacts: List of contact dictionaries (from database)
+        contacts: Iterable of contact mappings, sqlite3 rows or cursor tuples
         filename: Output filename
         program_name: Name of the program generating the file
+        include_contact_id: Write each contact's database ID (used by backups)
+
+    Returns:
+        int: Number of contacts written
 
     Raises:
         ValueError: If contacts is empty or filename is invalid
         IOError: If file cannot be written
     """
     import os
+    from itertools import chain
 
     # Validate inputs
-    if not contacts:
+    if contacts is None or (hasattr(contacts, '__len__') and not contacts):
         raise ValueError("No contacts to export")
 
     if not filename:
@@ -603,31 +933,43 @@ def export_contacts_to_adif(contacts, filename, program_name="W4GNS General Logg
     if directory and not os.access(directory, os.W_OK):
         raise PermissionError(f"Directory not writable: {directory}")
 
-    generator = ADIFGenerator()
-
-    # Convert database Row objects to dictionaries if needed
-    contact_list = []
-    for contact in contacts:
-        try:
-            if hasattr(contact, 'keys'):
-                # It's a sqlite3.Row object or dict-like
-                contact_dict = {key: contact[key] for key in contact.keys()}
-            else:
-                contact_dict = contact
-            contact_list.append(contact_dict)
-        except Exception as e:
-            print(f"Warning: Skipping invalid contact: {e}")
-            continue
-
-    if not contact_list:
+    generator = ADIFGenerator(include_contact_id=include_contact_id)
+    written = 0
+
+    # Plain cursors (no row factory) yield tuples; name them from the description
+    column_names = None
+    if isinstance(contacts, sqlite3.Cursor) and contacts.description:
+        column_names = [column[0] for column in contacts.description]
+
+    def contact_mappings():
+        """Pass mappings through as-is; only rows without .get() are converted"""
+        nonlocal written
+        for contact in contacts:
+            if not hasattr(contact, 'get'):
+                try:
+                    if column_names and isinstance(contact, tuple):
+                        contact = dict(zip(column_names, contact))
+                    else:
+                        # sqlite3.Row
+                        contact = dict(contact)
+                except Exception as e:
+                    print(f"Warning: Skipping invalid contact: {e}")
+                    continue
+            written += 1
+            yield contact
+
+    records = contact_mappings()
+    first = next(records, None)
+    if first is None:
         raise ValueError("No valid contacts to export after filtering")
 
     try:
-        generator.generate_file(filename, contact_list, program_name)
+        generator.generate_file(filename, chain([first], records), program_name)
     except IOError as e:
         raise IOError(f"Failed to write ADIF file {filename}: {e}")
     except Exception as e:
         raise Exception(f"Error generating ADIF file: {type(e).__name__}: {e}")
+    return written
 
 
 def import_contacts_from_adif(filename):
@@ -670,23 +1012,19 @@ def validate_adif_file(filename):
 
     try:
         with open(filename, 'r', encoding='utf-8', errors='replace') as f:
-            content = f.read()
+            head = f.read(ADIF_CHUNK_SIZE)
 
-        if not content.strip():
+        if not head.strip():
             return False, "File is empty"
 
-        # Check for at least one record
-        if not re.search(r'<eor>|<EOR>', content, re.IGNORECASE):
-            return False, "No records found in ADIF file"
-
-        # Try to parse
-        parser = ADIFParser()
-        contacts = parser.parse_file(filename)
+        # Index the records without decoding them
+        with MappedADIFReader(filename) as reader:
+            contact_count = len(reader)
 
-        if not contacts:
+        if not contact_count:
             return False, "No valid contacts found in file"
 
-        return True, f"Valid ADIF file with {len(contacts)} contacts"
+        return True, f"Valid ADIF file with {contact_count} contacts"
 
     except PermissionError:
         return False, f"Permission denied reading file: {filename}"
@@ -0,0 +1,137 @@
+"""
+Incremental ADIF backups
+
+A backup directory holds full snapshots (w4gns_log_<timestamp>.adi plus a
+w4gns_log_<timestamp>.db copy of the database) and one journal per snapshot
+(w4gns_journal_<timestamp>.adi). Each backup run only appends the contacts
+added or edited since the previous run to the newest snapshot's journal, so
+its cost follows the number of changes rather than the size of the log.
+
+A new full snapshot is written when the directory has none yet, when
+contacts were deleted (a journal cannot express deletions), when the change
+log no longer reaches back to the directory's high-water mark, when the
+journal has grown past journal_max_records, or when the snapshot is older
+than full_snapshot_days.
+
+Backup records carry the contact's database ID (APP_W4GNS_CONTACT_ID).
+Restoring a snapshot means reading its journal after it; a journal record
+replaces the snapshot record with the same contact ID, so edits to the
+callsign, date or time replace the old record instead of duplicating it.
+Records from older backups without IDs are matched on callsign, date and time.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+from src.adif import ADIFGenerator, export_contacts_to_adif
+
+SNAPSHOT_PREFIX = "w4gns_log_"
+JOURNAL_PREFIX = "w4gns_journal_"
+FULL_SNAPSHOT_DAYS = 7
+JOURNAL_MAX_RECORDS = 5000
+
+
+def journal_path_for(snapshot_path):
+    """Get the journal filename belonging to a w4gns_log_<timestamp>.adi snapshot"""
+    directory, name = os.path.split(snapshot_path)
+    return os.path.join(directory, JOURNAL_PREFIX + name[len(SNAPSHOT_PREFIX):])
+
+
+def merge_journal(snapshot_contacts, journal_contacts):
+    """
+    Apply journal records on top of snapshot records
+
+    Args:
+        snapshot_contacts: Contacts parsed from a snapshot
+        journal_contacts: Contacts parsed from its journal, oldest first
+
+    Returns:
+        list: Snapshot contacts with edited ones replaced and new ones appended
+    """
+    merged = {}
+    for contact in snapshot_contacts:
+        merged.setdefault(_contact_key(contact), []).append(contact)
+    for contact in journal_contacts:
+        # The latest version of an edited contact wins
+        merged[_contact_key(contact)] = [contact]
+    return [contact for contacts in merged.values() for contact in contacts]
+
+
+def _contact_key(contact):
+    contact_id = contact.get('id')
+    if contact_id:
+        return ('id', str(contact_id))
+    return ((contact.get('callsign') or '').upper(), contact.get('date'), contact.get('time_on'))
+
+
+def backup_adif(database, directory, full_snapshot_days=FULL_SNAPSHOT_DAYS,
+                journal_max_records=JOURNAL_MAX_RECORDS, force_full=False):
+    """
+    Bring the ADIF backup in a directory up to date
+
+    Args:
+        database: Database instance to back up
+        directory: Backup directory (created if missing)
+        full_snapshot_days: Maximum age of a snapshot before a new one is written
+        journal_max_records: Journal size that triggers a new snapshot
+        force_full: Always write a new full snapshot
+
+    Returns:
+        dict: mode ('full', 'journal' or 'unchanged'), written (records
+            written) and path (file written, or None)
+    """
+    os.makedirs(directory, exist_ok=True)
+    target = os.path.abspath(directory)
+    watermark = database.get_export_watermark(target)
+
+    if not force_full and watermark and _journal_is_current(watermark, directory, full_snapshot_days):
+        changes = database.get_contact_changes(watermark['revision'])
+        if changes is not None and not any(operation == 'DELETE' for _, _, operation in changes):
+            if not changes:
+                return {'mode': 'unchanged', 'written': 0, 'path': None}
+
+            contact_ids = list(dict.fromkeys(contact_id for _, contact_id, _ in changes))
+            if watermark['journal_records'] + len(contact_ids) <= journal_max_records:
+                return _append_journal(database, directory, target, watermark, changes, contact_ids)
+
+    return _write_snapshot(database, directory, target)
+
+
+def _journal_is_current(watermark, directory, full_snapshot_days):
+    """Check that the watermark's snapshot and journal exist and are recent enough"""
+    snapshot_path = os.path.join(directory, watermark['snapshot'])
+    if not os.path.exists(snapshot_path):
+        return False
+    if watermark['journal_records'] and not os.path.exists(journal_path_for(snapshot_path)):
+        return False
+    snapshot_at = datetime.fromisoformat(watermark['snapshot_at'])
+    return datetime.now() - snapshot_at < timedelta(days=full_snapshot_days)
+
+
+def _append_journal(database, directory, target, watermark, changes, contact_ids):
+    """Append the contacts changed since the watermark to the snapshot's journal"""
+    journal_path = journal_path_for(os.path.join(directory, watermark['snapshot']))
+    contacts = database.get_contacts_by_ids(contact_ids)
+    ADIFGenerator(include_contact_id=True).append_file(journal_path, contacts)
+
+    database.set_export_watermark(
+        target, changes[-1][0], watermark['snapshot'], watermark['snapshot_at'],
+        watermark['journal_records'] + len(contacts),
+    )
+    return {'mode': 'journal', 'written': len(contacts), 'path': journal_path}
+
+
+def _write_snapshot(database, directory, target):
+    """Write a full ADIF snapshot and database copy, starting an empty journal"""
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    snapshot_name = f"{SNAPSHOT_PREFIX}{timestamp}.adi"
+    snapshot_path = os.path.join(directory, snapshot_name)
+
+    # Read before exporting so writes during the export are journaled next time
+    revision = database.get_log_revision()
+    written = export_contacts_to_adif(database.iter_contacts(), snapshot_path, include_contact_id=True)
+    database.backup_to(os.path.join(directory, f"{SNAPSHOT_PREFIX}{timestamp}.db"))
+
+    database.set_export_watermark(target, revision, snapshot_name, now.isoformat(), 0)
+    return {'mode': 'full', 'written': written, 'path': snapshot_path}
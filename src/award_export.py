@@ -4,15 +4,24 @@ Award Export Utility
 Provides utilities for exporting qualifying contacts for SKCC award applications.
 Award managers require ADIF files containing only the contacts that qualify for
 the specific award being applied for.
+
+Contacts come from the shared ContactStore, earliest first. Batch exports take
+qualifying contacts from the award state store for the awards it tracks and
+write the files on a thread pool; awards whose qualifying contacts and export
+rules (export_view_key) match share one application list.
 """
 
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on award export threads (only file writes run on the pool)
+MAX_EXPORT_WORKERS = 4
+
 
 class AwardExporter:
     """Export qualifying contacts for SKCC awards"""
@@ -55,19 +64,11 @@ class AwardExporter:
         if not contacts:
             raise ValueError("No contacts found in database")
 
-        # Generate filename
-        award_name = award_instance.name.replace(' ', '_').replace('/', '_')
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-        if callsign:
-            filename = f"{callsign}_{award_name}_Application_{timestamp}.adi"
-        else:
-            filename = f"{award_name}_Application_{timestamp}.adi"
-
         # Create output directory if needed
         os.makedirs(output_directory, exist_ok=True)
 
-        filepath = os.path.join(output_directory, filename)
+        filepath = self._application_path(award_instance, output_directory, callsign,
+                                          datetime.now().strftime('%Y%m%d_%H%M%S'))
 
         # Export qualifying contacts
         try:
@@ -92,15 +93,25 @@ class AwardExporter:
         self,
         award_instances: List,
         output_directory: str = "exports",
-        callsign: Optional[str] = None
+        callsign: Optional[str] = None,
+        include_award_info: bool = True,
+        max_workers: Optional[int] = None
     ) -> Dict[str, str]:
         """
         Export application files for multiple awards.
 
+        Qualifying contacts come from the shared award state store for the
+        awards it tracks, so the log is not validated again per award; other
+        awards are validated here. Awards with the same qualifying contacts
+        and export rules share one deduplicated application list, and the
+        files are written on worker threads.
+
         Args:
             award_instances: List of SKCC award instances
             output_directory: Directory to save export files
             callsign: Optional callsign to include in filenames
+            include_award_info: Add award name to contact comments
+            max_workers: Writer threads (default: one per award, up to MAX_EXPORT_WORKERS)
 
         Returns:
             Dict[str, str]: Mapping of award names to exported file paths
@@ -109,28 +120,103 @@ class AwardExporter:
             Awards with no qualifying contacts will be skipped with a warning
         """
         results = {}
+        if not award_instances:
+            return results
+
+        contacts = self._get_all_contacts()
+        if not contacts:
+            logger.warning("No contacts found in database")
+            return {award.name: None for award in award_instances}
 
+        os.makedirs(output_directory, exist_ok=True)
+        # One timestamp for the whole batch
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        workers = max_workers or min(len(award_instances), MAX_EXPORT_WORKERS)
+        award_state, state_keys = self._award_state_keys()
+
+        # Build each distinct application list once (CPU-bound, so not threaded)
+        views = {}
+        applications = []
         for award in award_instances:
             try:
-                filepath = self.export_award_application(
-                    award,
-                    output_directory=output_directory,
-                    callsign=callsign
-                )
-                results[award.name] = filepath
-
-            except ValueError as e:
-                logger.warning(
-                    f"Skipping {award.name} award - no qualifying contacts: {e}"
-                )
-                results[award.name] = None
-
+                state_key = state_keys.get(type(award))
+                if state_key and award.database is self.database:
+                    qualifying = sorted(
+                        award_state.get_qualifying_contacts(state_key),
+                        key=lambda c: (c.get('date') or '', c.get('time_on') or '', c.get('id') or 0),
+                    )
+                else:
+                    qualifying = self._validate_all(award, contacts)
+                view_key = (award.export_view_key(), tuple(id(c) for c in qualifying))
+                if view_key not in views:
+                    views[view_key] = award.prepare_export_contacts(qualifying)
+                application = views[view_key]
             except Exception as e:
                 logger.error(f"Error exporting {award.name} award: {e}")
                 results[award.name] = None
+                continue
+
+            if not application:
+                logger.warning(f"Skipping {award.name} award - no qualifying contacts")
+                results[award.name] = None
+                continue
+
+            filepath = self._application_path(award, output_directory, callsign, timestamp)
+            applications.append((award, filepath, application))
+
+        # Write all files concurrently
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            writes = [
+                (award, filepath, executor.submit(
+                    award.write_application_adif, application, filepath, include_award_info
+                ))
+                for award, filepath, application in applications
+            ]
+            for award, filepath, future in writes:
+                try:
+                    count = future.result()
+                    logger.info(
+                        f"Exported {count} qualifying contacts for {award.name} "
+                        f"award to {filepath}"
+                    )
+                    results[award.name] = filepath
+                except Exception as e:
+                    logger.error(f"Error exporting {award.name} award: {e}")
+                    results[award.name] = None
 
+        logger.debug(f"Exported {len(award_instances)} awards from {len(contacts)} contacts "
+                     f"using {len(views)} application lists")
         return results
 
+    def _award_state_keys(self):
+        """Shared award state store and its award keys by award class (None, {} if unavailable)"""
+        if not hasattr(self.database, 'contact_columns'):
+            return None, {}
+
+        from src.skcc_awards.award_state import get_award_state_store
+
+        award_state = get_award_state_store(self.database)
+        return award_state, {cls: key for key, cls in award_state.award_classes.items()}
+
+    @staticmethod
+    def _validate_all(award, contacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Contacts that pass the award's validate(), keeping the log's order"""
+        validate = award.validate
+        return [contact for contact in contacts if validate(contact)]
+
+    @staticmethod
+    def _application_path(award_instance, output_directory: str,
+                          callsign: Optional[str], timestamp: str) -> str:
+        """Path of an award application file"""
+        award_name = award_instance.name.replace(' ', '_').replace('/', '_')
+
+        if callsign:
+            filename = f"{callsign}_{award_name}_Application_{timestamp}.adi"
+        else:
+            filename = f"{award_name}_Application_{timestamp}.adi"
+
+        return os.path.join(output_directory, filename)
+
     def export_all_ready_awards(
         self,
         output_directory: str = "exports",
@@ -149,44 +235,16 @@ class AwardExporter:
         Returns:
             Dict[str, str]: Mapping of award names to exported file paths
         """
-        # Import all award classes
-        from src.skcc_awards import (
-            CenturionAward, TribuneAward, SenatorAward,
-            TripleKeyAward, RagChewAward, MarathonAward,
-            CanadianMapleAward, SKCCDXQAward, SKCCDXCAward,
-            PFXAward, QRP1xAward, QRP2xAward, QRPMPWAward,
-            SKCCWASAward, SKCCWASTAward, SKCCWASSAward, SKCCWACAward
-        )
+        from src.skcc_awards.award_state import get_award_state_store
 
-        # Instantiate all awards
-        all_awards = [
-            CenturionAward(self.database),
-            TribuneAward(self.database),
-            SenatorAward(self.database),
-            TripleKeyAward(self.database),
-            RagChewAward(self.database),
-            MarathonAward(self.database),
-            CanadianMapleAward(self.database),
-            SKCCDXQAward(self.database),
-            SKCCDXCAward(self.database),
-            PFXAward(self.database),
-            QRP1xAward(self.database),
-            QRP2xAward(self.database),
-            QRPMPWAward(self.database),
-            SKCCWASAward(self.database),
-            SKCCWASTAward(self.database),
-            SKCCWASSAward(self.database),
-            SKCCWACAward(self.database)
-        ]
-
-        # Get all contacts
-        contacts = self._get_all_contacts()
+        # Progress comes from the shared award state (snapshot + log deltas)
+        award_state = get_award_state_store(self.database)
 
         # Check which awards are achieved
         ready_awards = []
-        for award in all_awards:
+        for award_key, award in award_state.awards_by_key().items():
             try:
-                progress = award.calculate_progress(contacts)
+                progress = award_state.get_progress(award_key)
                 if progress.get('achieved', False):
                     ready_awards.append(award)
                     logger.info(f"{award.name} award is achieved - ready for export")
@@ -212,19 +270,22 @@ class AwardExporter:
 
     def _get_all_contacts(self) -> List[Dict[str, Any]]:
         """
-        Get all contacts from the database.
+        Get all contacts from the database, earliest first.
 
         Returns:
             List of contact dictionaries
         """
-        # Check if database has a method to get all contacts
-        if hasattr(self.database, 'get_all_contacts'):
-            return self.database.get_all_contacts()
+        # Serve the log from the shared in-memory contact store
+        if hasattr(self.database, 'contact_columns'):
+            from src.contact_store import get_contact_store
+            contacts = get_contact_store(self.database).all()
+            contacts.reverse()
+            return contacts
 
         # Otherwise, query directly
         if hasattr(self.database, 'conn'):
             cursor = self.database.conn.cursor()
-            cursor.execute("SELECT * FROM contacts")
+            cursor.execute("SELECT * FROM contacts ORDER BY date, time_on")
             rows = cursor.fetchall()
 
             # Convert Row objects to dictionaries
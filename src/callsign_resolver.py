@@ -0,0 +1,120 @@
+"""
+Callsign Resolution Service
+
+Resolves a callsign once to everything the spot, logging and award code
+needs about it: base call, prefix, DXCC entity, continent, zones and SKCC
+roster member. Results are kept in a bounded LRU cache shared by all
+callers and dropped whenever the roster reloads.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+from typing import Optional
+
+from src.dxcc import lookup_dxcc
+from src.skcc_roster import SKCCRosterManager, get_roster_manager
+
+# Distinct callsigns kept; a large log plus a busy cluster session fit easily
+DEFAULT_CACHE_SIZE = 16384
+
+ResolvedCallsign = namedtuple('ResolvedCallsign', [
+    'callsign',    # Uppercased callsign as given
+    'base_call',   # Longest segment around '/' (VP2E/W1ABC -> W1ABC)
+    'prefix',      # Base call up to its last leading digit (W1ABC -> W1)
+    'entity',      # DXCC entity code, or None
+    'country',
+    'continent',
+    'cq_zone',
+    'itu_zone',
+    'member',      # SKCC roster row, or None
+])
+
+_PREFIX_PATTERN = re.compile(r'^([A-Z0-9]*\d)')
+
+
+def callsign_prefix(base_call: str) -> str:
+    """
+    Prefix of a base callsign: letters and digits up to its last leading digit
+
+    W4GNS -> W4, VE3XYZ -> VE3, 2E0ABC -> 2E0; "" when the call has no digit
+    """
+    match = _PREFIX_PATTERN.match(base_call)
+    return match.group(1) if match else ""
+
+
+class CallsignResolver:
+    """Memoized callsign -> ResolvedCallsign lookups against DXCC and the roster"""
+
+    def __init__(self, roster_manager: Optional[SKCCRosterManager] = None,
+                 maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            roster_manager: Roster used for member lookups; None skips them
+            maxsize: Number of distinct callsigns cached
+        """
+        self.roster_manager = roster_manager
+        self._resolve_cached = lru_cache(maxsize=maxsize)(self._resolve)
+        if roster_manager is not None:
+            roster_manager.add_reload_listener(self.invalidate)
+
+    def _resolve(self, callsign: str) -> ResolvedCallsign:
+        base_call = SKCCRosterManager.normalize_callsign(callsign)
+        dxcc = lookup_dxcc(callsign) or {}
+        member = self.roster_manager.lookup_callsign(callsign) if self.roster_manager else None
+        return ResolvedCallsign(
+            callsign=callsign,
+            base_call=base_call,
+            prefix=callsign_prefix(base_call),
+            entity=dxcc.get('entity'),
+            country=dxcc.get('country'),
+            continent=dxcc.get('continent'),
+            cq_zone=dxcc.get('cq_zone'),
+            itu_zone=dxcc.get('itu_zone'),
+            member=member,
+        )
+
+    def resolve(self, callsign: Optional[str]) -> ResolvedCallsign:
+        """
+        Resolve a callsign
+
+        Args:
+            callsign: Callsign in any case, with or without portable parts
+
+        Returns:
+            ResolvedCallsign; fields are empty/None when nothing is known
+        """
+        return self._resolve_cached((callsign or '').strip().upper())
+
+    def was_member_on_date(self, callsign: Optional[str], qso_date: str) -> bool:
+        """
+        Check if a callsign was an SKCC member on a date
+
+        Same rule as SKCCRosterManager.was_member_on_date (join_date <= qso_date),
+        using the cached roster member.
+        """
+        member = self.resolve(callsign).member
+        join_date = member.get('join_date') if member else None
+        if not join_date or not qso_date:
+            return False
+        return join_date.replace('-', '') <= qso_date.replace('-', '')
+
+    def invalidate(self):
+        """Drop every cached result (the roster or DXCC table changed)"""
+        self._resolve_cached.cache_clear()
+
+    def cache_info(self):
+        """Hit/miss counters and size of the cache (functools.lru_cache format)"""
+        return self._resolve_cached.cache_info()
+
+
+# Global instance
+_callsign_resolver = None
+
+
+def get_callsign_resolver() -> CallsignResolver:
+    """Get global CallsignResolver instance, bound to the global roster"""
+    global _callsign_resolver
+    if _callsign_resolver is None:
+        _callsign_resolver = CallsignResolver(get_roster_manager())
+    return _callsign_resolver
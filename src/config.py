@@ -127,7 +127,11 @@ class Config:
                 "show_cw_spots": True,
                 "show_ssb_spots": True,
                 "show_digital_spots": True,
-                "filter_band": None
+                "filter_band": None,
+                "spot_batch_size": 50,
+                "spot_flush_ms": 500,
+                "spot_retention_hours": 24,
+                "spot_max_rows": 20000
             },
             "qrz": {
                 "username": "",
@@ -141,6 +145,9 @@ class Config:
                 "warn_duplicates": True,
                 "auto_time_off": True
             },
+            "database": {
+                "durability": "safe"
+            },
             "window": {
                 "width": 1200,
                 "height": 750
@@ -0,0 +1,339 @@
+"""
+Shared in-memory contact cache
+
+Loads the log once into compact ``__slots__`` records instead of a list of
+dicts per tab. Categorical text fields (band, mode, key type, state, country,
+...) are interned so every record shares one string object per distinct value.
+
+The store registers a Database change listener, so single-contact writes are
+applied in place and bulk changes (imports) trigger a lazy reload. Secondary
+indexes on normalized mode, key type, SKCC base number and QSO timestamp let
+filter() answer award-style queries without scanning every record.
+"""
+
+import bisect
+import functools
+import logging
+import sqlite3
+import sys
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from src.database import CONTACT_TEXT_FIELDS
+from src.utils.skcc_number import extract_base_skcc_number
+
+logger = logging.getLogger(__name__)
+
+# Low-cardinality fields whose strings are interned
+INTERNED_FIELDS = frozenset({
+    'band', 'mode', 'key_type', 'state', 'country', 'continent', 'cq_zone',
+    'itu_zone', 'distance_source', 'my_gridsquare', 'my_skcc_number',
+})
+
+
+class ContactRecord:
+    """
+    Read-only contact row with dict-style access
+
+    Supports ``record['field']``, ``record.get('field', default)``, ``keys()``
+    and ``dict(record)``, so it can be passed wherever a contact dict is read.
+    Values match the dict rows Database returns: NULL text fields read as
+    "", other NULL fields as None.
+
+    Records are instances of a subclass built by record_type() for the
+    stored columns of the contacts table, which holds one slot per column.
+    """
+
+    __slots__ = ()
+
+    # Set on each record_type() subclass
+    _fields: Tuple[str, ...] = ()
+    _field_set: FrozenSet[str] = frozenset()
+    _setters: Tuple[Any, ...] = ()
+
+    def __init__(self, values):
+        """
+        Args:
+            values: Column values in _fields order (e.g. a row from
+                SELECT <_fields> FROM contacts)
+        """
+        for (setter, interned, text), value in zip(self._setters, values):
+            if value is None:
+                if text:
+                    value = ''
+            elif interned and value.__class__ is str:
+                value = sys.intern(value)
+            setter(self, value)
+
+        date_text = str(self.get('date') or '').strip().replace('-', '')
+        time_text = (str(self.get('time_on') or '').strip().replace(':', '') + '0000')[:4]
+        qso_ts = None
+        if len(date_text) == 8 and date_text.isdigit() and time_text.isdigit():
+            qso_ts = int(date_text) * 10000 + int(time_text)
+        object.__setattr__(self, 'qso_ts', qso_ts)
+
+        base_number = extract_base_skcc_number(str(self.get('skcc_number') or ''))
+        object.__setattr__(self, 'skcc_base', int(base_number) if base_number else None)
+
+    @classmethod
+    def from_contact(cls, contact: Dict[str, Any]) -> 'ContactRecord':
+        """Build a record from a contact dictionary"""
+        return cls([contact.get(field) for field in cls._fields])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ContactRecord is read-only; use to_dict() for a mutable copy")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._field_set:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._field_set
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key not in self._field_set:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return self._fields
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self._fields]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Mutable copy of the record"""
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __repr__(self):
+        return f"ContactRecord(id={self.get('id')!r}, callsign={self.get('callsign')!r}, date={self.get('date')!r})"
+
+
+@functools.lru_cache(maxsize=None)
+def record_type(fields: Tuple[str, ...]) -> type:
+    """
+    ContactRecord subclass with one slot per field
+
+    Args:
+        fields: Stored contacts columns in SELECT order
+            (Database.contact_columns.stored_columns)
+    """
+    cls = type('ContactRecord', (ContactRecord,), {
+        '__slots__': fields + ('qso_ts', 'skcc_base'),
+        '__module__': __name__,
+    })
+    cls._fields = fields
+    cls._field_set = frozenset(fields)
+    # Slot descriptors bypass the read-only __setattr__ while building a record
+    cls._setters = tuple(
+        (cls.__dict__[field].__set__, field in INTERNED_FIELDS, field in CONTACT_TEXT_FIELDS)
+        for field in fields
+    )
+    return cls
+
+
+def _norm(value: Any) -> str:
+    return str(value or '').strip().upper()
+
+
+class ContactStore:
+    """Process-wide cache of the contact log, kept in sync through Database write hooks"""
+
+    def __init__(self, database):
+        """
+        Initialize the store (the log is loaded on first use)
+
+        Args:
+            database: Database instance whose contacts are cached
+        """
+        self.database = database
+        self._record_type = record_type(database.contact_columns.stored_columns)
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._records: Dict[int, ContactRecord] = {}
+        self._by_mode: Dict[str, Set[int]] = {}
+        self._by_key_type: Dict[str, Set[int]] = {}
+        self._by_skcc_base: Dict[int, Set[int]] = {}
+        # Lazily rebuilt views, dropped on every change
+        self._ts_index = None
+        self._ordered = None
+
+        database.add_change_listener(self._on_contact_change)
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._clear()
+        try:
+            with self.database.read_connection() as conn:
+                cursor = conn.execute(f"SELECT {', '.join(self._record_type._fields)} FROM contacts")
+                while True:
+                    rows = cursor.fetchmany(1000)
+                    if not rows:
+                        break
+                    for row in rows:
+                        self._insert(self._record_type(row))
+        except sqlite3.DatabaseError as e:
+            logger.error(f"Contact store load failed: {e}")
+            self._clear()
+            return
+        self._loaded = True
+        logger.debug(f"Contact store loaded {len(self._records)} contacts")
+
+    def _clear(self):
+        self._records = {}
+        self._by_mode = {}
+        self._by_key_type = {}
+        self._by_skcc_base = {}
+        self._ts_index = None
+        self._ordered = None
+
+    def _insert(self, record: ContactRecord):
+        self._records[record.id] = record
+        self._by_mode.setdefault(_norm(record.mode), set()).add(record.id)
+        self._by_key_type.setdefault(_norm(record.key_type), set()).add(record.id)
+        if record.skcc_base is not None:
+            self._by_skcc_base.setdefault(record.skcc_base, set()).add(record.id)
+
+    def _remove(self, contact_id: int):
+        record = self._records.pop(contact_id, None)
+        if record is None:
+            return
+        self._by_mode.get(_norm(record.mode), set()).discard(contact_id)
+        self._by_key_type.get(_norm(record.key_type), set()).discard(contact_id)
+        if record.skcc_base is not None:
+            self._by_skcc_base.get(record.skcc_base, set()).discard(contact_id)
+
+    def _on_contact_change(self, event: str, contact_id: Optional[int]):
+        """Database change listener: apply single-contact writes in place"""
+        with self._lock:
+            if not self._loaded:
+                return
+            if event == 'reload' or contact_id is None:
+                self._loaded = False
+                self._clear()
+                return
+
+            self._remove(contact_id)
+            if event != 'delete':
+                contact = self.database.get_contact(contact_id)
+                if contact:
+                    self._insert(self._record_type.from_contact(contact))
+            self._ts_index = None
+            self._ordered = None
+
+    def close(self):
+        """Stop following the database's changes and drop the cache"""
+        self.database.remove_change_listener(self._on_contact_change)
+        self.invalidate()
+
+    def invalidate(self):
+        """Drop the cache; the log is reloaded on next use"""
+        with self._lock:
+            self._loaded = False
+            self._clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._records)
+
+    def get(self, contact_id: int) -> Optional[ContactRecord]:
+        """Get one contact record by ID"""
+        with self._lock:
+            self._ensure_loaded()
+            return self._records.get(contact_id)
+
+    def get_many(self, contact_ids: Iterable[int]) -> Dict[int, ContactRecord]:
+        """Get the records of the given contact IDs that exist, keyed by ID"""
+        with self._lock:
+            self._ensure_loaded()
+            records = self._records
+            return {contact_id: records[contact_id] for contact_id in contact_ids if contact_id in records}
+
+    def all(self) -> List[ContactRecord]:
+        """All contacts, most recent first (same order as Database.get_all_contacts)"""
+        with self._lock:
+            self._ensure_loaded()
+            if self._ordered is None:
+                self._ordered = sorted(
+                    self._records.values(),
+                    key=lambda r: (r.date, r.time_on),
+                    reverse=True,
+                )
+            return list(self._ordered)
+
+    def filter(self, mode: Optional[str] = None, key_types: Optional[Iterable[str]] = None,
+               start_date: Optional[str] = None, end_date: Optional[str] = None,
+               skcc_base_number: Optional[int] = None) -> List[ContactRecord]:
+        """
+        Contacts matching every given criterion, most recent first
+
+        Args:
+            mode: Mode (case-insensitive)
+            key_types: Allowed key types (case-insensitive)
+            start_date: First QSO date, YYYYMMDD or YYYY-MM-DD (inclusive)
+            end_date: Last QSO date, YYYYMMDD or YYYY-MM-DD (inclusive)
+            skcc_base_number: SKCC number without suffix (e.g. 12345 for "12345T")
+
+        Returns:
+            Matching contact records
+        """
+        with self._lock:
+            self._ensure_loaded()
+            selections: List[Set[int]] = []
+
+            if mode is not None:
+                selections.append(self._by_mode.get(_norm(mode), set()))
+            if key_types is not None:
+                ids: Set[int] = set()
+                for key_type in key_types:
+                    ids |= self._by_key_type.get(_norm(key_type), set())
+                selections.append(ids)
+            if skcc_base_number is not None:
+                selections.append(self._by_skcc_base.get(int(skcc_base_number), set()))
+            if start_date or end_date:
+                selections.append(self._ids_in_date_range(start_date, end_date))
+
+            if selections:
+                selections.sort(key=len)
+                matched = set(selections[0])
+                for ids in selections[1:]:
+                    matched &= ids
+                records = [self._records[contact_id] for contact_id in matched]
+            else:
+                records = list(self._records.values())
+
+        records.sort(key=lambda r: (r.date, r.time_on), reverse=True)
+        return records
+
+    def _ids_in_date_range(self, start_date: Optional[str], end_date: Optional[str]) -> Set[int]:
+        if self._ts_index is None:
+            pairs = sorted(
+                (record.qso_ts, record.id)
+                for record in self._records.values() if record.qso_ts is not None
+            )
+            self._ts_index = ([ts for ts, _ in pairs], [contact_id for _, contact_id in pairs])
+        timestamps, ids = self._ts_index
+
+        low = 0
+        high = len(timestamps)
+        if start_date:
+            low = bisect.bisect_left(timestamps, int(str(start_date).replace('-', '')) * 10000)
+        if end_date:
+            high = bisect.bisect_right(timestamps, int(str(end_date).replace('-', '')) * 10000 + 2359)
+        return set(ids[low:high])
+
+
+_contact_store = None
+
+
+def get_contact_store(database=None) -> ContactStore:
+    """Get singleton instance of the contact store"""
+    global _contact_store
+    if _contact_store is None or (database is not None and _contact_store.database is not database):
+        if _contact_store is not None:
+            _contact_store.close()
+        _contact_store = ContactStore(database)
+    return _contact_store
@@ -4,12 +4,17 @@ Uses SQLite for local storage
 """
 
 import glob
+import operator
 import os
 import shutil
 import sqlite3
 import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
 
 from src.app_paths import app_path
+from src.utils.skcc_number import extract_base_skcc_number
 
 
 BOOTSTRAP_DB_PATTERNS = (
@@ -61,16 +66,391 @@ CONTACT_TEXT_FIELDS = {
 }
 
 
+def _longest_callsign_segment_sql(call):
+    """SQL for the longest '/'-separated segment of a callsign (first three segments)."""
+    first_slash = f"INSTR({call}, '/')"
+    head = f"SUBSTR({call}, 1, {first_slash} - 1)"
+    rest = f"SUBSTR({call}, {first_slash} + 1)"
+    second_slash = f"INSTR({rest}, '/')"
+    middle = f"SUBSTR({rest}, 1, {second_slash} - 1)"
+    tail = f"SUBSTR({rest}, {second_slash} + 1)"
+    return (
+        f"CASE WHEN {first_slash} = 0 THEN {call} "
+        f"WHEN {second_slash} = 0 THEN "
+        f"CASE WHEN LENGTH({rest}) > LENGTH({head}) THEN {rest} ELSE {head} END "
+        f"WHEN LENGTH({middle}) > LENGTH({head}) AND LENGTH({middle}) >= LENGTH({tail}) THEN {middle} "
+        f"WHEN LENGTH({tail}) > LENGTH({head}) AND LENGTH({tail}) > LENGTH({middle}) THEN {tail} "
+        f"ELSE {head} END"
+    )
+
+
+# PRAGMA user_version of databases whose QSO dates are all YYYY-MM-DD
+QSO_DATE_SCHEMA_VERSION = 1
+
+# Normalized forms of contact fields used by award queries. Added as virtual
+# generated columns (SQLite 3.31+); older SQLite versions use the expressions inline.
+NORMALIZED_CONTACT_COLUMNS = {
+    # QSO date as YYYYMMDD (dates are stored as YYYY-MM-DD)
+    "date_yyyymmdd": "REPLACE(date, '-', '')",
+    "mode_norm": "UPPER(TRIM(mode))",
+    "key_type_norm": "UPPER(TRIM(key_type))",
+    # Leading digits of the SKCC number ("12345Tx2" -> 12345), NULL if none
+    "skcc_base_number": (
+        "CASE WHEN TRIM(skcc_number) GLOB '[0-9]*' "
+        "THEN CAST(TRIM(skcc_number) AS INTEGER) END"
+    ),
+    # Same rule as SKCCRosterManager.normalize_callsign: longest segment around '/'
+    "base_callsign": _longest_callsign_segment_sql("UPPER(TRIM(callsign))"),
+    # Sortable integer QSO timestamp YYYYMMDDHHMM for range seeks
+    "qso_ts": (
+        "CAST(REPLACE(date, '-', '') AS INTEGER) * 10000 + "
+        "CAST(SUBSTR(REPLACE(COALESCE(time_on, ''), ':', '') || '0000', 1, 4) AS INTEGER)"
+    ),
+}
+
+# SKCC membership roster (see replace_roster_members); {suffix} names the
+# staging tables a new roster is written to before it is swapped in
+ROSTER_MEMBERS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS skcc_roster_members{suffix} (
+        id INTEGER PRIMARY KEY,
+        skcc_number TEXT NOT NULL,
+        call TEXT NOT NULL,
+        other_calls TEXT NOT NULL DEFAULT '',
+        base_number INTEGER,
+        join_date TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS skcc_roster_calls{suffix} (
+        base_call TEXT NOT NULL,
+        member_id INTEGER NOT NULL,
+        PRIMARY KEY (base_call, member_id)
+    ) WITHOUT ROWID
+    """,
+)
+
+ROSTER_MEMBERS_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_skcc_roster_members_number
+    ON skcc_roster_members (base_number, join_date)
+"""
+
+# Award roster tables and their award date columns (dates are YYYYMMDD)
+AWARD_ROSTER_TABLES = {
+    'centurion': ('skcc_centurion_members', 'centurion_date'),
+    'tribune': ('skcc_tribune_members', 'tribune_date'),
+    'senator': ('skcc_senator_members', 'senator_date'),
+}
+
+NORMALIZED_COLUMN_INDEXES = {
+    "idx_contacts_qso_ts": "qso_ts",
+    "idx_contacts_award_filter_ts": "mode_norm, key_type_norm, qso_ts",
+    "idx_contacts_skcc_base_number": "skcc_base_number",
+    "idx_contacts_base_callsign": "base_callsign",
+}
+
+
+class ContactColumns:
+    """
+    Write layout of the contacts table, derived once from PRAGMA table_info.
+
+    Single and batch inserts share one INSERT statement and one row builder;
+    UPDATE statements are cached per set of changed columns. Identical SQL
+    text also lets sqlite3's statement cache reuse the prepared statement.
+    """
+
+    # Not written by the application (autoincrement key and column default)
+    SKIPPED_COLUMNS = ("id", "created_at")
+
+    def __init__(self, table_columns):
+        # Stored (not generated) columns in table order, as read back by SELECT
+        self.stored_columns = tuple(
+            name for name in table_columns if name not in NORMALIZED_CONTACT_COLUMNS
+        )
+        self.columns = tuple(name for name in self.stored_columns if name not in self.SKIPPED_COLUMNS)
+        self.column_set = frozenset(self.columns)
+        self.insert_sql = (
+            f"INSERT INTO contacts ({', '.join(self.columns)}) "
+            f"VALUES ({', '.join('?' * len(self.columns))})"
+        )
+        # Missing text fields are stored as "", other fields as NULL
+        self._defaults = {
+            name: ("" if name in CONTACT_TEXT_FIELDS else None) for name in self.columns
+        }
+        getter = operator.itemgetter(*self.columns)
+        self._row_getter = getter if len(self.columns) > 1 else (lambda values: (getter(values),))
+        self._update_sql = {}
+
+    def insert_row(self, contact, **overrides):
+        """Parameter tuple for insert_sql; keyword arguments replace contact fields."""
+        values = {**self._defaults, **contact, **overrides}
+        values["date"] = Database._canonical_qso_date(values["date"])
+        return self._row_getter(values)
+
+    def update_statement(self, contact_data):
+        """
+        Return (sql, params-without-id) updating the known columns in contact_data.
+
+        Keys that are not writable columns (id, generated columns, unknown
+        names) are ignored; sql is None when nothing is left to update.
+        """
+        names = tuple(name for name in contact_data if name in self.column_set)
+        if not names:
+            return None, []
+
+        sql = self._update_sql.get(names)
+        if sql is None:
+            sql = f"UPDATE contacts SET {', '.join(f'{name} = ?' for name in names)} WHERE id = ?"
+            self._update_sql[names] = sql
+
+        values = [contact_data[name] for name in names]
+        if "date" in names:
+            index = names.index("date")
+            values[index] = Database._canonical_qso_date(values[index])
+        return sql, values
+
+
+# Durability profiles selectable via the 'database.durability' config key.
+# QSO writes (add/update/delete contact, imports) always commit before returning;
+# DX spots are batched separately by the spot writer.
+DURABILITY_PROFILES = {
+    # Rollback journal, fsync on every commit (original behaviour). Reads on
+    # other threads' connections and commits wait for each other
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "wal_autocheckpoint": None,
+    },
+    # WAL, fsync of the WAL on every commit: survives power loss
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "wal_autocheckpoint": 1000,
+    },
+    # WAL without per-commit fsync: survives application crashes; a power
+    # loss can roll back the most recent commits
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "wal_autocheckpoint": 4000,
+    },
+}
+
+DEFAULT_DURABILITY = "safe"
+
+
+class _SpotWriter:
+    """
+    Write-behind queue for DX spots.
+
+    add() only appends to an in-memory buffer. A daemon thread inserts the
+    buffer with executemany() once batch_size spots are waiting or
+    flush_interval seconds after the first one arrived, then prunes spots
+    outside the retention window, at most PRUNE_CHUNK rows per rule and flush.
+    """
+
+    PRUNE_CHUNK = 500
+
+    def __init__(self, database, batch_size=50, flush_interval=0.5, max_age_hours=24, max_rows=20000):
+        self.database = database
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_age_hours = max_age_hours
+        self.max_rows = max_rows
+        self._pending = []
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopping = False
+        self._closed = False  # Set by stop(); later spots are dropped
+
+    def add(self, row):
+        """Queue one dx_spots row tuple (dropped once the writer is stopped)."""
+        with self._cond:
+            if self._closed:
+                return
+            self._pending.append(row)
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name="dx-spot-writer", daemon=True)
+                self._thread.start()
+            # Wake the writer to start the flush_interval timer, or for a full batch
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._pending and not self._stopping:
+                    self._cond.wait()
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                stopping = self._stopping
+            self.flush()
+            if stopping:
+                return
+
+    def flush(self):
+        """Insert every queued spot now."""
+        with self._cond:
+            rows, self._pending = self._pending, []
+        if not rows:
+            return
+
+        database = self.database
+        with database._write_lock:
+            if database.conn is None:
+                return
+            try:
+                cursor = database.conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO dx_spots
+                    (callsign, frequency, spotter, time, comment, cluster_source, received_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', rows)
+                self._prune(cursor)
+                database.conn.commit()
+            except sqlite3.Error as e:
+                try:
+                    database.conn.rollback()
+                except sqlite3.Error:
+                    pass
+                print(f"ERROR: Database write failed flushing {len(rows)} DX spots: {e}")
+
+    def _prune(self, cursor):
+        """Delete a bounded chunk of spots older than max_age_hours or beyond max_rows."""
+        if self.max_age_hours:
+            cursor.execute('''
+                DELETE FROM dx_spots WHERE id IN (
+                    SELECT id FROM dx_spots
+                    WHERE received_at < datetime('now', ?)
+                    LIMIT ?
+                )
+            ''', (f"-{self.max_age_hours} hours", self.PRUNE_CHUNK))
+        if self.max_rows:
+            cursor.execute('''
+                DELETE FROM dx_spots WHERE id IN (
+                    SELECT id FROM dx_spots
+                    WHERE id <= (SELECT id FROM dx_spots ORDER BY id DESC LIMIT 1 OFFSET ?)
+                    ORDER BY id
+                    LIMIT ?
+                )
+            ''', (self.max_rows, self.PRUNE_CHUNK))
+
+    def stop(self):
+        """Stop the writer thread after it has flushed the queue; later spots are dropped."""
+        with self._cond:
+            self._stopping = True
+            self._closed = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self.flush()
+
+
+class _DuplicateIndex:
+    """
+    Callsign/date/time index used to skip duplicate imports
+
+    A contact is a duplicate of a logged one with the same callsign and date
+    whose time_on is within window_minutes (exact time match if the time
+    cannot be parsed).
+
+    Only logged contacts that share a callsign and date with the contacts
+    being imported are loaded: load() puts the import's keys in a temporary
+    table and joins it against idx_contacts_date_callsign, so the cost
+    follows the size of the import rather than the size of the log.
+    """
+
+    def __init__(self, database, window_minutes):
+        self._database = database
+        self.window_minutes = window_minutes
+        self._contacts = set()
+        self._times = {}
+        self._loaded_keys = set()
+
+    def load(self, cursor, contacts):
+        """Index logged contacts sharing a callsign and date with contacts"""
+        keys = set()
+        for contact in contacts:
+            callsign = (contact.get('callsign') or '').strip().upper()
+            date = self._database._canonical_qso_date(contact.get('date'))
+            if callsign and date and (callsign, date) not in self._loaded_keys:
+                keys.add((callsign, date))
+        if not keys:
+            return
+        self._loaded_keys |= keys
+
+        cursor.execute('''
+            CREATE TEMP TABLE IF NOT EXISTS import_keys (
+                callsign TEXT NOT NULL,
+                date TEXT NOT NULL
+            )
+        ''')
+        cursor.execute('DELETE FROM temp.import_keys')
+        cursor.executemany('INSERT INTO temp.import_keys (callsign, date) VALUES (?, ?)', keys)
+        cursor.execute('''
+            SELECT c.callsign, c.date, c.time_on
+            FROM temp.import_keys AS k
+            JOIN contacts AS c
+              ON c.date = k.date AND c.callsign = k.callsign COLLATE NOCASE
+        ''')
+        for callsign, date, time_on in cursor.fetchall():
+            self.add(callsign, date, time_on)
+        cursor.execute('DELETE FROM temp.import_keys')
+
+    def _key(self, callsign, date, time_on):
+        if not (callsign and date and time_on):
+            return None, None
+        key = (callsign.upper(), self._database._normalize_qso_date(date))
+        return key, self._database._qso_time_to_minutes(time_on)
+
+    def is_duplicate(self, callsign, date, time_on):
+        key, minutes = self._key(callsign, date, time_on)
+        if key is None:
+            return False
+        if minutes is not None:
+            return any(
+                abs(minutes - existing_minutes) <= self.window_minutes
+                for existing_minutes in self._times.get(key, ())
+            )
+        return key + (time_on,) in self._contacts
+
+    def add(self, callsign, date, time_on):
+        key, minutes = self._key(callsign, date, time_on)
+        if key is None:
+            return
+        self._contacts.add(key + (time_on,))
+        if minutes is not None:
+            self._times.setdefault(key, []).append(minutes)
+
+
 class Database:
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, durability=None):
         # Default to logger.db in the runtime app directory
         if db_path is None:
             db_path = app_path("logger.db")
 
         self.db_path = db_path
         self.conn: sqlite3.Connection = None  # type: ignore[assignment]
+        self.durability = durability or DEFAULT_DURABILITY
+        if self.durability not in DURABILITY_PROFILES:
+            print(f"Warning: Unknown database durability '{self.durability}', using '{DEFAULT_DURABILITY}'")
+            self.durability = DEFAULT_DURABILITY
+        # DX spots are buffered and inserted in bulk off the calling thread
+        self._spot_writer = _SpotWriter(self)
+        # Per-thread read-only connections, keyed by thread
+        self._read_local = threading.local()
+        self._read_connections = {}
+        self._read_pool_lock = threading.Lock()
         # Thread lock for all write operations to prevent corruption
         self._write_lock = threading.Lock()
+        # Callables notified after contact writes commit (award state, caches)
+        self._change_listeners = []
+        # Set by _create_normalized_columns once generated columns exist
+        self.has_normalized_columns = False
+        # Insert/update statement layout, set by init_database from the live schema
+        self.contact_columns = None
         self._adopt_provided_backup_if_needed()
         self.init_database()
 
@@ -152,6 +532,30 @@ class Database:
             if conn is not None:
                 conn.close()
 
+    def add_change_listener(self, listener):
+        """
+        Register a callable notified after contact writes are committed.
+
+        The listener is called as ``listener(event, contact_id)`` where event is
+        'add', 'update', 'delete' or 'reload' (bulk changes such as imports, where
+        contact_id is None). Listeners run on the writing thread.
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+
+    def remove_change_listener(self, listener):
+        """Unregister a previously added change listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+
+    def _notify_change(self, event, contact_id=None):
+        """Notify change listeners; listener errors never fail the write."""
+        for listener in list(self._change_listeners):
+            try:
+                listener(event, contact_id)
+            except Exception as e:
+                print(f"Warning: Contact change listener failed: {type(e).__name__}: {e}")
+
     def _normalize_contact_record(self, contact):
         """Normalize nullable text fields so older backups behave like current records."""
         for field in CONTACT_TEXT_FIELDS:
@@ -170,6 +574,27 @@ class Database:
             return date_text.replace("-", "")
         return date_text
 
+    @staticmethod
+    def _canonical_qso_date(date_value):
+        """Return a QSO date as YYYY-MM-DD (YYYYMMDD input is converted)."""
+        date_text = str(date_value or "").strip()
+        if len(date_text) == 8 and date_text.isdigit():
+            return f"{date_text[:4]}-{date_text[4:6]}-{date_text[6:]}"
+        return date_text
+
+    @staticmethod
+    def _qso_ts(date_value, time_value="0000"):
+        """
+        Convert a QSO date and time to the integer qso_ts form (YYYYMMDDHHMM).
+
+        Returns None if the date is not YYYYMMDD or YYYY-MM-DD.
+        """
+        date_text = str(date_value or "").strip().replace("-", "")
+        time_text = (str(time_value or "").strip().replace(":", "") + "0000")[:4]
+        if len(date_text) != 8 or not date_text.isdigit() or not time_text.isdigit():
+            return None
+        return int(date_text) * 10000 + int(time_text)
+
     def _qso_time_to_minutes(self, time_value):
         """Convert HH:MM, HHMM, or HHMMSS to minutes since midnight."""
         time_text = str(time_value or "").strip().replace(":", "")
@@ -183,6 +608,63 @@ class Database:
 
         return hours * 60 + minutes
 
+    def _apply_durability(self, cursor):
+        """Set journal/sync pragmas for the durability profile."""
+        profile = DURABILITY_PROFILES[self.durability]
+        cursor.execute(f"PRAGMA journal_mode={profile['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous={profile['synchronous']}")
+        if profile['wal_autocheckpoint'] is not None:
+            # Periodic PASSIVE checkpoints keep the WAL file bounded
+            cursor.execute(f"PRAGMA wal_autocheckpoint={profile['wal_autocheckpoint']}")
+
+    @contextmanager
+    def read_connection(self):
+        """
+        Context manager yielding a connection for read-only queries.
+
+        Each thread gets its own ``mode=ro`` connection, so reads see the last
+        committed state without sharing cursors with other threads. Under WAL
+        (the 'balanced' and 'fast' profiles) reads also never wait for the
+        writer. With the rollback journal ('safe', the default) a read holds a
+        shared lock until its statement finishes: a commit waits for running
+        reads and new reads wait for a commit in progress (up to the 5 s busy
+        timeout), so keep reads short and fetch results before leaving the block.
+
+        Usage:
+            with database.read_connection() as conn:
+                rows = conn.execute("SELECT ...").fetchall()
+        """
+        yield self._reader()
+
+    def _reader(self):
+        """Return the calling thread's read connection (see read_connection)."""
+        conn = getattr(self._read_local, 'conn', None)
+        if conn is not None:
+            return conn
+
+        uri = f"{Path(os.path.abspath(self.db_path)).as_uri()}?mode=ro"
+        # check_same_thread=False only so close() can release it from another thread
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        with self._read_pool_lock:
+            # Release connections left behind by finished worker threads
+            for thread in [t for t in self._read_connections if not t.is_alive()]:
+                self._read_connections.pop(thread).close()
+            self._read_connections[threading.current_thread()] = conn
+        self._read_local.conn = conn
+        return conn
+
+    def _close_read_connections(self):
+        """Close every pooled read connection."""
+        with self._read_pool_lock:
+            for conn in self._read_connections.values():
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._read_connections.clear()
+            self._read_local = threading.local()
+
     def init_database(self):
         """
         Initialize database and create tables if they don't exist
@@ -197,10 +679,9 @@ class Database:
             self.conn.row_factory = sqlite3.Row
             cursor = self.conn.cursor()
 
-            # Use DELETE journal mode (more reliable than WAL, prevents corruption)
-            cursor.execute('PRAGMA journal_mode=DELETE')
-            # Set synchronous mode to FULL for maximum safety
-            cursor.execute('PRAGMA synchronous=FULL')
+            # Journal and sync mode come from the durability profile
+            # ('safe' keeps DELETE journal + synchronous=FULL)
+            self._apply_durability(cursor)
             # Enable foreign keys
             cursor.execute('PRAGMA foreign_keys=ON')
 
@@ -213,8 +694,7 @@ class Database:
                 self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
                 self.conn.row_factory = sqlite3.Row
                 cursor = self.conn.cursor()
-                cursor.execute('PRAGMA journal_mode=DELETE')
-                cursor.execute('PRAGMA synchronous=FULL')
+                self._apply_durability(cursor)
                 cursor.execute('PRAGMA foreign_keys=ON')
             else:
                 raise sqlite3.DatabaseError(f"Failed to connect to database {self.db_path}: {e}")
@@ -283,11 +763,17 @@ class Database:
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_contacts_key_type ON contacts(key_type)')
         cursor.execute('CREATE INDEX IF NOT EXISTS idx_contacts_mode_skcc ON contacts(mode, skcc_number, date)')
 
+        # Recent-spot queries and age-based spot pruning
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_dx_spots_received_at ON dx_spots(received_at)')
+
         self.conn.commit()
 
         # Validate database schema after creation/upgrade
         self._validate_schema(cursor)
 
+        cursor.execute("PRAGMA table_info(contacts)")
+        self.contact_columns = ContactColumns([row[1] for row in cursor.fetchall()])
+
     def _validate_schema(self, cursor):
         """Validate that the contacts table has all required core columns"""
         required_columns = ['id', 'callsign', 'date', 'time_on', 'band', 'mode']
@@ -360,6 +846,15 @@ class Database:
         # Create SKCC member list tables
         self._create_skcc_tables(cursor)
 
+        # Create contact change log, award state, backup and import checkpoint tables
+        self._create_state_tables(cursor)
+
+        # Store every QSO date as YYYY-MM-DD
+        self._canonicalize_qso_dates(cursor)
+
+        # Add normalized columns used by award queries
+        self._create_normalized_columns(cursor)
+
     def _create_skcc_tables(self, cursor):
         """Create SKCC member list tables for Tribune/Senator validation"""
 
@@ -402,6 +897,151 @@ class Database:
             )
         ''')
 
+        # Membership roster: members, and every base call they were listed
+        # under, so award queries can join on contacts.base_callsign
+        for statement in ROSTER_MEMBERS_SCHEMA:
+            cursor.execute(statement.format(suffix=''))
+        cursor.execute(ROSTER_MEMBERS_INDEX)
+
+        # Which roster version skcc_roster_members holds (single row)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS skcc_roster_source (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                source TEXT NOT NULL,
+                members INTEGER NOT NULL,
+                loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        self.conn.commit()
+
+    def _canonicalize_qso_dates(self, cursor):
+        """Rewrite QSO dates stored as YYYYMMDD to the canonical YYYY-MM-DD (once)"""
+        # New writes are canonical, so the rewrite only runs for older databases
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] >= QSO_DATE_SCHEMA_VERSION:
+            return
+
+        cursor.execute('''
+            UPDATE contacts
+            SET date = SUBSTR(date, 1, 4) || '-' || SUBSTR(date, 5, 2) || '-' || SUBSTR(date, 7, 2)
+            WHERE date GLOB '[0-9][0-9][0-9][0-9][0-9][0-9][0-9][0-9]'
+        ''')
+        if cursor.rowcount > 0:
+            print(f"Normalized {cursor.rowcount} QSO dates to YYYY-MM-DD")
+        # Committed with the rewrite, so an interrupted migration is retried
+        cursor.execute(f"PRAGMA user_version = {QSO_DATE_SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _create_normalized_columns(self, cursor):
+        """Add generated normalized columns and their indexes to contacts"""
+        self.has_normalized_columns = False
+        if sqlite3.sqlite_version_info < (3, 31, 0):
+            print(f"SQLite {sqlite3.sqlite_version} lacks generated columns; "
+                  f"award queries will normalize inline")
+            return
+
+        # table_xinfo lists generated columns, table_info hides them
+        cursor.execute("PRAGMA table_xinfo(contacts)")
+        existing_columns = {row[1] for row in cursor.fetchall()}
+
+        try:
+            for column, expression in NORMALIZED_CONTACT_COLUMNS.items():
+                if column not in existing_columns:
+                    cursor.execute(
+                        f'ALTER TABLE contacts ADD COLUMN {column} '
+                        f'GENERATED ALWAYS AS ({expression}) VIRTUAL'
+                    )
+                    print(f"Added column: {column}")
+
+            for index, columns in NORMALIZED_COLUMN_INDEXES.items():
+                cursor.execute(f'CREATE INDEX IF NOT EXISTS {index} ON contacts({columns})')
+            # Superseded by idx_contacts_award_filter_ts (date ranges now seek on qso_ts)
+            cursor.execute('DROP INDEX IF EXISTS idx_contacts_award_filter')
+
+            self.conn.commit()
+            self.has_normalized_columns = True
+        except sqlite3.OperationalError as e:
+            self.conn.rollback()
+            print(f"Warning: Could not add normalized columns: {e}")
+
+    def normalized_column(self, column):
+        """
+        Get SQL for a normalized contact column
+
+        Args:
+            column: Key of NORMALIZED_CONTACT_COLUMNS (e.g., 'date_yyyymmdd')
+
+        Returns:
+            str: The column name, or its expression when generated columns are unavailable
+        """
+        if self.has_normalized_columns:
+            return column
+        return f"({NORMALIZED_CONTACT_COLUMNS[column]})"
+
+    def _create_state_tables(self, cursor):
+        """Create the contact change log and persisted award state tables"""
+
+        # Every write to contacts is recorded here by triggers; the highest
+        # revision acts as a last-modified counter for the log
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS contact_changes (
+                revision INTEGER PRIMARY KEY AUTOINCREMENT,
+                contact_id INTEGER NOT NULL,
+                operation TEXT NOT NULL
+            )
+        ''')
+
+        for operation, row in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_contacts_{operation.lower()}_log
+                AFTER {operation} ON contacts
+                BEGIN
+                    INSERT INTO contact_changes (contact_id, operation)
+                    VALUES ({row}.id, '{operation}');
+                END
+            ''')
+
+        # Award progress snapshots (one row per award)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS award_state_snapshots (
+                award_key TEXT PRIMARY KEY,
+                rules_fingerprint TEXT NOT NULL,
+                log_fingerprint TEXT NOT NULL,
+                revision INTEGER NOT NULL,
+                progress TEXT NOT NULL,
+                qualifying_ids TEXT NOT NULL,
+                saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
+        # Incremental backup high-water marks (one row per backup directory);
+        # the change log is kept back to the oldest of them
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS export_watermarks (
+                target TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL,
+                snapshot TEXT NOT NULL,
+                snapshot_at TEXT NOT NULL,
+                journal_records INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+
+        # Position of an unfinished chunked import (one row per file content),
+        # written in the same transaction as each chunk
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS import_checkpoints (
+                file_hash TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                byte_offset INTEGER NOT NULL,
+                record_index INTEGER NOT NULL,
+                imported INTEGER NOT NULL DEFAULT 0,
+                duplicates INTEGER NOT NULL DEFAULT 0,
+                errors INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+
         self.conn.commit()
 
     def _attempt_auto_recovery(self):
@@ -447,12 +1087,19 @@ class Database:
                 os.remove(shm_file)
                 print(f"Removed SHM file: {shm_file}")
 
-            # Parse ADIF backup
+            # Parse ADIF backup, then replay the contacts journaled since it
             from src.adif import ADIFParser
+            from src.adif_backup import journal_path_for, merge_journal
             parser = ADIFParser()
             contacts = parser.parse_file(backup_file)
             print(f"Parsed {len(contacts)} contacts from backup")
 
+            journal_file = journal_path_for(backup_file)
+            if os.path.exists(journal_file):
+                journal_contacts = ADIFParser().parse_file(journal_file)
+                contacts = merge_journal(contacts, journal_contacts)
+                print(f"Applied {len(journal_contacts)} journaled contacts")
+
             if not contacts:
                 print("ERROR: No contacts found in backup file")
                 return False
@@ -577,61 +1224,10 @@ class Database:
         with self._write_lock:
             try:
                 cursor = self.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO contacts
-                    (callsign, date, time_on, time_off, frequency, band, mode,
-                     rst_sent, rst_rcvd, power, name, first_name, qth, gridsquare, county, state,
-                     country, continent, cq_zone, itu_zone, dxcc, iota, sota, pota,
-                     my_gridsquare, comment, notes, email,
-                     skcc_number, my_skcc_number, key_type, duration_minutes, power_watts, their_power_watts,
-                     distance_miles, distance_source, site, antenna, is_satellite, distance_nm, dxcc_entity)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    contact_data.get('callsign', ''),
-                    contact_data.get('date', ''),
-                    contact_data.get('time_on', ''),
-                    contact_data.get('time_off', ''),
-                    contact_data.get('frequency', ''),
-                    contact_data.get('band', ''),
-                    contact_data.get('mode', ''),
-                    contact_data.get('rst_sent', ''),
-                    contact_data.get('rst_rcvd', ''),
-                    contact_data.get('power', ''),
-                    contact_data.get('name', ''),
-                    contact_data.get('first_name', ''),
-                    contact_data.get('qth', ''),
-                    contact_data.get('gridsquare', ''),
-                    contact_data.get('county', ''),
-                    contact_data.get('state', ''),
-                    contact_data.get('country', ''),
-                    contact_data.get('continent', ''),
-                    contact_data.get('cq_zone', ''),
-                    contact_data.get('itu_zone', ''),
-                    contact_data.get('dxcc', ''),
-                    contact_data.get('iota', ''),
-                    contact_data.get('sota', ''),
-                    contact_data.get('pota', ''),
-                    contact_data.get('my_gridsquare', ''),
-                    contact_data.get('comment', ''),
-                    contact_data.get('notes', ''),
-                    contact_data.get('email', ''),
-                    # SKCC fields
-                    contact_data.get('skcc_number', ''),
-                    contact_data.get('my_skcc_number', ''),
-                    contact_data.get('key_type', ''),
-                    contact_data.get('duration_minutes', None),
-                    contact_data.get('power_watts', None),
-                    contact_data.get('their_power_watts', None),
-                    contact_data.get('distance_miles', None),
-                    contact_data.get('distance_source', ''),
-                    contact_data.get('site', ''),
-                    contact_data.get('antenna', ''),
-                    contact_data.get('is_satellite', None),
-                    contact_data.get('distance_nm', None),
-                    contact_data.get('dxcc_entity', None)
-                ))
+                cursor.execute(self.contact_columns.insert_sql,
+                               self.contact_columns.insert_row(contact_data))
                 self.conn.commit()
-                return cursor.lastrowid
+                contact_id = cursor.lastrowid
 
             except sqlite3.IntegrityError as e:
                 self.conn.rollback()
@@ -643,6 +1239,60 @@ class Database:
                 self.conn.rollback()
                 raise Exception(f"Unexpected error adding contact: {type(e).__name__}: {e}")
 
+        self._notify_change('add', contact_id)
+        return contact_id
+
+    def _prepare_import_rows(self, contacts, duplicates, offset, error_details, progress=None):
+        """
+        Validate imported contacts, skip duplicates and lay them out for INSERT
+
+        Args:
+            contacts: Contact dictionaries
+            duplicates: _DuplicateIndex, or None to keep duplicates
+            offset: Position of contacts[0] in the whole import (for messages)
+            error_details: List that error messages are appended to
+            progress: Optional callable(index), called every 100 contacts
+
+        Returns:
+            tuple: (rows, duplicate_count, error_count)
+        """
+        rows = []
+        duplicate_count = 0
+        error_count = 0
+
+        for idx, contact in enumerate(contacts, offset):
+            try:
+                # Progress update
+                if progress and idx % 100 == 0:
+                    progress(idx)
+
+                # Validate required fields
+                callsign = (contact.get('callsign') or '').strip()
+                if not callsign:
+                    error_count += 1
+                    error_details.append(f"Contact {idx + 1}: Missing callsign")
+                    continue
+
+                date = (contact.get('date') or '').strip()
+                time_on = (contact.get('time_on') or '').strip()
+
+                if duplicates is not None and duplicates.is_duplicate(callsign, date, time_on):
+                    duplicate_count += 1
+                    continue
+
+                # Same row layout as add_contact
+                rows.append(self.contact_columns.insert_row(
+                    contact, callsign=callsign, date=date, time_on=time_on
+                ))
+                if duplicates is not None:
+                    duplicates.add(callsign, date, time_on)
+
+            except Exception as e:
+                error_count += 1
+                error_details.append(f"Contact {idx + 1} ({contact.get('callsign', 'unknown')}): {str(e)}")
+
+        return rows, duplicate_count, error_count
+
     def add_contacts_batch(self, contacts, skip_duplicates=True, window_minutes=10, progress_callback=None):
         """
         Add multiple contacts in a single transaction for much faster imports.
@@ -683,143 +1333,28 @@ class Database:
                 cursor.execute('BEGIN TRANSACTION')
 
                 # Pre-load existing contacts for duplicate detection.
-                existing_contacts = set()
-                existing_contact_times = {}
+                duplicates = None
                 if skip_duplicates:
                     if progress_callback:
                         progress_callback(0, len(contacts), "Building duplicate detection index...")
+                    duplicates = _DuplicateIndex(self, window_minutes)
+                    duplicates.load(cursor, contacts)
 
-                    # Query all existing contacts for duplicate detection
-                    # For very large databases (>100k contacts), consider adding date filter
-                    cursor.execute('''
-                        SELECT callsign, date, time_on
-                        FROM contacts
-                    ''')
-
-                    for row in cursor.fetchall():
-                        callsign = row[0].upper() if row[0] else ''
-                        date = row[1] if row[1] else ''
-                        time_on = row[2] if row[2] else ''
-                        if callsign and date and time_on:
-                            normalized_date = self._normalize_qso_date(date)
-                            existing_contacts.add((callsign, normalized_date, time_on))
-
-                            minutes = self._qso_time_to_minutes(time_on)
-                            if minutes is not None:
-                                key = (callsign, normalized_date)
-                                existing_contact_times.setdefault(key, []).append(minutes)
+                def report(idx):
+                    if progress_callback:
+                        progress_callback(idx, len(contacts), f"Processing contact {idx + 1} of {len(contacts)}...")
 
                 # Prepare batch insert data
-                contacts_to_insert = []
-
-                for idx, contact in enumerate(contacts):
-                    try:
-                        # Progress update
-                        if progress_callback and idx % 100 == 0:
-                            progress_callback(idx, len(contacts), f"Processing contact {idx + 1} of {len(contacts)}...")
-
-                        # Validate required fields
-                        callsign = (contact.get('callsign') or '').strip()
-                        if not callsign:
-                            error_count += 1
-                            error_details.append(f"Contact {idx + 1}: Missing callsign")
-                            continue
-
-                        date = (contact.get('date') or '').strip()
-                        time_on = (contact.get('time_on') or '').strip()
-
-                        # Check for duplicates using the pre-loaded time index.
-                        if skip_duplicates and callsign and date and time_on:
-                            normalized_callsign = callsign.upper()
-                            normalized_date = self._normalize_qso_date(date)
-                            new_minutes = self._qso_time_to_minutes(time_on)
-                            duplicate_found = False
-
-                            if new_minutes is not None:
-                                existing_times = existing_contact_times.get(
-                                    (normalized_callsign, normalized_date),
-                                    [],
-                                )
-                                duplicate_found = any(
-                                    abs(new_minutes - existing_minutes) <= window_minutes
-                                    for existing_minutes in existing_times
-                                )
-                            elif (normalized_callsign, normalized_date, time_on) in existing_contacts:
-                                duplicate_found = True
-
-                            if duplicate_found:
-                                duplicate_count += 1
-                                continue
-
-                        # Build tuple for batch insert
-                        contact_tuple = (
-                            callsign,
-                            date,
-                            time_on,
-                            contact.get('time_off', ''),
-                            contact.get('frequency', ''),
-                            contact.get('band', ''),
-                            contact.get('mode', ''),
-                            contact.get('rst_sent', ''),
-                            contact.get('rst_rcvd', ''),
-                            contact.get('power', ''),
-                            contact.get('name', ''),
-                            contact.get('qth', ''),
-                            contact.get('gridsquare', ''),
-                            contact.get('county', ''),
-                            contact.get('state', ''),
-                            contact.get('country', ''),
-                            contact.get('continent', ''),
-                            contact.get('cq_zone', ''),
-                            contact.get('itu_zone', ''),
-                            contact.get('dxcc', ''),
-                            contact.get('iota', ''),
-                            contact.get('sota', ''),
-                            contact.get('pota', ''),
-                            contact.get('my_gridsquare', ''),
-                            contact.get('comment', ''),
-                            contact.get('notes', ''),
-                            contact.get('skcc_number', ''),
-                            contact.get('my_skcc_number', ''),
-                            contact.get('key_type', ''),
-                            contact.get('duration_minutes', None),
-                            contact.get('power_watts', None),
-                            contact.get('their_power_watts', None),
-                            contact.get('distance_miles', None),
-                            contact.get('distance_source', ''),
-                            contact.get('site', ''),
-                            contact.get('antenna', ''),
-                            contact.get('is_satellite', None),
-                            contact.get('distance_nm', None),
-                            contact.get('dxcc_entity', None)
-                        )
-
-                        contacts_to_insert.append(contact_tuple)
-                        if skip_duplicates and callsign and date and time_on:
-                            existing_contacts.add((normalized_callsign, normalized_date, time_on))
-                            if new_minutes is not None:
-                                key = (normalized_callsign, normalized_date)
-                                existing_contact_times.setdefault(key, []).append(new_minutes)
-
-                    except Exception as e:
-                        error_count += 1
-                        error_details.append(f"Contact {idx + 1} ({contact.get('callsign', 'unknown')}): {str(e)}")
+                contacts_to_insert, duplicate_count, error_count = self._prepare_import_rows(
+                    contacts, duplicates, 0, error_details, report
+                )
 
                 # Batch insert all contacts at once
                 if contacts_to_insert:
                     if progress_callback:
                         progress_callback(len(contacts), len(contacts), f"Inserting {len(contacts_to_insert)} contacts...")
 
-                    cursor.executemany('''
-                        INSERT INTO contacts
-                        (callsign, date, time_on, time_off, frequency, band, mode,
-                         rst_sent, rst_rcvd, power, name, qth, gridsquare, county, state,
-                         country, continent, cq_zone, itu_zone, dxcc, iota, sota, pota,
-                         my_gridsquare, comment, notes,
-                         skcc_number, my_skcc_number, key_type, duration_minutes, power_watts, their_power_watts,
-                         distance_miles, distance_source, site, antenna, is_satellite, distance_nm, dxcc_entity)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', contacts_to_insert)
+                    cursor.executemany(self.contact_columns.insert_sql, contacts_to_insert)
 
                     imported_count = len(contacts_to_insert)
 
@@ -829,7 +1364,7 @@ class Database:
                 if progress_callback:
                     progress_callback(len(contacts), len(contacts), "Import complete!")
 
-                return {
+                result = {
                     'imported': imported_count,
                     'duplicates': duplicate_count,
                     'errors': error_count,
@@ -843,10 +1378,147 @@ class Database:
                 self.conn.rollback()
                 raise Exception(f"Unexpected error during batch import: {type(e).__name__}: {e}")
 
+        if imported_count:
+            self._notify_change('reload')
+        return result
+
+    def import_contact_chunks(self, chunks, total=None, skip_duplicates=True, window_minutes=10,
+                              progress_callback=None, checkpoint=None):
+        """
+        Insert contacts arriving in chunks, one bounded transaction per chunk
+
+        Used by the staged ADIF import: each chunk is committed as soon as it
+        arrives, so the write lock is never held for the whole import and
+        progress is reported per chunk. Duplicates are looked up per chunk for
+        just the callsigns and dates it contains.
+
+        With a checkpoint, the file position after each chunk is saved in the
+        chunk's own transaction, so an interrupted import can resume right
+        after the last committed chunk. The checkpoint is removed once the
+        last chunk is written.
+
+        Args:
+            chunks: Iterable of lists of contact dictionaries, or of
+                (contacts, next_record_index, next_byte_offset) tuples; a
+                checkpoint needs the tuples
+            total: Expected number of contacts (for progress only)
+            skip_duplicates: If True, skip contacts that appear to be duplicates
+            window_minutes: Time window for duplicate detection in minutes
+            progress_callback: Optional callback function(current, total, message)
+            checkpoint: Optional dict with file_hash, filename, record_index,
+                imported, duplicates and errors to continue from (a row from
+                get_import_checkpoint, or zeros for a new import)
+
+        Returns:
+            dict: Same keys as add_contacts_batch (counts include the part
+                imported before resuming), plus resumed_from (record index)
+
+        Raises:
+            sqlite3.DatabaseError: If a chunk cannot be written (earlier chunks stay committed)
+        """
+        imported_count = checkpoint['imported'] if checkpoint else 0
+        duplicate_count = checkpoint['duplicates'] if checkpoint else 0
+        error_count = checkpoint['errors'] if checkpoint else 0
+        error_details = []
+        resumed_from = processed = checkpoint['record_index'] if checkpoint else 0
+        written = 0
+
+        duplicates = _DuplicateIndex(self, window_minutes) if skip_duplicates else None
+
+        try:
+            for chunk in chunks:
+                if isinstance(chunk, tuple):
+                    chunk, next_index, next_offset = chunk
+                else:
+                    next_index = processed + len(chunk)
+                with self._write_lock:
+                    try:
+                        cursor = self.conn.cursor()
+                        cursor.execute('BEGIN TRANSACTION')
+                        if duplicates is not None:
+                            duplicates.load(cursor, chunk)
+                        rows, chunk_duplicates, chunk_errors = self._prepare_import_rows(
+                            chunk, duplicates, processed, error_details
+                        )
+                        if rows:
+                            cursor.executemany(self.contact_columns.insert_sql, rows)
+                        if checkpoint is not None:
+                            cursor.execute('''
+                                INSERT OR REPLACE INTO import_checkpoints
+                                (file_hash, filename, byte_offset, record_index,
+                                 imported, duplicates, errors, updated_at)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                            ''', (checkpoint['file_hash'], checkpoint['filename'], next_offset,
+                                  next_index, imported_count + len(rows),
+                                  duplicate_count + chunk_duplicates, error_count + chunk_errors))
+                        self.conn.commit()
+                    except sqlite3.Error as e:
+                        self.conn.rollback()
+                        raise sqlite3.DatabaseError(
+                            f"Import failed after {imported_count} contacts: {e}"
+                        )
+
+                imported_count += len(rows)
+                written += len(rows)
+                duplicate_count += chunk_duplicates
+                error_count += chunk_errors
+                processed = next_index
+                del error_details[10:]
+                if progress_callback:
+                    progress_callback(processed, max(total or 0, processed),
+                                      f"Imported {imported_count} of {total or processed} contacts...")
+
+            if checkpoint is not None:
+                self.delete_import_checkpoint(checkpoint['file_hash'])
+        finally:
+            if written:
+                self._notify_change('reload')
+
+        if progress_callback:
+            progress_callback(processed, processed, "Import complete!")
+
+        return {
+            'imported': imported_count,
+            'duplicates': duplicate_count,
+            'errors': error_count,
+            'error_details': error_details[:10],  # Limit to first 10 errors
+            'resumed_from': resumed_from
+        }
+
+    def get_import_checkpoint(self, file_hash):
+        """
+        Get the saved position of an unfinished chunked import
+
+        Args:
+            file_hash: Content hash of the import file
+
+        Returns:
+            dict: Checkpoint row (byte_offset, record_index and running
+                counts), or None if no import of this file is unfinished
+        """
+        try:
+            row = self._reader().execute(
+                'SELECT * FROM import_checkpoints WHERE file_hash = ?', (file_hash,)
+            ).fetchone()
+            return dict(row) if row else None
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_import_checkpoint: {e}")
+            return None
+
+    def delete_import_checkpoint(self, file_hash):
+        """Forget an import checkpoint so the next import of the file starts over"""
+        with self._write_lock:
+            try:
+                self.conn.execute('DELETE FROM import_checkpoints WHERE file_hash = ?', (file_hash,))
+                self.conn.commit()
+            except sqlite3.DatabaseError as e:
+                self.conn.rollback()
+                raise sqlite3.DatabaseError(f"Failed to delete import checkpoint: {e}")
+
     def get_all_contacts(self, limit=100):
         """Retrieve all contacts (most recent first)"""
         try:
-            cursor = self.conn.cursor()
+            cursor = self._reader().cursor()
             cursor.execute('''
                 SELECT * FROM contacts
                 ORDER BY date DESC, time_on DESC
@@ -861,6 +1533,443 @@ class Database:
             print(f"ERROR: Unexpected error in get_all_contacts: {type(e).__name__}: {e}")
             return []
 
+    def count_contacts(self):
+        """Count contacts in the log"""
+        try:
+            return self._reader().execute('SELECT COUNT(*) FROM contacts').fetchone()[0]
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in count_contacts: {e}")
+            return 0
+
+    def iter_contacts(self, columns=None, where=None, params=(),
+                      order_by='date DESC, time_on DESC', batch_size=1000):
+        """
+        Stream contacts in batches instead of building the whole list
+
+        Rows are fetched with fetchmany() so only batch_size rows are held at a
+        time; stop iterating early to skip the rest of the log.
+
+        Args:
+            columns: Column names to select (default: all columns)
+            where: Optional SQL WHERE clause with ? placeholders
+            params: Parameters for the WHERE clause
+            order_by: SQL ORDER BY clause, or None for table order
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            dict: One contact per row with only the selected columns
+                  (NULL text fields normalized to "")
+        """
+        if columns:
+            columns = list(columns)
+            invalid = [name for name in columns if not str(name).isidentifier()]
+            if invalid:
+                raise ValueError(f"Invalid contact column names: {invalid}")
+            select = ', '.join(columns)
+        else:
+            select = '*'
+
+        query = f'SELECT {select} FROM contacts'
+        if where:
+            query += f' WHERE {where}'
+        if order_by:
+            query += f' ORDER BY {order_by}'
+
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute(query, list(params))
+            names = [description[0] for description in cursor.description]
+            text_fields = [name in CONTACT_TEXT_FIELDS for name in names]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield {
+                        name: ("" if value is None and is_text else value)
+                        for name, value, is_text in zip(names, row, text_fields)
+                    }
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in iter_contacts: {e}")
+
+    def get_contact(self, contact_id):
+        """Retrieve a single contact by ID, or None if it does not exist"""
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute('SELECT * FROM contacts WHERE id = ?', (contact_id,))
+            row = cursor.fetchone()
+            return self._normalize_contact_record(dict(row)) if row else None
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_contact: {e}")
+            return None
+
+    def get_contacts_by_ids(self, contact_ids):
+        """
+        Retrieve contacts by ID
+
+        Args:
+            contact_ids: Iterable of contact IDs
+
+        Returns:
+            list: Normalized contact dictionaries (missing IDs are skipped)
+        """
+        contact_ids = list(contact_ids)
+        contacts = []
+        try:
+            cursor = self._reader().cursor()
+            # Stay below SQLite's host parameter limit
+            for start in range(0, len(contact_ids), 500):
+                chunk = contact_ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor.execute(f'SELECT * FROM contacts WHERE id IN ({placeholders})', chunk)
+                contacts.extend(self._normalize_contact_records(cursor.fetchall()))
+            return contacts
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_contacts_by_ids: {e}")
+            return []
+
+    def get_log_revision(self):
+        """Get the contact change counter (increases on every contact write)"""
+        try:
+            row = self._reader().execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'contact_changes'"
+            ).fetchone()
+            return row[0] if row else 0
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_log_revision: {e}")
+            return 0
+
+    def get_log_fingerprint(self):
+        """
+        Get a fingerprint of the contacts table
+
+        Returns:
+            str: "max_id:row_count:revision"
+        """
+        try:
+            max_id, count = self._reader().execute(
+                'SELECT COALESCE(MAX(id), 0), COUNT(*) FROM contacts'
+            ).fetchone()
+            return f"{max_id}:{count}:{self.get_log_revision()}"
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_log_fingerprint: {e}")
+            return ""
+
+    def get_contact_changes(self, since_revision):
+        """
+        Get contact writes recorded after a revision
+
+        Args:
+            since_revision: Last revision already seen
+
+        Returns:
+            list: (revision, contact_id, operation) tuples in order, or None if
+                the change log no longer covers since_revision (pruned)
+        """
+        try:
+            cursor = self._reader().cursor()
+            oldest = cursor.execute('SELECT MIN(revision) FROM contact_changes').fetchone()[0]
+            current = self.get_log_revision()
+            if current > since_revision and (oldest is None or oldest > since_revision + 1):
+                return None
+
+            cursor.execute('''
+                SELECT revision, contact_id, operation FROM contact_changes
+                WHERE revision > ?
+                ORDER BY revision
+            ''', (since_revision,))
+            return [tuple(row) for row in cursor.fetchall()]
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_contact_changes: {e}")
+            return None
+
+    def get_award_roster_versions(self):
+        """
+        Get a version marker for each stored award roster table
+
+        Rosters are replaced wholesale on download, so (row count, max id)
+        changes whenever a roster is refreshed.
+
+        Returns:
+            dict: {award_type: "count:max_id"}
+        """
+        versions = {}
+        try:
+            for award_type, (table, _) in AWARD_ROSTER_TABLES.items():
+                count, max_id = self._reader().execute(
+                    f'SELECT COUNT(*), COALESCE(MAX(id), 0) FROM {table}'
+                ).fetchone()
+                versions[award_type] = f"{count}:{max_id}"
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_award_roster_versions: {e}")
+        return versions
+
+    def get_award_roster_dates(self, award_type):
+        """
+        Get a stored Centurion/Tribune/Senator award roster
+
+        Args:
+            award_type: Key of AWARD_ROSTER_TABLES ('centurion', 'tribune', 'senator')
+
+        Returns:
+            dict: {skcc_number: award date (YYYYMMDD)}, empty if none is stored
+        """
+        table, date_column = AWARD_ROSTER_TABLES[award_type]
+        try:
+            rows = self._reader().execute(
+                f'SELECT skcc_number, {date_column} FROM {table} WHERE {date_column} IS NOT NULL'
+            ).fetchall()
+            return {skcc_number: award_date for skcc_number, award_date in rows}
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_award_roster_dates: {e}")
+            return {}
+
+    def get_roster_member_source(self):
+        """
+        Get the version marker of the stored SKCC membership roster
+
+        Returns:
+            str: Source passed to replace_roster_members(), or None if no roster is stored
+        """
+        try:
+            row = self._reader().execute('SELECT source FROM skcc_roster_source WHERE id = 1').fetchone()
+            return row[0] if row else None
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_roster_member_source: {e}")
+            return None
+
+    def replace_roster_members(self, members, source):
+        """
+        Replace the stored SKCC membership roster
+
+        The new roster is written to staging tables that are swapped in for
+        the old ones in the same transaction, so readers see one roster or
+        the other in full.
+
+        Args:
+            members: (skcc_number, call, other_calls, join_date, base_calls)
+                tuples in roster order; join_date is YYYYMMDD and base_calls are
+                the normalized forms of the member's call and other calls
+            source: Version marker of the roster (SKCCRosterManager.source)
+
+        Returns:
+            int: Number of members stored
+        """
+        member_rows = []
+        call_rows = []
+        for member_id, (skcc_number, call, other_calls, join_date, base_calls) in enumerate(members, 1):
+            base_number = extract_base_skcc_number(skcc_number)
+            member_rows.append((member_id, skcc_number, call, other_calls or '',
+                                int(base_number) if base_number else None, join_date or None))
+            call_rows.extend((base_call, member_id) for base_call in base_calls if base_call)
+
+        with self._write_lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute('BEGIN TRANSACTION')
+                for table in ('skcc_roster_members', 'skcc_roster_calls'):
+                    cursor.execute(f'DROP TABLE IF EXISTS {table}_staging')
+                for statement in ROSTER_MEMBERS_SCHEMA:
+                    cursor.execute(statement.format(suffix='_staging'))
+                cursor.executemany(
+                    'INSERT INTO skcc_roster_members_staging VALUES (?, ?, ?, ?, ?, ?)', member_rows
+                )
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO skcc_roster_calls_staging VALUES (?, ?)', call_rows
+                )
+                for table in ('skcc_roster_members', 'skcc_roster_calls'):
+                    cursor.execute(f'DROP TABLE {table}')
+                    cursor.execute(f'ALTER TABLE {table}_staging RENAME TO {table}')
+                cursor.execute(ROSTER_MEMBERS_INDEX)
+                cursor.execute('''
+                    INSERT OR REPLACE INTO skcc_roster_source (id, source, members, loaded_at)
+                    VALUES (1, ?, ?, CURRENT_TIMESTAMP)
+                ''', (source, len(member_rows)))
+                self.conn.commit()
+                return len(member_rows)
+            except sqlite3.DatabaseError as e:
+                self.conn.rollback()
+                raise sqlite3.DatabaseError(f"Failed to replace roster members: {e}")
+
+    def roster_member_condition(self, source, include_numbers=False):
+        """
+        SQL condition: the contacted station was an SKCC member on the QSO date
+
+        Joins the contact's base callsign to skcc_roster_calls (primary key
+        seek) and compares the member's join date with the QSO date. With
+        include_numbers, a member whose SKCC number matches the contact's
+        also satisfies it.
+
+        Args:
+            source: Roster version the caller validates against; the condition
+                is only usable when the stored roster is the same one
+            include_numbers: Also match members by SKCC base number
+
+        Returns:
+            str: SQL condition, or None if the stored roster is missing or stale
+        """
+        if not source or self.get_roster_member_source() != source:
+            return None
+
+        qso_date = self.normalized_column('date_yyyymmdd')
+        condition = (
+            f"EXISTS (SELECT 1 FROM skcc_roster_calls rc "
+            f"JOIN skcc_roster_members rm ON rm.id = rc.member_id "
+            f"WHERE rc.base_call = {self.normalized_column('base_callsign')} "
+            f"AND rm.join_date <= {qso_date})"
+        )
+        if include_numbers:
+            condition = (
+                f"({condition} OR EXISTS (SELECT 1 FROM skcc_roster_members rm "
+                f"WHERE rm.base_number = {self.normalized_column('skcc_base_number')} "
+                f"AND rm.join_date <= {qso_date}))"
+            )
+        return condition
+
+    def award_holder_condition(self, award_types):
+        """
+        SQL condition: the contacted station held one of the awards on the QSO date
+
+        Joins the contact's SKCC base number to the award roster tables
+        (unique index seek) and compares award date and QSO date.
+
+        Args:
+            award_types: Keys of AWARD_ROSTER_TABLES ('centurion', 'tribune', 'senator')
+
+        Returns:
+            str: SQL condition, or None if any of the award rosters is empty
+        """
+        skcc_number = f"CAST({self.normalized_column('skcc_base_number')} AS TEXT)"
+        qso_date = self.normalized_column('date_yyyymmdd')
+        conditions = []
+        try:
+            for award_type in award_types:
+                table, date_column = AWARD_ROSTER_TABLES[award_type]
+                if self._reader().execute(f'SELECT 1 FROM {table} LIMIT 1').fetchone() is None:
+                    return None
+                conditions.append(
+                    f"EXISTS (SELECT 1 FROM {table} a WHERE a.skcc_number = {skcc_number} "
+                    f"AND a.{date_column} <= {qso_date})"
+                )
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in award_holder_condition: {e}")
+            return None
+        return f"({' OR '.join(conditions)})"
+
+    def get_award_snapshots(self):
+        """
+        Get persisted award state snapshots
+
+        Returns:
+            dict: {award_key: snapshot row dict}
+        """
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute('SELECT * FROM award_state_snapshots')
+            return {row['award_key']: dict(row) for row in cursor.fetchall()}
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_award_snapshots: {e}")
+            return {}
+
+    def save_award_snapshots(self, snapshots, rules_fingerprint, log_fingerprint, revision):
+        """
+        Replace the persisted award state snapshots
+
+        Change log entries up to the snapshot revision are no longer needed to
+        bring the snapshots up to date and are pruned, unless an incremental
+        backup has not caught up with them yet.
+
+        Args:
+            snapshots: {award_key: (progress_json, qualifying_ids_json)}
+            rules_fingerprint: Fingerprint of rosters, award dates and rules
+            log_fingerprint: Database.get_log_fingerprint() at snapshot time
+            revision: Log revision the snapshots reflect
+        """
+        with self._write_lock:
+            try:
+                cursor = self.conn.cursor()
+                cursor.execute('DELETE FROM award_state_snapshots')
+                cursor.executemany('''
+                    INSERT INTO award_state_snapshots
+                    (award_key, rules_fingerprint, log_fingerprint, revision, progress, qualifying_ids)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', [
+                    (award_key, rules_fingerprint, log_fingerprint, revision, progress, qualifying_ids)
+                    for award_key, (progress, qualifying_ids) in snapshots.items()
+                ])
+                # Incremental backups still need the changes after their watermark
+                cursor.execute('''
+                    DELETE FROM contact_changes WHERE revision <= MIN(
+                        ?, COALESCE((SELECT MIN(revision) FROM export_watermarks), ?)
+                    )
+                ''', (revision, revision))
+                self.conn.commit()
+            except sqlite3.DatabaseError as e:
+                self.conn.rollback()
+                raise sqlite3.DatabaseError(f"Failed to save award snapshots: {e}")
+
+    def get_export_watermark(self, target):
+        """
+        Get the incremental backup state of a backup directory
+
+        Args:
+            target: Absolute path of the backup directory
+
+        Returns:
+            dict: revision, snapshot, snapshot_at and journal_records, or None
+        """
+        try:
+            row = self._reader().execute(
+                'SELECT * FROM export_watermarks WHERE target = ?', (target,)
+            ).fetchone()
+            return dict(row) if row else None
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_export_watermark: {e}")
+            return None
+
+    def set_export_watermark(self, target, revision, snapshot, snapshot_at, journal_records):
+        """
+        Record how far a backup directory has been exported
+
+        Args:
+            target: Absolute path of the backup directory
+            revision: Last log revision contained in the backup
+            snapshot: Filename of the full snapshot the journal extends
+            snapshot_at: ISO timestamp of that snapshot
+            journal_records: Records appended to the journal since the snapshot
+        """
+        with self._write_lock:
+            try:
+                self.conn.execute('''
+                    INSERT OR REPLACE INTO export_watermarks
+                    (target, revision, snapshot, snapshot_at, journal_records)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (target, revision, snapshot, snapshot_at, journal_records))
+                self.conn.commit()
+            except sqlite3.DatabaseError as e:
+                self.conn.rollback()
+                raise sqlite3.DatabaseError(f"Failed to save export watermark: {e}")
+
+    def get_contacts_missing_distance(self):
+        """
+        Get contacts whose distance can be derived from gridsquares but is not stored yet
+
+        Returns:
+            list: Dictionaries with id, my_gridsquare and gridsquare
+        """
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute('''
+                SELECT id, my_gridsquare, gridsquare FROM contacts
+                WHERE distance_nm IS NULL
+                  AND LENGTH(TRIM(my_gridsquare)) >= 4
+                  AND LENGTH(TRIM(gridsquare)) >= 4
+            ''')
+            return [dict(row) for row in cursor.fetchall()]
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database read failed in get_contacts_missing_distance: {e}")
+            return []
+
     def get_contacts_by_date_range(self, start_date, end_date, start_time=None, end_time=None):
         """
         Retrieve contacts within a date/time range
@@ -874,7 +1983,7 @@ class Database:
         Returns:
             List of contact dictionaries within the specified range
         """
-        cursor = self.conn.cursor()
+        cursor = self._reader().cursor()
 
         # Default times if not specified
         if start_time is None:
@@ -882,14 +1991,21 @@ class Database:
         if end_time is None:
             end_time = '23:59'
 
-        # Query contacts within date/time range
+        start_ts = self._qso_ts(start_date, start_time)
+        end_ts = self._qso_ts(end_date, end_time)
+        if start_ts is None or end_ts is None:
+            print(f"ERROR: Invalid date range in get_contacts_by_date_range: "
+                  f"{start_date} {start_time} - {end_date} {end_time}")
+            return []
+
+        # Query contacts within date/time range (index range seek on qso_ts)
         try:
-            cursor.execute('''
+            qso_ts = self.normalized_column('qso_ts')
+            cursor.execute(f'''
                 SELECT * FROM contacts
-                WHERE (date > ? OR (date = ? AND time_on >= ?))
-                  AND (date < ? OR (date = ? AND time_on <= ?))
-                ORDER BY date ASC, time_on ASC
-            ''', (start_date, start_date, start_time, end_date, end_date, end_time))
+                WHERE {qso_ts} BETWEEN ? AND ?
+                ORDER BY {qso_ts} ASC
+            ''', (start_ts, end_ts))
 
             # Convert Row objects to dicts for compatibility
             return self._normalize_contact_records(cursor.fetchall())
@@ -903,7 +2019,7 @@ class Database:
     def search_contacts(self, callsign):
         """Search for contacts by callsign"""
         try:
-            cursor = self.conn.cursor()
+            cursor = self._reader().cursor()
             cursor.execute('''
                 SELECT * FROM contacts
                 WHERE callsign LIKE ?
@@ -926,7 +2042,7 @@ class Database:
             dict with duplicate info or None if not a duplicate
         """
         try:
-            cursor = self.conn.cursor()
+            cursor = self._reader().cursor()
             cursor.execute('''
                 SELECT * FROM contacts
                 WHERE callsign = ? AND band = ? AND mode = ? AND date = ?
@@ -948,7 +2064,7 @@ class Database:
 
         Args:
             callsign: Callsign to check
-            date: Date in YYYYMMDD format
+            date: Date in YYYY-MM-DD or YYYYMMDD format
             time_on: Time in HHMM or HHMMSS format
             window_minutes: Time window in minutes (default 10)
 
@@ -957,14 +2073,18 @@ class Database:
         """
         from datetime import datetime
 
-        cursor = self.conn.cursor()
+        # Stored dates are YYYY-MM-DD; times are parsed against YYYYMMDD
+        stored_date = self._canonical_qso_date(date)
+        date = stored_date.replace("-", "")
+
+        cursor = self._reader().cursor()
 
         # Get all contacts with same callsign on the same date
         cursor.execute('''
             SELECT * FROM contacts
             WHERE callsign = ? AND date = ?
             ORDER BY time_on
-        ''', (callsign.upper(), date))
+        ''', (callsign.upper(), stored_date))
 
         results = cursor.fetchall()
         if not results:
@@ -1006,32 +2126,49 @@ class Database:
         return None
 
     def add_dx_spot(self, spot_data):
-        """Add a DX spot to cache"""
-        try:
-            with self._write_lock:
-                cursor = self.conn.cursor()
-                cursor.execute('''
-                    INSERT INTO dx_spots
-                    (callsign, frequency, spotter, time, comment, cluster_source)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    spot_data.get('callsign', ''),
-                    spot_data.get('frequency', ''),
-                    spot_data.get('spotter', ''),
-                    spot_data.get('time', ''),
-                    spot_data.get('comment', ''),
-                    spot_data.get('cluster_source', '')
-                ))
-                self.conn.commit()
-        except sqlite3.DatabaseError as e:
-            print(f"ERROR: Database write failed in add_dx_spot: {e}")
-        except Exception as e:
-            print(f"ERROR: Unexpected error in add_dx_spot: {type(e).__name__}: {e}")
+        """
+        Add a DX spot to cache
+
+        The spot is queued and written in bulk by a background thread; call
+        flush() to write queued spots immediately.
+        """
+        self._spot_writer.add((
+            spot_data.get('callsign', ''),
+            spot_data.get('frequency', ''),
+            spot_data.get('spotter', ''),
+            spot_data.get('time', ''),
+            spot_data.get('comment', ''),
+            spot_data.get('cluster_source', ''),
+            # Same format as CURRENT_TIMESTAMP, taken when the spot arrived
+            datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+        ))
+
+    def configure_spot_writer(self, batch_size=None, flush_interval_ms=None,
+                              max_age_hours=None, max_rows=None):
+        """
+        Tune DX spot batching and retention
+
+        Args:
+            batch_size: Spots queued before a write is forced
+            flush_interval_ms: Longest time a queued spot waits to be written
+            max_age_hours: Spots older than this are pruned (0 keeps all)
+            max_rows: Most spots kept in dx_spots (0 for no cap)
+        """
+        writer = self._spot_writer
+        if batch_size is not None:
+            writer.batch_size = max(1, int(batch_size))
+        if flush_interval_ms is not None:
+            writer.flush_interval = max(0, int(flush_interval_ms)) / 1000
+        if max_age_hours is not None:
+            writer.max_age_hours = max(0, int(max_age_hours))
+        if max_rows is not None:
+            writer.max_rows = max(0, int(max_rows))
 
     def get_recent_spots(self, limit=50):
         """Get recent DX spots"""
+        self._spot_writer.flush()
         try:
-            cursor = self.conn.cursor()
+            cursor = self._reader().cursor()
             cursor.execute('''
                 SELECT * FROM dx_spots
                 ORDER BY received_at DESC
@@ -1056,26 +2193,15 @@ class Database:
         """
         try:
             with self._write_lock:
-                cursor = self.conn.cursor()
-
-                # Build the UPDATE query dynamically based on provided fields
-                fields = []
-                values = []
-
-                for field, value in contact_data.items():
-                    if field != 'id':  # Don't update the ID field
-                        fields.append(f"{field} = ?")
-                        values.append(value)
-
-                if not fields:
+                # Statement is cached per set of updated columns
+                query, values = self.contact_columns.update_statement(contact_data)
+                if query is None:
                     return  # Nothing to update
 
                 # Add the contact_id for the WHERE clause
                 values.append(contact_id)
 
-                query = f"UPDATE contacts SET {', '.join(fields)} WHERE id = ?"
-
-                cursor.execute(query, values)
+                self.conn.execute(query, values)
                 self.conn.commit()
         except sqlite3.DatabaseError as e:
             print(f"ERROR: Database update failed in update_contact: {e}")
@@ -1084,6 +2210,8 @@ class Database:
             print(f"ERROR: Unexpected error in update_contact: {type(e).__name__}: {e}")
             raise
 
+        self._notify_change('update', contact_id)
+
     def delete_contact(self, contact_id):
         """
         Delete a contact from the database.
@@ -1103,7 +2231,49 @@ class Database:
             print(f"ERROR: Unexpected error in delete_contact: {type(e).__name__}: {e}")
             raise
 
+        self._notify_change('delete', contact_id)
+
     # Performance-optimized queries for award calculations
+    def _award_conditions(self, mode=None, key_types=None, min_date=None, max_date=None,
+                          has_skcc_number=False):
+        """Build WHERE conditions over the normalized contact columns"""
+        col = self.normalized_column
+        conditions = []
+        params = []
+
+        if mode:
+            conditions.append(f"{col('mode_norm')} = ?")
+            params.append(mode.upper())
+
+        if key_types:
+            placeholders = ','.join('?' * len(key_types))
+            conditions.append(f"{col('key_type_norm')} IN ({placeholders})")
+            params.extend([kt.upper() for kt in key_types])
+
+        if has_skcc_number:
+            conditions.append(f"{col('skcc_base_number')} IS NOT NULL")
+
+        # Date bounds seek on qso_ts; malformed dates fall back to text comparison
+        if min_date:
+            min_ts = self._qso_ts(min_date, '0000')
+            if min_ts is not None:
+                conditions.append(f"{col('qso_ts')} >= ?")
+                params.append(min_ts)
+            else:
+                conditions.append(f"{col('date_yyyymmdd')} >= ?")
+                params.append(min_date.replace('-', ''))  # Normalize to YYYYMMDD
+
+        if max_date:
+            max_ts = self._qso_ts(max_date, '2359')
+            if max_ts is not None:
+                conditions.append(f"{col('qso_ts')} <= ?")
+                params.append(max_ts)  # Through 23:59 of the last day
+            else:
+                conditions.append(f"{col('date_yyyymmdd')} <= ?")
+                params.append(max_date.replace('-', ''))
+
+        return conditions, params
+
     def get_unique_skcc_contacts(self, mode='CW', key_types=None, min_date=None, max_date=None):
         """
         Get unique SKCC contacts efficiently using SQL (for award calculations)
@@ -1115,39 +2285,25 @@ class Database:
             max_date: Maximum date in YYYYMMDD or YYYY-MM-DD format
 
         Returns:
-            list: Unique SKCC numbers with first contact details
+            list: One record per base SKCC number (its first contact)
         """
         try:
-            cursor = self.conn.cursor()
-
-            # Build SQL query with WHERE conditions
-            conditions = ["mode = ? AND skcc_number IS NOT NULL AND skcc_number != ''"]
-            params = [mode.upper()]
-
-            if key_types:
-                placeholders = ','.join('?' * len(key_types))
-                conditions.append(f"key_type IN ({placeholders})")
-                params.extend([kt.upper() for kt in key_types])
-
-            if min_date:
-                min_date = min_date.replace('-', '')  # Normalize to YYYYMMDD
-                conditions.append("REPLACE(date, '-', '') >= ?")
-                params.append(min_date)
-
-            if max_date:
-                max_date = max_date.replace('-', '')  # Normalize to YYYYMMDD
-                conditions.append("REPLACE(date, '-', '') <= ?")
-                params.append(max_date)
+            cursor = self._reader().cursor()
+            col = self.normalized_column
 
+            conditions, params = self._award_conditions(
+                mode, key_types, min_date, max_date, has_skcc_number=True
+            )
             where_clause = ' AND '.join(conditions)
 
-            # Use GROUP BY to get unique SKCC numbers with their first contact
+            # MIN() makes SQLite take the other columns from each member's first QSO
             query = f'''
-                SELECT skcc_number, callsign, date, band, state, name
+                SELECT skcc_number, callsign, date, band, state, name,
+                       MIN({col('date_yyyymmdd')} || time_on) AS first_qso
                 FROM contacts
                 WHERE {where_clause}
-                GROUP BY skcc_number
-                ORDER BY date ASC, time_on ASC
+                GROUP BY {col('skcc_base_number')}
+                ORDER BY first_qso ASC
             '''
 
             cursor.execute(query, params)
@@ -1171,35 +2327,19 @@ class Database:
             max_date: Maximum date in YYYYMMDD or YYYY-MM-DD format
 
         Returns:
-            int: Count of unique SKCC numbers
+            int: Count of unique base SKCC numbers
         """
         try:
-            cursor = self.conn.cursor()
-
-            # Build SQL query with WHERE conditions
-            conditions = ["mode = ? AND skcc_number IS NOT NULL AND skcc_number != ''"]
-            params = [mode.upper()]
-
-            if key_types:
-                placeholders = ','.join('?' * len(key_types))
-                conditions.append(f"key_type IN ({placeholders})")
-                params.extend([kt.upper() for kt in key_types])
-
-            if min_date:
-                min_date = min_date.replace('-', '')
-                conditions.append("REPLACE(date, '-', '') >= ?")
-                params.append(min_date)
-
-            if max_date:
-                max_date = max_date.replace('-', '')
-                conditions.append("REPLACE(date, '-', '') <= ?")
-                params.append(max_date)
+            cursor = self._reader().cursor()
 
+            conditions, params = self._award_conditions(
+                mode, key_types, min_date, max_date, has_skcc_number=True
+            )
             where_clause = ' AND '.join(conditions)
 
             # Use COUNT(DISTINCT) for optimal performance
             query = f'''
-                SELECT COUNT(DISTINCT skcc_number) as count
+                SELECT COUNT(DISTINCT {self.normalized_column('skcc_base_number')}) as count
                 FROM contacts
                 WHERE {where_clause}
             '''
@@ -1232,33 +2372,11 @@ class Database:
             list: Filtered contact records
         """
         try:
-            cursor = self.conn.cursor()
-
-            conditions = []
-            params = []
-
-            if mode:
-                conditions.append("mode = ?")
-                params.append(mode.upper())
-
-            if key_types:
-                placeholders = ','.join('?' * len(key_types))
-                conditions.append(f"key_type IN ({placeholders})")
-                params.extend([kt.upper() for kt in key_types])
-
-            if has_skcc_number:
-                conditions.append("skcc_number IS NOT NULL AND skcc_number != ''")
-
-            if min_date:
-                min_date = min_date.replace('-', '')
-                conditions.append("REPLACE(date, '-', '') >= ?")
-                params.append(min_date)
-
-            if max_date:
-                max_date = max_date.replace('-', '')
-                conditions.append("REPLACE(date, '-', '') <= ?")
-                params.append(max_date)
+            cursor = self._reader().cursor()
 
+            conditions, params = self._award_conditions(
+                mode, key_types, min_date, max_date, has_skcc_number
+            )
             where_clause = ' AND '.join(conditions) if conditions else '1=1'
 
             query = f'''
@@ -1281,7 +2399,79 @@ class Database:
             print(f"ERROR: Unexpected error in get_filtered_contacts: {type(e).__name__}: {e}")
             return []
 
+    def get_contact_ids(self, where, params=()):
+        """
+        Get IDs of contacts matching a WHERE clause
+
+        Args:
+            where: SQL condition (may use normalized_column() expressions)
+            params: Query parameters
+
+        Returns:
+            set: Matching contact IDs
+        """
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute(f'SELECT id FROM contacts WHERE {where}', list(params))
+            return {row[0] for row in cursor.fetchall()}
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database query failed in get_contact_ids: {e}")
+            return set()
+
+    def get_contacts_where(self, where, params=()):
+        """
+        Get contacts matching a WHERE clause (most recent first)
+
+        Args:
+            where: SQL condition (may use normalized_column() expressions)
+            params: Query parameters
+
+        Returns:
+            list: Normalized contact dictionaries
+        """
+        try:
+            cursor = self._reader().cursor()
+            cursor.execute(f'''
+                SELECT * FROM contacts
+                WHERE {where}
+                ORDER BY date DESC, time_on DESC
+            ''', list(params))
+            return self._normalize_contact_records(cursor.fetchall())
+        except sqlite3.DatabaseError as e:
+            print(f"ERROR: Database query failed in get_contacts_where: {e}")
+            return []
+
+    def backup_to(self, backup_path):
+        """
+        Write a consistent copy of the database using SQLite's backup API.
+
+        The copy always uses a rollback journal so it is a single self-contained
+        file, whatever durability profile the live database runs with.
+        """
+        self.flush()
+        backup_conn = sqlite3.connect(backup_path)
+        try:
+            with backup_conn:
+                self.conn.backup(backup_conn)
+            backup_conn.execute('PRAGMA journal_mode=DELETE')
+        finally:
+            backup_conn.close()
+
+    def flush(self):
+        """Write DX spots still waiting in the spot writer queue."""
+        self._spot_writer.flush()
+
     def close(self):
         """Close database connection"""
+        self._close_read_connections()
         if self.conn:
-            self.conn.close()
+            self._spot_writer.stop()
+            if DURABILITY_PROFILES[self.durability]['journal_mode'] == 'WAL':
+                try:
+                    # Fold the WAL back into the main file so the .db is self-contained
+                    self.conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                except sqlite3.Error as e:
+                    print(f"Warning: WAL checkpoint on close failed: {e}")
+            with self._write_lock:
+                self.conn.close()
+                self.conn = None
@@ -6,21 +6,23 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 
+from src.contact_store import get_contact_store
 from src.qrz import QRZSession
-from src.skcc_roster import SKCCRosterManager
+from src.skcc_roster import get_roster_manager
 
 
 class ContactsTab:
     def __init__(self, parent, database, config):
         self.parent = parent
         self.database = database
+        self.contact_store = get_contact_store(database)
         self.config = config
         self.frame = ttk.Frame(parent)
         self.all_contacts = []  # Store all contacts for filtering
         self.is_loading = False
         self.qrz_session = None
         self.is_looking_up = False
-        self.skcc_roster = SKCCRosterManager()
+        self.skcc_roster = get_roster_manager()
         self.create_widgets()
 
     def create_widgets(self):
@@ -227,9 +229,8 @@ class ContactsTab:
     def _load_contacts_background(self):
         """Background thread for loading contacts"""
         try:
-            # Perform the database query off the UI thread
-            contacts = self.database.get_all_contacts(limit=999999)
-            contacts_list = list(contacts)
+            # Load (or reuse) the shared contact cache off the UI thread
+            contacts_list = self.contact_store.all()
 
             # Schedule UI update on main thread (main loop is guaranteed to be running)
             self.parent.after(0, lambda: self._update_contacts_display(contacts_list))
@@ -357,10 +358,11 @@ class ContactsTab:
 
         # Execute query
         try:
-            cursor = self.database.conn.cursor()
-            cursor.execute(query, params)
-            columns = [description[0] for description in cursor.description]
-            filtered_contacts = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(query, params)
+                columns = [description[0] for description in cursor.description]
+                filtered_contacts = [dict(zip(columns, row)) for row in cursor.fetchall()]
         except Exception as e:
             self.loading_label.config(text=f"Query error: {str(e)}", foreground='red')
             filtered_contacts = []
@@ -394,9 +396,10 @@ class ContactsTab:
         if has_filter:
             # Get total count from database
             try:
-                cursor = self.database.conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM contacts")
-                total = cursor.fetchone()[0]
+                with self.database.read_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT COUNT(*) FROM contacts")
+                    total = cursor.fetchone()[0]
             except Exception as e:
                 print(f"Warning: Could not get total count: {e}")
                 total = shown
@@ -521,11 +524,15 @@ class ContactsTab:
                 contact = c
                 break
 
+        if contact is None:
+            contact = self.contact_store.get(contact_id)
+
         if contact is None:
             try:
-                cursor = self.database.conn.cursor()
-                cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
-                row = cursor.fetchone()
+                with self.database.read_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT * FROM contacts WHERE id = ?", (contact_id,))
+                    row = cursor.fetchone()
                 if row:
                     contact = dict(row)
             except Exception as e:
@@ -607,9 +614,10 @@ class ContactsTab:
             query += " ORDER BY date DESC, time_on DESC LIMIT 200"
 
             try:
-                cursor = self.database.conn.cursor()
-                cursor.execute(query, params)
-                rows = [dict(row) for row in cursor.fetchall()]
+                with self.database.read_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute(query, params)
+                    rows = [dict(row) for row in cursor.fetchall()]
             except Exception as e:
                 messagebox.showerror("Search Error", f"Failed to search contacts: {str(e)}")
                 return
@@ -903,13 +911,14 @@ class ContactsTab:
 
             if not skcc_number:
                 try:
-                    cursor = self.database.conn.cursor()
-                    cursor.execute('''
-                        SELECT skcc_number FROM contacts
-                        WHERE callsign = ? AND skcc_number IS NOT NULL AND skcc_number != ''
-                        ORDER BY date DESC LIMIT 1
-                    ''', (callsign.upper(),))
-                    result = cursor.fetchone()
+                    with self.database.read_connection() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute('''
+                            SELECT skcc_number FROM contacts
+                            WHERE callsign = ? AND skcc_number IS NOT NULL AND skcc_number != ''
+                            ORDER BY date DESC LIMIT 1
+                        ''', (callsign.upper(),))
+                        result = cursor.fetchone()
                     if result:
                         skcc_number = result[0]
                 except Exception as e:
@@ -10,7 +10,7 @@ import re
 
 from src.theme_colors import get_muted_color, get_info_color
 from src.qrz import QRZSession
-from src.skcc_roster import SKCCRosterManager
+from src.skcc_roster import get_roster_manager
 
 
 def validate_time_format(time_str):
@@ -86,7 +86,7 @@ class ContestTab:
         # QRZ lookup
         self.qrz_session = None
         self.is_looking_up = False
-        self.skcc_roster = SKCCRosterManager()
+        self.skcc_roster = get_roster_manager()
 
         self.frame = ttk.Frame(notebook)
         self.create_widgets()
@@ -951,14 +951,15 @@ class ContestTab:
 
         # Then try previous contacts in database
         try:
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT skcc_number FROM contacts
-                WHERE callsign = ? AND skcc_number IS NOT NULL AND skcc_number != ''
-                ORDER BY date DESC, time_on DESC
-                LIMIT 1
-            ''', (callsign.upper(),))
-            result = cursor.fetchone()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT skcc_number FROM contacts
+                    WHERE callsign = ? AND skcc_number IS NOT NULL AND skcc_number != ''
+                    ORDER BY date DESC, time_on DESC
+                    LIMIT 1
+                ''', (callsign.upper(),))
+                result = cursor.fetchone()
             if result:
                 return result[0]
         except Exception:
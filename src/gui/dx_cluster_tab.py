@@ -7,7 +7,7 @@ from tkinter import ttk, messagebox, scrolledtext
 import time
 from src.dx_clusters import DX_CLUSTERS, get_cluster_by_callsign
 from src.dx_client import DXClusterClient
-from src.dxcc import get_continent_from_callsign, get_country_from_callsign
+from src.callsign_resolver import get_callsign_resolver
 from src.theme_colors import get_success_color, get_error_color, get_info_color
 
 
@@ -19,6 +19,7 @@ class DXClusterTab:
         self.frame = ttk.Frame(parent)
         self.client = None
         self.logging_tab = None  # Reference to logging tab for spot display
+        self.callsign_resolver = get_callsign_resolver()
 
         # Rate limiting for spots
         self.spot_queue = []
@@ -377,9 +378,9 @@ class DXClusterTab:
                 frequency = spot.get('frequency', '')
                 comment = spot.get('comment', '')
 
-                # Get country from callsign
-                country_info = get_country_from_callsign(callsign)
-                country = country_info if country_info else ''
+                # Get country and continent from callsign
+                resolved = self.callsign_resolver.resolve(callsign)
+                country = resolved.country or ''
 
                 # Get mode from comment, fall back to frequency-based guess
                 mode = self.extract_mode_from_comment(comment.upper())
@@ -396,6 +397,7 @@ class DXClusterTab:
                     spot_data = {
                         'callsign': callsign,
                         'country': country,
+                        'continent': resolved.continent,
                         'mode': mode_display,
                         'band': band_display,
                         'frequency': frequency,
@@ -542,8 +544,7 @@ class DXClusterTab:
             # Get spotter's callsign and determine their continent
             spotter = spot.get('spotter', '').upper().strip()
             if spotter:
-                # get_continent_from_callsign returns a string like "NA", not a dict
-                continent = get_continent_from_callsign(spotter)
+                continent = self.callsign_resolver.resolve(spotter).continent
 
                 if continent:
                     if continent in self.continent_filters:
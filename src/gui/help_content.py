@@ -1844,7 +1844,7 @@ class HelpContent:
             ("ADIF Import\n", 'title'),
             ("\nImport contacts from other logging software via ADIF 3.x format.\n\n", ()),
 
-            ("Location: File menu → Import Log (ADIF)\n\n", 'italic'),
+            ("Location: File menu → Import Log (ADIF/ADX/Cabrillo)\n\n", 'italic'),
 
             ("What Can You Import?\n", 'heading'),
             ("ADIF files from:\n", ()),
@@ -1852,11 +1852,13 @@ class HelpContent:
             ("• Log4OM, N1MM, WSJT-X exports\n", 'bullet'),
             ("• QRZ.com logbook downloads\n", 'bullet'),
             ("• LOTW ADIF exports\n", 'bullet'),
-            ("• Any ADIF 3.x compliant file\n\n", 'bullet'),
+            ("• Any ADIF 3.x compliant file\n", 'bullet'),
+            ("• ADX (XML ADIF) files (.adx)\n", 'bullet'),
+            ("• Cabrillo contest logs (.log, .cbr)\n\n", 'bullet'),
 
             ("Import Process:\n", 'heading'),
-            ("1. Click File → Import Log (ADIF)\n", 'numbered'),
-            ("2. Select ADIF file (.adi or .adif)\n", 'numbered'),
+            ("1. Click File → Import Log (ADIF/ADX/Cabrillo)\n", 'numbered'),
+            ("2. Select a log file (.adi, .adif, .adx, .log or .cbr)\n", 'numbered'),
             ("3. App validates file format\n", 'numbered'),
             ("4. Progress bar shows import status\n", 'numbered'),
             ("5. Duplicate detection runs automatically\n", 'numbered'),
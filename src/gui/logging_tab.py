@@ -224,18 +224,19 @@ class LoggingTab:
 
         try:
             # Get all contacts for this callsign
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT skcc_number
-                FROM contacts
-                WHERE UPPER(callsign) = ?
-                  AND skcc_number IS NOT NULL
-                  AND skcc_number != ''
-                ORDER BY date DESC, time_on DESC
-                LIMIT 1
-            ''', (callsign.upper(),))
-
-            result = cursor.fetchone()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT skcc_number
+                    FROM contacts
+                    WHERE UPPER(callsign) = ?
+                      AND skcc_number IS NOT NULL
+                      AND skcc_number != ''
+                    ORDER BY date DESC, time_on DESC
+                    LIMIT 1
+                ''', (callsign.upper(),))
+
+                result = cursor.fetchone()
             if result and result[0]:
                 return result[0]
 
@@ -257,16 +258,17 @@ class LoggingTab:
 
         try:
             # Get previous QSOs for this callsign
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT date, time_on, band, mode, skcc_number
-                FROM contacts
-                WHERE UPPER(callsign) = ?
-                ORDER BY date DESC, time_on DESC
-                LIMIT 20
-            ''', (callsign.upper(),))
-
-            results = cursor.fetchall()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT date, time_on, band, mode, skcc_number
+                    FROM contacts
+                    WHERE UPPER(callsign) = ?
+                    ORDER BY date DESC, time_on DESC
+                    LIMIT 20
+                ''', (callsign.upper(),))
+
+                results = cursor.fetchall()
 
             # Enable text widget for editing
             self.previous_qsos_text.config(state='normal')
@@ -318,15 +320,16 @@ class LoggingTab:
         """Display the 10 most recent QSOs from the entire log."""
         try:
             # Get 10 most recent QSOs
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT callsign, date, time_on, band, mode, skcc_number
-                FROM contacts
-                ORDER BY date DESC, time_on DESC
-                LIMIT 10
-            ''')
-
-            results = cursor.fetchall()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT callsign, date, time_on, band, mode, skcc_number
+                    FROM contacts
+                    ORDER BY date DESC, time_on DESC
+                    LIMIT 10
+                ''')
+
+                results = cursor.fetchall()
 
             # Enable text widget for editing
             self.recent_qsos_text.config(state='normal')
@@ -13,7 +13,7 @@ import struct
 import time
 from src.qrz import QRZSession, upload_to_qrz_logbook
 from src.pota_client import POTAClient
-from src.skcc_roster import SKCCRosterManager
+from src.callsign_resolver import get_callsign_resolver
 from src.needed_analyzer import NeededContactsAnalyzer
 from src.notifier import get_notifier, NotificationPreferences
 from src.theme_colors import get_success_color, get_error_color, get_warning_color, get_info_color, get_muted_color, get_spot_highlight_color
@@ -28,8 +28,8 @@ class EnhancedLoggingTab:
         self.qrz_session = None
         self.is_looking_up = False  # Track if a lookup is in progress
 
-        # SKCC roster manager for member lookup
-        self.skcc_roster = SKCCRosterManager()
+        # Cached callsign lookups (SKCC roster member, DXCC)
+        self.callsign_resolver = get_callsign_resolver()
 
         # Smart log processing - needed contacts analyzer
         self.analyzer = NeededContactsAnalyzer(database)
@@ -975,24 +975,25 @@ class EnhancedLoggingTab:
         callsign = callsign.upper()
 
         # First check SKCC roster
-        member_info = self.skcc_roster.lookup_callsign(callsign)
+        member_info = self.callsign_resolver.resolve(callsign).member
         if member_info and member_info.get('skcc_number'):
             return member_info['skcc_number'], 'roster'
 
         # If not in roster, check previous contacts
         try:
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT skcc_number
-                FROM contacts
-                WHERE UPPER(callsign) = ?
-                  AND skcc_number IS NOT NULL
-                  AND skcc_number != ''
-                ORDER BY date DESC, time_on DESC
-                LIMIT 1
-            ''', (callsign,))
-
-            result = cursor.fetchone()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT skcc_number
+                    FROM contacts
+                    WHERE UPPER(callsign) = ?
+                      AND skcc_number IS NOT NULL
+                      AND skcc_number != ''
+                    ORDER BY date DESC, time_on DESC
+                    LIMIT 1
+                ''', (callsign,))
+
+                result = cursor.fetchone()
             if result and result[0]:
                 return result[0], 'previous'
         except Exception as e:
@@ -1003,29 +1004,30 @@ class EnhancedLoggingTab:
     def display_recent_qsos(self):
         """Display previous QSOs - filtered by callsign if entered, otherwise 10 most recent."""
         try:
-            cursor = self.database.conn.cursor()
-            callsign_filter = self.callsign_var.get().strip().upper()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                callsign_filter = self.callsign_var.get().strip().upper()
 
-            if callsign_filter:
-                # Show all previous QSOs with this callsign
-                cursor.execute('''
-                    SELECT callsign, date, time_on, band, mode, skcc_number
-                    FROM contacts
-                    WHERE UPPER(callsign) = ?
-                    ORDER BY date DESC, time_on DESC
-                ''', (callsign_filter,))
-                header_text = f"Previous QSOs with {callsign_filter}\n"
-            else:
-                # Show 10 most recent QSOs
-                cursor.execute('''
-                    SELECT callsign, date, time_on, band, mode, skcc_number
-                    FROM contacts
-                    ORDER BY date DESC, time_on DESC
-                    LIMIT 10
-                ''')
-                header_text = "10 Most Recent QSOs\n"
+                if callsign_filter:
+                    # Show all previous QSOs with this callsign
+                    cursor.execute('''
+                        SELECT callsign, date, time_on, band, mode, skcc_number
+                        FROM contacts
+                        WHERE UPPER(callsign) = ?
+                        ORDER BY date DESC, time_on DESC
+                    ''', (callsign_filter,))
+                    header_text = f"Previous QSOs with {callsign_filter}\n"
+                else:
+                    # Show 10 most recent QSOs
+                    cursor.execute('''
+                        SELECT callsign, date, time_on, band, mode, skcc_number
+                        FROM contacts
+                        ORDER BY date DESC, time_on DESC
+                        LIMIT 10
+                    ''')
+                    header_text = "10 Most Recent QSOs\n"
 
-            results = cursor.fetchall()
+                results = cursor.fetchall()
 
             # Enable text widget for editing
             self.recent_qsos_text.config(state='normal')
@@ -1302,8 +1304,9 @@ class EnhancedLoggingTab:
 
         # Check if station is SKCC member
         skcc_number = None
-        if callsign and self.skcc_roster:
-            skcc_number = self.skcc_roster.get_skcc_number(callsign)
+        if callsign:
+            member_info = self.callsign_resolver.resolve(callsign).member
+            skcc_number = member_info['skcc_number'] if member_info else None
 
         # Analyze if this spot is needed for any awards
         analysis = self.analyzer.analyze_spot(
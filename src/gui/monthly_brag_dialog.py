@@ -165,16 +165,17 @@ class MonthlyBragDialog:
             end_date = f"{year}-{month:02d}-{last_day}"
 
             # Query database for SKCC contacts in this month
-            cursor = self.database.conn.cursor()
-            cursor.execute('''
-                SELECT callsign, skcc_number, date, band, comment
-                FROM contacts
-                WHERE date >= ? AND date <= ?
-                AND skcc_number IS NOT NULL AND skcc_number != ''
-                ORDER BY date, time_on
-            ''', (start_date, end_date))
-
-            contacts = cursor.fetchall()
+            with self.database.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT callsign, skcc_number, date, band, comment
+                    FROM contacts
+                    WHERE date >= ? AND date <= ?
+                    AND skcc_number IS NOT NULL AND skcc_number != ''
+                    ORDER BY date, time_on
+                ''', (start_date, end_date))
+
+                contacts = cursor.fetchall()
 
             # Filter out contest contacts
             skcc_members = {}  # {skcc_number: callsign}
@@ -622,57 +622,37 @@ Cluster list sources:
             self.auto_save_var.set(False)
 
     def backup_now(self):
-        """Manually trigger a backup of both database and ADIF export"""
+        """Manually trigger a full backup of both database and ADIF export"""
         try:
             # Import here to avoid circular dependency
-            from src.adif import export_contacts_to_adif
-            from datetime import datetime
+            from src.adif_backup import backup_adif
             import os
-            import shutil
 
             # Check if database is available
             if not self.database:
                 messagebox.showerror("Error", "Could not access database")
                 return
 
-            # Get all contacts
-            contacts = self.database.get_all_contacts(limit=999999)
-
-            if not contacts:
+            if not self.database.count_contacts():
                 messagebox.showinfo("No Contacts", "No contacts to backup.")
                 return
 
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            db_filename = f"w4gns_log_{timestamp}.db"
-            adif_filename = f"w4gns_log_{timestamp}.adi"
-
-            # Backup to local logs directory
-            logs_dir = app_path("logs")
-            os.makedirs(logs_dir, exist_ok=True)
+            # Backup to local logs directory; a full snapshot also starts a new
+            # journal for the incremental backups made on shutdown
+            result = backup_adif(self.database, app_path("logs"), force_full=True)
+            local_adif_path = result['path']
 
-            # Backup database file
-            local_db_path = os.path.join(logs_dir, db_filename)
-            shutil.copy2(self.database.db_path, local_db_path)
-
-            # Export to ADIF
-            local_adif_path = os.path.join(logs_dir, adif_filename)
-            export_contacts_to_adif(contacts, local_adif_path)
-
-            backup_message = f"Backed up {len(contacts)} contacts:\n\n"
-            backup_message += f"Database: {local_db_path}\n"
+            backup_message = f"Backed up {result['written']} contacts:\n\n"
+            backup_message += f"Database: {os.path.splitext(local_adif_path)[0]}.db\n"
             backup_message += f"ADIF: {local_adif_path}"
 
             # Backup to external path if configured
             external_path = self.backup_path_var.get().strip()
             if external_path and os.path.exists(external_path):
-                external_db_file = os.path.join(external_path, db_filename)
-                external_adif_file = os.path.join(external_path, adif_filename)
-
-                shutil.copy2(self.database.db_path, external_db_file)
-                export_contacts_to_adif(contacts, external_adif_file)
+                external_adif_file = backup_adif(self.database, external_path, force_full=True)['path']
 
                 backup_message += "\n\nAlso backed up to external path:\n"
-                backup_message += f"Database: {external_db_file}\n"
+                backup_message += f"Database: {os.path.splitext(external_adif_file)[0]}.db\n"
                 backup_message += f"ADIF: {external_adif_file}"
 
             messagebox.showinfo("Backup Complete", backup_message)
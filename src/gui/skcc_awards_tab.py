@@ -15,6 +15,8 @@ from src.skcc_awards import (
 from src.skcc_roster import get_roster_manager
 from src.skcc_award_rosters import get_award_roster_manager
 from src.skcc_awards.award_application import AwardApplicationGenerator
+from src.skcc_awards.award_state import get_award_state_store
+from src.contact_store import get_contact_store
 from src.theme_colors import get_success_color, get_info_color, get_muted_color
 from src.utils.gridsquare import gridsquare_distance_nm
 
@@ -30,6 +32,7 @@ class SKCCAwardsTab:
         # Tribune/Senator awards need to read user's Centurion/Tribune dates from config
         # to filter contacts by achievement dates
         self.database.config = config
+        self.contact_store = get_contact_store(database)
 
         # Initialize roster managers
         self.roster_manager = get_roster_manager()
@@ -59,6 +62,9 @@ class SKCCAwardsTab:
             'wac': SKCCWACAward(database)
         }
 
+        # Incrementally maintained progress for all of the above awards
+        self.award_state = get_award_state_store(database)
+
         self.create_widgets()
         self.refresh_awards()
 
@@ -484,29 +490,18 @@ class SKCCAwardsTab:
 
     def refresh_awards(self):
         """Refresh all award progress displays"""
-        # Get all contacts for calculations
-        contacts = self.database.get_all_contacts(limit=999999)
-        contacts_list = [dict(c) for c in contacts]
-
         # Calculate distance from gridsquares if not already set
         contacts_to_update = []
-        for contact in contacts_list:
-            if contact.get('distance_nm') is None:
-                my_grid = contact.get('my_gridsquare', '').strip()
-                their_grid = contact.get('gridsquare', '').strip()
-
-                if my_grid and their_grid and len(my_grid) >= 4 and len(their_grid) >= 4:
-                    try:
-                        distance_nm = gridsquare_distance_nm(my_grid, their_grid)
-                        if distance_nm is not None:
-                            contact['distance_nm'] = distance_nm
-                            # Queue this contact for database update
-                            if contact.get('id'):
-                                contacts_to_update.append((contact['id'], distance_nm))
-                    except Exception:
-                        pass  # Skip if calculation fails
-
-        # Persist calculated distances to database
+        for contact in self.database.get_contacts_missing_distance():
+            try:
+                distance_nm = gridsquare_distance_nm(contact['my_gridsquare'].strip(),
+                                                     contact['gridsquare'].strip())
+                if distance_nm is not None:
+                    contacts_to_update.append((contact['id'], distance_nm))
+            except Exception:
+                pass  # Skip if calculation fails
+
+        # Persist calculated distances to database (award state picks them up as updates)
         if contacts_to_update:
             try:
                 for contact_id, distance_nm in contacts_to_update:
@@ -514,73 +509,27 @@ class SKCCAwardsTab:
             except Exception as e:
                 print(f"Warning: Could not persist distance calculations: {e}")
 
-        # Centurion
-        centurion_progress = self.awards['centurion'].calculate_progress(contacts_list)
-        self.update_centurion_display(centurion_progress)
-
-        # Tribune
-        tribune_progress = self.awards['tribune'].calculate_progress(contacts_list)
-        self.update_tribune_display(tribune_progress)
-
-        # Senator
-        senator_progress = self.awards['senator'].calculate_progress(contacts_list)
-        self.update_senator_display(senator_progress)
-
-        # Triple Key
-        triple_key_progress = self.awards['triple_key'].calculate_progress(contacts_list)
-        self.update_triple_key_display(triple_key_progress)
-
-        # Rag Chew
-        rag_chew_progress = self.awards['rag_chew'].calculate_progress(contacts_list)
-        self.update_rag_chew_display(rag_chew_progress)
-
-        # PFX
-        pfx_progress = self.awards['pfx'].calculate_progress(contacts_list)
-        self.update_pfx_display(pfx_progress)
-
-        # Canadian Maple
-        maple_progress = self.awards['canadian_maple'].calculate_progress(contacts_list)
-        self.update_maple_display(maple_progress)
-
-        # WAS
-        was_progress = self.awards['was'].calculate_progress(contacts_list)
-        self.update_was_display(was_progress)
-
-        # WAC
-        wac_progress = self.awards['wac'].calculate_progress(contacts_list)
-        self.update_wac_display(wac_progress)
-
-        # DXQ
-        dxq_progress = self.awards['dxq'].calculate_progress(contacts_list)
-        self.update_dxq_display(dxq_progress)
-
-        # DXC
-        dxc_progress = self.awards['dxc'].calculate_progress(contacts_list)
-        self.update_dxc_display(dxc_progress)
-
-        # Marathon
-        marathon_progress = self.awards['marathon'].calculate_progress(contacts_list)
-        self.update_marathon_display(marathon_progress)
-
-        # 1xQRP
-        qrp_1x_progress = self.awards['qrp_1x'].calculate_progress(contacts_list)
-        self.update_qrp_1x_display(qrp_1x_progress)
-
-        # 2xQRP
-        qrp_2x_progress = self.awards['qrp_2x'].calculate_progress(contacts_list)
-        self.update_qrp_2x_display(qrp_2x_progress)
-
-        # QRP/MPW
-        qrp_mpw_progress = self.awards['qrp_mpw'].calculate_progress(contacts_list)
-        self.update_qrp_mpw_display(qrp_mpw_progress)
-
-        # WAS-T
-        was_t_progress = self.awards['was_t'].calculate_progress(contacts_list)
-        self.update_was_t_display(was_t_progress)
-
-        # WAS-S
-        was_s_progress = self.awards['was_s'].calculate_progress(contacts_list)
-        self.update_was_s_display(was_s_progress)
+        # Award progress is maintained incrementally; only awards touched by
+        # logged/edited/deleted contacts since the last refresh are recomputed
+        progress = self.award_state.get_all_progress()
+
+        self.update_centurion_display(progress['centurion'])
+        self.update_tribune_display(progress['tribune'])
+        self.update_senator_display(progress['senator'])
+        self.update_triple_key_display(progress['triple_key'])
+        self.update_rag_chew_display(progress['rag_chew'])
+        self.update_pfx_display(progress['pfx'])
+        self.update_maple_display(progress['canadian_maple'])
+        self.update_was_display(progress['was'])
+        self.update_wac_display(progress['wac'])
+        self.update_dxq_display(progress['dxq'])
+        self.update_dxc_display(progress['dxc'])
+        self.update_marathon_display(progress['marathon'])
+        self.update_qrp_1x_display(progress['qrp_1x'])
+        self.update_qrp_2x_display(progress['qrp_2x'])
+        self.update_qrp_mpw_display(progress['qrp_mpw'])
+        self.update_was_t_display(progress['was_t'])
+        self.update_was_s_display(progress['was_s'])
 
     def update_centurion_display(self, progress):
         """Update Centurion award display"""
@@ -1001,16 +950,15 @@ class SKCCAwardsTab:
         centurion_date = self.config.get('skcc.centurion_date', '')
         tribune_x8_date = self.config.get('skcc.tribune_x8_date', '')
 
-        # Analyze contacts
-        contacts = self.database.get_all_contacts(limit=999999)
-        contacts_list = list(contacts)
-        total_contacts = len(contacts_list)
-
+        # Analyze contacts (streamed, only the columns the report needs)
+        total_contacts = 0
         cw_contacts = 0
         skcc_contacts = 0
         key_type_contacts = 0
 
-        for contact in contacts_list:
+        for contact in self.database.iter_contacts(columns=('mode', 'skcc_number', 'key_type'),
+                                                   order_by=None):
+            total_contacts += 1
             if contact['mode'] and contact['mode'].upper() == 'CW':
                 cw_contacts += 1
             if contact['skcc_number'] and contact['skcc_number'].strip():
@@ -1173,35 +1121,14 @@ class SKCCAwardsTab:
             award_type: Type of award (centurion, tribune, senator, dxq, dxc, etc.)
             award_name: Display name of the award
         """
-        # Get all contacts
-        all_contacts = self.database.get_all_contacts(limit=999999)
-        contacts_list = [dict(c) for c in all_contacts]
-
-        # Get qualifying contacts for this award
+        # Get qualifying contacts for this award from the shared contact cache
         award_instance = self.awards[award_type]
-        if hasattr(award_instance, 'get_application_contacts'):
-            qualifying_contacts = award_instance.get_application_contacts(contacts_list)
-        else:
-            qualifying_contacts = [c for c in contacts_list if award_instance.validate(c)]
-
-            # Sort by date (earliest first)
-            qualifying_contacts.sort(key=lambda x: (x.get('date', ''), x.get('time_on', '')))
-
-            # Deduplicate by SKCC number when required by award rules
-            if award_instance.should_deduplicate_for_export():
-                from src.utils.skcc_number import extract_base_skcc_number
-                seen_skcc_numbers = set()
-                deduplicated_contacts = []
-
-                for contact in qualifying_contacts:
-                    skcc_number = contact.get('skcc_number', '').strip()
-                    if skcc_number:
-                        base_number = extract_base_skcc_number(skcc_number)
-                        if base_number and base_number not in seen_skcc_numbers:
-                            seen_skcc_numbers.add(base_number)
-                            deduplicated_contacts.append(contact)
-
-                qualifying_contacts = deduplicated_contacts
+        all_contacts = self.contact_store.all()
+        qualifying_contacts = [c for c in all_contacts if award_instance.validate(c)]
+
+        # Sort by date (earliest first), then apply the award's export rules
+        qualifying_contacts.sort(key=lambda x: (x.get('date', ''), x.get('time_on', '')))
+        qualifying_contacts = award_instance.prepare_export_contacts(qualifying_contacts)
 
         if not qualifying_contacts:
             messagebox.showwarning(
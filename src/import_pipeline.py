@@ -0,0 +1,300 @@
+"""
+Staged log import pipeline
+
+Parsing, enrichment and database writes overlap instead of running one
+after another over the whole file:
+
+  parse   MappedADIFReader indexes the file and parses it chunk by chunk
+          (ADX and Cabrillo files are streamed by their src.log_formats reader)
+  enrich  a process pool normalizes fields, fills missing DXCC data, translates
+          SKCC Logger key codes and computes grid distances
+  write   Database.import_contact_chunks commits each enriched chunk in its
+          own transaction and reports progress
+
+The first chunk is kept small so the progress dialog moves almost at once.
+Small files are enriched inline because starting worker processes would cost
+more than it saves.
+
+Every ADIF chunk commits together with a checkpoint (file hash, byte offset and
+record index of the next record). Importing the same file again after an
+interruption resumes at that record; nothing before it is parsed or checked
+for duplicates again.
+"""
+
+import hashlib
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.adif import KEY_TYPE_CODES, MappedADIFReader
+from src.dxcc import lookup_dxcc
+from src.log_formats import ADIF_FORMAT, detect_log_format, iter_log_contacts
+from src.utils.gridsquare import gridsquare_distance_nm
+
+logger = logging.getLogger(__name__)
+
+# Contacts per chunk and per write transaction; smaller chunks pay noticeably
+# more in commit and index-page journaling
+IMPORT_CHUNK_SIZE = 5000
+FIRST_CHUNK_SIZE = 100
+# Files with fewer records than this are enriched in-process
+PARALLEL_IMPORT_THRESHOLD = 5000
+
+
+def enrich_contact(contact):
+    """
+    Normalize one imported contact and fill derived fields it lacks
+
+    Fields already present in the file are never overwritten.
+
+    Args:
+        contact: Contact dictionary from ADIFParser
+
+    Returns:
+        dict: Enriched copy of the contact
+    """
+    contact = {
+        field: value.strip() if isinstance(value, str) else value
+        for field, value in contact.items()
+    }
+
+    callsign = (contact.get('callsign') or '').upper()
+    if callsign:
+        contact['callsign'] = callsign
+
+    key_type = contact.get('key_type')
+    if key_type:
+        contact['key_type'] = KEY_TYPE_CODES.get(key_type.upper(), key_type)
+
+    # DXCC data from the callsign prefix
+    if callsign and not all(contact.get(field) for field in
+                            ('country', 'continent', 'cq_zone', 'itu_zone', 'dxcc_entity')):
+        info = lookup_dxcc(callsign)
+        if info:
+            for field, value in (('country', info['country']),
+                                 ('continent', info['continent']),
+                                 ('cq_zone', str(info['cq_zone'])),
+                                 ('itu_zone', str(info['itu_zone'])),
+                                 ('dxcc_entity', info['entity'])):
+                if not contact.get(field):
+                    contact[field] = value
+
+    # Distance between the two gridsquares
+    my_grid = contact.get('my_gridsquare')
+    their_grid = contact.get('gridsquare')
+    if not contact.get('distance_nm') and my_grid and their_grid:
+        distance_nm = gridsquare_distance_nm(my_grid, their_grid)
+        if distance_nm is not None:
+            contact['distance_nm'] = distance_nm
+
+    return contact
+
+
+def enrich_chunk(contacts):
+    """Enrich a list of contacts (runs in a worker process)"""
+    return [enrich_contact(contact) for contact in contacts]
+
+
+# Bytes hashed from each end of a file by file_digest()
+DIGEST_EDGE_BYTES = 1024 * 1024
+
+
+def file_digest(filename):
+    """
+    Identify a file for import checkpoints without reading all of it
+
+    Hashes the absolute path, size and modification time with the first and
+    last DIGEST_EDGE_BYTES of the contents, so large logs cost two short
+    reads. find_import_checkpoint() also checks that the checkpoint's byte
+    offset still starts a record.
+    """
+    stat = os.stat(filename)
+    digest = hashlib.sha1(
+        f"{os.path.abspath(filename)}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode('utf-8')
+    )
+    with open(filename, 'rb') as f:
+        digest.update(f.read(DIGEST_EDGE_BYTES))
+        if stat.st_size > DIGEST_EDGE_BYTES:
+            f.seek(max(DIGEST_EDGE_BYTES, stat.st_size - DIGEST_EDGE_BYTES))
+            digest.update(f.read(DIGEST_EDGE_BYTES))
+    return digest.hexdigest()
+
+
+def find_import_checkpoint(database, filename, file_hash=None):
+    """
+    Get the checkpoint of an interrupted import of this file, if it is still usable
+
+    Args:
+        database: Database instance
+        filename: ADIF file about to be imported
+        file_hash: file_digest(filename), if already known
+
+    Returns:
+        dict: Checkpoint from Database.get_import_checkpoint, or None
+    """
+    checkpoint = database.get_import_checkpoint(file_hash or file_digest(filename))
+    if checkpoint is None:
+        return None
+    with MappedADIFReader(filename) as reader:
+        index = checkpoint['record_index']
+        if index < len(reader) and reader.record_offset(index) == checkpoint['byte_offset']:
+            return checkpoint
+    return None
+
+
+def _iter_chunks(reader, start, chunk_size, first_chunk_size):
+    """
+    Parse the reader's records from start in chunks; the first one is smaller
+
+    Yields:
+        tuple: (contacts, next record index, byte offset of that record)
+    """
+    size = first_chunk_size
+    while start < len(reader):
+        end = min(start + size, len(reader))
+        contacts = [contact for contact in map(reader.contact, range(start, end)) if contact]
+        yield contacts, end, reader.record_offset(end)
+        start = end
+        size = chunk_size
+
+
+def _enrich_positioned(chunks):
+    """Enrich chunks inline, keeping their positions"""
+    for contacts, next_index, next_offset in chunks:
+        yield enrich_chunk(contacts), next_index, next_offset
+
+
+def _enriched_chunks(chunks, executor, max_pending):
+    """Submit chunks to the pool, yielding results in order with a bounded backlog"""
+    pending = deque()
+    for contacts, next_index, next_offset in chunks:
+        pending.append((executor.submit(enrich_chunk, contacts), next_index, next_offset))
+        if len(pending) >= max_pending:
+            future, next_index, next_offset = pending.popleft()
+            yield future.result(), next_index, next_offset
+    while pending:
+        future, next_index, next_offset = pending.popleft()
+        yield future.result(), next_index, next_offset
+
+
+def _iter_stream_chunks(contacts, chunk_size, first_chunk_size):
+    """
+    Cut a contact iterator into chunks; the first one is smaller
+
+    Yields:
+        tuple: (contacts, next record index, None), as _iter_chunks without offsets
+    """
+    size = first_chunk_size
+    index = 0
+    while True:
+        chunk = list(islice(contacts, size))
+        if not chunk:
+            return
+        index += len(chunk)
+        yield chunk, index, None
+        size = chunk_size
+
+
+def _write_chunks(database, chunks, total, remaining, workers, checkpoint=None, **import_options):
+    """Enrich chunks inline or in a process pool and hand them to the database"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if remaining < PARALLEL_IMPORT_THRESHOLD:
+        workers = 0
+
+    if workers <= 1:
+        return database.import_contact_chunks(
+            _enrich_positioned(chunks), total=total, checkpoint=checkpoint, **import_options
+        )
+
+    logger.debug(f"Importing {remaining} records with {workers} workers")
+    # Spawned workers: forking the GUI process would copy its threads' locks
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        return database.import_contact_chunks(
+            _enriched_chunks(chunks, executor, max_pending=workers * 2), total=total,
+            checkpoint=checkpoint, **import_options
+        )
+
+
+def import_adif_file(database, filename, skip_duplicates=True, window_minutes=10,
+                     progress_callback=None, workers=None,
+                     chunk_size=IMPORT_CHUNK_SIZE, first_chunk_size=FIRST_CHUNK_SIZE,
+                     resume=True, file_hash=None):
+    """
+    Import an ADIF file through the parse / enrich / write pipeline
+
+    Args:
+        database: Database instance to import into
+        filename: ADIF file to import
+        skip_duplicates: If True, skip contacts already in the log
+        window_minutes: Time window for duplicate detection in minutes
+        progress_callback: Optional callback function(current, total, message),
+            called from the importing thread
+        workers: Worker processes for enrichment (default: one per CPU;
+            0 or 1 enriches in-process)
+        chunk_size: Contacts per chunk and per database transaction
+        first_chunk_size: Size of the first chunk
+        resume: Continue an interrupted import of the same file from its
+            checkpoint; if False, any checkpoint is discarded
+        file_hash: file_digest(filename), if already known
+
+    Returns:
+        dict: Same keys as Database.import_contact_chunks
+    """
+    file_hash = file_hash or file_digest(filename)
+    checkpoint = find_import_checkpoint(database, filename, file_hash) if resume else None
+    if checkpoint is None:
+        database.delete_import_checkpoint(file_hash)
+        checkpoint = {'file_hash': file_hash, 'filename': os.path.abspath(filename),
+                      'record_index': 0, 'imported': 0, 'duplicates': 0, 'errors': 0}
+    else:
+        logger.info(f"Resuming import of {filename} at record {checkpoint['record_index']}")
+
+    with MappedADIFReader(filename) as reader:
+        total = len(reader)
+        chunks = _iter_chunks(reader, checkpoint['record_index'], chunk_size, first_chunk_size)
+        return _write_chunks(
+            database, chunks, total, total - checkpoint['record_index'], workers, checkpoint,
+            skip_duplicates=skip_duplicates, window_minutes=window_minutes,
+            progress_callback=progress_callback,
+        )
+
+
+def import_log_file(database, filename, skip_duplicates=True, window_minutes=10,
+                    progress_callback=None, workers=None,
+                    chunk_size=IMPORT_CHUNK_SIZE, first_chunk_size=FIRST_CHUNK_SIZE,
+                    resume=True, file_hash=None):
+    """
+    Import a log file in any format from src.log_formats
+
+    ADIF files go through import_adif_file (with checkpoints). Other formats
+    are streamed by their reader into the same enrich and write stages; they
+    are not checkpointed, but a repeated import skips what is already in the
+    log as duplicates.
+
+    Args:
+        Same as import_adif_file; resume and file_hash only apply to ADIF
+
+    Returns:
+        dict: Same keys as Database.import_contact_chunks
+    """
+    log_format = detect_log_format(filename)
+    if log_format is ADIF_FORMAT:
+        return import_adif_file(
+            database, filename, skip_duplicates=skip_duplicates, window_minutes=window_minutes,
+            progress_callback=progress_callback, workers=workers, chunk_size=chunk_size,
+            first_chunk_size=first_chunk_size, resume=resume, file_hash=file_hash,
+        )
+
+    total = log_format.count_records(filename)
+    chunks = _iter_stream_chunks(iter_log_contacts(filename, log_format), chunk_size,
+                                 first_chunk_size)
+    return _write_chunks(
+        database, chunks, total, total, workers,
+        skip_duplicates=skip_duplicates, window_minutes=window_minutes,
+        progress_callback=progress_callback,
+    )
@@ -0,0 +1,271 @@
+"""
+Log file formats accepted by the importer
+
+Each format's reader streams a file as (FIELD_NAME, data) lists using ADIF
+field names, the same tokens iter_adif_fields produces. All formats therefore
+share ADIF_FIELD_MAP, key type translation and the enrich/write stages of
+src.import_pipeline:
+
+  ADIF      .adi, .adif    length-prefixed tags (iter_adif_fields)
+  ADX       .adx           XML ADIF, read with iterparse; every record is
+                           cleared once read so memory stays flat
+  Cabrillo  .log, .cbr     contest logs, one QSO: line per contact
+
+Further formats are added with register_log_format().
+"""
+
+import io
+import mmap
+import re
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+from src.adif import MappedADIFReader, _contact_from_fields, iter_adif_fields
+
+# name: display name; extensions: lower-case suffixes; iter_fields(binary
+# stream) yields field lists; count_records(filename) counts records quickly;
+# sniff(first bytes) recognises the format when the extension does not
+LogFormat = namedtuple('LogFormat', 'name extensions iter_fields count_records sniff')
+
+LOG_FORMATS = []
+
+
+def register_log_format(log_format):
+    """Make a LogFormat available to detect_log_format() and the importer"""
+    LOG_FORMATS.append(log_format)
+    return log_format
+
+
+def detect_log_format(filename):
+    """
+    Pick the format of a log file by extension, then by content
+
+    Returns:
+        LogFormat: The matching format (ADIF if nothing else matches)
+    """
+    lower = str(filename).lower()
+    for log_format in LOG_FORMATS:
+        if lower.endswith(log_format.extensions):
+            return log_format
+
+    with open(filename, 'rb') as f:
+        head = f.read(4096).lstrip(b'\xef\xbb\xbf \t\r\n')
+    for log_format in LOG_FORMATS:
+        if log_format.sniff(head):
+            return log_format
+    return ADIF_FORMAT
+
+
+def iter_log_contacts(filename, log_format=None):
+    """
+    Stream contacts from a log file in any registered format
+
+    Args:
+        filename: Log file
+        log_format: LogFormat to read it as (default: detect_log_format)
+
+    Yields:
+        dict: Contact dictionaries, as ADIFParser produces them
+    """
+    log_format = log_format or detect_log_format(filename)
+    with open(filename, 'rb') as f:
+        for fields in log_format.iter_fields(f):
+            contact = _contact_from_fields(fields)
+            if contact:
+                yield contact
+
+
+def _count_pattern(filename, pattern):
+    """Count matches of a bytes pattern over a memory-mapped file"""
+    with open(filename, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return sum(1 for _ in pattern.finditer(mm))
+        except ValueError:
+            # Empty files cannot be mapped
+            return 0
+
+
+# ADIF
+
+def _iter_adif(stream):
+    text = io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+    try:
+        yield from iter_adif_fields(text)
+    finally:
+        text.detach()
+
+
+def _count_adif(filename):
+    with MappedADIFReader(filename) as reader:
+        return len(reader)
+
+
+ADIF_FORMAT = register_log_format(LogFormat(
+    'ADIF', ('.adi', '.adif'), _iter_adif, _count_adif,
+    lambda head: b'<EOH>' in head.upper() or b'<EOR>' in head.upper(),
+))
+
+
+# ADX
+
+_ADX_RECORD_END_PATTERN = re.compile(rb'</RECORD\s*>', re.IGNORECASE)
+
+
+def _local_name(tag):
+    """Tag name without an XML namespace, upper-cased"""
+    return tag.rsplit('}', 1)[-1].upper()
+
+
+def _iter_adx(stream):
+    """
+    Tokenize ADX records
+
+    <APP PROGRAMID="P" FIELDNAME="F"> becomes APP_P_F and <USERDEF
+    FIELDNAME="F"> becomes F, matching how ADIF writes those fields.
+    """
+    records = None
+    for event, element in ET.iterparse(stream, events=('start', 'end')):
+        tag = _local_name(element.tag)
+        if event == 'start':
+            if tag == 'RECORDS':
+                records = element
+            continue
+        if tag != 'RECORD':
+            continue
+
+        fields = []
+        for child in element:
+            name = _local_name(child.tag)
+            if name == 'APP':
+                name = f"APP_{child.get('PROGRAMID', '')}_{child.get('FIELDNAME', '')}".upper()
+            elif name == 'USERDEF':
+                name = (child.get('FIELDNAME') or '').upper()
+            fields.append((name, child.text or ''))
+
+        # Drop finished records so the tree never holds more than one
+        element.clear()
+        if records is not None:
+            records.clear()
+        if fields:
+            yield fields
+
+
+ADX_FORMAT = register_log_format(LogFormat(
+    'ADX', ('.adx',), _iter_adx,
+    lambda filename: _count_pattern(filename, _ADX_RECORD_END_PATTERN),
+    lambda head: head.startswith(b'<?xml') or head[:5].upper() == b'<ADX>',
+))
+
+
+# Cabrillo
+
+_CABRILLO_QSO_PATTERN = re.compile(rb'^QSO:', re.MULTILINE)
+_RST_PATTERN = re.compile(r'^[1-5][1-9][1-9]?$')
+_SKCC_NUMBER_PATTERN = re.compile(r'^\d+[CTSX]?$', re.IGNORECASE)
+
+CABRILLO_MODES = {'CW': 'CW', 'PH': 'SSB', 'FM': 'FM', 'RY': 'RTTY', 'DG': 'DATA'}
+
+# VHF and up are logged by band designator instead of frequency
+CABRILLO_BANDS = {'50': '6M', '70': '4M', '144': '2M', '222': '1.25M', '432': '70CM',
+                  '902': '33CM', '1.2G': '23CM', '2.3G': '13CM', 'LIGHT': 'SUBMM'}
+
+# (lowest kHz, highest kHz, band)
+_BAND_EDGES_KHZ = (
+    (1800, 2000, '160M'), (3500, 4000, '80M'), (5330, 5410, '60M'), (7000, 7300, '40M'),
+    (10100, 10150, '30M'), (14000, 14350, '20M'), (18068, 18168, '17M'), (21000, 21450, '15M'),
+    (24890, 24990, '12M'), (28000, 29700, '10M'), (50000, 54000, '6M'),
+)
+
+
+def _band_for_khz(khz):
+    for low, high, band in _BAND_EDGES_KHZ:
+        if low <= khz < high:
+            return band
+    return ''
+
+
+def _split_cabrillo_qso(tokens):
+    """Split what follows date and time into (sent exchange, call, received exchange)"""
+    # tokens: my call, sent exchange, call, received exchange[, transmitter id]
+    if len(tokens) % 2 and tokens[-1] in ('0', '1'):
+        tokens = tokens[:-1]
+    half = len(tokens) // 2
+    return tokens[1:half], tokens[half], tokens[half + 1:]
+
+
+def _cabrillo_exchange_fields(received, skcc_contest):
+    """
+    Map a received exchange (after the RST) to ADIF fields
+
+    SKCC contests exchange SPC, name and SKCC number; for other contests the
+    exchange is kept in the comment.
+
+    Returns:
+        tuple: (fields, unrecognised tokens)
+    """
+    if skcc_contest and len(received) >= 3 and _SKCC_NUMBER_PATTERN.match(received[2]):
+        fields = [('STATE', received[0].upper()), ('NAME', received[1].capitalize()),
+                  ('SKCC', received[2].upper())]
+        return fields, received[3:]
+    return [], received
+
+
+def _iter_cabrillo(stream):
+    """Tokenize Cabrillo QSO: lines"""
+    text = io.TextIOWrapper(stream, encoding='utf-8', errors='replace')
+    try:
+        yield from _iter_cabrillo_lines(text)
+    finally:
+        text.detach()
+
+
+def _iter_cabrillo_lines(lines):
+    contest = ''
+    for raw_line in lines:
+        line = raw_line.strip()
+        tag, _, value = line.partition(':')
+        tag = tag.upper()
+        if tag == 'CONTEST':
+            contest = value.strip()
+            continue
+        if tag != 'QSO':
+            continue
+
+        tokens = value.split()
+        if len(tokens) < 7:
+            continue
+        frequency, mode, date, time_on = tokens[:4]
+        sent, callsign, received = _split_cabrillo_qso(tokens[4:])
+
+        fields = [('CALL', callsign), ('QSO_DATE', date.replace('-', '')), ('TIME_ON', time_on)]
+        if frequency.isdigit() and int(frequency) >= 1800:
+            khz = int(frequency)
+            fields.append(('FREQ', f"{khz / 1000:.3f}"))
+            band = _band_for_khz(khz)
+        else:
+            band = CABRILLO_BANDS.get(frequency.upper(), '')
+        if band:
+            fields.append(('BAND', band))
+        fields.append(('MODE', CABRILLO_MODES.get(mode.upper(), mode.upper())))
+
+        if sent and _RST_PATTERN.match(sent[0]):
+            fields.append(('RST_SENT', sent[0]))
+        if received and _RST_PATTERN.match(received[0]):
+            fields.append(('RST_RCVD', received[0]))
+            received = received[1:]
+
+        exchange_fields, unknown = _cabrillo_exchange_fields(
+            received, contest.upper().startswith('SKCC'))
+        fields.extend(exchange_fields)
+        comment = ' '.join(part for part in (contest, ' '.join(unknown)) if part)
+        if comment:
+            fields.append(('COMMENT', comment))
+        yield fields
+
+
+CABRILLO_FORMAT = register_log_format(LogFormat(
+    'Cabrillo', ('.log', '.cbr', '.cabrillo'), _iter_cabrillo,
+    lambda filename: _count_pattern(filename, _CABRILLO_QSO_PATTERN),
+    lambda head: head.upper().startswith(b'START-OF-LOG'),
+))
@@ -13,9 +13,7 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 
-from src.skcc_awards.centurion import CenturionAward
-from src.skcc_awards.tribune import TribuneAward
-from src.skcc_awards.senator import SenatorAward
+from src.skcc_awards.award_state import get_award_state_store
 from src.utils.skcc_number import extract_base_skcc_number, get_member_type, is_centurion
 from src.skcc_roster import get_roster_manager
 from src.skcc_award_rosters import get_award_roster_manager
@@ -84,10 +82,8 @@ class NeededContactsAnalyzer:
         self.cache_timeout = 300  # 5 minutes
         self._cache: Dict[str, Tuple[SpotAnalysis, datetime]] = {}
 
-        # Initialize award calculators
-        self.centurion = CenturionAward(db_connection)
-        self.tribune = TribuneAward(db_connection)
-        self.senator = SenatorAward(db_connection)
+        # Shared, incrementally maintained award progress
+        self.award_state = get_award_state_store(db_connection)
 
         # Get roster managers for validation
         self.roster_manager = get_roster_manager()
@@ -165,14 +161,15 @@ class NeededContactsAnalyzer:
     def _already_worked(self, callsign: str, band: str, mode: str) -> bool:
         """Check if callsign already worked on this band/mode"""
         try:
-            cursor = self.db.conn.cursor()
-            cursor.execute("""
-                SELECT COUNT(*) FROM contacts
-                WHERE LOWER(callsign) = LOWER(?)
-                AND LOWER(band) = LOWER(?)
-                AND LOWER(mode) = LOWER(?)
-            """, (callsign, band, mode))
-            count = cursor.fetchone()[0]
+            with self.db.read_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT COUNT(*) FROM contacts
+                    WHERE LOWER(callsign) = LOWER(?)
+                    AND LOWER(band) = LOWER(?)
+                    AND LOWER(mode) = LOWER(?)
+                """, (callsign, band, mode))
+                count = cursor.fetchone()[0]
             return count > 0
         except Exception as e:
             logger.error(f"Error checking if worked: {e}")
@@ -181,7 +178,7 @@ class NeededContactsAnalyzer:
     def _get_user_progress(self) -> Dict[str, Dict]:
         """
         Get cached user progress on all awards, updating every 5 minutes.
-        Uses the award calculators to get accurate progress.
+        Uses the shared award state store (restored from its snapshot at startup).
         """
         now = datetime.now()
 
@@ -192,13 +189,10 @@ class NeededContactsAnalyzer:
 
         # Recalculate progress
         try:
-            all_contacts = self.db.get_all_contacts(limit=999999)
-            contacts_list = [dict(c) for c in all_contacts] if all_contacts else []
-
             self._progress_cache = {
-                'centurion': self.centurion.calculate_progress(contacts_list),
-                'tribune': self.tribune.calculate_progress(contacts_list),
-                'senator': self.senator.calculate_progress(contacts_list),
+                'centurion': self.award_state.get_progress('centurion'),
+                'tribune': self.award_state.get_progress('tribune'),
+                'senator': self.award_state.get_progress('senator'),
             }
             self._progress_cache_time = now
         except Exception as e:
@@ -258,12 +252,15 @@ class NeededContactsAnalyzer:
                     member_type = get_member_type(skcc_number)
                     # For Senator, need T/S specifically (not just C)
                     if member_type in ['T', 'S']:
-                        # Check via rosters first
-                        is_tribune_or_senator = self.award_rosters.was_tribune_or_senator_on_date(
-                            skcc_number,
-                            self._get_today_date()
+                        # Check via rosters first (skipped until they are loaded)
+                        is_tribune_or_senator = (
+                            self.award_rosters.is_ready('tribune', 'senator') and
+                            self.award_rosters.was_tribune_or_senator_on_date(
+                                skcc_number,
+                                self._get_today_date()
+                            )
                         )
-                        # Fallback to suffix check
+                        # Fallback to suffix check (rosters lag new awards)
                         if not is_tribune_or_senator and member_type in ['T', 'S']:
                             is_tribune_or_senator = True
 
@@ -284,12 +281,15 @@ class NeededContactsAnalyzer:
                 # User is working toward Tribune
                 # Check if this station is Centurion or higher (C/T/S suffix)
                 if is_centurion(skcc_number):
-                    # Check via rosters
-                    is_centurion_or_higher = self.award_rosters.was_centurion_or_higher_on_date(
-                        skcc_number,
-                        self._get_today_date()
+                    # Check via rosters first (skipped until they are loaded)
+                    is_centurion_or_higher = (
+                        self.award_rosters.is_ready() and
+                        self.award_rosters.was_centurion_or_higher_on_date(
+                            skcc_number,
+                            self._get_today_date()
+                        )
                     )
-                    # Fallback to suffix check
+                    # Fallback to suffix check (rosters lag new awards)
                     if not is_centurion_or_higher:
                         is_centurion_or_higher = True
 
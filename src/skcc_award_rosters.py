@@ -6,11 +6,17 @@ that contacted stations had achieved the award level at time of QSO.
 
 CRITICAL: For Tribune and Senator awards, you must verify the OTHER station had
 already achieved Tribune or Senator status at the time of contact.
+
+Lookups never touch the network: rosters are loaded at startup from the
+database tables (or the cached roster pages) and refreshed by a background
+thread (start_background_refresh). Until a roster has been loaded, lookups
+return no award date and is_ready() reports False.
 """
 
 import requests
 import re
 import os
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Optional
@@ -19,6 +25,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+AWARD_TYPES = ('centurion', 'tribune', 'senator')
+
+# Cached roster pages younger than this are reused instead of downloaded
+ROSTER_MAX_AGE_DAYS = 7
+
+# How often the background refresh downloads the rosters again
+REFRESH_INTERVAL_HOURS = 24
+
 
 class SKCCAwardRosterManager:
     """
@@ -63,6 +77,13 @@ class SKCCAwardRosterManager:
             'senator': False
         }
 
+        # Set once all rosters are loaded
+        self._ready = threading.Event()
+        self._refresh_thread = None
+        self._stop_refresh = threading.Event()
+
+        self.load_persisted_rosters()
+
     def _get_roster_file_path(self, award_type: str) -> str:
         """Get file path for cached roster"""
         return os.path.join(self.cache_dir, f'{award_type}_roster.txt')
@@ -100,7 +121,7 @@ class SKCCAwardRosterManager:
         # Check if we need to download
         if not force:
             age = self._get_roster_age(award_type)
-            if age is not None and age < 7:  # Cache for 7 days
+            if age is not None and age < ROSTER_MAX_AGE_DAYS:
                 logger.info(f"{award_type} roster is {age} days old, using cache")
                 return self.load_roster(award_type)
 
@@ -155,6 +176,59 @@ class SKCCAwardRosterManager:
             logger.error(f"Error loading {award_type} roster: {e}")
             return False
 
+    def load_persisted_rosters(self) -> Dict[str, bool]:
+        """
+        Load every roster from local storage, without network access
+
+        Prefers the roster tables in the database and falls back to the
+        cached roster pages.
+
+        Returns:
+            Dictionary with load status for each roster
+        """
+        results = {}
+        for award_type in AWARD_TYPES:
+            stored = self.database.get_award_roster_dates(award_type) if self.database else {}
+            if stored:
+                self.rosters[award_type] = stored
+                self.loaded[award_type] = True
+                self._update_ready()
+                results[award_type] = True
+            elif os.path.exists(self._get_roster_file_path(award_type)):
+                results[award_type] = self.load_roster(award_type)
+            else:
+                results[award_type] = False
+        return results
+
+    def _update_ready(self):
+        """Signal readiness once all rosters are loaded"""
+        if all(self.loaded.values()):
+            self._ready.set()
+
+    def is_ready(self, *award_types: str) -> bool:
+        """
+        Check whether rosters are loaded and can be used for validation
+
+        Args:
+            award_types: Rosters to check (default: all)
+
+        Returns:
+            True if every requested roster is loaded
+        """
+        return all(self.loaded.get(award_type, False) for award_type in award_types or AWARD_TYPES)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all rosters are loaded (never call this on the Tk thread)
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if all rosters are loaded
+        """
+        return self._ready.wait(timeout)
+
     def _parse_roster(self, award_type: str, html_content: str) -> bool:
         """
         Parse HTML roster and extract member numbers and award dates
@@ -218,9 +292,10 @@ class SKCCAwardRosterManager:
                     logger.debug(f"Could not parse date '{date_str}': {e}")
                     continue
 
-            # Store in memory
+            # Store in memory (swapped in whole; lookups may run concurrently)
             self.rosters[award_type] = roster_data
             self.loaded[award_type] = True
+            self._update_ready()
 
             # Store in database if available
             if self.database and roster_records:
@@ -296,17 +371,16 @@ class SKCCAwardRosterManager:
         """
         Get the date a member achieved a specific award
 
+        Served from memory only; check is_ready() to tell a member without
+        the award from a roster that is not loaded yet.
+
         Args:
             award_type: 'centurion', 'tribune', or 'senator'
             skcc_number: SKCC member number (can include suffix like 'C', 'T', 'S')
 
         Returns:
-            Award date in YYYYMMDD format, or None if not found
+            Award date in YYYYMMDD format, or None if not found or not loaded
         """
-        # Ensure roster is loaded
-        if not self.loaded.get(award_type):
-            self.download_roster(award_type)
-
         # Strip suffix from SKCC number (e.g., "1234T" -> "1234")
         base_number = re.sub(r'[CTSX]$', '', skcc_number.strip().upper())
 
@@ -421,6 +495,48 @@ class SKCCAwardRosterManager:
 
         return results
 
+    def start_background_refresh(self, force: bool = True,
+                                 interval_hours: float = REFRESH_INTERVAL_HOURS,
+                                 callback=None) -> threading.Thread:
+        """
+        Download the rosters now and then periodically, in a daemon thread
+
+        Lookups keep serving the current rosters while a refresh runs. Calling
+        this again while the refresh thread is running has no effect.
+
+        Args:
+            force: Download even if the cached roster pages are recent
+            interval_hours: Time between refreshes
+            callback: Optional callback(results) called on the refresh thread
+                after each refresh, with download_all_rosters() results
+
+        Returns:
+            The refresh thread
+        """
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return self._refresh_thread
+
+        def _refresh_loop():
+            while True:
+                results = self.download_all_rosters(force=force)
+                if callback:
+                    try:
+                        callback(results)
+                    except Exception as e:
+                        logger.error(f"Award roster refresh callback failed: {e}")
+                if self._stop_refresh.wait(interval_hours * 3600):
+                    return
+
+        self._stop_refresh.clear()
+        self._refresh_thread = threading.Thread(target=_refresh_loop, daemon=True,
+                                                name="award-roster-refresh")
+        self._refresh_thread.start()
+        return self._refresh_thread
+
+    def stop_background_refresh(self):
+        """Stop the background refresh after its current download"""
+        self._stop_refresh.set()
+
     def get_roster_info(self) -> Dict[str, Dict]:
         """
         Get information about loaded rosters
@@ -430,7 +546,7 @@ class SKCCAwardRosterManager:
         """
         info = {}
 
-        for award_type in ['centurion', 'tribune', 'senator']:
+        for award_type in AWARD_TYPES:
             age = self._get_roster_age(award_type)
             count = len(self.rosters.get(award_type, {}))
 
@@ -438,7 +554,7 @@ class SKCCAwardRosterManager:
                 'loaded': self.loaded.get(award_type, False),
                 'count': count,
                 'age_days': age,
-                'status': 'current' if (age and age < 7) else ('old' if age else 'missing')
+                'status': 'current' if (age and age < ROSTER_MAX_AGE_DAYS) else ('old' if age else 'missing')
             }
 
         return info
@@ -47,6 +47,7 @@ from .was import SKCCWASAward
 from .was_t import SKCCWASTAward
 from .was_s import SKCCWASSAward
 from .wac import SKCCWACAward
+from .award_state import AwardStateStore, get_award_state_store
 
 __all__ = [
     'SKCCAwardBase',
@@ -67,4 +68,6 @@ __all__ = [
     'SKCCWASTAward',
     'SKCCWASSAward',
     'SKCCWACAward',
+    'AwardStateStore',
+    'get_award_state_store',
 ]
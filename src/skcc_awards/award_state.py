@@ -0,0 +1,489 @@
+"""
+SKCC Award State Store
+
+Keeps the qualifying contacts of every award in memory and applies QSO-level
+deltas (add/update/delete) reported by the Database, so award progress no longer
+requires re-validating the whole log after each logged contact.
+
+Each award keeps an accumulator of the IDs of its qualifying contacts; the
+contacts themselves are read from the shared ContactStore, so the log is held
+in memory once.
+A delta validates only the changed contact against each award and marks the
+awards whose accumulator changed as dirty; progress is then recomputed for the
+dirty awards only, without calling validate() again for contacts that are
+already known to qualify.
+
+Accumulators and progress are persisted in the award_state_snapshots table,
+keyed by a fingerprint of the contacts table (max ID, row count, change log
+revision) and of the rules inputs (SKCC roster file, award roster tables, the
+user's award dates). At startup the snapshot is restored and only contacts
+written since it was saved are re-validated, using the contact_changes log. A
+full rebuild happens only when the rules inputs change or the log no longer
+covers the snapshot.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from src.skcc_awards.centurion import CenturionAward
+from src.skcc_awards.tribune import TribuneAward
+from src.skcc_awards.senator import SenatorAward
+from src.skcc_awards.triple_key import TripleKeyAward
+from src.skcc_awards.rag_chew import RagChewAward
+from src.skcc_awards.marathon import MarathonAward
+from src.skcc_awards.canadian_maple import CanadianMapleAward
+from src.skcc_awards.skcc_dx import SKCCDXQAward, SKCCDXCAward
+from src.skcc_awards.pfx import PFXAward
+from src.skcc_awards.qrp_awards import QRP1xAward, QRP2xAward
+from src.skcc_awards.qrp_mpw import QRPMPWAward
+from src.skcc_awards.was import SKCCWASAward
+from src.skcc_awards.was_t import SKCCWASTAward
+from src.skcc_awards.was_s import SKCCWASSAward
+from src.skcc_awards.wac import SKCCWACAward
+from src.contact_store import get_contact_store
+from src.skcc_roster import get_roster_manager, sync_roster_members
+
+logger = logging.getLogger(__name__)
+
+# Bump when award validation rules change so persisted snapshots are discarded
+AWARD_STATE_VERSION = 1
+
+# Award key -> award class (keys match SKCCAwardsTab.awards)
+AWARD_CLASSES = {
+    'centurion': CenturionAward,
+    'tribune': TribuneAward,
+    'senator': SenatorAward,
+    'triple_key': TripleKeyAward,
+    'rag_chew': RagChewAward,
+    'marathon': MarathonAward,
+    'qrp_1x': QRP1xAward,
+    'qrp_2x': QRP2xAward,
+    'qrp_mpw': QRPMPWAward,
+    'canadian_maple': CanadianMapleAward,
+    'dxq': SKCCDXQAward,
+    'dxc': SKCCDXCAward,
+    'pfx': PFXAward,
+    'was': SKCCWASAward,
+    'was_t': SKCCWASTAward,
+    'was_s': SKCCWASSAward,
+    'wac': SKCCWACAward,
+}
+
+# Progress of one award passed into another's calculate_progress:
+# {award_key: {keyword_argument: prerequisite_award_key}}
+AWARD_DEPENDENCIES = {
+    'tribune': {'centurion_progress': 'centurion'},
+}
+
+# Config values the award rules read at construction time
+RULE_CONFIG_KEYS = (
+    'skcc.join_date',
+    'skcc.centurion_date',
+    'skcc.tribune_x8_date',
+)
+
+
+def _encode_state(value: Any) -> Any:
+    """Convert award progress into JSON-compatible data (sets, tuples, non-str keys)"""
+    if isinstance(value, dict):
+        if all(isinstance(key, str) for key in value):
+            return {key: _encode_state(item) for key, item in value.items()}
+        return {'__items__': [[_encode_state(key), _encode_state(item)] for key, item in value.items()]}
+    if isinstance(value, (set, frozenset)):
+        return {'__set__': [_encode_state(item) for item in value]}
+    if isinstance(value, tuple):
+        return {'__tuple__': [_encode_state(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode_state(item) for item in value]
+    return value
+
+
+def _decode_state(value: Any) -> Any:
+    """Reverse _encode_state()"""
+    if isinstance(value, list):
+        return [_decode_state(item) for item in value]
+    if isinstance(value, dict):
+        if len(value) == 1:
+            tag, items = next(iter(value.items()))
+            if tag == '__set__':
+                return {_decode_state(item) for item in items}
+            if tag == '__tuple__':
+                return tuple(_decode_state(item) for item in items)
+            if tag == '__items__':
+                return {_decode_state(key): _decode_state(item) for key, item in items}
+        return {key: _decode_state(item) for key, item in value.items()}
+    return value
+
+
+class AwardStateStore:
+    """Incrementally maintained award progress for all SKCC awards"""
+
+    def __init__(self, database, award_classes: Optional[Dict[str, type]] = None,
+                 persist: bool = True):
+        """
+        Initialize award state store
+
+        Args:
+            database: Database instance (change notifications are subscribed to)
+            award_classes: Optional {award_key: award class} override
+            persist: Load and save award state snapshots in the database
+        """
+        self.database = database
+        self.award_classes = dict(award_classes or AWARD_CLASSES)
+        self.persist = persist
+        self.awards: Dict[str, Any] = {}
+
+        # Accumulators: {award_key: IDs of qualifying contacts}
+        self._qualifying: Dict[str, Set[int]] = {}
+        self._progress: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._initialized = False
+        self._needs_rebuild = False
+        self._snapshot_stale = False
+        self._rules_signature = None
+        self._revision = 0  # Log revision the accumulators reflect
+        self._lock = threading.RLock()
+
+        database.add_change_listener(self._on_contact_change)
+        # Swap the database copy of the roster as soon as a new one is loaded
+        get_roster_manager().add_reload_listener(self._on_roster_reload)
+
+    def _current_rules_signature(self) -> str:
+        """Fingerprint of everything that invalidates cached validation verdicts"""
+        config = getattr(self.database, 'config', None)
+        dates = [
+            (config.get(key, '') or '') if config is not None else ''
+            for key in RULE_CONFIG_KEYS
+        ]
+        roster = get_roster_manager()
+
+        signature = json.dumps([
+            AWARD_STATE_VERSION,
+            list(self.award_classes),
+            dates,
+            roster.get_roster_mtime(),
+            roster.get_member_count(),
+            self.database.get_award_roster_versions(),
+        ], sort_keys=True)
+        return hashlib.sha1(signature.encode('utf-8')).hexdigest()
+
+    def close(self):
+        """Unregister the database change and roster reload listeners"""
+        self.database.remove_change_listener(self._on_contact_change)
+        get_roster_manager().remove_reload_listener(self._on_roster_reload)
+
+    def invalidate(self):
+        """Force a full rebuild on the next progress request"""
+        with self._lock:
+            self._needs_rebuild = True
+
+    def rebuild(self, rules_signature: Optional[str] = None):
+        """Recreate award instances and re-validate the whole log"""
+        with self._lock:
+            # Read the revision first; writes racing the scan are caught up later
+            revision = self.database.get_log_revision()
+            self._rules_signature = rules_signature or self._current_rules_signature()
+            self.awards = {key: cls(self.database) for key, cls in self.award_classes.items()}
+            self._qualifying = {key: set() for key in self.award_classes}
+            self._progress = {}
+            self._dirty = set(self.award_classes)
+
+            # Membership joins in the award filters need the current roster stored
+            sync_roster_members(self.database)
+
+            # One indexed query per award narrows the contacts validate() sees
+            candidates = {key: award.get_sql_filter() for key, award in self.awards.items()}
+            if all(sql_filter is not None for sql_filter in candidates.values()):
+                where = ' OR '.join(f'({clause})' for clause, _ in candidates.values())
+                params = [param for _, clause_params in candidates.values() for param in clause_params]
+                contacts = self.database.iter_contacts(where=where, params=params)
+                candidates = {
+                    key: self.database.get_contact_ids(*sql_filter)
+                    for key, sql_filter in candidates.items()
+                }
+            else:
+                contacts = self.database.iter_contacts()
+
+            for contact in contacts:
+                self._apply_contact(contact, candidates)
+
+            self._revision = revision
+            self._initialized = True
+            self._needs_rebuild = False
+            self._snapshot_stale = True
+            logger.debug(
+                "Award state rebuilt: "
+                + ", ".join(f"{key}={len(ids)}" for key, ids in self._qualifying.items())
+            )
+
+    def _load_snapshot(self, rules_signature: str) -> bool:
+        """
+        Restore accumulators and progress from the persisted snapshot
+
+        Returns:
+            True if a snapshot matching the current rules was restored
+        """
+        snapshots = self.database.get_award_snapshots()
+        if set(snapshots) != set(self.award_classes):
+            return False
+
+        rows = list(snapshots.values())
+        revision = rows[0]['revision']
+        log_fingerprint = rows[0]['log_fingerprint']
+        if any(row['rules_fingerprint'] != rules_signature
+               or row['revision'] != revision
+               or row['log_fingerprint'] != log_fingerprint for row in rows):
+            return False
+
+        current_revision = self.database.get_log_revision()
+        if revision > current_revision:
+            return False
+        if revision == current_revision and log_fingerprint != self.database.get_log_fingerprint():
+            return False  # Contacts table was replaced without going through the change log
+
+        try:
+            progress = {key: _decode_state(json.loads(row['progress'])) for key, row in snapshots.items()}
+            qualifying = {
+                key: set(json.loads(row['qualifying_ids']))
+                for key, row in snapshots.items()
+            }
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding unreadable award state snapshot: {e}")
+            return False
+
+        self.awards = {key: cls(self.database) for key, cls in self.award_classes.items()}
+        self._qualifying = qualifying
+        self._progress = progress
+        self._dirty = set()
+        self._rules_signature = rules_signature
+        self._revision = revision
+        self._initialized = True
+        self._needs_rebuild = False
+        self._snapshot_stale = False
+        logger.debug(f"Award state restored from snapshot at revision {revision}")
+        return True
+
+    def save_snapshot(self):
+        """Persist progress and qualifying contact IDs for every award"""
+        with self._lock:
+            self._ensure_current()
+            self._save_snapshot()
+
+    def _save_snapshot(self):
+        """Write the current state (caller holds the lock and state is current)"""
+        try:
+            snapshots = {
+                key: (
+                    json.dumps(_encode_state(self._progress_for(key))),
+                    json.dumps(sorted(self._qualifying[key])),
+                )
+                for key in self.award_classes
+            }
+            self.database.save_award_snapshots(
+                snapshots, self._rules_signature,
+                self.database.get_log_fingerprint(), self._revision
+            )
+            self._snapshot_stale = False
+        except (TypeError, ValueError, sqlite3.DatabaseError) as e:
+            logger.warning(f"Could not save award state snapshot: {e}")
+
+    def _ensure_current(self):
+        """Bring the accumulators up to date with the rules and the log"""
+        rules_signature = self._current_rules_signature()
+        if not self._initialized:
+            if not (self.persist and self._load_snapshot(rules_signature)):
+                self.rebuild(rules_signature)
+        elif self._needs_rebuild or rules_signature != self._rules_signature:
+            logger.info("Award rules or rosters changed, rebuilding award state")
+            self.rebuild(rules_signature)
+        self._catch_up()
+
+    def _catch_up(self):
+        """Apply contact writes recorded in the change log since our revision"""
+        revision = self.database.get_log_revision()
+        if revision == self._revision:
+            return
+
+        changes = self.database.get_contact_changes(self._revision) if revision > self._revision else None
+        if changes is None:
+            self.rebuild(self._rules_signature)
+            return
+
+        # Only the last operation per contact matters
+        latest = {contact_id: operation for _, contact_id, operation in changes}
+        changed_ids = [contact_id for contact_id, operation in latest.items() if operation != 'DELETE']
+
+        found = set()
+        for contact in self.database.get_contacts_by_ids(changed_ids):
+            found.add(contact['id'])
+            self._apply_contact(contact)
+        for contact_id in latest.keys() - found:
+            self._remove_contact(contact_id)
+
+        self._revision = changes[-1][0] if changes else revision
+
+    def _mark_dirty(self, award_key: str):
+        """Mark an award and every award depending on it for recomputation"""
+        self._dirty.add(award_key)
+        self._snapshot_stale = True
+        for dependent, prerequisites in AWARD_DEPENDENCIES.items():
+            if award_key in prerequisites.values():
+                self._mark_dirty(dependent)
+
+    def _apply_contact(self, contact: Dict[str, Any],
+                       candidates: Optional[Dict[str, Any]] = None):
+        """
+        Validate one contact against every award and update the accumulators
+
+        Args:
+            contact: Contact record
+            candidates: Optional {award_key: IDs passing the award's SQL filter};
+                contacts outside an award's candidates are not validated for it
+        """
+        contact_id = contact.get('id')
+        if contact_id is None:
+            return
+
+        for key, award in self.awards.items():
+            accumulator = self._qualifying[key]
+            award_candidates = candidates.get(key) if candidates else None
+            try:
+                if award_candidates is not None and contact_id not in award_candidates:
+                    qualifies = False
+                else:
+                    qualifies = award.validate(contact)
+            except Exception as e:
+                logger.error(f"{award.name} validation failed for contact {contact_id}: {e}")
+                qualifies = False
+
+            if qualifies:
+                accumulator.add(contact_id)
+                self._mark_dirty(key)
+            elif contact_id in accumulator:
+                accumulator.discard(contact_id)
+                self._mark_dirty(key)
+
+    def _remove_contact(self, contact_id: int):
+        """Drop a contact from every accumulator"""
+        for key, accumulator in self._qualifying.items():
+            if contact_id in accumulator:
+                accumulator.discard(contact_id)
+                self._mark_dirty(key)
+
+    def _on_contact_change(self, event: str, contact_id: Optional[int]):
+        """Database change listener applying add/update/delete deltas"""
+        with self._lock:
+            if not self._initialized or event == 'reload' or contact_id is None:
+                return  # Picked up from the change log on the next progress request
+
+            if event == 'delete':
+                self._remove_contact(contact_id)
+            else:
+                contact = self.database.get_contact(contact_id)
+                if contact is None:
+                    self._remove_contact(contact_id)
+                else:
+                    self._apply_contact(contact)
+
+            # Advance only if this write is the sole change since our revision;
+            # otherwise _catch_up() replays the log (re-applying is idempotent)
+            revision = self.database.get_log_revision()
+            if revision == self._revision + 1:
+                self._revision = revision
+
+    def _on_roster_reload(self):
+        """Roster reload listener; award progress is rebuilt on the next request"""
+        sync_roster_members(self.database)
+
+    def awards_by_key(self) -> Dict[str, Any]:
+        """Get the store's award instances keyed by award key"""
+        with self._lock:
+            self._ensure_current()
+            return dict(self.awards)
+
+    def _qualifying_contacts(self, award_key: str) -> List[Dict[str, Any]]:
+        """Qualifying contacts, most recent first (caller holds the lock)"""
+        accumulator = self._qualifying[award_key]
+        records = get_contact_store(self.database).get_many(accumulator)
+        if len(records) != len(accumulator):
+            # Deleted without a change notification (e.g. a restored snapshot)
+            accumulator.intersection_update(records)
+            self._mark_dirty(award_key)
+        contacts = list(records.values())
+        contacts.sort(key=lambda c: (c.get('date') or '', c.get('time_on') or ''), reverse=True)
+        return contacts
+
+    def get_qualifying_contacts(self, award_key: str) -> List[Dict[str, Any]]:
+        """
+        Get the contacts currently qualifying for an award
+
+        Returns:
+            Contacts ordered like Database.get_all_contacts (most recent first)
+        """
+        with self._lock:
+            self._ensure_current()
+            return self._qualifying_contacts(award_key)
+
+    def _progress_for(self, award_key: str) -> Dict[str, Any]:
+        """Progress for one award, recomputed only if its accumulator changed"""
+        if award_key in self._dirty or award_key not in self._progress:
+            award = self.awards[award_key]
+            contacts = self._qualifying_contacts(award_key)
+            kwargs = {
+                argument: self._progress_for(prerequisite)
+                for argument, prerequisite in AWARD_DEPENDENCIES.get(award_key, {}).items()
+            }
+
+            with award.known_qualifying(set(self._qualifying[award_key])):
+                self._progress[award_key] = award.calculate_progress(contacts, **kwargs)
+            self._dirty.discard(award_key)
+
+        return self._progress[award_key]
+
+    def get_progress(self, award_key: str) -> Dict[str, Any]:
+        """
+        Get progress for one award
+
+        Args:
+            award_key: Award key (e.g., 'centurion', 'was_t')
+
+        Returns:
+            Progress dictionary as returned by the award's calculate_progress()
+        """
+        with self._lock:
+            self._ensure_current()
+            return self._progress_for(award_key)
+
+    def get_all_progress(self) -> Dict[str, Dict[str, Any]]:
+        """Get progress for every award keyed by award key, saving a snapshot if it changed"""
+        with self._lock:
+            self._ensure_current()
+            progress = {key: self._progress_for(key) for key in self.award_classes}
+            if self.persist and self._snapshot_stale:
+                self._save_snapshot()
+            return progress
+
+    def __repr__(self) -> str:
+        if not self._initialized:
+            state = "not loaded"
+        else:
+            state = f"revision={self._revision}, dirty={len(self._dirty)}"
+        return f"<AwardStateStore(awards={len(self.award_classes)}, {state})>"
+
+
+# Singleton instance
+_award_state_store = None
+
+
+def get_award_state_store(database=None) -> AwardStateStore:
+    """Get singleton instance of the award state store"""
+    global _award_state_store
+    if _award_state_store is None or (database is not None and _award_state_store.database is not database):
+        if _award_state_store is not None:
+            _award_state_store.close()
+        _award_state_store = AwardStateStore(database)
+    return _award_state_store
@@ -6,13 +6,26 @@ Defines common interface and validation logic.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Optional, Set, Tuple
 from src.skcc_awards.constants import VALID_KEY_TYPES
 
 
 class SKCCAwardBase(ABC):
     """Abstract base class for SKCC award programs"""
 
+    # Earliest QSO date (YYYYMMDD) accepted by the award rules, if any
+    effective_date: Optional[str] = None
+
+    # How validate() checks the contacted station's SKCC membership on the QSO
+    # date: None (not required), 'callsign', or 'callsign_or_number' (special
+    # event calls are checked by SKCC number)
+    membership_filter: Optional[str] = None
+
+    # Award rosters ('centurion', 'tribune', 'senator') of which the contacted
+    # station must have held one award on the QSO date
+    award_holder_filter: Tuple[str, ...] = ()
+
     def __init__(self, name: str, program_id: str, database):
         """
         Initialize SKCC award program
@@ -25,6 +38,9 @@ class SKCCAwardBase(ABC):
         self.name = name
         self.program_id = program_id
         self.database = database
+        # Contact IDs already known to qualify (set by AwardStateStore while it
+        # recomputes progress, so calculate_progress skips re-validation)
+        self._known_qualifying_ids: Optional[Set[int]] = None
 
     @abstractmethod
     def validate(self, contact: Dict[str, Any]) -> bool:
@@ -86,6 +102,38 @@ class SKCCAwardBase(ABC):
         """
         pass
 
+    def is_qualifying(self, contact: Dict[str, Any]) -> bool:
+        """
+        Check if a contact qualifies, reusing verdicts from the award state store
+
+        Behaves exactly like validate() unless called inside known_qualifying().
+
+        Args:
+            contact: Contact record dictionary
+
+        Returns:
+            True if contact qualifies for this award
+        """
+        known = self._known_qualifying_ids
+        if known is not None and contact.get('id') in known:
+            return True
+        return self.validate(contact)
+
+    @contextmanager
+    def known_qualifying(self, contact_ids: Set[int]) -> Iterator[None]:
+        """
+        Treat the given contact IDs as already validated for the duration of the block
+
+        Args:
+            contact_ids: IDs of contacts that passed validate() with the current rules
+        """
+        previous = self._known_qualifying_ids
+        self._known_qualifying_ids = contact_ids
+        try:
+            yield
+        finally:
+            self._known_qualifying_ids = previous
+
     def get_name(self) -> str:
         """Get award name"""
         return self.name
@@ -94,6 +142,12 @@ class SKCCAwardBase(ABC):
         """Get program ID"""
         return self.program_id
 
+    @property
+    def callsign_resolver(self):
+        """Shared CallsignResolver for base calls, prefixes and roster membership"""
+        from src.callsign_resolver import get_callsign_resolver
+        return get_callsign_resolver()
+
     def validate_common_rules(self, contact: Dict[str, Any]) -> bool:
         """
         Validate common SKCC award rules
@@ -126,6 +180,67 @@ class SKCCAwardBase(ABC):
 
         return True
 
+    @staticmethod
+    def _latest_date(*dates: Optional[str]) -> Optional[str]:
+        """Latest of the given YYYYMMDD dates, ignoring unset or malformed values"""
+        valid = [d for d in dates if d and len(d) == 8 and d.isdigit()]
+        return max(valid) if valid else None
+
+    def get_min_qso_date(self) -> Optional[str]:
+        """
+        Earliest QSO date (YYYYMMDD) that can qualify
+
+        Combines the award's effective date with the user's SKCC join date.
+        """
+        return self._latest_date(self.effective_date, getattr(self, 'user_join_date', ''))
+
+    def get_sql_filter(self) -> Optional[Tuple[str, List[Any]]]:
+        """
+        SQL condition selecting the contacts that can possibly qualify
+
+        Pushes validate_common_rules(), the date floor and, when the rosters
+        are stored in the database, the membership and award holder checks
+        down to indexed joins on normalized contact columns. The result is a
+        superset of qualifying contacts; validate() still decides the rest.
+
+        Returns:
+            (where_clause, params), or None if contacts cannot be prefiltered
+        """
+        normalized_column = getattr(self.database, 'normalized_column', None)
+        if normalized_column is None:
+            return None
+
+        placeholders = ', '.join('?' * len(VALID_KEY_TYPES))
+        conditions = [
+            f"{normalized_column('mode_norm')} = 'CW'",
+            f"{normalized_column('key_type_norm')} IN ({placeholders})",
+            "skcc_number != ''",
+        ]
+        params: List[Any] = sorted(VALID_KEY_TYPES)
+
+        min_date = self.get_min_qso_date()
+        if min_date:
+            # Range seek on the QSO timestamp; contacts without a date are left to validate()
+            conditions.append(f"({normalized_column('qso_ts')} >= ? OR date = '')")
+            params.append(int(min_date) * 10000)
+
+        # Roster joins; skipped (left to validate()) while a roster is not stored
+        roster_member_condition = getattr(self.database, 'roster_member_condition', None)
+        if self.membership_filter and roster_member_condition is not None:
+            condition = roster_member_condition(
+                self.callsign_resolver.roster_manager.source,
+                include_numbers=self.membership_filter == 'callsign_or_number'
+            )
+            if condition:
+                conditions.append(condition)
+        award_holder_condition = getattr(self.database, 'award_holder_condition', None)
+        if self.award_holder_filter and award_holder_condition is not None:
+            condition = award_holder_condition(self.award_holder_filter)
+            if condition:
+                conditions.append(condition)
+
+        return ' AND '.join(conditions), params
+
     def should_deduplicate_for_export(self) -> bool:
         """
         Return True when export should keep only the first QSO per SKCC member.
@@ -138,94 +253,133 @@ class SKCCAwardBase(ABC):
         """Normalize callsign for award export output."""
         return callsign
 
-    def export_qualifying_contacts_to_adif(
+    def export_view_key(self) -> Tuple[str, ...]:
+        """
+        Identify how prepare_export_contacts() builds an application
+
+        Awards with equal keys turn the same qualifying contacts into the same
+        application list, so a batch export builds that list once for all of
+        them (see AwardExporter.export_multiple_awards).
+        """
+        return ('first_per_member',) if self.should_deduplicate_for_export() else ('all',)
+
+    def prepare_export_contacts(self, qualifying: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Build the application list from validated contacts
+
+        Args:
+            qualifying: Contacts that passed validate(), in date/time order
+
+        Returns:
+            Contacts to submit, in date/time order
+        """
+        if not self.should_deduplicate_for_export():
+            return list(qualifying)
+
+        # CRITICAL: Deduplicate by SKCC number (keep only first QSO with each unique member)
+        # Per SKCC rules: "Each call sign counts only once (per category)"
+        from src.utils.skcc_number import extract_base_skcc_number
+
+        seen_skcc_numbers = set()
+        deduplicated = []
+
+        for contact in qualifying:
+            skcc_number = (contact.get('skcc_number') or '').strip()
+            if skcc_number:
+                base_number = extract_base_skcc_number(skcc_number)
+                if base_number and base_number not in seen_skcc_numbers:
+                    seen_skcc_numbers.add(base_number)
+                    deduplicated.append(contact)
+
+        return deduplicated
+
+    def write_application_adif(
         self,
         contacts: List[Dict[str, Any]],
         filename: str,
         include_award_info: bool = True
     ) -> int:
         """
-        Export qualifying contacts for this award to ADIF file.
+        Write application contacts to an ADIF file
 
-        This is used for submitting award applications to SKCC awards managers.
+        Contacts are copied before the award note and callsign normalization
+        are applied, so lists shared between awards are left untouched.
 
         Args:
-            contacts: List of all contact records from database
+            contacts: Contacts from prepare_export_contacts()
             filename: Output filename for ADIF file
             include_award_info: If True, add award name to each contact's comment field
 
         Returns:
-            Number of qualifying contacts exported
+            Number of contacts written
 
         Raises:
-            ValueError: If no qualifying contacts found
             IOError: If file cannot be written
         """
-        # Filter for qualifying contacts only
-        qualifying = [c for c in contacts if self.validate(c)]
-
-        if not qualifying:
-            raise ValueError(f"No qualifying contacts found for {self.name} award")
-
-        if self.should_deduplicate_for_export():
-            # CRITICAL: Deduplicate by SKCC number (keep only first QSO with each unique member)
-            # Per SKCC rules: "Each call sign counts only once (per category)"
-            from src.utils.skcc_number import extract_base_skcc_number
-
-            # Sort by date/time to ensure we keep the first contact with each member
-            qualifying.sort(key=lambda x: (x.get('date', ''), x.get('time_on', '')))
-
-            seen_skcc_numbers = set()
-            deduplicated = []
-
-            for contact in qualifying:
-                skcc_number = contact.get('skcc_number', '').strip()
-                if skcc_number:
-                    base_number = extract_base_skcc_number(skcc_number)
-                    if base_number and base_number not in seen_skcc_numbers:
-                        seen_skcc_numbers.add(base_number)
-                        deduplicated.append(contact)
-
-            qualifying = deduplicated
-
-        # Add award information to comments if requested
-        if include_award_info:
-            for contact in qualifying:
-                existing_comment = contact.get('comment', contact.get('comments', ''))
-                award_note = f"[{self.name} Award]"
+        award_note = f"[{self.name} Award]"
+        application = []
+        for contact in contacts:
+            contact_copy = dict(contact)
 
+            if include_award_info:
+                existing_comment = contact_copy.get('comment', contact_copy.get('comments', ''))
                 if existing_comment:
                     if award_note not in existing_comment:
-                        contact['comment'] = f"{existing_comment} {award_note}"
+                        contact_copy['comment'] = f"{existing_comment} {award_note}"
                 else:
-                    contact['comment'] = award_note
+                    contact_copy['comment'] = award_note
 
-        # Normalize callsigns for export without mutating original records
-        normalized_contacts = []
-        for contact in qualifying:
-            contact_copy = dict(contact)
-            callsign = contact_copy.get('callsign', '')
-            normalized = self.normalize_callsign_for_export(callsign)
+            normalized = self.normalize_callsign_for_export(contact_copy.get('callsign', ''))
             if normalized:
                 contact_copy['callsign'] = normalized
-            normalized_contacts.append(contact_copy)
-
-        qualifying = normalized_contacts
+            application.append(contact_copy)
 
         # Import ADIF export function
         from src.adif import export_contacts_to_adif
 
-        # Export to ADIF file
         try:
             export_contacts_to_adif(
-                qualifying,
+                application,
                 filename,
                 program_name=f"W4GNS General Logger - {self.name} Award"
             )
-            return len(qualifying)
+            return len(application)
         except Exception as e:
             raise IOError(f"Failed to export {self.name} award contacts: {e}")
 
+    def export_qualifying_contacts_to_adif(
+        self,
+        contacts: List[Dict[str, Any]],
+        filename: str,
+        include_award_info: bool = True
+    ) -> int:
+        """
+        Export qualifying contacts for this award to ADIF file.
+
+        This is used for submitting award applications to SKCC awards managers.
+
+        Args:
+            contacts: List of all contact records from database
+            filename: Output filename for ADIF file
+            include_award_info: If True, add award name to each contact's comment field
+
+        Returns:
+            Number of qualifying contacts exported
+
+        Raises:
+            ValueError: If no qualifying contacts found
+            IOError: If file cannot be written
+        """
+        # Filter for qualifying contacts only, earliest first
+        qualifying = [c for c in contacts if self.validate(c)]
+        qualifying.sort(key=lambda x: (x.get('date') or '', x.get('time_on') or ''))
+
+        application = self.prepare_export_contacts(qualifying)
+        if not application:
+            raise ValueError(f"No qualifying contacts found for {self.name} award")
+
+        return self.write_application_adif(application, filename, include_award_info)
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}(id={self.program_id}, name={self.name})>"
 
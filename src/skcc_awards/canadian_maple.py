@@ -49,6 +49,8 @@ QRP_THRESHOLD = 5.0
 class CanadianMapleAward(SKCCAwardBase):
     """SKCC Canadian Maple Award - 4 levels (Yellow, Orange, Red, Gold)"""
 
+    effective_date = CANADIAN_PROVINCES_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize Canadian Maple award
@@ -102,7 +104,7 @@ class CanadianMapleAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Get province/territory
         location = self._extract_location(contact)
@@ -128,7 +130,7 @@ class CanadianMapleAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both parties in the QSO must be SKCC members at the time of the QSO"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -272,7 +274,7 @@ class CanadianMapleAward(SKCCAwardBase):
 
         # Process all qualifying contacts
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 location = self._extract_location(contact)
                 band = self._normalize_band(contact.get('band', ''))
                 power = contact.get('power_watts')
@@ -36,6 +36,8 @@ logger = logging.getLogger(__name__)
 class CenturionAward(SKCCAwardBase):
     """SKCC Centurion Award - 100+ unique SKCC member contacts"""
 
+    membership_filter = 'callsign'
+
     def __init__(self, database):
         """
         Initialize Centurion award
@@ -93,7 +95,7 @@ class CenturionAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # CRITICAL RULE: Club calls and special event calls don't count after Dec 1, 2009
         if qso_date and qso_date >= CENTURION_SPECIAL_EVENT_CUTOFF:
@@ -114,10 +116,10 @@ class CenturionAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both parties in the QSO must be SKCC members at the time of the QSO"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date} "
-                f"(join date: {self.roster_manager.get_join_date(base_call)})"
+                f"(join date: {self.roster_manager.get_join_date(callsign)})"
             )
             return False
 
@@ -156,7 +158,7 @@ class CenturionAward(SKCCAwardBase):
         unique_members = set()
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 skcc_number = contact.get('skcc_number', '').strip()
                 if skcc_number:
                     base_number = extract_base_skcc_number(skcc_number)
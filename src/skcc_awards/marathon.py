@@ -38,6 +38,8 @@ MARATHON_MIN_DURATION = 60
 class MarathonAward(SKCCAwardBase):
     """SKCC Marathon Award - 100 QSOs of 60+ minutes each with different members"""
 
+    effective_date = MARATHON_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize Marathon award
@@ -95,7 +97,7 @@ class MarathonAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # CRITICAL RULE: No club calls or special event calls
         if base_call in SPECIAL_EVENT_CALLS:
@@ -131,7 +133,7 @@ class MarathonAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must have SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -172,7 +174,7 @@ class MarathonAward(SKCCAwardBase):
             }
         """
         # Filter for qualifying contacts
-        qualifying_contacts = [c for c in contacts if self.validate(c)]
+        qualifying_contacts = [c for c in contacts if self.is_qualifying(c)]
 
         # Sort by date to ensure earliest contact wins
         qualifying_contacts.sort(
@@ -33,7 +33,6 @@ Endorsements:
 """
 
 import logging
-import re
 from typing import Dict, List, Any, Set, Tuple
 from collections import defaultdict
 
@@ -67,6 +66,8 @@ PFX_ENDORSEMENTS = [
 class PFXAward(SKCCAwardBase):
     """SKCC PFX Award - 500,000+ points from prefixes"""
 
+    effective_date = PFX_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize PFX award
@@ -106,23 +107,7 @@ class PFXAward(SKCCAwardBase):
         Returns:
             Prefix string
         """
-        if not callsign:
-            return ""
-
-        # Remove slashes and take base callsign
-        callsign = callsign.upper().strip()
-        if '/' in callsign:
-            # Take the longest part (usually the base call)
-            parts = callsign.split('/')
-            callsign = max(parts, key=len)
-
-        # Find the position of the last digit on the left side
-        # (before any letters that follow the digit)
-        match = re.search(r'^([A-Z0-9]*\d)', callsign)
-        if match:
-            return match.group(1)
-
-        return ""
+        return self.callsign_resolver.resolve(callsign).prefix
 
     def validate(self, contact: Dict[str, Any]) -> bool:
         """
@@ -158,7 +143,7 @@ class PFXAward(SKCCAwardBase):
 
         # CRITICAL RULE: Club calls and special-event calls don't qualify
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         if base_call in SPECIAL_EVENT_CALLS:
             logger.debug(f"Club/special-event call filtered for PFX: {callsign}")
@@ -172,7 +157,7 @@ class PFXAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both stations must be members of the SKCC at time of the contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -230,7 +215,7 @@ class PFXAward(SKCCAwardBase):
         total_contacts = 0
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 callsign = contact.get('callsign', '').upper().strip()
                 skcc_number = contact.get('skcc_number', '').strip()
                 base_number = extract_base_skcc_number(skcc_number)
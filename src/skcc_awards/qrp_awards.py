@@ -55,7 +55,7 @@ class QRPBaseAward(SKCCAwardBase):
         return False
 
     def normalize_callsign_for_export(self, callsign: str) -> str:
-        return self.roster_manager.normalize_callsign(callsign)
+        return self.callsign_resolver.resolve(callsign).base_call
 
     def _get_qso_date(self, contact: Dict[str, Any]) -> str:
         qso_date = contact.get('qso_date', contact.get('date', '')) or ''
@@ -111,11 +111,11 @@ class QRPBaseAward(SKCCAwardBase):
             return False
 
         callsign = contact.get('callsign', '')
-        base_call = self.roster_manager.normalize_callsign(callsign)
+        base_call = self.callsign_resolver.resolve(callsign).base_call
         if not base_call:
             return False
 
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             return False
 
         if self.user_join_date and qso_date and qso_date < self.user_join_date:
@@ -139,7 +139,7 @@ class QRPBaseAward(SKCCAwardBase):
 
     def _select_unique_contacts(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Select unique contacts by callsign + band and calculate points."""
-        qualifying = [c for c in contacts if self.validate(c)]
+        qualifying = [c for c in contacts if self.is_qualifying(c)]
         qualifying.sort(key=lambda x: (self._get_qso_date(x), x.get('time_on', '')))
 
         seen: set[Tuple[str, str]] = set()
@@ -151,7 +151,7 @@ class QRPBaseAward(SKCCAwardBase):
 
         for contact in qualifying:
             band = self._normalize_band(contact.get('band', ''))
-            base_call = self.roster_manager.normalize_callsign(contact.get('callsign', ''))
+            base_call = self.callsign_resolver.resolve(contact.get('callsign')).base_call
             if not band or not base_call:
                 continue
 
@@ -233,48 +233,13 @@ class QRPBaseAward(SKCCAwardBase):
             {'level': self.REQUIRED_POINTS, 'description': self.name, 'points_needed': self.REQUIRED_POINTS}
         ]
 
-    def export_qualifying_contacts_to_adif(
-        self,
-        contacts: List[Dict[str, Any]],
-        filename: str,
-        include_award_info: bool = True
-    ) -> int:
-        """Export QRP award contacts with per-band deduplication."""
-        qualifying = self.get_application_contacts(contacts)
-
-        if not qualifying:
-            raise ValueError(f"No qualifying contacts found for {self.name} award")
-
-        if include_award_info:
-            for contact in qualifying:
-                existing_comment = contact.get('comment', contact.get('comments', ''))
-                award_note = f"[{self.name} Award]"
-                if existing_comment:
-                    if award_note not in existing_comment:
-                        contact['comment'] = f"{existing_comment} {award_note}"
-                else:
-                    contact['comment'] = award_note
-
-        normalized_contacts = []
-        for contact in qualifying:
-            contact_copy = dict(contact)
-            callsign = contact_copy.get('callsign', '')
-            normalized = self.normalize_callsign_for_export(callsign)
-            if normalized:
-                contact_copy['callsign'] = normalized
-            normalized_contacts.append(contact_copy)
+    def export_view_key(self) -> Tuple[str, ...]:
+        """QRP applications keep one contact per station and band."""
+        return ('qrp_station_band',)
 
-        from src.adif import export_contacts_to_adif
-
-        try:
-            export_contacts_to_adif(
-                normalized_contacts,
-                filename,
-                program_name=f"W4GNS General Logger - {self.name} Award"
-            )
-            return len(normalized_contacts)
-        except Exception as e:
-            raise IOError(f"Failed to export {self.name} award contacts: {e}")
+    def prepare_export_contacts(self, qualifying: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Select one contact per station and band for the application."""
+        return self.get_application_contacts(qualifying)
 
 
 class QRP1xAward(QRPBaseAward):
@@ -53,6 +53,8 @@ CANADA_COUNTRY_NAMES = {'CANADA', 'CAN'}
 class QRPMPWAward(SKCCAwardBase):
     """SKCC QRP Miles per Watt Award - 1,000+ MPW contacts"""
 
+    effective_date = QRP_MPW_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize QRP MPW award
@@ -231,7 +233,7 @@ class QRPMPWAward(SKCCAwardBase):
             return False
 
         # Get callsign (remove portable/suffix indicators)
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Filter out club and special event calls
         if base_call in SPECIAL_EVENT_CALLS:
@@ -240,7 +242,7 @@ class QRPMPWAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both stations must be members of the SKCC at time of the contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -320,7 +322,7 @@ class QRPMPWAward(SKCCAwardBase):
         qualified_contacts = []
 
         for contact in contacts:
-            if not self.validate(contact):
+            if not self.is_qualifying(contact):
                 continue
 
             power_watts = contact.get('power_watts')
@@ -36,6 +36,8 @@ logger = logging.getLogger(__name__)
 class RagChewAward(SKCCAwardBase):
     """SKCC Rag Chew Award - Accumulate 300+ minutes of conversations"""
 
+    effective_date = RAG_CHEW_EFFECTIVE_DATE
+
     # Minimum duration thresholds
     MIN_DURATION_SINGLE = 30  # 30 minutes minimum for single-station QSOs
     MIN_DURATION_MULTI = 40   # 40 minutes minimum for multi-station QSOs
@@ -120,7 +122,7 @@ class RagChewAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Verify valid SKCC number
         skcc_num = contact.get('skcc_number', '').strip()
@@ -131,7 +133,7 @@ class RagChewAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must have SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -214,7 +216,7 @@ class RagChewAward(SKCCAwardBase):
             }
         """
         # Filter for qualifying contacts
-        qualifying_contacts = [c for c in contacts if self.validate(c)]
+        qualifying_contacts = [c for c in contacts if self.is_qualifying(c)]
 
         # Remove back-to-back contacts with same member
         qualifying_contacts = self._check_back_to_back(qualifying_contacts)
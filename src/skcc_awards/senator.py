@@ -19,7 +19,7 @@ Rules:
 """
 
 import logging
-from typing import Dict, List, Any, Set, Optional
+from typing import Dict, List, Any, Set, Optional, Tuple
 
 from src.skcc_awards.base import SKCCAwardBase
 from src.utils.skcc_number import extract_base_skcc_number
@@ -44,6 +44,10 @@ SENATOR_BAND_ORDER = (
 class SenatorAward(SKCCAwardBase):
     """SKCC Senator Award - 200+ unique Tribune/Senator contacts after Tribune x8"""
 
+    effective_date = SENATOR_EFFECTIVE_DATE
+    membership_filter = 'callsign'
+    award_holder_filter = ('tribune', 'senator')
+
     def __init__(self, database):
         """
         Initialize Senator award
@@ -73,9 +77,19 @@ class SenatorAward(SKCCAwardBase):
             return self.database.config.get('skcc.tribune_x8_date', '')
         return ''
 
+    def get_min_qso_date(self) -> Optional[str]:
+        """Earliest qualifying QSO date, including the user's Tribune x8 date"""
+        return self._latest_date(super().get_min_qso_date(), self.user_tribune_x8_date)
+
+    def get_sql_filter(self) -> Optional[Tuple[str, List[Any]]]:
+        """Nothing can qualify until the user's Tribune x8 date is set"""
+        if not self.user_tribune_x8_date:
+            return '0', []
+        return super().get_sql_filter()
+
     def normalize_callsign_for_export(self, callsign: str) -> str:
         """Remove prefixes/suffixes for Senator applications."""
-        return self.roster_manager.normalize_callsign(callsign)
+        return self.callsign_resolver.resolve(callsign).base_call
 
     def _normalize_band(self, band: str) -> str:
         if not band:
@@ -134,7 +148,7 @@ class SenatorAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = self.roster_manager.normalize_callsign(callsign)
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # CRITICAL RULE: Club calls don't qualify for Senator
         if base_call in SPECIAL_EVENT_CALLS:
@@ -146,7 +160,7 @@ class SenatorAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both parties in the QSO must be SKCC members at the time of the QSO"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -168,13 +182,10 @@ class SenatorAward(SKCCAwardBase):
             logger.debug(f"Contact {base_call} missing SKCC number")
             return False
 
-        roster_info = self.award_rosters.get_roster_info()
-        tribune_loaded = roster_info.get('tribune', {}).get('loaded', False)
-        senator_loaded = roster_info.get('senator', {}).get('loaded', False)
-        if not (tribune_loaded and senator_loaded):
+        if not self.award_rosters.is_ready(*self.award_holder_filter):
             logger.debug(
                 f"Contact {callsign} with SKCC#{skcc_num} not valid: "
-                f"Tribune/Senator rosters not loaded"
+                f"Tribune/Senator rosters not ready"
             )
             return False
 
@@ -225,7 +236,7 @@ class SenatorAward(SKCCAwardBase):
         tribune_x8_threshold = 400
 
         for contact in sorted_contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 skcc_number = contact.get('skcc_number', '').strip()
                 if skcc_number:
                     base_number = extract_base_skcc_number(skcc_number)
@@ -296,7 +307,7 @@ class SenatorAward(SKCCAwardBase):
         band_members: Dict[str, Set[str]] = {}
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 qso_date = contact.get('date', '').replace('-', '')
 
                 # Only count contacts AFTER Tribune x8 achievement
@@ -58,6 +58,8 @@ DX_LEVELS = [
 class SKCCDXQAward(SKCCAwardBase):
     """SKCC DXQ Award - QSO-based DX contacts (each member per country counts)"""
 
+    effective_date = DXQ_EFFECTIVE_DATE
+
     def __init__(self, database, operator_dxcc_entity: int = 291):
         """
         Initialize DXQ award
@@ -115,7 +117,7 @@ class SKCCDXQAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Check for DXCC entity
         dxcc_entity = contact.get('dxcc_entity')
@@ -145,7 +147,7 @@ class SKCCDXQAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both parties to the QSO must be SKCC members at the time of the contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -195,7 +197,7 @@ class SKCCDXQAward(SKCCAwardBase):
         total_qsos = 0
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 dxcc_entity = contact.get('dxcc_entity')
                 skcc_number = contact.get('skcc_number', '').strip()
 
@@ -281,6 +283,8 @@ class SKCCDXQAward(SKCCAwardBase):
 class SKCCDXCAward(SKCCAwardBase):
     """SKCC DXC Award - Country-based DX contacts (each country counts once)"""
 
+    effective_date = DXC_EFFECTIVE_DATE
+
     def __init__(self, database, operator_dxcc_entity: int = 291):
         """
         Initialize DXC award
@@ -338,7 +342,7 @@ class SKCCDXCAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Check for DXCC entity
         dxcc_entity = contact.get('dxcc_entity')
@@ -368,7 +372,7 @@ class SKCCDXCAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both parties to the QSO must be SKCC members at the time of the contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -416,7 +420,7 @@ class SKCCDXCAward(SKCCAwardBase):
         entity_details: Dict[int, Dict] = {}
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 dxcc_entity = contact.get('dxcc_entity')
 
                 if dxcc_entity and dxcc_entity not in entities_worked:
@@ -20,7 +20,7 @@ Rules:
 """
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 from src.skcc_awards.base import SKCCAwardBase
 from src.skcc_awards.centurion import CenturionAward
@@ -33,6 +33,7 @@ from src.skcc_awards.constants import (
     get_endorsement_level,
     get_next_endorsement_threshold
 )
+from src.contact_store import get_contact_store
 from src.skcc_roster import get_roster_manager
 from src.skcc_award_rosters import get_award_roster_manager
 
@@ -42,6 +43,10 @@ logger = logging.getLogger(__name__)
 class TribuneAward(SKCCAwardBase):
     """SKCC Tribune Award - 50+ unique Centurion/Tribune/Senator contacts"""
 
+    effective_date = TRIBUNE_EFFECTIVE_DATE
+    membership_filter = 'callsign_or_number'
+    award_holder_filter = ('centurion', 'tribune', 'senator')
+
     def __init__(self, database):
         """
         Initialize Tribune award
@@ -71,9 +76,13 @@ class TribuneAward(SKCCAwardBase):
             return self.database.config.get('skcc.centurion_date', '')
         return ''
 
+    def get_min_qso_date(self) -> Optional[str]:
+        """Earliest qualifying QSO date, including the user's Centurion date"""
+        return self._latest_date(super().get_min_qso_date(), self.user_centurion_date)
+
     def normalize_callsign_for_export(self, callsign: str) -> str:
         """Remove prefixes/suffixes for Tribune applications."""
-        return self.roster_manager.normalize_callsign(callsign)
+        return self.callsign_resolver.resolve(callsign).base_call
 
     def validate(self, contact: Dict[str, Any]) -> bool:
         """
@@ -118,7 +127,7 @@ class TribuneAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = self.roster_manager.normalize_callsign(callsign)
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # CRITICAL RULE: Club calls and special event calls don't count after Oct 1, 2008
         is_special_event_call = base_call in SPECIAL_EVENT_CALLS
@@ -145,7 +154,7 @@ class TribuneAward(SKCCAwardBase):
                 )
                 return False
         else:
-            if not self.roster_manager.was_member_on_date(base_call, qso_date):
+            if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
                 logger.debug(
                     f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
                 )
@@ -168,11 +177,10 @@ class TribuneAward(SKCCAwardBase):
         is_valid_centurion_or_higher = self.award_rosters.was_centurion_or_higher_on_date(skcc_num, qso_date)
 
         if not is_valid_centurion_or_higher:
-            roster_info = self.award_rosters.get_roster_info()
-            if not roster_info.get('centurion', {}).get('loaded', False):
+            if not self.award_rosters.is_ready(*self.award_holder_filter):
                 logger.debug(
                     f"Contact {callsign} with SKCC#{skcc_num} not valid: "
-                    f"Centurion roster not loaded"
+                    f"award rosters not ready"
                 )
             else:
                 logger.debug(
@@ -196,7 +204,8 @@ class TribuneAward(SKCCAwardBase):
 
         return True
 
-    def calculate_progress(self, contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def calculate_progress(self, contacts: List[Dict[str, Any]],
+                           centurion_progress: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Calculate Tribune award progress
 
@@ -204,6 +213,7 @@ class TribuneAward(SKCCAwardBase):
 
         Args:
             contacts: List of contact records
+            centurion_progress: Precomputed Centurion progress (avoids re-scanning the log)
 
         Returns:
             {
@@ -218,9 +228,10 @@ class TribuneAward(SKCCAwardBase):
             }
         """
         # First, check if user is a Centurion (prerequisite)
-        all_contacts = self.database.get_all_contacts(limit=999999)
-        centurion_award = CenturionAward(self.database)
-        centurion_progress = centurion_award.calculate_progress(all_contacts)
+        if centurion_progress is None:
+            all_contacts = get_contact_store(self.database).all()
+            centurion_award = CenturionAward(self.database)
+            centurion_progress = centurion_award.calculate_progress(all_contacts)
         unique_centurions = centurion_progress.get('unique_members', set())
         centurion_count = centurion_progress.get('current', len(unique_centurions))
         is_centurion = centurion_progress.get('achieved', centurion_count >= 100)
@@ -229,7 +240,7 @@ class TribuneAward(SKCCAwardBase):
         unique_members = set()
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 skcc_number = contact.get('skcc_number', '').strip()
                 if skcc_number:
                     base_number = extract_base_skcc_number(skcc_number)
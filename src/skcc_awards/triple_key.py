@@ -40,6 +40,8 @@ logger = logging.getLogger(__name__)
 class TripleKeyAward(SKCCAwardBase):
     """SKCC Triple Key Award - 100+ unique members with each of 3 key types"""
 
+    effective_date = TRIPLE_KEY_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize Triple Key award
@@ -101,7 +103,7 @@ class TripleKeyAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Verify valid SKCC number
         skcc_num = contact.get('skcc_number', '').strip()
@@ -112,7 +114,7 @@ class TripleKeyAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must have SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -170,7 +172,7 @@ class TripleKeyAward(SKCCAwardBase):
 
         # Sort contacts by date to ensure earliest contact wins
         sorted_contacts = sorted(
-            [c for c in contacts if self.validate(c)],
+            [c for c in contacts if self.is_qualifying(c)],
             key=lambda x: (x.get('qso_date', x.get('date', '')), x.get('time_on', ''))
         )
 
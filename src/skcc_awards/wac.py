@@ -53,6 +53,8 @@ CONTINENT_NAMES = {
 class SKCCWACAward(SKCCAwardBase):
     """SKCC WAC Award - Worked All 6 Continents"""
 
+    effective_date = WAC_EFFECTIVE_DATE
+
     def __init__(self, database):
         """
         Initialize SKCC WAC award
@@ -111,7 +113,7 @@ class SKCCWACAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Must have extractable continent from contact
         continent = self._get_continent_from_contact(contact)
@@ -128,7 +130,7 @@ class SKCCWACAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must hold SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -261,7 +263,7 @@ class SKCCWACAward(SKCCAwardBase):
         qrp_continents: Set[str] = set()
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 continent = self._get_continent_from_contact(contact)
 
                 if continent in CONTINENTS:
@@ -100,7 +100,7 @@ class SKCCWASAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Must have extractable state from contact
         state = self._get_state_from_contact(contact)
@@ -117,7 +117,7 @@ class SKCCWASAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must hold SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -209,7 +209,7 @@ class SKCCWASAward(SKCCAwardBase):
         qrp_states: Set[str] = set()
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 state = self._get_state_from_contact(contact)
 
                 if state in US_STATES:
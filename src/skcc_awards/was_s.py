@@ -53,6 +53,9 @@ CALL_AREA_TO_STATES: Dict[str, List[str]] = {
 class SKCCWASSAward(SKCCAwardBase):
     """SKCC WAS-S Award - Worked All 50 US States (Senator Only)"""
 
+    effective_date = WASS_EFFECTIVE_DATE
+    membership_filter = 'callsign'
+
     def __init__(self, database):
         """
         Initialize SKCC WAS-S award
@@ -116,7 +119,7 @@ class SKCCWASSAward(SKCCAwardBase):
 
         # Get callsign (remove portable/suffix indicators)
         callsign = contact.get('callsign', '').upper().strip()
-        base_call = callsign.split('/')[0] if '/' in callsign else callsign
+        base_call = self.callsign_resolver.resolve(callsign).base_call
 
         # Verify valid SKCC number
         skcc_num = contact.get('skcc_number', '').strip()
@@ -144,7 +147,7 @@ class SKCCWASSAward(SKCCAwardBase):
 
         # CRITICAL RULE: "Both operators must hold SKCC membership at time of contact"
         # Check if contacted station was SKCC member at time of QSO
-        if not self.roster_manager.was_member_on_date(base_call, qso_date):
+        if not self.callsign_resolver.was_member_on_date(callsign, qso_date):
             logger.debug(
                 f"Contact {base_call} not valid: not an SKCC member on {qso_date}"
             )
@@ -236,7 +239,7 @@ class SKCCWASSAward(SKCCAwardBase):
         qrp_states: Set[str] = set()
 
         for contact in contacts:
-            if self.validate(contact):
+            if self.is_qualifying(contact):
                 state = self._get_state_from_contact(contact)
 
                 if state in US_STATES:
@@ -5,18 +5,56 @@ Downloads and parses the SKCC membership roster from:
 https://www.skccgroup.com/membership_data/membership_roster.php
 
 Provides lookup functions for SKCC member information needed for awards tracking.
+
+The roster CSV is indexed once into an SQLite cache (data/skcc_roster.cache.db)
+that lookups query directly, so startup opens the cache instead of parsing
+30k+ rows into dicts. The cache is rebuilt when the CSV or its .meta changes.
+
+sync_roster_members() copies the roster into the logger database, where award
+filters join contacts against it by base callsign, SKCC number and join date.
 """
 
 import re
 import requests
 import csv
+import json
 import os
+import sqlite3
 from datetime import datetime
 from typing import Optional, Dict, List
 import threading
 
 from src.app_paths import app_path, bundled_path
 
+ROSTER_FIELDS = ['skcc_number', 'call', 'name', 'city', 'spc', 'dxcc', 'join_date', 'other_calls']
+
+# Bump when the cache schema or indexing rules change
+ROSTER_CACHE_VERSION = 1
+
+# Portable suffixes a roster call may carry that a worked call omits
+ROSTER_CALL_SUFFIXES = ['/EX', '/P', '/QRP', '/MM']
+
+_ROSTER_CACHE_SCHEMA = f"""
+    CREATE TABLE roster_members (
+        id INTEGER PRIMARY KEY,
+        {', '.join(f'{field} TEXT NOT NULL' for field in ROSTER_FIELDS)}
+    );
+    CREATE TABLE roster_calls (
+        callsign TEXT PRIMARY KEY,
+        member_id INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE roster_numbers (
+        base_number TEXT PRIMARY KEY,
+        member_id INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE roster_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+"""
+
+_MEMBER_COLUMNS = ', '.join(f'm.{field}' for field in ROSTER_FIELDS)
+
 
 class SKCCRosterManager:
     """Manager for SKCC membership roster data"""
@@ -25,9 +63,12 @@ class SKCCRosterManager:
     def __init__(self):
         self.roster_file = app_path("data", "skcc_roster.csv")
         self.bundled_roster_file = bundled_path("data", "skcc_roster.csv")
-        self.roster_data = {}  # Maps callsign -> member info
-        self.roster_by_number = {}  # Maps base SKCC number -> member info
+        self.cache_file = app_path("data", "skcc_roster.cache.db")
+        self._conn = None  # Open roster cache; queries hold _lock
+        self._lock = threading.Lock()
         self.member_count = 0
+        self.source = None  # Signature of the roster files the cache was built from
+        self._reload_listeners = []
         self.load_local_roster()
 
     @staticmethod
@@ -46,6 +87,29 @@ class SKCCRosterManager:
                 return max(parts, key=len)
         return callsign
 
+    def add_reload_listener(self, listener):
+        """
+        Register a callable notified after the roster is (re)loaded.
+
+        The listener is called with no arguments on the loading thread, once
+        the new roster is in place.
+        """
+        if listener not in self._reload_listeners:
+            self._reload_listeners.append(listener)
+
+    def remove_reload_listener(self, listener):
+        """Unregister a previously added reload listener."""
+        if listener in self._reload_listeners:
+            self._reload_listeners.remove(listener)
+
+    def _notify_reload(self):
+        """Notify reload listeners; listener errors never fail the load."""
+        for listener in list(self._reload_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Warning: Roster reload listener failed: {type(e).__name__}: {e}")
+
     @staticmethod
     def normalize_skcc_number(skcc_number: str) -> str:
         """Normalize SKCC number to digits-only base."""
@@ -53,29 +117,34 @@ class SKCCRosterManager:
             return ""
         return re.sub(r'[^0-9]', '', str(skcc_number).strip().upper())
 
-    def _split_other_calls(self, other_calls: str) -> List[str]:
+    @staticmethod
+    def _split_other_calls(other_calls: str) -> List[str]:
         """Split other calls field into individual callsigns."""
         if not other_calls:
             return []
         parts = re.split(r'[,\s]+', other_calls.strip())
         return [part for part in (p.strip().upper() for p in parts) if part]
 
-    def _add_roster_entry(self, callsign: str, member: Dict) -> None:
-        """Add callsign and its normalized form to the roster index."""
-        if not callsign:
-            return
-        callsign = callsign.strip().upper()
-        if callsign:
-            self.roster_data.setdefault(callsign, member)
-        normalized = self.normalize_callsign(callsign)
-        if normalized:
-            self.roster_data.setdefault(normalized, member)
-
-    def _add_number_entry(self, skcc_number: str, member: Dict) -> None:
-        """Add SKCC number and its base form to the roster index."""
-        base_number = self.normalize_skcc_number(skcc_number)
+    def _index_member(self, conn, member_id: int, member: Dict) -> None:
+        """Index a member's calls (as given and normalized) and base number.
+
+        The first member to claim a call or number keeps it.
+        """
+        calls = [member.get('call', '')] + self._split_other_calls(member.get('other_calls', ''))
+        for callsign in calls:
+            callsign = (callsign or '').strip().upper()
+            for key in {callsign, self.normalize_callsign(callsign)}:
+                if key:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO roster_calls (callsign, member_id) VALUES (?, ?)",
+                        (key, member_id)
+                    )
+        base_number = self.normalize_skcc_number(member.get('skcc_number', ''))
         if base_number:
-            self.roster_by_number.setdefault(base_number, member)
+            conn.execute(
+                "INSERT OR IGNORE INTO roster_numbers (base_number, member_id) VALUES (?, ?)",
+                (base_number, member_id)
+            )
 
     def download_roster(self, progress_callback=None) -> bool:
         """
@@ -113,15 +182,11 @@ class SKCCRosterManager:
             # Save to CSV file
             self._save_roster_to_csv(members)
 
-            # Load into memory
-            self.roster_data = {}
-            self.roster_by_number = {}
-            self.member_count = len(members)
-            for member in members:
-                self._add_roster_entry(member.get('call', ''), member)
-                self._add_number_entry(member.get('skcc_number', ''), member)
-                for other_call in self._split_other_calls(member.get('other_calls', '')):
-                    self._add_roster_entry(other_call, member)
+            # Re-index the cache from the new file
+            if not self.load_local_roster():
+                if progress_callback:
+                    progress_callback("Error: Could not index downloaded roster")
+                return False
 
             if progress_callback:
                 progress_callback(f"✅ Successfully downloaded {len(members)} SKCC members")
@@ -266,32 +331,163 @@ class SKCCRosterManager:
             return self.bundled_roster_file
         return None
 
+    def _source_signature(self, roster_file: str) -> str:
+        """Fingerprint of the roster CSV and .meta a cache was built from"""
+        parts = [ROSTER_CACHE_VERSION, os.path.abspath(roster_file)]
+        for path in (roster_file, roster_file + '.meta'):
+            try:
+                stat = os.stat(path)
+                parts += [stat.st_size, stat.st_mtime_ns]
+            except OSError:
+                parts += [None, None]
+        return json.dumps(parts)
+
+    @staticmethod
+    def _connect(path: str):
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _open_cache(self, signature: str):
+        """Open the roster cache if it was built from the current CSV, else None"""
+        if not os.path.exists(self.cache_file):
+            return None
+        conn = None
+        try:
+            conn = self._connect(self.cache_file)
+            meta = dict(conn.execute("SELECT key, value FROM roster_meta").fetchall())
+            if meta.get('source') == signature:
+                return conn
+        except sqlite3.Error:
+            pass
+        if conn is not None:
+            conn.close()
+        return None
+
+    def _build_cache(self, conn, roster_file: str, signature: str) -> None:
+        """Index a roster CSV into an empty cache database"""
+        conn.executescript(_ROSTER_CACHE_SCHEMA)
+        unique_numbers = set()
+        insert = (f"INSERT INTO roster_members ({', '.join(ROSTER_FIELDS)}) "
+                  f"VALUES ({', '.join('?' for _ in ROSTER_FIELDS)})")
+        with open(roster_file, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                member = {field: (row.get(field) or '').strip() for field in ROSTER_FIELDS}
+                member_id = conn.execute(insert, [member[field] for field in ROSTER_FIELDS]).lastrowid
+                if member['skcc_number']:
+                    unique_numbers.add(member['skcc_number'])
+                self._index_member(conn, member_id, member)
+        conn.executemany("INSERT INTO roster_meta (key, value) VALUES (?, ?)", [
+            ('source', signature),
+            ('member_count', str(len(unique_numbers))),
+        ])
+        conn.commit()
+
+    def _rebuild_cache(self, roster_file: str, signature: str):
+        """
+        Build a new cache next to the CSV.
+
+        Returns (conn, temp_file): the open, fully built cache and the file
+        _install_cache() moves into place. Falls back to an in-memory cache
+        (temp_file None) when the data directory is not writable.
+        """
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        conn = None
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            conn = self._connect(temp_file)
+            self._build_cache(conn, roster_file, signature)
+            return conn, temp_file
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: Could not write roster cache, indexing in memory: {e}")
+            if conn is not None:
+                conn.close()
+            self._remove_file(temp_file)
+            conn = self._connect(':memory:')
+            self._build_cache(conn, roster_file, signature)
+            return conn, None
+
+    def _install_cache(self, conn, temp_file: Optional[str], meta: Dict[str, str]):
+        """
+        Swap a built cache in for the current one (caller holds the lock).
+
+        A rebuilt cache file replaces the old one; the open cache has to be
+        closed before it can be replaced on Windows, so readers waiting on
+        the lock go straight from the old roster to the new one.
+        """
+        previous = self._conn
+        if temp_file is not None:
+            conn.close()
+            if previous is not None:
+                previous.close()
+                previous = None
+            try:
+                os.replace(temp_file, self.cache_file)
+                conn = self._connect(self.cache_file)
+            except OSError as e:
+                print(f"Warning: Could not replace roster cache, keeping it in memory: {e}")
+                conn = self._connect(':memory:')
+                built = self._connect(temp_file)
+                built.backup(conn)
+                built.close()
+                self._remove_file(temp_file)
+
+        self._conn = conn
+        self.member_count = int(meta['member_count'])
+        self.source = meta['source']
+        if previous is not None and previous is not conn:
+            previous.close()
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def load_local_roster(self) -> bool:
-        """Load roster from local CSV file"""
+        """Load roster from local CSV file (through the roster cache)"""
         roster_file = self._resolve_roster_file()
         if roster_file is None:
             return False
 
         try:
-            self.roster_data = {}
-            self.roster_by_number = {}
-            unique_numbers = set()
-            with open(roster_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    skcc_number = row.get('skcc_number', '').strip()
-                    if skcc_number:
-                        unique_numbers.add(skcc_number)
-                    self._add_roster_entry(row.get('call', ''), row)
-                    self._add_number_entry(skcc_number, row)
-                    for other_call in self._split_other_calls(row.get('other_calls', '')):
-                        self._add_roster_entry(other_call, row)
-            self.member_count = len(unique_numbers)
+            signature = self._source_signature(roster_file)
+            conn, temp_file = self._open_cache(signature), None
+            if conn is None:
+                conn, temp_file = self._rebuild_cache(roster_file, signature)
+            meta = dict(conn.execute("SELECT key, value FROM roster_meta").fetchall())
+            with self._lock:
+                self._install_cache(conn, temp_file, meta)
+            self._notify_reload()
             return True
         except Exception as e:
             print(f"Error loading roster: {e}")
             return False
 
+    def close(self) -> None:
+        """Close the roster cache"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _member_from_row(row) -> Dict:
+        return {field: row[field] for field in ROSTER_FIELDS}
+
+    def iter_members(self):
+        """Iterate over all roster members (dicts of ROSTER_FIELDS), in roster order"""
+        with self._lock:
+            if self._conn is None:
+                return iter(())
+            rows = self._conn.execute(
+                f"SELECT {_MEMBER_COLUMNS} FROM roster_members m ORDER BY m.id"
+            ).fetchall()
+        return (self._member_from_row(row) for row in rows)
+
     def lookup_callsign(self, callsign: str) -> Optional[Dict]:
         """
         Look up a callsign in the roster.
@@ -306,23 +502,25 @@ class SKCCRosterManager:
             Member info dict or None if not found
         """
         callsign_upper = callsign.upper().strip()
-
-        # First try exact match
-        if callsign_upper in self.roster_data:
-            return self.roster_data[callsign_upper]
-
-        # Extract base callsign if it has a slash
         base_call = self.normalize_callsign(callsign_upper)
 
-        if base_call in self.roster_data:
-            return self.roster_data[base_call]
-
-        # Try base callsign with common portable suffixes
-        # e.g., "W8CBC" matches "W8CBC/EX" in roster
-        for suffix in ['/EX', '/P', '/QRP', '/MM']:
-            roster_entry = self.roster_data.get(base_call + suffix)
-            if roster_entry:
-                return roster_entry
+        # Exact match first, then the base callsign, then the base callsign
+        # with common portable suffixes (e.g., "W8CBC" matches "W8CBC/EX")
+        candidates = [callsign_upper, base_call] + [base_call + suffix for suffix in ROSTER_CALL_SUFFIXES]
+        with self._lock:
+            if self._conn is None:
+                return None
+            rows = self._conn.execute(
+                f"SELECT c.callsign, {_MEMBER_COLUMNS} FROM roster_calls c "
+                f"JOIN roster_members m ON m.id = c.member_id "
+                f"WHERE c.callsign IN ({', '.join('?' for _ in candidates)})",
+                candidates
+            ).fetchall()
+
+        found = {row['callsign']: row for row in rows}
+        for candidate in candidates:
+            if candidate in found:
+                return self._member_from_row(found[candidate])
 
         # No match found
         return None
@@ -374,7 +572,15 @@ class SKCCRosterManager:
         base_number = self.normalize_skcc_number(skcc_number)
         if not base_number:
             return None
-        return self.roster_by_number.get(base_number)
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                f"SELECT {_MEMBER_COLUMNS} FROM roster_numbers n "
+                f"JOIN roster_members m ON m.id = n.member_id WHERE n.base_number = ?",
+                (base_number,)
+            ).fetchone()
+        return self._member_from_row(row) if row else None
 
     def get_join_date_by_number(self, skcc_number: str) -> Optional[str]:
         """Get SKCC join date by SKCC number."""
@@ -424,10 +630,7 @@ class SKCCRosterManager:
 
     def get_member_count(self) -> int:
         """Get total number of members in roster"""
-        if self.member_count:
-            return self.member_count
-        unique_numbers = {member.get('skcc_number') for member in self.roster_data.values()}
-        return len({num for num in unique_numbers if num})
+        return self.member_count
 
     def get_roster_age(self) -> Optional[str]:
         """Get age of local roster file"""
@@ -458,9 +661,51 @@ class SKCCRosterManager:
 
         return "Unknown"
 
+    def get_roster_mtime(self) -> float:
+        """Get modification time of the roster file in use (0 if none)"""
+        roster_file = self._resolve_roster_file()
+        try:
+            return os.path.getmtime(roster_file) if roster_file else 0
+        except OSError:
+            return 0
+
     def has_local_roster(self) -> bool:
         """Check if local roster file exists"""
-        return self._resolve_roster_file() is not None and len(self.roster_data) > 0
+        return self._resolve_roster_file() is not None and self.member_count > 0
+
+
+def sync_roster_members(database, roster_manager: Optional[SKCCRosterManager] = None) -> bool:
+    """
+    Copy the membership roster into the logger database for award queries.
+
+    The database's roster tables are replaced atomically, and only when they
+    hold a different roster version than the roster manager.
+
+    Args:
+        database: Database instance (Database.replace_roster_members)
+        roster_manager: Roster to copy (default: the global roster)
+
+    Returns:
+        True if the database holds the current roster afterwards
+    """
+    roster = roster_manager or get_roster_manager()
+    if not roster.source:
+        return False
+    if database.get_roster_member_source() == roster.source:
+        return True
+
+    members = []
+    for member in roster.iter_members():
+        calls = [member['call']] + roster._split_other_calls(member['other_calls'])
+        base_calls = {roster.normalize_callsign(call) for call in calls} - {''}
+        members.append((member['skcc_number'], member['call'], member['other_calls'],
+                        member['join_date'].replace('-', ''), sorted(base_calls)))
+    try:
+        database.replace_roster_members(members, roster.source)
+        return True
+    except sqlite3.DatabaseError as e:
+        print(f"Warning: Could not store roster in database: {e}")
+        return False
 
 
 # Global instance
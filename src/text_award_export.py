@@ -690,9 +690,10 @@ class TextAwardExporter:
         Returns:
             List of contact dictionaries
         """
-        # Check if database has a method to get all contacts
-        if hasattr(self.database, 'get_all_contacts'):
-            return self.database.get_all_contacts()
+        # Serve the log from the shared in-memory contact store
+        if hasattr(self.database, 'contact_columns'):
+            from src.contact_store import get_contact_store
+            return get_contact_store(self.database).all()
 
         # Otherwise, query directly
         if hasattr(self.database, 'conn'):
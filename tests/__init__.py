@@ -1 +1,33 @@
+import os
+import tempfile
+import unittest
 
+from src.database import Database
+
+
+def make_contact(callsign, date="2026-04-24", time_on="1200", band="20M", mode="CW",
+                 key_type="STRAIGHT", skcc_number="1234", **fields):
+    """Contact dict for Database.add_contact(); extra keyword arguments add fields"""
+    return {
+        "callsign": callsign,
+        "date": date,
+        "time_on": time_on,
+        "band": band,
+        "mode": mode,
+        "key_type": key_type,
+        "skcc_number": skcc_number,
+        **fields,
+    }
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """Test case with an empty Database in a temporary directory"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tempdir.name, "logger.db")
+        self.database = Database(db_path=self.db_path)
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
@@ -1,8 +1,17 @@
+import gzip
+import io
 import os
+import sqlite3
 import tempfile
 import unittest
 
-from src.adif import ADIFParser, export_contacts_to_adif, validate_adif_file
+from src.adif import (
+    ADIFParser,
+    MappedADIFReader,
+    export_contacts_to_adif,
+    iter_adif_fields,
+    validate_adif_file,
+)
 
 
 class ADIFParserTests(unittest.TestCase):
@@ -22,6 +31,48 @@ class ADIFParserTests(unittest.TestCase):
         self.assertEqual(contact["date"], "2026-04-24")
         self.assertEqual(contact["time_on"], "12:00")
 
+    def test_tokenizer_handles_tags_and_data_across_chunk_boundaries(self):
+        text = (
+            "Exported log <ADIF_VER:5>3.1.4 <EOH>\n"
+            "<CALL:6>N0CALL <COMMENT:12>see <EOR> ok <QSO_DATE:8:D>20260424 <eor>\n"
+            "<call:5>K1ABC <APP_SKCCLOGGER_KEYTYPE:2>BG <EOR>\n"
+        )
+        expected = [
+            [("CALL", "N0CALL"), ("COMMENT", "see <EOR> ok"), ("QSO_DATE", "20260424")],
+            [("CALL", "K1ABC"), ("APP_SKCCLOGGER_KEYTYPE", "BG")],
+        ]
+
+        for chunk_size in range(1, len(text) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                records = list(iter_adif_fields(io.StringIO(text), chunk_size=chunk_size))
+                self.assertEqual(records, expected)
+
+    def test_mapped_reader_matches_parser(self):
+        logs = {
+            "plain": (
+                "Header <EOH>\n"
+                "<CALL:6>N0CALL <QSO_DATE:8>20260424 <TIME_ON:4>1200 <EOR>\n"
+                "<CALL:5>K1ABC <NAME:4>José <APP_SKCCLOGGER_KEYTYPE:2>BG <eor>\n"
+                "<CALL:4>W1AW <COMMENT:5>a<b>c <EOR>\n"
+            ),
+            "eor in data": (
+                "<CALL:6>N0CALL <COMMENT:12>see <EOR> ok <EOR>\n"
+                "<CALL:5>K1ABC <EOR>"
+            ),
+        }
+
+        for label, text in logs.items():
+            with self.subTest(log=label), tempfile.TemporaryDirectory() as tempdir:
+                path = os.path.join(tempdir, "log.adi")
+                with open(path, "w", encoding="utf-8") as handle:
+                    handle.write(text)
+
+                expected = ADIFParser().parse_file(path)
+                with MappedADIFReader(path) as reader:
+                    self.assertEqual(len(reader), len(expected))
+                    self.assertEqual(reader[-1]["callsign"], expected[-1]["callsign"])
+                    self.assertEqual([view.to_dict() for view in reader], expected)
+
     def test_validation_accepts_headerless_adif_record(self):
         with tempfile.NamedTemporaryFile("w", suffix=".adi", delete=False) as handle:
             handle.write("<CALL:6>N0CALL <QSO_DATE:8>20260424 <TIME_ON:4>1200 <EOR>")
@@ -63,6 +114,26 @@ class ADIFGeneratorTests(unittest.TestCase):
         self.assertIn("<DXCC:3>291", content)
         self.assertIn("<DXCC_ENTITY:3>291", content)
 
+    def test_exports_plain_cursor_to_gzip(self):
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE TABLE contacts (callsign TEXT, date TEXT, time_on TEXT, comment TEXT)")
+        conn.executemany("INSERT INTO contacts VALUES (?, ?, ?, ?)", [
+            ("n0call", "2026-04-24", "12:00", "SKCC:123-Ron-MD great sig"),
+            ("K1ABC", "2026-04-25", "13:30", ""),
+        ])
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "log.adi.gz")
+            written = export_contacts_to_adif(conn.execute("SELECT * FROM contacts"), path)
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                content = handle.read()
+        conn.close()
+
+        self.assertEqual(written, 2)
+        self.assertIn("<CALL:6>N0CALL <QSO_DATE:8>20260424 <TIME_ON:6>120000 "
+                      "<COMMENT:9>great sig <EOR>", content)
+        self.assertIn("<CALL:5>K1ABC", content)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+
+from src.adif import ADIFParser
+from src.adif_backup import backup_adif, journal_path_for, merge_journal
+from src.database import Database
+
+
+class IncrementalADIFBackupTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"))
+        self.backup_dir = os.path.join(self.tempdir.name, "logs")
+        self.ids = [self.add(f"K{i}ABC", f"{i:02d}:00") for i in range(5)]
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
+
+    def add(self, callsign, time_on):
+        return self.database.add_contact({
+            "callsign": callsign, "date": "2026-05-01", "time_on": time_on,
+            "band": "20M", "mode": "CW",
+        })
+
+    def test_journals_changes_since_snapshot_and_restores_them(self):
+        first = backup_adif(self.database, self.backup_dir)
+        self.assertEqual(first["mode"], "full")
+        self.assertEqual(first["written"], 5)
+        self.assertTrue(os.path.exists(first["path"][:-4] + ".db"))
+
+        self.assertEqual(backup_adif(self.database, self.backup_dir)["mode"], "unchanged")
+
+        self.add("W1AW", "12:00")
+        self.database.update_contact(self.ids[0], {"band": "40M"})
+        journal = backup_adif(self.database, self.backup_dir)
+        self.assertEqual(journal["mode"], "journal")
+        self.assertEqual(journal["written"], 2)
+        self.assertEqual(journal["path"], journal_path_for(first["path"]))
+
+        self.add("W2AW", "13:00")
+        self.assertEqual(backup_adif(self.database, self.backup_dir)["written"], 1)
+
+        restored = merge_journal(ADIFParser().parse_file(first["path"]),
+                                 ADIFParser().parse_file(journal["path"]))
+        self.assertEqual(len(restored), 7)
+        bands = {contact["callsign"]: contact["band"] for contact in restored}
+        self.assertEqual(bands["K0ABC"], "40M")
+        self.assertIn("W2AW", bands)
+
+    def test_restore_matches_journal_records_by_contact_id(self):
+        snapshot = backup_adif(self.database, self.backup_dir)
+        self.database.update_contact(self.ids[0], {"callsign": "K0ABD"})
+        # Same callsign, date and time as a snapshot record, but a new QSO
+        self.add("K1ABC", "01:00")
+        journal = backup_adif(self.database, self.backup_dir)
+
+        restored = merge_journal(ADIFParser().parse_file(snapshot["path"]),
+                                 ADIFParser().parse_file(journal["path"]))
+        callsigns = sorted(contact["callsign"] for contact in restored)
+        self.assertEqual(callsigns, ["K0ABD", "K1ABC", "K1ABC", "K2ABC", "K3ABC", "K4ABC"])
+        self.assertEqual(sorted(int(contact["id"]) for contact in restored),
+                         sorted(self.ids + [self.ids[-1] + 1]))
+
+    def test_deletions_and_full_journal_write_a_new_snapshot(self):
+        backup_adif(self.database, self.backup_dir)
+        self.database.delete_contact(self.ids[1])
+        result = backup_adif(self.database, self.backup_dir)
+        self.assertEqual(result["mode"], "full")
+        self.assertEqual(result["written"], 4)
+
+        self.add("W1AW", "12:00")
+        self.add("W2AW", "13:00")
+        result = backup_adif(self.database, self.backup_dir, journal_max_records=1)
+        self.assertEqual(result["mode"], "full")
+        self.assertEqual(result["written"], 6)
+
+    def test_award_snapshots_keep_changes_the_backup_still_needs(self):
+        backup_adif(self.database, self.backup_dir)
+        self.add("W1AW", "12:00")
+        revision = self.database.get_log_revision()
+        self.database.save_award_snapshots({}, "rules", "log", revision)
+
+        result = backup_adif(self.database, self.backup_dir)
+        self.assertEqual(result["mode"], "journal")
+        self.assertEqual(result["written"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import unittest
+from unittest import mock
+
+from src.adif import ADIFParser
+from src.award_export import AwardExporter
+from src.skcc_awards.award_state import AwardStateStore
+from src.skcc_awards.base import SKCCAwardBase
+from tests import DatabaseTestCase, make_contact
+
+
+class MechanicalKeyAward(SKCCAwardBase):
+    """Minimal award: every contact meeting the common rules qualifies"""
+
+    def __init__(self, database, name="Mechanical", deduplicate=True):
+        super().__init__(name=name, program_id=f"TEST_{name.upper()}", database=database)
+        self.deduplicate = deduplicate
+
+    def validate(self, contact):
+        return self.validate_common_rules(contact)
+
+    def should_deduplicate_for_export(self):
+        return self.deduplicate
+
+    def calculate_progress(self, contacts):
+        return {}
+
+    def get_requirements(self):
+        return {}
+
+    def get_endorsements(self):
+        return []
+
+
+class AwardExporterTests(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.database.add_contacts_batch([
+            make_contact("K1ABC", time_on="1400", key_type="BUG", skcc_number="1234T"),
+            make_contact("K1ABC", time_on="1200", key_type="BUG", skcc_number="1234"),
+            make_contact("W1XYZ", time_on="1300", key_type="BUG", skcc_number="5678C"),
+            make_contact("N0SSB", time_on="1100", mode="SSB", key_type="BUG", skcc_number="9999"),
+        ], skip_duplicates=False)
+        self.exporter = AwardExporter(self.database)
+        self.output = os.path.join(self.tempdir.name, "exports")
+
+    def read_export(self, path):
+        return [(c["callsign"], c["time_on"], c["comment"]) for c in ADIFParser(path).parse_file(path)]
+
+    def test_exports_share_the_contact_store_and_deduplicated_view(self):
+        awards = [MechanicalKeyAward(self.database, "First"),
+                  MechanicalKeyAward(self.database, "Second"),
+                  MechanicalKeyAward(self.database, "Every QSO", deduplicate=False)]
+
+        with mock.patch.object(self.database, "iter_contacts",
+                               wraps=self.database.iter_contacts) as iter_contacts, \
+                mock.patch.object(MechanicalKeyAward, "prepare_export_contacts",
+                                  autospec=True,
+                                  side_effect=SKCCAwardBase.prepare_export_contacts) as prepare:
+            results = self.exporter.export_multiple_awards(awards, self.output, callsign="W4GNS")
+
+        # The log is served from the contact store, not re-read per export
+        self.assertEqual(iter_contacts.call_count, 0)
+        # First and Second share one view; Every QSO keeps duplicates
+        self.assertEqual(prepare.call_count, 2)
+
+        self.assertEqual(self.read_export(results["First"]), [
+            ("K1ABC", "12:00", "[First Award] SKCC:1234"),
+            ("W1XYZ", "13:00", "[First Award] SKCC:5678C"),
+        ])
+        self.assertEqual(self.read_export(results["Second"]), [
+            ("K1ABC", "12:00", "[Second Award] SKCC:1234"),
+            ("W1XYZ", "13:00", "[Second Award] SKCC:5678C"),
+        ])
+        self.assertEqual([c[:2] for c in self.read_export(results["Every QSO"])],
+                         [("K1ABC", "12:00"), ("W1XYZ", "13:00"), ("K1ABC", "14:00")])
+
+    def test_tracked_awards_reuse_award_state_qualifying_contacts(self):
+        award_state = AwardStateStore(self.database, award_classes={"mechanical": MechanicalKeyAward},
+                                      persist=False)
+        award = MechanicalKeyAward(self.database)
+
+        with mock.patch("src.skcc_awards.award_state._award_state_store", award_state), \
+                mock.patch.object(award, "validate", side_effect=AssertionError("log re-validated")):
+            results = self.exporter.export_multiple_awards([award], self.output)
+
+        self.assertEqual([c[:2] for c in self.read_export(results["Mechanical"])],
+                         [("K1ABC", "12:00"), ("W1XYZ", "13:00")])
+
+    def test_award_without_qualifying_contacts_is_skipped(self):
+        class NoContactsAward(MechanicalKeyAward):
+            def validate(self, contact):
+                return False
+
+        results = self.exporter.export_multiple_awards(
+            [NoContactsAward(self.database, "Empty"), MechanicalKeyAward(self.database)],
+            self.output,
+        )
+
+        self.assertIsNone(results["Empty"])
+        self.assertTrue(os.path.exists(results["Mechanical"]))
+
+    def test_single_export_reads_the_whole_log(self):
+        self.database.add_contacts_batch(
+            [make_contact(f"K{i}AB", time_on=f"{i // 60:02d}{i % 60:02d}", key_type="BUG",
+                          skcc_number=str(2000 + i)) for i in range(150)],
+            skip_duplicates=False,
+        )
+
+        path = self.exporter.export_award_application(MechanicalKeyAward(self.database), self.output)
+
+        self.assertEqual(len(ADIFParser(path).parse_file(path)), 152)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import os
+import unittest
+from unittest import mock
+
+from src.database import Database
+from src.skcc_awards.award_state import AwardStateStore, get_award_state_store
+from src.skcc_roster import get_roster_manager
+from src.skcc_awards.base import SKCCAwardBase
+from tests import DatabaseTestCase, make_contact
+
+
+class CountingCWAward(SKCCAwardBase):
+    """Minimal award: every CW contact qualifies, progress counts callsigns"""
+
+    validate_calls = 0
+
+    def __init__(self, database):
+        super().__init__(name="Counting CW", program_id="TEST", database=database)
+
+    def validate(self, contact):
+        CountingCWAward.validate_calls += 1
+        return (contact.get('mode') or '').upper() == 'CW'
+
+    def calculate_progress(self, contacts):
+        calls = {c['callsign'] for c in contacts if self.is_qualifying(c)}
+        return {'current': len(calls), 'required': 2, 'achieved': len(calls) >= 2}
+
+    def get_requirements(self):
+        return {}
+
+    def get_endorsements(self):
+        return []
+
+
+class AwardStateStoreTests(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.store = AwardStateStore(self.database, award_classes={'counting': CountingCWAward})
+
+    def tearDown(self):
+        self.store.close()
+        super().tearDown()
+
+    def test_deltas_only_validate_changed_contacts(self):
+        self.database.add_contact(make_contact("N0CALL"))
+        self.assertEqual(self.store.get_progress('counting')['current'], 1)
+
+        CountingCWAward.validate_calls = 0
+        contact_id = self.database.add_contact(make_contact("K1ABC", time_on="1230"))
+        self.database.add_contact(make_contact("W1SSB", mode="SSB", time_on="1300"))
+        progress = self.store.get_progress('counting')
+
+        self.assertEqual(CountingCWAward.validate_calls, 2)
+        self.assertEqual(progress['current'], 2)
+        self.assertTrue(progress['achieved'])
+
+        self.database.update_contact(contact_id, {"mode": "SSB"})
+        self.assertEqual(self.store.get_progress('counting')['current'], 1)
+
+        self.database.update_contact(contact_id, {"mode": "CW"})
+        self.database.delete_contact(contact_id)
+        self.assertEqual(self.store.get_progress('counting')['current'], 1)
+        self.assertEqual(
+            [c['callsign'] for c in self.store.get_qualifying_contacts('counting')],
+            ["N0CALL"],
+        )
+
+    def test_batch_import_triggers_rebuild(self):
+        self.store.get_progress('counting')
+        self.database.add_contacts_batch(
+            [make_contact("N0CALL"), make_contact("K1ABC", time_on="1400")],
+            skip_duplicates=False,
+        )
+        self.assertEqual(self.store.get_progress('counting')['current'], 2)
+
+    def test_rebuild_only_validates_sql_candidates(self):
+        self.database.add_contact(make_contact("N0CALL"))
+        self.database.add_contact(make_contact("W1SSB", mode="SSB", time_on="1300"))
+        self.database.add_contact(make_contact("K1KEY", time_on="1400", key_type="KEYER"))
+
+        CountingCWAward.validate_calls = 0
+        store = AwardStateStore(self.database, award_classes={'counting': CountingCWAward},
+                                persist=False)
+        self.assertEqual(store.get_progress('counting')['current'], 1)
+        self.assertEqual(CountingCWAward.validate_calls, 1)
+
+    def test_snapshot_restores_without_revalidating_log(self):
+        self.database.add_contact(make_contact("N0CALL"))
+        self.database.add_contact(make_contact("K1ABC", time_on="1230"))
+        self.store.get_all_progress()
+
+        CountingCWAward.validate_calls = 0
+        restored = AwardStateStore(self.database, award_classes={'counting': CountingCWAward})
+        self.assertEqual(restored.get_progress('counting')['current'], 2)
+        self.assertEqual(CountingCWAward.validate_calls, 0)
+
+    def test_snapshot_catches_up_on_changes_logged_after_save(self):
+        first_id = self.database.add_contact(make_contact("N0CALL"))
+        self.store.get_all_progress()
+        self.database.remove_change_listener(self.store._on_contact_change)
+
+        self.database.add_contact(make_contact("K1ABC", time_on="1230"))
+        self.database.delete_contact(first_id)
+
+        CountingCWAward.validate_calls = 0
+        restored = AwardStateStore(self.database, award_classes={'counting': CountingCWAward})
+        self.assertEqual(
+            [c['callsign'] for c in restored.get_qualifying_contacts('counting')],
+            ["K1ABC"],
+        )
+        self.assertEqual(CountingCWAward.validate_calls, 1)
+
+
+    def test_replaced_singleton_unregisters_its_listeners(self):
+        other = Database(db_path=os.path.join(self.tempdir.name, "other.db"))
+        try:
+            with mock.patch("src.skcc_awards.award_state._award_state_store", None):
+                old_store = get_award_state_store(self.database)
+                new_store = get_award_state_store(other)
+                reload_listeners = list(get_roster_manager()._reload_listeners)
+                new_store.close()
+        finally:
+            other.close()
+
+        self.assertNotIn(old_store._on_contact_change, self.database._change_listeners)
+        self.assertNotIn(old_store._on_roster_reload, reload_listeners)
+        self.assertIn(new_store._on_roster_reload, reload_listeners)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.callsign_resolver import CallsignResolver, callsign_prefix
+from src.skcc_roster import SKCCRosterManager
+
+ROSTER_HEADER = "skcc_number,call,name,city,spc,dxcc,join_date,other_calls\n"
+
+
+class CallsignResolverTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.roster_path = os.path.join(self.tempdir.name, "skcc_roster.csv")
+        self.write_roster("1234T,W1ABC,Ann,Boston,MA,291,20100105,\n")
+        data_path = lambda *parts: os.path.join(self.tempdir.name, parts[-1])
+        with mock.patch("src.skcc_roster.app_path", side_effect=data_path), \
+                mock.patch("src.skcc_roster.bundled_path", side_effect=data_path):
+            self.roster = SKCCRosterManager()
+        self.resolver = CallsignResolver(self.roster, maxsize=4)
+
+    def tearDown(self):
+        self.roster.close()
+        self.tempdir.cleanup()
+
+    def write_roster(self, rows):
+        with open(self.roster_path, "w", encoding="utf-8") as f:
+            f.write(ROSTER_HEADER + rows)
+
+    def test_resolves_base_call_prefix_dxcc_and_member_at_once(self):
+        resolved = self.resolver.resolve(" vp2e/w1abc ")
+
+        self.assertEqual((resolved.callsign, resolved.base_call, resolved.prefix),
+                         ("VP2E/W1ABC", "W1ABC", "W1"))
+        self.assertEqual((resolved.entity, resolved.country, resolved.continent), (12, "Anguilla", "NA"))
+        self.assertEqual((resolved.cq_zone, resolved.itu_zone), (8, 11))
+        self.assertEqual(resolved.member["skcc_number"], "1234T")
+
+    def test_unknown_and_empty_callsigns(self):
+        for callsign in (None, "", "QQ1XYZ"):
+            with self.subTest(callsign=callsign):
+                resolved = self.resolver.resolve(callsign)
+                self.assertIsNone(resolved.member)
+                self.assertIsNone(resolved.entity)
+
+    def test_repeated_lookups_hit_the_cache(self):
+        first = self.resolver.resolve("W1ABC")
+        self.assertIs(self.resolver.resolve("w1abc"), first)
+
+        info = self.resolver.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_cache_is_bounded(self):
+        for callsign in ("K1A", "K2A", "K3A", "K4A", "K5A", "K6A"):
+            self.resolver.resolve(callsign)
+
+        self.assertEqual(self.resolver.cache_info().currsize, 4)
+
+    def test_roster_reload_invalidates_cache(self):
+        self.assertTrue(self.resolver.was_member_on_date("W1ABC/P", "2010-01-05"))
+        self.assertFalse(self.resolver.was_member_on_date("W1ABC", "20100104"))
+        self.assertIsNone(self.resolver.resolve("K2XYZ").member)
+
+        self.write_roster("1234T,W1ABC,Ann,Boston,MA,291,20100105,\n"
+                          "5678,K2XYZ,Bob,Albany,NY,291,20200301,\n")
+        self.roster.load_local_roster()
+
+        self.assertEqual(self.resolver.cache_info().currsize, 0)
+        self.assertEqual(self.resolver.resolve("K2XYZ").member["skcc_number"], "5678")
+        self.assertTrue(self.resolver.was_member_on_date("K2XYZ", "20200301"))
+
+    def test_prefix_is_up_to_last_leading_digit(self):
+        for base_call, prefix in (("W4GNS", "W4"), ("VE3XYZ", "VE3"), ("2E0ABC", "2E0"),
+                                  ("AA1A", "AA1"), ("3DA0XYZ", "3DA0"), ("ABC", "")):
+            with self.subTest(base_call=base_call):
+                self.assertEqual(callsign_prefix(base_call), prefix)
+
+
+if __name__ == "__main__":
+    unittest.main()
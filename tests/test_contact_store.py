@@ -0,0 +1,98 @@
+import os
+import unittest
+from unittest import mock
+
+from src.contact_store import ContactStore, get_contact_store
+from src.database import Database
+from tests import DatabaseTestCase, make_contact
+
+
+class ContactStoreTests(DatabaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.store = ContactStore(self.database)
+
+    def tearDown(self):
+        self.store.close()
+        super().tearDown()
+
+    def test_records_read_like_contact_dicts_and_intern_categories(self):
+        self.database.add_contact(make_contact("N0CALL", skcc_number="1234T"))
+        self.database.add_contact(make_contact("K1ABC", time_on="1300"))
+
+        first, second = self.store.all()
+        self.assertEqual(first["callsign"], "K1ABC")
+        self.assertEqual(second.get("skcc_number"), "1234T")
+        self.assertEqual(second.get("name"), "")
+        self.assertIsNone(second.get("not_a_field"))
+        self.assertEqual(dict(second)["callsign"], "N0CALL")
+        self.assertIs(first.band, second.band)
+        with self.assertRaises(AttributeError):
+            first.callsign = "W1AW"
+
+    def test_records_match_database_rows(self):
+        contact_id = self.database.add_contact(make_contact("N0CALL"))
+
+        record = self.store.get(contact_id)
+        row = self.database.get_contact(contact_id)
+        self.assertEqual(dict(record), {field: row[field] for field in record.keys()})
+        self.assertIsNone(record["power_watts"])
+        self.assertEqual(record["name"], "")
+
+    def test_record_fields_follow_the_contacts_schema(self):
+        self.database.conn.execute("ALTER TABLE contacts ADD COLUMN qsl_via TEXT")
+        self.database.close()
+        self.database = Database(db_path=self.db_path)
+        self.database.add_contact(make_contact("N0CALL", qsl_via="W1AW"))
+
+        record = ContactStore(self.database).all()[0]
+        self.assertEqual(record["qsl_via"], "W1AW")
+        self.assertEqual(set(record.keys()), set(self.database.contact_columns.stored_columns))
+
+    def test_stays_coherent_through_write_hooks(self):
+        contact_id = self.database.add_contact(make_contact("N0CALL"))
+        self.assertEqual(len(self.store), 1)
+
+        other_id = self.database.add_contact(make_contact("K1ABC", mode="SSB"))
+        self.database.update_contact(contact_id, {"mode": "SSB"})
+        self.assertEqual(len(self.store.filter(mode="ssb")), 2)
+
+        self.database.delete_contact(other_id)
+        self.assertEqual([c.id for c in self.store.all()], [contact_id])
+
+        self.database.add_contacts_batch([make_contact("W1AW", time_on="1400")],
+                                         skip_duplicates=False)
+        self.assertEqual(len(self.store), 2)
+
+    def test_filter_combines_indexes(self):
+        self.database.add_contact(make_contact("K1AAA", date="2025-12-31", skcc_number="100C"))
+        self.database.add_contact(make_contact("K1BBB", date="2026-01-01", skcc_number="100"))
+        self.database.add_contact(make_contact("K1CCC", date="2026-01-02", key_type="KEYER",
+                                               skcc_number="100"))
+        self.database.add_contact(make_contact("K1DDD", date="2026-01-03", mode="SSB",
+                                               skcc_number="200"))
+
+        matches = self.store.filter(mode="CW", key_types=["STRAIGHT", "BUG"],
+                                    start_date="20260101", end_date="2026-01-31",
+                                    skcc_base_number=100)
+        self.assertEqual([c.callsign for c in matches], ["K1BBB"])
+        self.assertEqual(
+            [c.callsign for c in self.store.filter(skcc_base_number=100)],
+            ["K1CCC", "K1BBB", "K1AAA"],
+        )
+
+
+    def test_replaced_singleton_stops_following_its_database(self):
+        other = Database(db_path=os.path.join(self.tempdir.name, "other.db"))
+        try:
+            with mock.patch("src.contact_store._contact_store", None):
+                old_store = get_contact_store(self.database)
+                new_store = get_contact_store(other)
+        finally:
+            other.close()
+
+        self.assertNotIn(old_store._on_contact_change, self.database._change_listeners)
+        self.assertIsNot(old_store, new_store)
+
+if __name__ == "__main__":
+    unittest.main()
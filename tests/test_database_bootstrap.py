@@ -3,7 +3,7 @@ import sqlite3
 import tempfile
 import unittest
 
-from src.database import Database
+from src.database import QSO_DATE_SCHEMA_VERSION, Database
 
 
 def create_backup_database(path, callsign="W4GNS"):
@@ -110,6 +110,190 @@ class DatabaseBootstrapTests(unittest.TestCase):
             self.assertEqual(result["duplicates"], 1)
             self.assertEqual(count, 1)
 
+    def test_batch_import_matches_duplicates_across_formats_and_within_the_import(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, "logger.db"))
+            try:
+                database.add_contact({"callsign": "N0CALL", "date": "2026-04-24", "time_on": "12:00"})
+
+                result = database.add_contacts_batch(
+                    [
+                        # Lowercase call and YYYYMMDD date match the logged contact
+                        {"callsign": "n0call", "date": "20260424", "time_on": "12:05"},
+                        # Second contact falls in the window of the first one imported
+                        {"callsign": "K1ABC", "date": "2026-04-24", "time_on": "12:00"},
+                        {"callsign": "K1ABC", "date": "2026-04-24", "time_on": "12:08"},
+                        # Same call on another day is not a duplicate
+                        {"callsign": "N0CALL", "date": "2026-04-25", "time_on": "12:00"},
+                    ],
+                    skip_duplicates=True,
+                    window_minutes=10,
+                )
+
+                count = database.conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+            finally:
+                database.close()
+
+            self.assertEqual(result["imported"], 2)
+            self.assertEqual(result["duplicates"], 2)
+            self.assertEqual(count, 3)
+
+    def test_normalized_columns_match_python_normalization(self):
+        from src.skcc_roster import SKCCRosterManager
+        from src.utils.skcc_number import extract_base_skcc_number
+
+        samples = [
+            ("k1abc", "12345Tx2", "2026-04-24", " cw ", "straight"),
+            ("VE3/K1ABC", "678 C", "2026-04-25", "CW", "Bug"),
+            ("K1ABC/QRP", "", "2026-04-26", "SSB", ""),
+            ("VE3/K1ABC/P", "S123", "2026-04-27", "CW", "SIDESWIPER"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, "logger.db"))
+            try:
+                for callsign, skcc_number, date, mode, key_type in samples:
+                    database.add_contact({
+                        "callsign": callsign,
+                        "skcc_number": skcc_number,
+                        "date": date,
+                        "time_on": "12:00",
+                        "mode": mode,
+                        "key_type": key_type,
+                    })
+
+                col = database.normalized_column
+                rows = database.conn.execute(
+                    f"SELECT callsign, skcc_number, date, mode, key_type, "
+                    f"{col('base_callsign')}, {col('skcc_base_number')}, "
+                    f"{col('date_yyyymmdd')}, {col('mode_norm')}, {col('key_type_norm')} "
+                    f"FROM contacts ORDER BY id"
+                ).fetchall()
+            finally:
+                database.close()
+
+        for row in rows:
+            callsign, skcc_number, date, mode, key_type = tuple(row)[:5]
+            base_number = extract_base_skcc_number(skcc_number)
+            self.assertEqual(row[5], SKCCRosterManager.normalize_callsign(callsign))
+            self.assertEqual(row[6], int(base_number) if base_number else None)
+            self.assertEqual(row[7], date.replace("-", ""))
+            self.assertEqual(row[8], mode.strip().upper())
+            self.assertEqual(row[9], key_type.strip().upper())
+
+    def test_date_range_uses_canonical_dates_and_mixed_time_formats(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, "logger.db"))
+            try:
+                for callsign, date, time_on in [
+                    ("K1AAA", "20260424", "2359"),
+                    ("K1BBB", "2026-04-25", "00:30"),
+                    ("K1CCC", "2026-04-25", "1200"),
+                    ("K1DDD", "2026-04-26", "0001"),
+                ]:
+                    database.add_contact({"callsign": callsign, "date": date, "time_on": time_on})
+
+                contacts = database.get_contacts_by_date_range(
+                    "2026-04-24", "2026-04-25", "23:00", "12:00"
+                )
+                plan = " ".join(
+                    row["detail"] for row in database.conn.execute(
+                        "EXPLAIN QUERY PLAN SELECT * FROM contacts "
+                        f"WHERE {database.normalized_column('qso_ts')} BETWEEN 1 AND 2"
+                    )
+                )
+            finally:
+                database.close()
+
+        self.assertEqual([c["callsign"] for c in contacts], ["K1AAA", "K1BBB", "K1CCC"])
+        self.assertEqual(contacts[0]["date"], "2026-04-24")
+        if database.has_normalized_columns:
+            self.assertIn("idx_contacts_qso_ts", plan)
+
+    def test_qso_date_migration_runs_once(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            db_path = os.path.join(tempdir, "logger.db")
+            database = Database(db_path=db_path)
+            database.conn.execute(
+                "INSERT INTO contacts (callsign, date, time_on) VALUES ('K1AAA', '20260424', '1200')"
+            )
+            database.conn.commit()
+            database.close()
+
+            # Migrated databases are left alone on startup
+            database = Database(db_path=db_path)
+            migrated_date = database.conn.execute("SELECT date FROM contacts").fetchone()[0]
+            database.conn.execute("PRAGMA user_version = 0")
+            database.conn.commit()
+            database.close()
+
+            database = Database(db_path=db_path)
+            try:
+                date = database.conn.execute("SELECT date FROM contacts").fetchone()[0]
+                version = database.conn.execute("PRAGMA user_version").fetchone()[0]
+                duplicate = database.check_duplicate_within_time_window("k1aaa", "20260424", "1205")
+            finally:
+                database.close()
+
+        self.assertEqual(migrated_date, "20260424")
+        self.assertEqual(date, "2026-04-24")
+        self.assertEqual(version, QSO_DATE_SCHEMA_VERSION)
+        self.assertEqual(duplicate["callsign"], "K1AAA")
+
+    def test_iter_contacts_streams_projected_rows_in_batches(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, "logger.db"))
+            try:
+                for index in range(5):
+                    database.add_contact({
+                        "callsign": f"K{index}AAA", "date": "2026-04-24",
+                        "time_on": f"12{index:02d}", "mode": "CW" if index % 2 else "SSB",
+                    })
+
+                rows = list(database.iter_contacts(
+                    columns=("callsign", "name"), where="mode = ?", params=("CW",), batch_size=1
+                ))
+                streamed = database.iter_contacts(batch_size=2)
+                first = next(streamed)
+                streamed.close()
+            finally:
+                database.close()
+
+        self.assertEqual(rows, [
+            {"callsign": "K3AAA", "name": ""},
+            {"callsign": "K1AAA", "name": ""},
+        ])
+        self.assertEqual(first["callsign"], "K4AAA")
+
+    def test_single_and_batch_inserts_share_column_layout(self):
+        contact = {
+            "callsign": "N0CALL", "date": "20260424", "time_on": "1200", "mode": "CW",
+            "first_name": "Ann", "email": "ann@example.com", "power_watts": 5,
+        }
+        with tempfile.TemporaryDirectory() as tempdir:
+            database = Database(db_path=os.path.join(tempdir, "logger.db"))
+            try:
+                single_id = database.add_contact(contact)
+                database.add_contacts_batch([contact], skip_duplicates=False)
+                single, batch = (
+                    {k: v for k, v in c.items() if k not in ("id", "created_at")}
+                    for c in sorted(database.get_all_contacts(), key=lambda c: c["id"])
+                )
+
+                database.update_contact(single_id, {"name": "Ann", "bogus": "x", "qso_ts": 1})
+                database.update_contact(single_id, {"name": "Bea"})
+                updated = database.get_contact(single_id)
+                cached_updates = len(database.contact_columns._update_sql)
+            finally:
+                database.close()
+
+        self.assertEqual(single, batch)
+        self.assertEqual(single["date"], "2026-04-24")
+        self.assertEqual(single["email"], "ann@example.com")
+        self.assertEqual(single["qth"], "")
+        self.assertEqual(updated["name"], "Bea")
+        self.assertEqual(cached_updates, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
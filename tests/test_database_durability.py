@@ -0,0 +1,195 @@
+import os
+import signal
+import subprocess
+import sys
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from src.database import DURABILITY_PROFILES, Database
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Child process: log QSOs (interleaved with DX spots) and report each id once
+# add_contact has returned; the parent kills it mid-stream.
+WRITER_SCRIPT = """
+import sys
+from src.database import Database
+
+database = Database(db_path=sys.argv[1], durability=sys.argv[2])
+for i in range(100000):
+    database.add_dx_spot({'callsign': f'DX{i}', 'frequency': '14025'})
+    contact_id = database.add_contact({
+        'callsign': f'K{i}TEST', 'date': '2026-04-24', 'time_on': '1200', 'mode': 'CW',
+    })
+    print('QSO', contact_id, flush=True)
+"""
+
+
+def run_writer_and_kill(db_path, durability, committed_before_kill=50):
+    """Run the writer, SIGKILL it after enough commits, return the reported ids."""
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    proc = subprocess.Popen(
+        [sys.executable, "-c", WRITER_SCRIPT, db_path, durability],
+        stdout=subprocess.PIPE, text=True, cwd=REPO_ROOT, env=env,
+    )
+    reported = []
+    try:
+        for line in proc.stdout:
+            if not line.startswith('QSO '):
+                continue  # schema upgrade messages
+            reported.append(int(line.split()[1]))
+            if len(reported) >= committed_before_kill:
+                proc.send_signal(signal.SIGKILL)
+                break
+    finally:
+        proc.kill()
+        proc.wait()
+        proc.stdout.close()
+    return reported
+
+
+@unittest.skipUnless(hasattr(signal, "SIGKILL"), "requires SIGKILL")
+class CrashInjectionTests(unittest.TestCase):
+    def test_no_committed_qso_lost_when_process_is_killed(self):
+        for durability in DURABILITY_PROFILES:
+            with self.subTest(durability=durability), tempfile.TemporaryDirectory() as tempdir:
+                db_path = os.path.join(tempdir, "logger.db")
+                reported = run_writer_and_kill(db_path, durability)
+                self.assertGreaterEqual(len(reported), 50)
+
+                database = Database(db_path=db_path, durability=durability)
+                try:
+                    stored = {c['id'] for c in database.get_contacts_by_ids(reported)}
+                    self.assertEqual(stored, set(reported))
+                    cursor = database.conn.execute("PRAGMA quick_check")
+                    self.assertEqual(cursor.fetchone()[0], "ok")
+                finally:
+                    database.close()
+
+
+class DurabilityProfileTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tempdir.name, "logger.db")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_profiles_set_journal_and_sync_modes(self):
+        for durability, profile in DURABILITY_PROFILES.items():
+            with self.subTest(durability=durability):
+                database = Database(db_path=self.db_path, durability=durability)
+                try:
+                    journal = database.conn.execute("PRAGMA journal_mode").fetchone()[0]
+                    self.assertEqual(journal.upper(), profile['journal_mode'])
+                finally:
+                    database.close()
+                self.assertFalse(os.path.exists(self.db_path + "-wal"))
+
+    def test_unknown_profile_falls_back_to_safe(self):
+        database = Database(db_path=self.db_path, durability="reckless")
+        try:
+            self.assertEqual(database.durability, "safe")
+        finally:
+            database.close()
+
+    def test_backup_of_wal_database_is_adopted(self):
+        database = Database(db_path=self.db_path, durability="balanced")
+        try:
+            database.add_contact({'callsign': 'N0CALL', 'date': '2026-04-24', 'time_on': '1200'})
+            restore_dir = os.path.join(self.tempdir.name, "restore")
+            os.makedirs(restore_dir)
+            database.backup_to(os.path.join(restore_dir, "w4gns_log_20260424_120000.db"))
+        finally:
+            database.close()
+
+        restored = Database(db_path=os.path.join(restore_dir, "logger.db"), durability="balanced")
+        try:
+            self.assertEqual([c['callsign'] for c in restored.get_all_contacts()], ["N0CALL"])
+        finally:
+            restored.close()
+
+
+class ReadConnectionPoolTests(unittest.TestCase):
+    durability = "balanced"
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"),
+                                 durability=self.durability)
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
+
+    def test_each_thread_reads_through_its_own_read_only_connection(self):
+        self.database.add_contact({'callsign': 'N0CALL', 'date': '2026-04-24', 'time_on': '1200'})
+        seen = {}
+
+        def worker():
+            with self.database.read_connection() as conn:
+                seen['conn'] = conn
+                seen['count'] = conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+                with self.assertRaises(sqlite3.OperationalError):
+                    conn.execute("DELETE FROM contacts")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        with self.database.read_connection() as conn:
+            self.assertIsNot(conn, self.database.conn)
+            self.assertIsNot(conn, seen['conn'])
+        self.assertEqual(seen['count'], 1)
+
+    def test_reads_do_not_share_the_writers_open_transaction(self):
+        self.database.conn.execute(
+            "INSERT INTO dx_spots (callsign, frequency, time, received_at) "
+            "VALUES ('DX1', '14025', '1200Z', '2026-04-24 12:00:00')"
+        )
+        self.database.conn.execute(
+            "INSERT INTO contacts (callsign, date, time_on) VALUES ('N0CALL', '2026-04-24', '1200')"
+        )
+        try:
+            spots = self.database.get_recent_spots()
+            duplicate = self.database.check_duplicate_within_time_window("N0CALL", "2026-04-24", "1200")
+        finally:
+            self.database.conn.rollback()
+
+        self.assertEqual(spots, [])
+        self.assertIsNone(duplicate)
+
+    def test_reads_see_contacts_committed_by_the_writer(self):
+        contact_id = self.database.add_contact(
+            {'callsign': 'N0CALL', 'date': '2026-04-24', 'time_on': '1200'})
+        self.assertEqual(self.database.get_contact(contact_id)['callsign'], 'N0CALL')
+        self.assertEqual(len(self.database.get_all_contacts()), 1)
+
+
+
+class RollbackJournalReadConnectionTests(ReadConnectionPoolTests):
+    durability = "safe"
+
+    def test_writes_commit_between_reads_on_other_threads(self):
+        written = threading.Event()
+        counts = []
+
+        def worker():
+            with self.database.read_connection() as conn:
+                counts.append(conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0])
+            written.wait(10)
+            with self.database.read_connection() as conn:
+                counts.append(conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0])
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.database.add_contact({'callsign': 'N0CALL', 'date': '2026-04-24', 'time_on': '1200'})
+        written.set()
+        thread.join()
+
+        self.assertEqual(counts[-1], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import tempfile
+import time
+import unittest
+
+from src.database import Database
+
+
+class DXSpotWriterTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tempdir.name, "logger.db")
+        self.database = Database(db_path=self.db_path)
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
+
+    def spot_count(self):
+        return self.database.conn.execute("SELECT COUNT(*) FROM dx_spots").fetchone()[0]
+
+    def test_spots_are_queued_and_written_in_bulk(self):
+        self.database.configure_spot_writer(batch_size=1000, flush_interval_ms=60000)
+        for index in range(3):
+            self.database.add_dx_spot({'callsign': f'DX{index}', 'frequency': '14025'})
+        self.assertEqual(self.spot_count(), 0)
+
+        spots = self.database.get_recent_spots()
+        self.assertEqual(len(spots), 3)
+        self.assertEqual(self.spot_count(), 3)
+
+    def wait_for_spot_count(self, expected, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.spot_count() < expected and time.monotonic() < deadline:
+            time.sleep(0.02)
+        return self.spot_count()
+
+    def test_lone_spots_are_written_after_the_flush_interval(self):
+        self.database.configure_spot_writer(batch_size=1000, flush_interval_ms=100)
+        self.database.add_dx_spot({'callsign': 'DX1', 'frequency': '14025'})
+        self.assertEqual(self.wait_for_spot_count(1), 1)
+
+        # The writer thread is idle now; the next spot must restart the timer
+        self.database.add_dx_spot({'callsign': 'DX2', 'frequency': '14025'})
+        self.assertEqual(self.wait_for_spot_count(2), 2)
+
+    def test_close_writes_queued_spots(self):
+        self.database.configure_spot_writer(batch_size=1000, flush_interval_ms=60000)
+        self.database.add_dx_spot({'callsign': 'DX1', 'frequency': '14025'})
+        self.database.close()
+
+        self.database = Database(db_path=self.db_path)
+        self.assertEqual(self.spot_count(), 1)
+
+    def test_spots_after_close_are_dropped(self):
+        writer = self.database._spot_writer
+        self.database.close()
+        self.assertIsNone(self.database.conn)
+
+        self.database.add_dx_spot({'callsign': 'DX1', 'frequency': '14025'})
+        writer.flush()
+
+        # No writer thread is started for a closed database
+        self.assertIsNone(writer._thread)
+        self.database = Database(db_path=self.db_path)
+        self.assertEqual(self.spot_count(), 0)
+
+    def test_retention_prunes_old_spots_and_caps_rows(self):
+        self.database.conn.executemany(
+            "INSERT INTO dx_spots (callsign, frequency, time, received_at) VALUES (?, ?, ?, ?)",
+            [(f'OLD{index}', '7030', '1200Z', '2020-01-01 00:00:00') for index in range(3)],
+        )
+        self.database.conn.commit()
+
+        self.database.configure_spot_writer(max_age_hours=24, max_rows=4)
+        for index in range(6):
+            self.database.add_dx_spot({'callsign': f'DX{index}', 'frequency': '14025'})
+        spots = self.database.get_recent_spots(limit=100)
+
+        self.assertEqual(sorted(s['callsign'] for s in spots), ['DX2', 'DX3', 'DX4', 'DX5'])
+
+    def test_recent_spot_query_uses_received_at_index(self):
+        plan = " ".join(
+            row['detail'] for row in self.database.conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM dx_spots ORDER BY received_at DESC LIMIT 50"
+            )
+        )
+        self.assertIn("idx_dx_spots_received_at", plan)
+
+
+if __name__ == "__main__":
+    unittest.main()
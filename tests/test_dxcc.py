@@ -1,33 +1,116 @@
-import ast
-import pathlib
+import os
+import tempfile
 import unittest
 
-from src.dxcc import lookup_dxcc
+from src.dxcc import DXCC_DATA_FILE, get_dxcc_index, load_dxcc_index, lookup_dxcc
+
+# (callsign, DXCC entity code) pairs the bundled table must resolve
+CORRECTNESS_CORPUS = [
+    ("W4GNS", 291), ("K1ABC", 291), ("N0CALL", 291), ("AA1A", 291), ("KG4ABC", 291),
+    ("AL7X", 6), ("KL7ABC", 6), ("KH6ABC", 110), ("AH6X", 110), ("KH2A", 103),
+    ("KP4ABC", 202), ("NP2X", 285), ("KH0A", 166), ("KH8B", 9),
+    ("VE3ABC", 1), ("VA7XYZ", 1), ("VY2ABC", 1), ("CY0A", 211), ("CY9B", 252),
+    ("XE1ABC", 50), ("XF4A", 204), ("TI9A", 37), ("TI2ABC", 308),
+    ("VP2EA", 12), ("VP2MA", 96), ("VP2VA", 65), ("VP5A", 89), ("VP9A", 64),
+    ("PJ2A", 517), ("PJ4A", 520), ("PJ7A", 518), ("FS4A", 213), ("FJ5A", 516),
+    ("G4ABC", 223), ("M0ABC", 223), ("2E0ABC", 223), ("GW4ABC", 294), ("MW0A", 294),
+    ("GM3ABC", 279), ("GI4ABC", 265), ("GD4ABC", 114), ("GJ4ABC", 122), ("GU4ABC", 106),
+    ("EI5A", 245), ("DL1ABC", 230), ("DJ2A", 230), ("F5ABC", 227), ("TK5A", 214),
+    ("I2ABC", 248), ("IT9ABC", 248), ("IS0ABC", 225), ("EA3ABC", 281), ("EA6A", 21),
+    ("EA8ABC", 29), ("EA9A", 32), ("CT1ABC", 272), ("CT3A", 256), ("CU2A", 149),
+    ("ON4UN", 209), ("PA3ABC", 263), ("HB9ABC", 287), ("HB0A", 251), ("OE1A", 206),
+    ("OK1ABC", 503), ("OM3A", 504), ("SP5ABC", 269), ("HA5A", 239), ("YO3A", 275),
+    ("LZ1A", 212), ("SV1ABC", 236), ("SV9A", 40), ("SV5A", 45), ("9A2A", 497),
+    ("S51A", 499), ("YU1A", 296), ("Z31A", 502), ("Z60A", 522), ("4O3A", 514),
+    ("OH2A", 224), ("OH0A", 5), ("OJ0B", 167), ("SM5A", 284), ("7S5A", 284),
+    ("LA1A", 266), ("JW5A", 259), ("JX2A", 118), ("OZ1A", 221), ("OY1A", 222),
+    ("OX3A", 237), ("TF3A", 242), ("ES1A", 52), ("YL2A", 145), ("LY1A", 146),
+    ("UA3ABC", 54), ("RA1A", 54), ("UA9ABC", 15), ("R0A", 15), ("RK2A", 126),
+    ("UA2F", 126), ("R1FJ", 61), ("UR5A", 288), ("EU1A", 27), ("ER1A", 179),
+    ("4L1A", 75), ("EK6A", 14), ("4K4A", 18), ("UN7A", 130), ("EX8A", 135),
+    ("TA1A", 390), ("5B4A", 215), ("ZC4A", 283), ("4X4A", 336), ("E44A", 510),
+    ("JY1A", 342), ("A61A", 391), ("A71A", 376), ("HZ1A", 378), ("9K2A", 348),
+    ("AP2A", 372), ("VU2A", 324), ("VU4A", 11), ("VU7A", 142), ("4S7A", 315),
+    ("S21ABC", 305), ("9N1A", 369), ("A51A", 306), ("XV1A", 293), ("XW1A", 143),
+    ("HS0A", 387), ("9V1ABC", 381), ("9M2A", 299), ("9M6A", 46), ("V85A", 345),
+    ("BY1AA", 318), ("BV2A", 386), ("BV9P", 505), ("VR2A", 321), ("XX9A", 152),
+    ("JA1ABC", 339), ("7J1A", 339), ("JD1A", 192), ("HL1A", 137), ("JT1A", 363),
+    ("DU1A", 375), ("YB1A", 327), ("4W6A", 511), ("VK2ABC", 150), ("VK9XA", 35),
+    ("VK9NA", 189), ("VK9LA", 147), ("ZL1ABC", 170), ("ZL7A", 34), ("P29A", 163),
+    ("H44A", 185), ("H40A", 507), ("YJ0A", 158), ("FK8A", 162), ("3D2A", 176),
+    ("A35A", 160), ("5W1A", 190), ("E51A", 234), ("T2A", 282), ("T30A", 301),
+    ("T31A", 31), ("T32A", 48), ("T33A", 490), ("C21A", 157), ("V73A", 168),
+    ("V63A", 173), ("T88A", 22), ("FO5A", 175), ("VP6A", 172), ("VP6DX", 513),
+    ("SU1A", 478), ("5A1A", 436), ("3V8A", 474), ("7X2A", 400), ("CN8A", 446),
+    ("S01A", 302), ("5T5A", 444), ("6W1A", 456), ("C56A", 422), ("J52A", 109),
+    ("3XY1A", 107), ("9L1A", 458), ("EL2A", 434), ("TU5A", 428), ("9G1A", 424),
+    ("5V7A", 483), ("TY1A", 416), ("5N1A", 450), ("5U7A", 187), ("XT2A", 480),
+    ("TZ6A", 442), ("TT8A", 410), ("TJ3A", 406), ("TL8A", 408), ("3C1A", 49),
+    ("3C0A", 195), ("TR8A", 420), ("TN5A", 412), ("9Q1A", 414), ("D2A", 401),
+    ("V51A", 464), ("A22A", 402), ("ZS6ABC", 462), ("ZS8A", 201), ("7P8A", 432),
+    ("3DA0A", 468), ("Z21A", 452), ("9J2A", 482), ("7Q7A", 440), ("C91A", 181),
+    ("5H3A", 470), ("5Z4A", 430), ("5X1A", 286), ("9X5A", 454), ("9U5A", 404),
+    ("ET3A", 53), ("E31A", 51), ("J28A", 382), ("6O1A", 232), ("ST2A", 466),
+    ("Z81A", 521), ("5R8A", 438), ("D68A", 411), ("FH8A", 169), ("FR5A", 453),
+    ("3B8A", 165), ("3B9A", 207), ("S79A", 379), ("VQ9A", 33), ("ZD7A", 250),
+    ("ZD8A", 205), ("ZD9A", 274), ("D44A", 409), ("S92A", 219), ("FT5WA", 41),
+    ("FT5XA", 131), ("FT5ZA", 10), ("FT4JA", 124), ("FT5GA", 99), ("FT4TA", 276),
+    ("3Y0A", 24), ("VK0HA", 111), ("VK0MA", 153),
+    ("HK3A", 116), ("HK0A", 216), ("YV5A", 148), ("YV0A", 17), ("8R1A", 129),
+    ("PZ1A", 140), ("FY5A", 63), ("PY2ABC", 108), ("PY0FA", 56), ("PY0SA", 253),
+    ("PY0TA", 273), ("HC1A", 120), ("HC8A", 71), ("OA4A", 136), ("CP6A", 104),
+    ("CE3A", 112), ("CE0YA", 47), ("CE0ZA", 125), ("CE0XA", 217), ("CE9A", 13),
+    ("LU1ABC", 100), ("CX2A", 144), ("ZP5A", 132), ("VP8A", 141),
+    ("CO2A", 70), ("6Y5A", 82), ("HH2A", 78), ("HI8A", 72), ("C6A", 60), ("ZF1A", 69),
+    ("V47A", 249), ("V21A", 94), ("J73A", 95), ("J68A", 97), ("J88A", 98), ("J37A", 77),
+    ("8P6A", 62), ("9Y4A", 90), ("P40A", 91), ("FG5A", 79), ("FM5A", 84), ("FP5A", 277),
+    ("TG9A", 76), ("V31A", 66), ("YS1A", 74), ("HR1A", 80), ("YN2A", 86), ("HP1A", 88),
+    ("KP1A", 182), ("KP5A", 43), ("KH1A", 20), ("KH3A", 123), ("KH4A", 174),
+    ("KH5A", 197), ("KH9A", 297), ("ZK3A", 270), ("E6A", 188), ("FW5A", 298),
+    ("1A0KM", 246), ("HV0A", 295), ("T77A", 278), ("3A2A", 260), ("C31A", 203),
+    ("LX1A", 254), ("9H1A", 257), ("ZB2A", 233), ("ZA1A", 7), ("E73A", 501),
+    ("YA1A", 3), ("EY8A", 262), ("EZ8A", 280), ("UK8A", 292), ("YI1A", 333),
+    ("EP2A", 330), ("YK1A", 384), ("OD5A", 354), ("A41A", 370), ("A92A", 304),
+    ("7O2A", 492), ("XZ1A", 309), ("XU7A", 312), ("8Q7A", 159), ("P51A", 344),
+    ("1S1A", 247), ("BS7H", 506), ("R1MV", 151),
+    # Exact callsign overrides
+    ("4U1UN", 289), ("4U1ITU", 117), ("4U1VIC", 206), ("KC4AAA", 13), ("SV2ASP", 180),
+]
+
+# (callsign, DXCC entity code or None) for portable and mobile forms
+SLASH_CORPUS = [
+    ("VP2E/W1ABC", 12), ("W1ABC/VP2E", 12), ("W1ABC/KH6", 110), ("KH6/W1ABC", 110),
+    ("DL1ABC/P", 230), ("W1ABC/M", 291), ("W1ABC/QRP", 291), ("VE3ABC/W4", 291),
+    ("F/ON4ABC", 227), ("EA8/DL1ABC/P", 29), ("W1ABC/MM", None), ("W1ABC/AM", None),
+    ("VE3ABC/7", 1), ("/W1ABC", 291),
+    # The home call is the shorter part
+    ("CE0Y/W1A", 47), ("W1A/CE0Y", 47), ("VP2E/K1A", 12), ("F/W1AB", 227), ("HC8/N1A", 71),
+]
 
 
 class DXCCLookupTests(unittest.TestCase):
-    def test_dxcc_data_has_no_duplicate_literal_keys(self):
-        dxcc_path = pathlib.Path(__file__).resolve().parents[1] / "src" / "dxcc.py"
-        tree = ast.parse(dxcc_path.read_text(encoding="utf-8"), filename=str(dxcc_path))
-
-        duplicates = []
-        for node in ast.walk(tree):
-            if not isinstance(node, ast.Assign):
-                continue
-            if not any(isinstance(target, ast.Name) and target.id == "DXCC_DATA" for target in node.targets):
-                continue
-            if not isinstance(node.value, ast.Dict):
-                continue
-
-            seen = {}
-            for key in node.value.keys:
-                if isinstance(key, ast.Constant):
-                    if key.value in seen:
-                        duplicates.append((key.value, seen[key.value], key.lineno))
-                    else:
-                        seen[key.value] = key.lineno
-
-        self.assertEqual(duplicates, [])
+    def test_bundled_table_loads_without_conflicting_prefixes(self):
+        index = load_dxcc_index()
+
+        self.assertGreaterEqual(len(index), 340)
+        self.assertIsNotNone(index.version)
+
+    def test_conflicting_prefixes_are_rejected(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "dxcc.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("entity,country,continent,cq_zone,itu_zone,prefixes\n"
+                        "1,One,NA,1,1,AA-AC\n"
+                        "2,Two,NA,1,1,AB\n")
+
+            with self.assertRaises(ValueError):
+                load_dxcc_index(path)
+
+    def test_correctness_corpus(self):
+        for callsign, entity in CORRECTNESS_CORPUS + SLASH_CORPUS:
+            with self.subTest(callsign=callsign):
+                info = lookup_dxcc(callsign)
+                self.assertEqual(info["entity"] if info else None, entity)
 
     def test_s2_prefix_resolves_to_bangladesh(self):
         self.assertEqual(lookup_dxcc("S21ABC")["country"], "Bangladesh")
@@ -35,6 +118,27 @@ class DXCCLookupTests(unittest.TestCase):
     def test_9v_prefix_resolves_to_singapore(self):
         self.assertEqual(lookup_dxcc("9V1ABC")["country"], "Singapore")
 
+    def test_records_are_shared_and_read_only(self):
+        first, second = lookup_dxcc("W1ABC"), lookup_dxcc("K4XYZ")
+
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["country"] = "Elsewhere"
+
+    def test_prefix_zone_overrides(self):
+        self.assertEqual((lookup_dxcc("VE7ABC")["cq_zone"], lookup_dxcc("VE7ABC")["itu_zone"]), (3, 2))
+        self.assertEqual(lookup_dxcc("VE1ABC")["cq_zone"], 5)
+        self.assertEqual(lookup_dxcc("VE7ABC")["entity"], lookup_dxcc("VE1ABC")["entity"])
+
+    def test_unknown_and_empty_callsigns(self):
+        for callsign in ("", None, "QQ1ABC", "/"):
+            with self.subTest(callsign=callsign):
+                self.assertIsNone(lookup_dxcc(callsign))
+
+    def test_shared_index_is_built_once(self):
+        self.assertIs(get_dxcc_index(), get_dxcc_index())
+        self.assertTrue(DXCC_DATA_FILE.endswith("dxcc_entities.csv"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.adif import ADIFGenerator
+from src.database import Database
+from src.import_pipeline import file_digest, import_adif_file
+
+
+class ImportPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"))
+        self.path = os.path.join(self.tempdir.name, "import.adi")
+        contacts = [
+            {
+                "callsign": f"k{i}abc",
+                "date": "2026-04-24",
+                "time_on": f"{i % 24:02d}:{i % 60:02d}",
+                "mode": "CW",
+                "key_type": "BUG",
+                "gridsquare": "FN31",
+                "my_gridsquare": "FM07",
+            }
+            for i in range(250)
+        ]
+        contacts.append({"callsign": "G4ABC", "date": "2026-04-24", "time_on": "12:00",
+                         "country": "Wales"})
+        ADIFGenerator().generate_file(self.path, contacts)
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
+
+    def test_imports_enriched_contacts_in_chunks(self):
+        progress = []
+        result = import_adif_file(
+            self.database, self.path, workers=0, chunk_size=100, first_chunk_size=10,
+            progress_callback=lambda current, total, message: progress.append((current, total)),
+        )
+
+        self.assertEqual(result["imported"], 251)
+        self.assertIn((10, 251), progress)
+        contact = self.database.get_contacts_where("callsign = ?", ("K1ABC",))[0]
+        self.assertEqual(contact["key_type"], "BUG")
+        self.assertEqual(contact["country"], "United States")
+        self.assertGreater(contact["distance_nm"], 100)
+        self.assertEqual(
+            self.database.get_contacts_where("callsign = ?", ("G4ABC",))[0]["country"], "Wales")
+
+        again = import_adif_file(self.database, self.path, workers=0)
+        self.assertEqual((again["imported"], again["duplicates"]), (0, 251))
+
+    def test_process_pool_matches_inline_import(self):
+        with mock.patch("src.import_pipeline.PARALLEL_IMPORT_THRESHOLD", 0):
+            result = import_adif_file(self.database, self.path, workers=2, chunk_size=50)
+
+        self.assertEqual(result["imported"], 251)
+        self.assertEqual(self.database.count_contacts(), 251)
+
+    def test_interrupted_import_resumes_from_checkpoint(self):
+        def interrupt(current, total, message):
+            if current == 110:
+                raise KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            import_adif_file(self.database, self.path, workers=0, chunk_size=100,
+                             first_chunk_size=10, progress_callback=interrupt)
+
+        file_hash = file_digest(self.path)
+        checkpoint = self.database.get_import_checkpoint(file_hash)
+        self.assertEqual((checkpoint["record_index"], checkpoint["imported"]), (110, 110))
+        self.assertEqual(self.database.count_contacts(), 110)
+
+        # The records before the checkpoint are neither parsed nor looked up again
+        with mock.patch.object(self.database, "_prepare_import_rows",
+                               wraps=self.database._prepare_import_rows) as prepare:
+            result = import_adif_file(self.database, self.path, workers=0, chunk_size=100)
+        self.assertEqual(sum(len(call.args[0]) for call in prepare.call_args_list), 141)
+
+        self.assertEqual(result["resumed_from"], 110)
+        self.assertEqual((result["imported"], result["duplicates"]), (251, 0))
+        self.assertEqual(self.database.count_contacts(), 251)
+        self.assertIsNone(self.database.get_import_checkpoint(file_hash))
+
+    def test_file_digest_reads_only_the_ends_of_large_files(self):
+        with mock.patch("src.import_pipeline.DIGEST_EDGE_BYTES", 1024):
+            file_hash = file_digest(self.path)
+            stat = os.stat(self.path)
+
+            # A change between the hashed ends that keeps size and mtime is not read
+            with open(self.path, "r+b") as f:
+                f.seek(stat.st_size // 2)
+                f.write(b"#")
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(file_digest(self.path), file_hash)
+
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+            self.assertNotEqual(file_digest(self.path), file_hash)
+
+if __name__ == "__main__":
+    unittest.main()
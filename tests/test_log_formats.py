@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+from src.database import Database
+from src.import_pipeline import import_log_file
+from src.log_formats import (
+    ADIF_FORMAT,
+    ADX_FORMAT,
+    CABRILLO_FORMAT,
+    detect_log_format,
+    iter_log_contacts,
+)
+
+ADX_LOG = """<?xml version="1.0" encoding="UTF-8"?>
+<ADX>
+  <HEADER><ADIF_VER>3.1.4</ADIF_VER></HEADER>
+  <RECORDS>
+    <RECORD>
+      <CALL>K1ABC</CALL><QSO_DATE>20260424</QSO_DATE><TIME_ON>120000</TIME_ON>
+      <MODE>CW</MODE><COMMENT>A &lt;B&gt; &amp; C</COMMENT>
+      <APP PROGRAMID="SKCCLOGGER" FIELDNAME="KEYTYPE" TYPE="S">BG</APP>
+    </RECORD>
+    <RECORD>
+      <CALL>G4ABC</CALL><QSO_DATE>20260425</QSO_DATE><TIME_ON>0930</TIME_ON>
+      <USERDEF FIELDNAME="SKCC">1234T</USERDEF>
+    </RECORD>
+  </RECORDS>
+</ADX>
+"""
+
+CABRILLO_LOG = """START-OF-LOG: 3.0
+CONTEST: SKCC-WES
+CALLSIGN: W4GNS
+QSO:  7055 CW 2026-04-24 1200 W4GNS         599 GA  GARY  12345T K1ABC         579 MA  JOHN  1234T
+QSO: 14050 CW 2026-04-24 1215 W4GNS         599 GA  GARY  12345T G4ABC         599 DX  PETE  NONE
+QSO:   144 PH 2026-04-24 1300 W4GNS         59  GA  GARY  12345T W1AW          59  CT  HIRAM 7S    1
+END-OF-LOG:
+"""
+
+
+class LogFormatTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.tempdir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_detects_format_by_extension_then_content(self):
+        self.assertIs(detect_log_format(self.write("log.adx", ADX_LOG)), ADX_FORMAT)
+        self.assertIs(detect_log_format(self.write("log.cbr", CABRILLO_LOG)), CABRILLO_FORMAT)
+        self.assertIs(detect_log_format(self.write("log.txt", CABRILLO_LOG)), CABRILLO_FORMAT)
+        self.assertIs(detect_log_format(self.write("log.xml", ADX_LOG)), ADX_FORMAT)
+        self.assertIs(detect_log_format(self.write("log.txt", "<CALL:5>K1ABC <EOR>")), ADIF_FORMAT)
+
+    def test_adx_records_use_adif_field_mapping(self):
+        path = self.write("log.adx", ADX_LOG)
+
+        contacts = list(iter_log_contacts(path))
+
+        self.assertEqual(ADX_FORMAT.count_records(path), 2)
+        self.assertEqual(contacts[0]["callsign"], "K1ABC")
+        self.assertEqual(contacts[0]["date"], "2026-04-24")
+        self.assertEqual(contacts[0]["time_on"], "12:00")
+        self.assertEqual(contacts[0]["comment"], "A <B> & C")
+        self.assertEqual(contacts[0]["key_type"], "BUG")
+        self.assertEqual(contacts[1]["skcc_number"], "1234T")
+
+    def test_cabrillo_qso_lines_map_to_contacts(self):
+        path = self.write("contest.log", CABRILLO_LOG)
+
+        contacts = list(iter_log_contacts(path))
+
+        self.assertEqual(CABRILLO_FORMAT.count_records(path), 3)
+        self.assertEqual(contacts[0], {
+            "callsign": "K1ABC", "date": "2026-04-24", "time_on": "12:00",
+            "frequency": "7.055", "band": "40M", "mode": "CW",
+            "rst_sent": "599", "rst_rcvd": "579",
+            "state": "MA", "name": "John", "skcc_number": "1234T", "comment": "SKCC-WES",
+        })
+        self.assertNotIn("skcc_number", contacts[1])
+        self.assertEqual(contacts[1]["comment"], "SKCC-WES DX PETE NONE")
+        # VHF band designator, phone mode and a trailing transmitter id
+        self.assertEqual((contacts[2]["callsign"], contacts[2]["band"], contacts[2]["mode"]),
+                         ("W1AW", "2M", "SSB"))
+        self.assertEqual(contacts[2]["skcc_number"], "7S")
+
+    def test_import_log_file_shares_enrichment_and_duplicate_detection(self):
+        path = self.write("contest.log", CABRILLO_LOG)
+        database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"))
+        try:
+            result = import_log_file(database, path, workers=0)
+            self.assertEqual(result["imported"], 3)
+            contact = database.get_contacts_where("callsign = ?", ("K1ABC",))[0]
+            self.assertEqual(contact["country"], "United States")
+
+            again = import_log_file(database, path, workers=0)
+            self.assertEqual((again["imported"], again["duplicates"]), (0, 3))
+        finally:
+            database.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.database import Database
+from src.skcc_award_rosters import SKCCAwardRosterManager
+
+ROSTER_PAGES = {
+    "centurion": "<tr><td>1</td><td>W4DF</td><td>436</td><td>Fred</td><td>Lynchburg</td>"
+                 "<td>VA</td><td>28 Jan 2006</td></tr>",
+    "tribune": "<tr><td>1 x15</td><td>W4DF</td><td>436</td><td>Fred</td><td>Lynchburg</td>"
+               "<td>VA</td><td>01 Mar 2007</td></tr>",
+    "senator": "<tr><td>1</td><td>K3Y</td><td>777</td><td>Ann</td><td>York</td>"
+               "<td>PA</td><td>01 Aug 2013</td></tr>",
+}
+
+
+def roster_response(url, timeout):
+    award_type = next(t for t, page_url in SKCCAwardRosterManager.ROSTER_URLS.items() if page_url == url)
+    return mock.Mock(text=ROSTER_PAGES[award_type], raise_for_status=mock.Mock())
+
+
+@mock.patch("src.skcc_award_rosters.requests.get", side_effect=AssertionError("network access"))
+class AwardRosterManagerTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"))
+
+    def tearDown(self):
+        self.database.close()
+        self.tempdir.cleanup()
+
+    def manager(self):
+        return SKCCAwardRosterManager(cache_dir=self.tempdir.name, database=self.database)
+
+    def test_lookups_never_download_before_rosters_are_loaded(self, get):
+        rosters = self.manager()
+
+        self.assertFalse(rosters.is_ready())
+        self.assertFalse(rosters.wait_until_ready(timeout=0))
+        self.assertIsNone(rosters.get_award_date("centurion", "436C"))
+        self.assertFalse(rosters.was_centurion_or_higher_on_date("436C", "20260101"))
+        get.assert_not_called()
+
+    def test_startup_loads_rosters_stored_in_database(self, get):
+        self.database.conn.execute(
+            "INSERT INTO skcc_centurion_members (skcc_number, callsign, centurion_date) "
+            "VALUES ('436', 'W4DF', '20060128')"
+        )
+        self.database.conn.commit()
+
+        rosters = self.manager()
+
+        self.assertTrue(rosters.is_ready("centurion"))
+        self.assertFalse(rosters.is_ready("centurion", "tribune"))
+        self.assertEqual(rosters.get_award_date("centurion", "436C"), "20060128")
+        get.assert_not_called()
+
+    def test_startup_falls_back_to_cached_roster_pages(self, get):
+        for award_type, page in ROSTER_PAGES.items():
+            with open(os.path.join(self.tempdir.name, f"{award_type}_roster.txt"), "w") as f:
+                f.write(page)
+
+        rosters = self.manager()
+
+        self.assertTrue(rosters.wait_until_ready(timeout=0))
+        self.assertTrue(rosters.was_tribune_or_senator_on_date("777S", "2013-08-01"))
+        self.assertEqual(self.database.get_award_roster_dates("tribune"), {"436": "20070301"})
+        get.assert_not_called()
+
+    def test_background_refresh_signals_readiness(self, get):
+        rosters = self.manager()
+        refreshed = mock.Mock()
+        get.side_effect = roster_response
+
+        thread = rosters.start_background_refresh(callback=refreshed)
+        self.assertTrue(rosters.wait_until_ready(timeout=10))
+        rosters.stop_background_refresh()
+        thread.join(timeout=10)
+
+        self.assertFalse(thread.is_alive())
+        refreshed.assert_called_once_with({"centurion": True, "tribune": True, "senator": True})
+        self.assertEqual(rosters.get_award_date("senator", "777"), "20130801")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from src.database import Database
+from src.skcc_roster import SKCCRosterManager, sync_roster_members
+
+ROSTER_CSV = (
+    "skcc_number,call,name,city,spc,dxcc,join_date,other_calls\n"
+    "1,KC9ECI,Tom,Galesville,WI,291,20060102,M0KCE\n"
+    "2C,KI4CIA,Melinda,Fayette,AL,291,20060102,\n"
+    "3T,W8CBC/EX,Bill,Dayton,OH,291,20060103,\n"
+    "4,M0KCE,Other,London,,223,20070101,\n"
+)
+
+
+class RosterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.write("skcc_roster.csv", ROSTER_CSV)
+        self.write("skcc_roster.csv.meta", "downloaded: 2026-03-24T12:08:10\ncount: 4\n")
+        self.managers = []
+
+    def tearDown(self):
+        for manager in self.managers:
+            manager.close()
+        self.tempdir.cleanup()
+
+    def write(self, name, text):
+        with open(os.path.join(self.tempdir.name, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def manager(self):
+        data_path = lambda *parts: os.path.join(self.tempdir.name, parts[-1])
+        with mock.patch("src.skcc_roster.app_path", side_effect=data_path), \
+                mock.patch("src.skcc_roster.bundled_path", side_effect=data_path):
+            manager = SKCCRosterManager()
+        self.managers.append(manager)
+        return manager
+
+
+class RosterCacheTests(RosterTestCase):
+    def test_lookups_follow_roster_matching_rules(self):
+        roster = self.manager()
+
+        self.assertEqual(roster.get_member_count(), 4)
+        self.assertEqual(roster.get_skcc_number("kc9eci"), "1")
+        # Other calls index to their member; the first member to claim a call keeps it
+        self.assertEqual(roster.get_skcc_number("M0KCE/P"), "1")
+        # Roster calls with a portable suffix match the bare call
+        self.assertEqual(roster.get_skcc_number("W8CBC"), "3T")
+        self.assertEqual(roster.get_member_by_number("2")["call"], "KI4CIA")
+        self.assertTrue(roster.was_member_on_date("KI4CIA", "2006-01-02"))
+        self.assertFalse(roster.was_member_on_date("KI4CIA", "20060101"))
+        self.assertIsNone(roster.lookup_callsign("N0NE"))
+
+    def test_unchanged_roster_reuses_cache(self):
+        self.manager()
+
+        with mock.patch.object(SKCCRosterManager, "_build_cache") as build:
+            roster = self.manager()
+
+        build.assert_not_called()
+        self.assertEqual(roster.get_skcc_number("KC9ECI"), "1")
+
+    def test_meta_change_rebuilds_cache(self):
+        self.manager()
+        self.write("skcc_roster.csv.meta", "downloaded: 2026-04-24T08:00:00.000000\ncount: 4\n")
+
+        with mock.patch.object(SKCCRosterManager, "_build_cache",
+                               autospec=True, side_effect=SKCCRosterManager._build_cache) as build:
+            roster = self.manager()
+
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(roster.get_member_count(), 4)
+
+    def test_reload_swaps_in_new_roster(self):
+        roster = self.manager()
+        listener = mock.Mock()
+        roster.add_reload_listener(listener)
+
+        self.write("skcc_roster.csv", ROSTER_CSV + "5S,K2XYZ,Bob,Albany,NY,291,20200301,\n")
+        self.assertTrue(roster.load_local_roster())
+
+        listener.assert_called_once_with()
+        self.assertEqual(roster.get_skcc_number("K2XYZ"), "5S")
+        self.assertEqual(roster.get_member_count(), 5)
+
+
+    def test_failed_cache_build_falls_back_to_memory_and_cleans_up(self):
+        build = SKCCRosterManager._build_cache
+        calls = []
+
+        def fail_on_disk(manager, conn, roster_file, signature):
+            calls.append(conn)
+            if len(calls) == 1:
+                raise sqlite3.OperationalError("disk I/O error")
+            build(manager, conn, roster_file, signature)
+
+        with mock.patch.object(SKCCRosterManager, "_build_cache", autospec=True,
+                               side_effect=fail_on_disk):
+            roster = self.manager()
+
+        self.assertEqual(roster.get_skcc_number("KC9ECI"), "1")
+        self.assertEqual([name for name in os.listdir(self.tempdir.name) if name.endswith(".tmp")], [])
+        # The connection to the abandoned temp file was closed
+        with self.assertRaises(sqlite3.ProgrammingError):
+            calls[0].execute("SELECT 1")
+
+class RosterDatabaseTests(RosterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.database = Database(db_path=os.path.join(self.tempdir.name, "logger.db"))
+
+    def tearDown(self):
+        self.database.close()
+        super().tearDown()
+
+    def add_contacts(self, *contacts):
+        return [
+            self.database.add_contact({"callsign": callsign, "date": date, "time_on": "12:00",
+                                       "band": "20m", "mode": "CW", "skcc_number": skcc_number})
+            for callsign, date, skcc_number in contacts
+        ]
+
+    def matching_ids(self, condition):
+        return set(self.database.get_contact_ids(condition, []))
+
+    def test_sync_swaps_roster_only_when_it_changed(self):
+        roster = self.manager()
+        self.assertTrue(sync_roster_members(self.database, roster))
+        self.assertEqual(self.database.get_roster_member_source(), roster.source)
+
+        with mock.patch.object(Database, "replace_roster_members") as replace:
+            self.assertTrue(sync_roster_members(self.database, roster))
+        replace.assert_not_called()
+
+        self.write("skcc_roster.csv", ROSTER_CSV + "5S,K2XYZ,Bob,Albany,NY,291,20200301,\n")
+        roster.load_local_roster()
+        self.assertTrue(sync_roster_members(self.database, roster))
+        count, = self.database.conn.execute("SELECT COUNT(*) FROM skcc_roster_members").fetchone()
+        self.assertEqual(count, 5)
+
+    def test_member_condition_joins_on_base_call_and_join_date(self):
+        roster = self.manager()
+        sync_roster_members(self.database, roster)
+        member, before_join, portable, other_call, by_number, non_member = self.add_contacts(
+            ("KI4CIA", "2006-01-02", "2C"),
+            ("KI4CIA", "2006-01-01", "2C"),
+            ("W8CBC", "2010-05-01", "3T"),
+            ("M0KCE/P", "2006-06-01", "1"),
+            ("N0NE", "2010-05-01", "4"),
+            ("N0NE", "2010-05-02", "99"),
+        )
+
+        condition = self.database.roster_member_condition(roster.source)
+        self.assertEqual(self.matching_ids(condition), {member, portable, other_call})
+        condition = self.database.roster_member_condition(roster.source, include_numbers=True)
+        self.assertEqual(self.matching_ids(condition), {member, portable, other_call, by_number})
+        # A stored roster that differs from the one validate() uses is not joined against
+        self.assertIsNone(self.database.roster_member_condition("other roster"))
+
+    def test_award_holder_condition_needs_every_roster(self):
+        early, late = self.add_contacts(("KC9ECI", "2009-12-31", "1C"), ("KC9ECI", "2010-01-01", "1C"))
+        self.database.conn.execute(
+            "INSERT INTO skcc_centurion_members (skcc_number, callsign, centurion_date) "
+            "VALUES ('1', 'KC9ECI', '20100101')"
+        )
+        self.database.conn.commit()
+
+        condition = self.database.award_holder_condition(("centurion",))
+        self.assertEqual(self.matching_ids(condition), {late})
+        self.assertIsNone(self.database.award_holder_condition(("centurion", "tribune")))
+
+
+if __name__ == "__main__":
+    unittest.main()